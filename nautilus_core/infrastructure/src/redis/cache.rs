@@ -62,6 +62,8 @@ const POSITIONS: &str = "positions";
 const ACTORS: &str = "actors";
 const STRATEGIES: &str = "strategies";
 const SNAPSHOTS: &str = "snapshots";
+const CHECKPOINTS: &str = "checkpoints";
+const COMPACT: &[u8] = b"compact";
 const HEALTH: &str = "health";
 
 // Index keys
@@ -209,10 +211,33 @@ impl RedisCacheDatabase {
             POSITIONS => read_list(&mut self.conn, &key),
             ACTORS => read_string(&mut self.conn, &key),
             STRATEGIES => read_string(&mut self.conn, &key),
+            CHECKPOINTS => read_list(&mut self.conn, &key),
             _ => anyhow::bail!("Unsupported operation: `read` for collection '{collection}'"),
         }
     }
 
+    /// Reads the lists for the given `keys` in a single pipelined round trip.
+    ///
+    /// Only list collections (accounts, orders, positions and checkpoints) are supported.
+    pub fn read_bulk(&mut self, keys: &[String]) -> anyhow::Result<Vec<Vec<Vec<u8>>>> {
+        let mut pipe = redis::pipe();
+        for key in keys {
+            let collection = get_collection_key(key)?;
+            match collection {
+                ACCOUNTS | ORDERS | POSITIONS | CHECKPOINTS => {
+                    let key = format!("{}{DELIMITER}{}", self.trader_key, key);
+                    pipe.lrange(key, 0, -1);
+                }
+                _ => anyhow::bail!(
+                    "Unsupported operation: `read_bulk` for collection '{collection}'"
+                ),
+            }
+        }
+
+        let result: Vec<Vec<Vec<u8>>> = pipe.query(&mut self.conn)?;
+        Ok(result)
+    }
+
     pub fn insert(&mut self, key: String, payload: Option<Vec<Vec<u8>>>) -> anyhow::Result<()> {
         let op = DatabaseCommand::new(DatabaseOperation::Insert, key, payload);
         match self.tx.send(op) {
@@ -448,6 +473,10 @@ fn insert(
             insert_list(pipe, key, value[0]);
             Ok(())
         }
+        CHECKPOINTS => {
+            insert_checkpoint(pipe, key, &value);
+            Ok(())
+        }
         HEALTH => {
             insert_string(pipe, key, value[0]);
             Ok(())
@@ -523,6 +552,21 @@ fn insert_list(pipe: &mut Pipeline, key: &str, value: &[u8]) {
     pipe.rpush(key, value);
 }
 
+/// Replaces the checkpoint at `key`.
+///
+/// If the payload is followed by the compact flag then the event list the checkpoint
+/// supersedes is also compacted down to its last event (so the list key remains for
+/// discovery). Both commands are added to the same atomic pipeline, so the list is
+/// never compacted without the checkpoint being written.
+fn insert_checkpoint(pipe: &mut Pipeline, key: &str, value: &[&[u8]]) {
+    pipe.del(key);
+    pipe.rpush(key, value[0]);
+    if value.get(1).copied() == Some(COMPACT) {
+        let list_key = key.replacen(&format!("{CHECKPOINTS}{DELIMITER}"), "", 1);
+        pipe.ltrim(list_key, -1, -1);
+    }
+}
+
 fn update(
     pipe: &mut Pipeline,
     collection: &str,
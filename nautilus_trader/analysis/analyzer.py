@@ -21,6 +21,7 @@ import pandas as pd
 from numpy import float64
 
 from nautilus_trader.accounting.accounts.base import Account
+from nautilus_trader.analysis import statistics
 from nautilus_trader.analysis.statistic import PortfolioStatistic
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.datetime import unix_nanos_to_dt
@@ -60,6 +61,28 @@ class PortfolioAnalyzer:
 
         self._statistics[statistic.name] = statistic
 
+    def register_default_statistics(self) -> None:
+        """
+        Register the default statistics with the analyzer.
+        """
+        self.register_statistic(statistics.winner_max.MaxWinner())
+        self.register_statistic(statistics.winner_avg.AvgWinner())
+        self.register_statistic(statistics.winner_min.MinWinner())
+        self.register_statistic(statistics.loser_min.MinLoser())
+        self.register_statistic(statistics.loser_avg.AvgLoser())
+        self.register_statistic(statistics.loser_max.MaxLoser())
+        self.register_statistic(statistics.expectancy.Expectancy())
+        self.register_statistic(statistics.win_rate.WinRate())
+        self.register_statistic(statistics.returns_volatility.ReturnsVolatility())
+        self.register_statistic(statistics.returns_avg.ReturnsAverage())
+        self.register_statistic(statistics.returns_avg_loss.ReturnsAverageLoss())
+        self.register_statistic(statistics.returns_avg_win.ReturnsAverageWin())
+        self.register_statistic(statistics.sharpe_ratio.SharpeRatio())
+        self.register_statistic(statistics.sortino_ratio.SortinoRatio())
+        self.register_statistic(statistics.profit_factor.ProfitFactor())
+        self.register_statistic(statistics.risk_return_ratio.RiskReturnRatio())
+        self.register_statistic(statistics.long_ratio.LongRatio())
+
     def deregister_statistic(self, statistic: PortfolioStatistic) -> None:
         """
         Deregister a statistic from the analyzer.
@@ -137,8 +160,33 @@ class PortfolioAnalyzer:
             The positions for the calculations.
 
         """
-        self._account_balances_starting = account.starting_balances()
-        self._account_balances = account.balances_total()
+        self.calculate_statistics_from_balances(
+            starting_balances=account.starting_balances(),
+            balances=account.balances_total(),
+            positions=positions,
+        )
+
+    def calculate_statistics_from_balances(
+        self,
+        starting_balances: dict[Currency, Money],
+        balances: dict[Currency, Money],
+        positions: list[Position],
+    ) -> None:
+        """
+        Calculate performance metrics from the given account balances and positions.
+
+        Parameters
+        ----------
+        starting_balances : dict[Currency, Money]
+            The starting account balances for the calculations.
+        balances : dict[Currency, Money]
+            The total account balances for the calculations.
+        positions : list[Position]
+            The positions for the calculations.
+
+        """
+        self._account_balances_starting = starting_balances
+        self._account_balances = balances
         self._realized_pnls = {}
         self._returns = pd.Series(dtype=float64)
 
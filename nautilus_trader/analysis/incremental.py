@@ -0,0 +1,396 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import math
+from typing import Any
+
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.model.objects import Currency
+from nautilus_trader.model.objects import Money
+
+
+_NANOS_PER_DAY = 86_400_000_000_000
+
+
+class _PnlTracker:
+    # Tracks the realized PnL equity curve and drawdown for a single currency
+    def __init__(self, starting_balance: float) -> None:
+        self.starting_balance = starting_balance
+        self.total = 0.0
+        self.peak = starting_balance
+        self.max_drawdown = 0.0
+        self.max_drawdown_pct = 0.0
+        self.winners = 0
+        self.losers = 0
+
+    @property
+    def equity(self) -> float:
+        return self.starting_balance + self.total
+
+    def update(self, pnl: float) -> None:
+        self.total += pnl
+        if pnl > 0.0:
+            self.winners += 1
+        elif pnl < 0.0:
+            self.losers += 1
+
+        equity = self.equity
+        if equity > self.peak:
+            self.peak = equity
+            return
+
+        drawdown = self.peak - equity
+        self.max_drawdown = max(self.max_drawdown, drawdown)
+        if self.peak > 0.0:
+            self.max_drawdown_pct = max(self.max_drawdown_pct, drawdown / self.peak)
+
+
+class IncrementalStatistics:
+    """
+    Provides portfolio performance statistics which are updated online as positions
+    close, rather than calculated from all positions after a run (as per the
+    `PortfolioAnalyzer`).
+
+    Returns are summed into daily bins by the position closed timestamp (with zero
+    returns for days without closed positions) to match the `PortfolioAnalyzer`
+    returns statistics, and the annualized Sharpe and Sortino ratios are maintained
+    over the bins with Welford's algorithm. Realized PnL and drawdown are tracked
+    per currency from the realized PnL equity curve (starting from the starting
+    balance, if set).
+
+    Parameters
+    ----------
+    period : int, default 252
+        The trading period in days (for annualizing the ratios).
+
+    Raises
+    ------
+    ValueError
+        If `period` is not positive (> 0).
+
+    """
+
+    def __init__(self, period: int = 252) -> None:
+        PyCondition.positive_int(period, "period")
+
+        self.period = period
+        self._starting_balances: dict[Currency, float] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the statistics.
+
+        All stateful fields are reset to their initial value, except for the
+        starting balances.
+
+        """
+        self._pnls: dict[Currency, _PnlTracker] = {
+            currency: _PnlTracker(balance) for currency, balance in self._starting_balances.items()
+        }
+        self._position_count = 0
+
+        # Daily returns bins
+        self._day: int | None = None
+        self._day_return = 0.0
+        self._days = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._downside_sq = 0.0
+
+    def set_starting_balances(self, balances: list[Money]) -> None:
+        """
+        Set the starting balances for the drawdown calculations.
+
+        Parameters
+        ----------
+        balances : list[Money]
+            The starting balances (balances in the same currency are summed).
+
+        """
+        PyCondition.not_none(balances, "balances")
+
+        self._starting_balances = {}
+        for balance in balances:
+            self._starting_balances[balance.currency] = (
+                self._starting_balances.get(balance.currency, 0.0) + balance.as_double()
+            )
+        for currency, balance in self._starting_balances.items():
+            tracker = self._pnls.get(currency)
+            if tracker is None:
+                self._pnls[currency] = _PnlTracker(balance)
+            elif tracker.total == 0.0:
+                tracker.starting_balance = balance
+                tracker.peak = balance
+
+    @property
+    def position_count(self) -> int:
+        """
+        Return the count of closed positions.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._position_count
+
+    @property
+    def currencies(self) -> list[Currency]:
+        """
+        Return the currencies with tracked PnL.
+
+        Returns
+        -------
+        list[Currency]
+
+        """
+        return list(self._pnls)
+
+    def update(self, realized_pnl: Money, realized_return: float, ts_closed: int) -> None:
+        """
+        Update the statistics with a closed position.
+
+        Parameters
+        ----------
+        realized_pnl : Money
+            The realized PnL for the position.
+        realized_return : float
+            The realized return for the position.
+        ts_closed : int
+            UNIX timestamp (nanoseconds) when the position closed.
+
+        """
+        PyCondition.not_none(realized_pnl, "realized_pnl")
+
+        self._position_count += 1
+
+        tracker = self._pnls.get(realized_pnl.currency)
+        if tracker is None:
+            tracker = _PnlTracker(0.0)
+            self._pnls[realized_pnl.currency] = tracker
+        tracker.update(realized_pnl.as_double())
+
+        if math.isnan(realized_return):
+            return
+
+        day = ts_closed // _NANOS_PER_DAY
+        if self._day is None:
+            self._day = day
+        elif day > self._day:
+            self._push_day(self._day_return)
+            for _ in range(day - self._day - 1):
+                self._push_day(0.0)  # Days without closed positions
+            self._day = day
+            self._day_return = 0.0
+        self._day_return += realized_return
+
+    def _push_day(self, value: float) -> None:
+        self._days += 1
+        delta = value - self._mean
+        self._mean += delta / self._days
+        self._m2 += delta * (value - self._mean)
+        if value < 0.0:
+            self._downside_sq += value * value
+
+    def _daily_moments(self) -> tuple[int, float, float, float]:
+        # Returns the moments including the current (incomplete) day
+        if self._day is None:
+            return 0, math.nan, math.nan, 0.0
+
+        value = self._day_return
+        days = self._days + 1
+        delta = value - self._mean
+        mean = self._mean + delta / days
+        m2 = self._m2 + delta * (value - mean)
+        downside_sq = self._downside_sq + (value * value if value < 0.0 else 0.0)
+        return days, mean, m2, downside_sq
+
+    def returns_mean(self) -> float:
+        """
+        Return the mean of the daily returns.
+
+        Returns
+        -------
+        float
+            NaN if no positions have closed.
+
+        """
+        return self._daily_moments()[1]
+
+    def returns_volatility(self) -> float:
+        """
+        Return the annualized volatility of the daily returns.
+
+        Returns
+        -------
+        float
+            NaN if there are fewer than two days of returns.
+
+        """
+        days, _, m2, _ = self._daily_moments()
+        if days < 2:
+            return math.nan
+        return math.sqrt(m2 / (days - 1)) * math.sqrt(self.period)
+
+    def sharpe_ratio(self) -> float:
+        """
+        Return the annualized Sharpe ratio of the daily returns.
+
+        Returns
+        -------
+        float
+            NaN if there are fewer than two days of returns, or no variance.
+
+        """
+        days, mean, m2, _ = self._daily_moments()
+        if days < 2 or m2 <= 0.0:
+            return math.nan
+        return mean / math.sqrt(m2 / (days - 1)) * math.sqrt(self.period)
+
+    def sortino_ratio(self) -> float:
+        """
+        Return the annualized Sortino ratio of the daily returns.
+
+        Returns
+        -------
+        float
+            NaN if there are no negative daily returns.
+
+        """
+        days, mean, _, downside_sq = self._daily_moments()
+        if days == 0 or downside_sq == 0.0:
+            return math.nan
+        return mean / math.sqrt(downside_sq / days) * math.sqrt(self.period)
+
+    def realized_pnl(self, currency: Currency | None = None) -> float:
+        """
+        Return the total realized PnL.
+
+        Parameters
+        ----------
+        currency : Currency, optional
+            The currency for the PnL. If ``None`` then will use the single tracked
+            currency (or the first currency for multi-currency portfolios).
+
+        Returns
+        -------
+        float
+
+        """
+        tracker = self._tracker(currency)
+        return tracker.total if tracker is not None else 0.0
+
+    def drawdown(self, currency: Currency | None = None) -> float:
+        """
+        Return the current drawdown from the peak realized equity.
+
+        Parameters
+        ----------
+        currency : Currency, optional
+            The currency for the drawdown.
+
+        Returns
+        -------
+        float
+
+        """
+        tracker = self._tracker(currency)
+        return tracker.peak - tracker.equity if tracker is not None else 0.0
+
+    def max_drawdown(self, currency: Currency | None = None) -> float:
+        """
+        Return the maximum drawdown from the peak realized equity.
+
+        Parameters
+        ----------
+        currency : Currency, optional
+            The currency for the drawdown.
+
+        Returns
+        -------
+        float
+
+        """
+        tracker = self._tracker(currency)
+        return tracker.max_drawdown if tracker is not None else 0.0
+
+    def max_drawdown_pct(self, currency: Currency | None = None) -> float:
+        """
+        Return the maximum drawdown as a fraction of the peak realized equity.
+
+        This requires the starting balances to be set to be meaningful.
+
+        Parameters
+        ----------
+        currency : Currency, optional
+            The currency for the drawdown.
+
+        Returns
+        -------
+        float
+
+        """
+        tracker = self._tracker(currency)
+        return tracker.max_drawdown_pct if tracker is not None else 0.0
+
+    def win_rate(self, currency: Currency | None = None) -> float:
+        """
+        Return the fraction of closed positions with a positive realized PnL.
+
+        Parameters
+        ----------
+        currency : Currency, optional
+            The currency for the win rate.
+
+        Returns
+        -------
+        float
+            NaN if no positions have closed with a non-zero PnL.
+
+        """
+        tracker = self._tracker(currency)
+        if tracker is None or tracker.winners + tracker.losers == 0:
+            return math.nan
+        return tracker.winners / (tracker.winners + tracker.losers)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return a snapshot of the current statistics.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        """
+        snapshot: dict[str, Any] = {
+            "Positions": self._position_count,
+            "Returns Mean": self.returns_mean(),
+            "Returns Volatility (annualized)": self.returns_volatility(),
+            f"Sharpe Ratio ({self.period} days)": self.sharpe_ratio(),
+            f"Sortino Ratio ({self.period} days)": self.sortino_ratio(),
+        }
+        for currency in self._pnls:
+            snapshot[f"PnL (total) {currency}"] = self.realized_pnl(currency)
+            snapshot[f"Max Drawdown {currency}"] = self.max_drawdown(currency)
+            snapshot[f"Max Drawdown % {currency}"] = self.max_drawdown_pct(currency)
+            snapshot[f"Win Rate {currency}"] = self.win_rate(currency)
+
+        return snapshot
+
+    def _tracker(self, currency: Currency | None) -> _PnlTracker | None:
+        if currency is None:
+            return next(iter(self._pnls.values()), None)
+        return self._pnls.get(currency)
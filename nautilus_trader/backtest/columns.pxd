@@ -0,0 +1,51 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+
+
+cdef class BarColumns:
+    cdef object _opens_arr
+    cdef object _highs_arr
+    cdef object _lows_arr
+    cdef object _closes_arr
+    cdef object _volumes_arr
+    cdef object _ts_events_arr
+    cdef object _ts_inits_arr
+
+    cdef int64_t[::1] _opens
+    cdef int64_t[::1] _highs
+    cdef int64_t[::1] _lows
+    cdef int64_t[::1] _closes
+    cdef uint64_t[::1] _volumes
+    cdef uint64_t[::1] _ts_events
+    cdef uint64_t[::1] _ts_inits
+
+    cdef readonly BarType bar_type
+    """The bar type for the columns.\n\n:returns: `BarType`"""
+    cdef readonly uint8_t price_precision
+    """The price precision for the OHLC columns.\n\n:returns: `uint8`"""
+    cdef readonly uint8_t size_precision
+    """The size precision for the volume column.\n\n:returns: `uint8`"""
+    cdef readonly Py_ssize_t size
+    """The number of bars (rows) held in the columns.\n\n:returns: `int`"""
+
+    cdef Bar bar_at_c(self, Py_ssize_t index)
+    cdef uint64_t ts_init_at_c(self, Py_ssize_t index)
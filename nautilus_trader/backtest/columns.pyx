@@ -0,0 +1,475 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.persistence.wranglers import prepare_event_and_init_timestamps
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport as_utc_index
+from nautilus_trader.core.rust.model cimport FIXED_SCALAR
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.instruments.base cimport Instrument
+
+
+cdef object _to_raw(values, uint8_t precision):
+    # Converts float values to raw fixed-point values at the given precision
+    return np.rint(np.round(values, precision) * FIXED_SCALAR)
+
+
+cdef class BarColumns:
+    """
+    Provides columnar storage of bars for a single bar type.
+
+    Bars are held as contiguous arrays of raw fixed-point values (as per `Price.raw` and
+    `Quantity.raw`), rather than as a list of `Bar` objects. When added to a
+    `BacktestEngine` as a data stream, each `Bar` is only materialized as the backtest
+    reaches its row, and is released once it has been processed.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type for the columns.
+    price_precision : uint8_t
+        The price precision for the OHLC columns.
+    size_precision : uint8_t
+        The size precision for the volume column.
+    opens : np.ndarray[int64]
+        The raw open prices.
+    highs : np.ndarray[int64]
+        The raw high prices.
+    lows : np.ndarray[int64]
+        The raw low prices.
+    closes : np.ndarray[int64]
+        The raw close prices.
+    volumes : np.ndarray[uint64]
+        The raw volumes.
+    ts_events : np.ndarray[uint64]
+        UNIX timestamps (nanoseconds) when the data events occurred.
+    ts_inits : np.ndarray[uint64]
+        UNIX timestamps (nanoseconds) when the data objects were initialized.
+
+    Raises
+    ------
+    ValueError
+        If the column lengths are not equal.
+    ValueError
+        If `ts_inits` is not sorted in ascending order.
+
+    """
+
+    def __init__(
+        self,
+        BarType bar_type not None,
+        uint8_t price_precision,
+        uint8_t size_precision,
+        opens not None,
+        highs not None,
+        lows not None,
+        closes not None,
+        volumes not None,
+        ts_events not None,
+        ts_inits not None,
+    ) -> None:
+        self._opens_arr = np.ascontiguousarray(opens, dtype=np.int64)
+        self._highs_arr = np.ascontiguousarray(highs, dtype=np.int64)
+        self._lows_arr = np.ascontiguousarray(lows, dtype=np.int64)
+        self._closes_arr = np.ascontiguousarray(closes, dtype=np.int64)
+        self._volumes_arr = np.ascontiguousarray(volumes, dtype=np.uint64)
+        self._ts_events_arr = np.ascontiguousarray(ts_events, dtype=np.uint64)
+        self._ts_inits_arr = np.ascontiguousarray(ts_inits, dtype=np.uint64)
+
+        Condition.true(
+            len(self._opens_arr) == len(self._highs_arr) == len(self._lows_arr)
+            == len(self._closes_arr) == len(self._volumes_arr)
+            == len(self._ts_events_arr) == len(self._ts_inits_arr),
+            "Array lengths must be equal",
+        )
+        Condition.true(
+            bool(np.all(self._ts_inits_arr[1:] >= self._ts_inits_arr[:-1])),
+            "`ts_inits` must be sorted in ascending order",
+        )
+
+        self._opens = self._opens_arr
+        self._highs = self._highs_arr
+        self._lows = self._lows_arr
+        self._closes = self._closes_arr
+        self._volumes = self._volumes_arr
+        self._ts_events = self._ts_events_arr
+        self._ts_inits = self._ts_inits_arr
+
+        self.bar_type = bar_type
+        self.price_precision = price_precision
+        self.size_precision = size_precision
+        self.size = len(self._ts_inits_arr)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            yield self.bar_at_c(i)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(bar_type={self.bar_type}, size={self.size})"
+
+    @property
+    def opens(self):
+        """
+        Return the raw open prices.
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._opens_arr
+
+    @property
+    def highs(self):
+        """
+        Return the raw high prices.
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._highs_arr
+
+    @property
+    def lows(self):
+        """
+        Return the raw low prices.
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._lows_arr
+
+    @property
+    def closes(self):
+        """
+        Return the raw close prices.
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._closes_arr
+
+    @property
+    def volumes(self):
+        """
+        Return the raw volumes.
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._volumes_arr
+
+    @property
+    def ts_events(self):
+        """
+        Return the UNIX timestamps (nanoseconds) when the data events occurred.
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._ts_events_arr
+
+    @property
+    def ts_inits(self):
+        """
+        Return the UNIX timestamps (nanoseconds) when the data objects were initialized.
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._ts_inits_arr
+
+    @property
+    def ts_init_first(self) -> int | None:
+        """
+        Return the first `ts_init` in the columns (if not empty).
+
+        Returns
+        -------
+        int or ``None``
+
+        """
+        return self._ts_inits[0] if self.size > 0 else None
+
+    @property
+    def ts_init_last(self) -> int | None:
+        """
+        Return the last `ts_init` in the columns (if not empty).
+
+        Returns
+        -------
+        int or ``None``
+
+        """
+        return self._ts_inits[self.size - 1] if self.size > 0 else None
+
+    def as_double(self, str column):
+        """
+        Return the given price or volume column as a `float64` array.
+
+        This is intended for vectorized computations over the columns (such as
+        pre-computing indicator values), without materializing any `Bar` objects.
+
+        Parameters
+        ----------
+        column : str {'open', 'high', 'low', 'close', 'volume'}
+            The column to return.
+
+        Returns
+        -------
+        np.ndarray[float64]
+
+        Raises
+        ------
+        ValueError
+            If `column` is not a valid column name.
+
+        """
+        Condition.is_in(column, ("open", "high", "low", "close", "volume"), "column", "columns")
+
+        if column == "open":
+            return self._opens_arr / FIXED_SCALAR
+        elif column == "high":
+            return self._highs_arr / FIXED_SCALAR
+        elif column == "low":
+            return self._lows_arr / FIXED_SCALAR
+        elif column == "close":
+            return self._closes_arr / FIXED_SCALAR
+        else:
+            return self._volumes_arr / FIXED_SCALAR
+
+    def bar_at(self, int index) -> Bar:
+        """
+        Return a `Bar` materialized from the row at the given index.
+
+        Parameters
+        ----------
+        index : int
+            The row index (negative indexing is supported).
+
+        Returns
+        -------
+        Bar
+
+        Raises
+        ------
+        IndexError
+            If `index` is out of range.
+
+        """
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError(f"index {index} out of range for {self.size} bars")
+        return self.bar_at_c(index)
+
+    def to_bars(self) -> list[Bar]:
+        """
+        Return all rows materialized as a list of `Bar` objects.
+
+        Returns
+        -------
+        list[Bar]
+
+        """
+        return Bar.from_raw_arrays_to_list_c(
+            self.bar_type,
+            self.price_precision,
+            self.size_precision,
+            self._opens,
+            self._highs,
+            self._lows,
+            self._closes,
+            self._volumes,
+            self._ts_events,
+            self._ts_inits,
+        )
+
+    cdef Bar bar_at_c(self, Py_ssize_t index):
+        return Bar.from_raw_c(
+            self.bar_type,
+            self._opens[index],
+            self._highs[index],
+            self._lows[index],
+            self._closes[index],
+            self.price_precision,
+            self._volumes[index],
+            self.size_precision,
+            self._ts_events[index],
+            self._ts_inits[index],
+        )
+
+    cdef uint64_t ts_init_at_c(self, Py_ssize_t index):
+        return self._ts_inits[index]
+
+    @staticmethod
+    def from_bars(list bars not None) -> BarColumns:
+        """
+        Return columns built from the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars for the columns (must all share the same bar type).
+
+        Returns
+        -------
+        BarColumns
+
+        Raises
+        ------
+        ValueError
+            If `bars` is empty.
+        ValueError
+            If `bars` contains more than one bar type.
+
+        """
+        Condition.not_empty(bars, "bars")
+
+        cdef Bar first = bars[0]
+        cdef Py_ssize_t count = len(bars)
+        opens = np.empty(count, dtype=np.int64)
+        highs = np.empty(count, dtype=np.int64)
+        lows = np.empty(count, dtype=np.int64)
+        closes = np.empty(count, dtype=np.int64)
+        volumes = np.empty(count, dtype=np.uint64)
+        ts_events = np.empty(count, dtype=np.uint64)
+        ts_inits = np.empty(count, dtype=np.uint64)
+
+        cdef:
+            int64_t[::1] opens_view = opens
+            int64_t[::1] highs_view = highs
+            int64_t[::1] lows_view = lows
+            int64_t[::1] closes_view = closes
+            uint64_t[::1] volumes_view = volumes
+            uint64_t[::1] ts_events_view = ts_events
+            uint64_t[::1] ts_inits_view = ts_inits
+            Py_ssize_t i
+            Bar bar
+        for i in range(count):
+            bar = bars[i]
+            Condition.equal(bar.bar_type, first.bar_type, "bar.bar_type", "first.bar_type")
+            opens_view[i] = bar._mem.open.raw
+            highs_view[i] = bar._mem.high.raw
+            lows_view[i] = bar._mem.low.raw
+            closes_view[i] = bar._mem.close.raw
+            volumes_view[i] = bar._mem.volume.raw
+            ts_events_view[i] = bar._mem.ts_event
+            ts_inits_view[i] = bar._mem.ts_init
+
+        return BarColumns(
+            bar_type=first.bar_type,
+            price_precision=first._mem.open.precision,
+            size_precision=first._mem.volume.precision,
+            opens=opens,
+            highs=highs,
+            lows=lows,
+            closes=closes,
+            volumes=volumes,
+            ts_events=ts_events,
+            ts_inits=ts_inits,
+        )
+
+    @staticmethod
+    def from_dataframe(
+        BarType bar_type not None,
+        Instrument instrument not None,
+        data: pd.DataFrame,
+        default_volume: float = 1_000_000.0,
+        ts_init_delta: int = 0,
+    ) -> BarColumns:
+        """
+        Return columns built from the given bar dataset, without creating `Bar` objects.
+
+        Expects columns ['open', 'high', 'low', 'close', 'volume'] with 'timestamp' index
+        (as per `BarDataWrangler`). The 'volume' column is optional, if one does not exist
+        then will use the `default_volume`.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the columns.
+        instrument : Instrument
+            The instrument for the bars (provides the price and size precisions).
+        data : pd.DataFrame
+            The data to process.
+        default_volume : float
+            The default volume for each bar (if not provided).
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value.
+
+        Returns
+        -------
+        BarColumns
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.false(data.empty, "data.empty")
+
+        data = as_utc_index(data)
+
+        cdef uint8_t price_prec = instrument.price_precision
+        cdef uint8_t size_prec = instrument.size_precision
+
+        if "volume" in data:
+            volumes = data["volume"].to_numpy(dtype=np.float64)
+        else:
+            volumes = np.full(len(data), float(default_volume), dtype=np.float64)
+
+        ts_events, ts_inits = prepare_event_and_init_timestamps(data.index, ts_init_delta)
+
+        return BarColumns(
+            bar_type=bar_type,
+            price_precision=price_prec,
+            size_precision=size_prec,
+            opens=_to_raw(data["open"].to_numpy(dtype=np.float64), price_prec).astype(np.int64),
+            highs=_to_raw(data["high"].to_numpy(dtype=np.float64), price_prec).astype(np.int64),
+            lows=_to_raw(data["low"].to_numpy(dtype=np.float64), price_prec).astype(np.int64),
+            closes=_to_raw(data["close"].to_numpy(dtype=np.float64), price_prec).astype(np.int64),
+            volumes=_to_raw(volumes, size_prec).astype(np.uint64),
+            ts_events=ts_events,
+            ts_inits=ts_inits,
+        )
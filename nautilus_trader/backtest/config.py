@@ -221,6 +221,13 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
         If logging should be bypassed.
     run_analysis : bool, default True
         If post backtest performance analysis should be run.
+    profile : bool, default False
+        If wall time should be profiled per component (data engine, venues, time event
+        callbacks and message bus handlers). Adds overhead to every event when enabled.
+    incremental_statistics : bool, default False
+        If portfolio statistics should be updated incrementally as positions close
+        during a run (see `BacktestEngine.statistics`). Also enabled by setting a stop
+        condition with `BacktestEngine.set_stop_condition`.
 
     """
 
@@ -230,6 +237,8 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
     risk_engine: RiskEngineConfig = RiskEngineConfig()
     exec_engine: ExecEngineConfig = ExecEngineConfig()
     run_analysis: bool = True
+    profile: bool = False
+    incremental_statistics: bool = False
 
 
 class BacktestRunConfig(NautilusConfig, frozen=True):
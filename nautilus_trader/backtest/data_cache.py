@@ -0,0 +1,279 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+import pickle
+from collections.abc import Generator
+from pathlib import Path
+
+import msgspec
+import pyarrow as pa
+
+from nautilus_trader.common.config import resolve_path
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+
+# Data types which are written as Arrow IPC files (decoded through the Rust wranglers),
+# all other data types are written as pickled lists.
+ARROW_IPC_DATA_TYPES: tuple[type, ...] = (OrderBookDelta, QuoteTick, TradeTick, Bar)
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+class DataCacheEntry(msgspec.Struct, frozen=True):
+    """
+    Represents a single file of time-ordered data within a backtest data cache.
+    """
+
+    name: str
+    filename: str
+    data_cls: str
+    is_arrow: bool
+    count: int
+    ts_init_first: int
+    ts_init_last: int
+
+
+class DataCacheManifest(msgspec.Struct, frozen=True):
+    """
+    Represents the manifest of files within a backtest data cache.
+    """
+
+    version: int
+    entries: list[DataCacheEntry]
+
+
+class DataCacheSource:
+    """
+    Provides a re-iterable data source over a single file of a backtest data cache.
+
+    Arrow IPC files are memory-mapped and decoded one record batch at a time as the
+    source is iterated, so only a single batch of objects is held in memory per source.
+
+    Parameters
+    ----------
+    path : Path
+        The directory of the data cache.
+    entry : DataCacheEntry
+        The manifest entry for the file.
+
+    """
+
+    def __init__(self, path: Path, entry: DataCacheEntry) -> None:
+        self._file = Path(path) / entry.filename
+        self._data_cls: type = resolve_path(entry.data_cls)
+        self.entry = entry
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.entry.name}, count={self.entry.count})"
+
+    def __len__(self) -> int:
+        return self.entry.count
+
+    def __iter__(self) -> Generator[list[Data], None, None]:
+        if not self.entry.is_arrow:
+            with open(self._file, "rb") as f:
+                yield pickle.load(f)  # noqa: S301 (written by `write_data_cache`)
+            return
+
+        with pa.memory_map(str(self._file), "r") as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                table = pa.Table.from_batches([reader.get_batch(i)], schema=reader.schema)
+                pyo3_data = ArrowSerializer.deserialize(data_cls=self._data_cls, batch=table)
+                del table  # Release references to the mapped buffer prior to closing
+                yield self._data_cls.from_pyo3_list(pyo3_data)
+
+    @property
+    def name(self) -> str:
+        """
+        Return the name of the source.
+
+        Returns
+        -------
+        str
+
+        """
+        return self.entry.name
+
+    @property
+    def data_cls(self) -> type:
+        """
+        Return the data type of the source.
+
+        Returns
+        -------
+        type
+
+        """
+        return self._data_cls
+
+    @property
+    def ts_init_first(self) -> int:
+        """
+        Return the first `ts_init` in the source.
+
+        Returns
+        -------
+        int
+
+        """
+        return self.entry.ts_init_first
+
+    @property
+    def ts_init_last(self) -> int:
+        """
+        Return the last `ts_init` in the source.
+
+        Returns
+        -------
+        int
+
+        """
+        return self.entry.ts_init_last
+
+
+def _group_name(data: Data) -> str:
+    if isinstance(data, Bar):
+        return f"{type(data).__name__}-{data.bar_type}"
+    instrument_id = getattr(data, "instrument_id", None)
+    if instrument_id is not None:
+        return f"{type(data).__name__}-{instrument_id}"
+    return type(data).__name__
+
+
+def write_data_cache(
+    data: list[Data],
+    path: os.PathLike[str] | str,
+    batch_size: int = 10_000,
+) -> list[DataCacheEntry]:
+    """
+    Write the given time-ordered data to a backtest data cache directory.
+
+    The data is split into one file per data type and instrument (or bar type).
+    Arrow IPC data types are written as Arrow IPC files with record batches of up to
+    `batch_size` rows, all other data types are written as pickled lists.
+
+    Parameters
+    ----------
+    data : list[Data]
+        The data to write (must be sorted by `ts_init`).
+    path : PathLike[str] | str
+        The directory to write the cache to (will be created if it does not exist).
+    batch_size : int, default 10_000
+        The maximum number of rows per Arrow record batch (the decoding granularity).
+
+    Returns
+    -------
+    list[DataCacheEntry]
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty.
+    ValueError
+        If `batch_size` is not positive (> 0).
+    FileExistsError
+        If a data cache manifest already exists at `path`.
+
+    """
+    PyCondition.not_empty(data, "data")
+    PyCondition.positive_int(batch_size, "batch_size")
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    manifest_file = path / MANIFEST_FILENAME
+    if manifest_file.exists():
+        raise FileExistsError(f"Data cache already exists at {path}")
+
+    groups: dict[str, list[Data]] = {}
+    for obj in data:
+        groups.setdefault(_group_name(obj), []).append(obj)
+
+    entries: list[DataCacheEntry] = []
+    for i, (name, group) in enumerate(groups.items()):
+        data_cls = type(group[0])
+        is_arrow = data_cls in ARROW_IPC_DATA_TYPES
+        filename = f"{i:04d}.{'arrow' if is_arrow else 'pkl'}"
+        if is_arrow:
+            table: pa.Table = ArrowSerializer.serialize_batch(group, data_cls=data_cls)
+            with pa.OSFile(str(path / filename), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=batch_size)
+        else:
+            with open(path / filename, "wb") as f:
+                pickle.dump(group, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        entries.append(
+            DataCacheEntry(
+                name=name,
+                filename=filename,
+                data_cls=f"{data_cls.__module__}:{data_cls.__qualname__}",
+                is_arrow=is_arrow,
+                count=len(group),
+                ts_init_first=group[0].ts_init,
+                ts_init_last=group[-1].ts_init,
+            ),
+        )
+
+    # Write manifest last, so an interrupted write is not mistaken for a complete cache
+    manifest = DataCacheManifest(version=MANIFEST_VERSION, entries=entries)
+    manifest_file.write_bytes(msgspec.json.encode(manifest))
+
+    return entries
+
+
+def open_data_cache(path: os.PathLike[str] | str) -> list[DataCacheSource]:
+    """
+    Open the backtest data cache at the given directory.
+
+    No data is read until the returned sources are iterated.
+
+    Parameters
+    ----------
+    path : PathLike[str] | str
+        The directory of the data cache.
+
+    Returns
+    -------
+    list[DataCacheSource]
+
+    Raises
+    ------
+    FileNotFoundError
+        If no data cache manifest exists at `path`.
+    ValueError
+        If the data cache manifest version is not supported.
+
+    """
+    path = Path(path)
+    manifest = msgspec.json.decode(
+        (path / MANIFEST_FILENAME).read_bytes(),
+        type=DataCacheManifest,
+    )
+    PyCondition.equal(
+        manifest.version,
+        MANIFEST_VERSION,
+        "manifest.version",
+        "MANIFEST_VERSION",
+    )
+    return [DataCacheSource(path, entry) for entry in manifest.entries]
@@ -14,11 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.backtest.columns cimport BarColumns
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.backtest cimport TimeEventAccumulatorAPI
 from nautilus_trader.core.rust.core cimport CVec
@@ -26,6 +29,46 @@ from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.engine cimport DataEngine
 
 
+cdef class BacktestDataStream:
+    cdef object _source
+    cdef object _iterator
+    cdef list _chunk
+    cdef Py_ssize_t _cursor
+    cdef int _chunk_size
+
+    cdef readonly str name
+    """The name of the data stream.\n\n:returns: `str`"""
+    cdef readonly int priority
+    """The priority of the stream when breaking `ts_init` ties (lower is first).\n\n:returns: `int`"""
+    cdef readonly bint is_rewindable
+    """If the stream can be rewound to its start.\n\n:returns: `bool`"""
+    cdef readonly Data head
+    """The next data element to be yielded by the stream.\n\n:returns: `Data` or ``None``"""
+
+    cdef void rewind(self)
+    cdef int64_t seek(self, uint64_t ts_ns)
+    cdef Data next_c(self)
+    cdef list _pull_chunk(self)
+
+
+cdef class BarColumnsStream(BacktestDataStream):
+    cdef BarColumns _columns
+
+
+cdef class BacktestDataIterator:
+    cdef dict[str, BacktestDataStream] _streams
+    cdef list _heap
+    cdef int _next_priority
+    cdef int _chunk_size
+
+    cdef void _push(self, BacktestDataStream stream)
+    cdef void _rebuild_heap(self)
+    cdef Data next_c(self)
+    cdef int64_t seek_c(self, uint64_t ts_ns)
+    cdef uint64_t peek_ts_init(self)
+    cdef bint is_done_c(self)
+
+
 cdef class BacktestEngine:
     cdef object _config
     cdef Clock _clock
@@ -35,6 +78,10 @@ cdef class BacktestEngine:
     cdef object _kernel
     cdef UUID4 _instance_id
     cdef DataEngine _data_engine
+    cdef Profiler _profiler
+    cdef object _statistics
+    cdef object _stop_condition
+    cdef bint _stop_requested
     cdef str _run_config_id
     cdef UUID4 _run_id
     cdef datetime _run_started
@@ -43,12 +90,15 @@ cdef class BacktestEngine:
     cdef datetime _backtest_end
 
     cdef dict[Venue, SimulatedExchange] _venues
-    cdef list[Data] _data
-    cdef uint64_t _data_len
-    cdef uint64_t _index
+    cdef list[SimulatedExchange] _exchanges
+    cdef dict[type, int] _dispatch_table
+    cdef BacktestDataIterator _data_iterator
+    cdef uint64_t _last_data_ns
     cdef uint64_t _iteration
 
-    cdef Data _next(self)
+    cdef Data _next(self, uint64_t end_ns)
+    cdef int _data_kind(self, Data data)
+    cdef void _process_exchanges(self, uint64_t ts_now)
     cdef CVec _advance_time(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
@@ -56,3 +106,4 @@ cdef class BacktestEngine:
         uint64_t ts_now,
         bint only_now,
     )
+
@@ -13,12 +13,21 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
+import multiprocessing
+import os
 import pickle
+import tempfile
+from collections.abc import Callable
 from decimal import Decimal
+from typing import Any
 
 import pandas as pd
 
 from nautilus_trader.accounting.error import AccountError
+from nautilus_trader.analysis.incremental import IncrementalStatistics
+from nautilus_trader.backtest.data_cache import open_data_cache
+from nautilus_trader.backtest.data_cache import write_data_cache
 from nautilus_trader.backtest.results import BacktestResult
 from nautilus_trader.common import Environment
 from nautilus_trader.common.component import is_logging_pyo3
@@ -35,8 +44,11 @@ from nautilus_trader.trading.trader import Trader
 
 from cpython.datetime cimport datetime
 from cpython.object cimport PyObject
+from libc.stdint cimport UINT64_MAX
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.backtest.columns cimport BarColumns
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
 from nautilus_trader.backtest.data_client cimport BacktestMarketDataClient
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
@@ -59,6 +71,7 @@ from nautilus_trader.common.component cimport log_sysinfo
 from nautilus_trader.common.component cimport set_logging_clock_realtime_mode
 from nautilus_trader.common.component cimport set_logging_clock_static_mode
 from nautilus_trader.common.component cimport set_logging_clock_static_time
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport maybe_dt_to_unix_nanos
@@ -85,6 +98,7 @@ from nautilus_trader.model.data cimport OrderBookDelta
 from nautilus_trader.model.data cimport OrderBookDeltas
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.events.position cimport PositionClosed
 from nautilus_trader.model.identifiers cimport ClientId
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport TraderId
@@ -129,9 +143,17 @@ cdef class BacktestEngine:
 
         # Venues and data
         self._venues: dict[Venue, SimulatedExchange] = {}
-        self._data: list[Data] = []
-        self._data_len: uint64_t = 0
-        self._index: uint64_t = 0
+        self._data_iterator = BacktestDataIterator()
+        self._last_data_ns: uint64_t = 0
+        self._exchanges: list[SimulatedExchange] = []
+        self._dispatch_table: dict[type, int] = {
+            OrderBookDelta: DATA_KIND_ORDER_BOOK_DELTA,
+            OrderBookDeltas: DATA_KIND_ORDER_BOOK_DELTAS,
+            QuoteTick: DATA_KIND_QUOTE_TICK,
+            TradeTick: DATA_KIND_TRADE_TICK,
+            Bar: DATA_KIND_BAR,
+            InstrumentStatus: DATA_KIND_INSTRUMENT_STATUS,
+        }
         self._iteration: uint64_t = 0
 
         # Timing
@@ -147,6 +169,19 @@ cdef class BacktestEngine:
 
         self._data_engine: DataEngine = self._kernel.data_engine
 
+        # Profiling (opt-in)
+        self._profiler: Profiler | None = None
+        if config.profile:
+            self._profiler = Profiler()
+            self._kernel.msgbus.set_profiler(self._profiler)
+
+        # Incremental statistics (opt-in, updated as positions close) and early stopping
+        self._statistics = None
+        self._stop_condition = None
+        self._stop_requested = False
+        if config.incremental_statistics:
+            self._enable_statistics()
+
     def __del__(self) -> None:
         if self._accumulator._0 != NULL:
             time_event_accumulator_drop(self._accumulator)
@@ -326,12 +361,27 @@ cdef class BacktestEngine:
         """
         Return the engines internal data stream.
 
+        Only data added as lists is included (iterable data streams are not listed,
+        as this would consume them).
+
         Returns
         -------
         list[Data]
 
         """
-        return self._data.copy()
+        return self._data_iterator.data()
+
+    @property
+    def data_iterator(self) -> BacktestDataIterator:
+        """
+        Return the engines internal data iterator.
+
+        Returns
+        -------
+        BacktestDataIterator
+
+        """
+        return self._data_iterator
 
     @property
     def portfolio(self) -> PortfolioFacade:
@@ -345,6 +395,104 @@ cdef class BacktestEngine:
         """
         return self._kernel.portfolio
 
+    @property
+    def profiler(self) -> Profiler | None:
+        """
+        Return the engines profiler (if profiling is enabled).
+
+        Returns
+        -------
+        Profiler or ``None``
+
+        """
+        return self._profiler
+
+    @property
+    def statistics(self) -> IncrementalStatistics | None:
+        """
+        Return the engines incremental portfolio statistics.
+
+        The statistics are updated as positions close during a run, and are reset
+        along with the engine.
+
+        Returns
+        -------
+        IncrementalStatistics or ``None``
+            ``None`` if incremental statistics are not enabled (see
+            `BacktestEngineConfig.incremental_statistics` and `set_stop_condition`).
+
+        """
+        return self._statistics
+
+    @property
+    def stop_requested(self) -> bool:
+        """
+        Return whether the stop condition has been met, halting the backtest.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._stop_requested
+
+    def set_stop_condition(
+        self,
+        condition: Callable[[IncrementalStatistics], bool] | None,
+    ) -> None:
+        """
+        Set the stop condition for halting backtest runs early.
+
+        The condition is evaluated with the engines incremental statistics each time a
+        position closes (setting a condition enables the statistics, so it should be set
+        before running). When it returns ``True`` the main loop stops after the current
+        data element, and the run then ends as normal (including post-run analysis).
+        The engine will not process further data until it is `reset()`.
+
+        Parameters
+        ----------
+        condition : Callable[[IncrementalStatistics], bool], optional
+            The stop condition. If ``None`` then any existing condition is removed.
+
+        Examples
+        --------
+        Stop when the max drawdown exceeds 10% of the starting balance:
+
+        >>> engine.set_stop_condition(lambda stats: stats.max_drawdown_pct() > 0.10)
+
+        """
+        if condition is not None:
+            Condition.callable(condition, "condition")
+            self._enable_statistics()
+
+        self._stop_condition = condition
+
+    def _enable_statistics(self) -> None:
+        if self._statistics is not None:
+            return  # Already enabled
+
+        self._statistics = IncrementalStatistics()
+        self._kernel.msgbus.subscribe(
+            topic="events.position.*",
+            handler=self._handle_position_event,
+        )
+
+    def _handle_position_event(self, event) -> None:
+        if not isinstance(event, PositionClosed):
+            return
+
+        cdef PositionClosed closed = <PositionClosed>event
+        self._statistics.update(closed.realized_pnl, closed.realized_return, closed.ts_closed)
+
+        if self._stop_condition is None or self._stop_requested:
+            return
+
+        if self._stop_condition(self._statistics):
+            self._stop_requested = True
+            self._log.warning(
+                f"Stop condition met at {unix_nanos_to_dt(closed.ts_closed)}, stopping backtest",
+            )
+
     def list_venues(self) -> list[Venue]:
         """
         Return the venues contained within the engine.
@@ -579,6 +727,9 @@ cdef class BacktestEngine:
         """
         Add the given custom data to the backtest engine.
 
+        Each call adds `data` as a separate stream, which is merged with all other
+        streams by `ts_init` as the backtest runs.
+
         Parameters
         ----------
         data : list[Data]
@@ -589,7 +740,7 @@ cdef class BacktestEngine:
             If `data` should be validated
             (recommended when adding data directly to the engine).
         sort : bool, default True
-            If `data` should be sorted by `ts_init` with the rest of the stream after adding
+            If `data` should be sorted by `ts_init` before being added as a stream
             (recommended when adding data directly to the engine).
 
         Raises
@@ -624,49 +775,120 @@ cdef class BacktestEngine:
             )
 
         cdef str data_added_str = "data"
-
         if validate:
-            first = data[0]
+            data_added_str = self._validate_data(data[0], client_id)
 
-            if hasattr(first, "instrument_id"):
-                Condition.true(
-                    first.instrument_id in self.kernel.cache.instrument_ids(),
-                    f"`Instrument` {first.instrument_id} for the given data not found in the cache. "
-                    "Add the instrument through `add_instrument()` prior to adding related data.",
-                )
-                # Check client has been registered
-                self._add_market_data_client_if_not_exists(first.instrument_id.venue)
-                data_added_str = f"{first.instrument_id} {type(first).__name__}"
-            elif isinstance(first, Bar):
-                Condition.true(
-                    first.bar_type.instrument_id in self.kernel.cache.instrument_ids(),
-                    f"`Instrument` {first.bar_type.instrument_id} for the given data not found in the cache. "
-                    "Add the instrument through `add_instrument()` prior to adding related data.",
-                )
-                Condition.equal(
-                    first.bar_type.aggregation_source,
-                    AggregationSource.EXTERNAL,
-                    "bar_type.aggregation_source",
-                    "required source",
-                )
-                data_added_str = f"{first.bar_type} {type(first).__name__}"
-            else:
-                Condition.not_none(client_id, "client_id")
-                # Check client has been registered
-                self._add_data_client_if_not_exists(client_id)
-                if isinstance(first, CustomData):
-                    data_added_str = f"{type(first.data).__name__} "
+        if sort:
+            data = sorted(data, key=lambda x: x.ts_init)
 
         # Add data
-        self._data.extend(data)
-
-        if sort:
-            self._data = sorted(self._data, key=lambda x: x.ts_init)
+        self._data_iterator.add_stream(self._next_stream_name(), data)
 
         self._log.info(
             f"Added {len(data):,} {data_added_str} element{'' if len(data) == 1 else 's'}",
         )
 
+    def add_data_stream(
+        self,
+        data,
+        str name = None,
+        ClientId client_id = None,
+        bint validate = True,
+    ) -> None:
+        """
+        Add the given time-ordered data stream to the backtest engine.
+
+        Unlike `add_data`, the stream is not materialized up front. Elements are pulled
+        from `data` in chunks and merged with all other streams by `ts_init` as the backtest
+        runs, bounding memory by the number of streams rather than the total event count.
+
+        Parameters
+        ----------
+        data : Iterable[Data | list[Data]] or BarColumns
+            The time-ordered data stream to add (such as a generator of data chunks
+            from a catalog query). `BarColumns` keep bars in columnar form, with each
+            `Bar` only materialized as the backtest reaches its row.
+        name : str, optional
+            The unique name for the stream. If ``None`` then a name will be generated.
+        client_id : ClientId, optional
+            The data client ID to associate with custom data.
+        validate : bool, default True
+            If the first element of the stream should be validated.
+
+        Raises
+        ------
+        ValueError
+            If a stream with `name` has already been added.
+        ValueError
+            If the first element of the stream fails validation.
+
+        Warnings
+        --------
+        The stream must already be sorted by `ts_init` (this is not checked).
+
+        One-shot iterators (such as generators) cannot be rewound, so will be consumed
+        by the first run of the engine.
+
+        """
+        Condition.not_none(data, "data")
+
+        if name is None:
+            name = self._next_stream_name()
+
+        cdef BacktestDataStream stream = self._data_iterator.add_stream(name, data)
+
+        cdef str data_added_str = "data"
+        if validate and stream.head is not None:
+            try:
+                data_added_str = self._validate_data(stream.head, client_id)
+            except Exception:
+                self._data_iterator.remove_stream(name)
+                raise
+
+        self._log.info(f"Added {data_added_str} stream '{name}'")
+
+    def _next_stream_name(self) -> str:
+        cdef int n = len(self._data_iterator.stream_names)
+        cdef str name = f"data-{n}"
+        while self._data_iterator.get_stream(name) is not None:
+            n += 1
+            name = f"data-{n}"
+        return name
+
+    def _validate_data(self, Data first, ClientId client_id) -> str:
+        cdef str data_added_str = "data"
+
+        if hasattr(first, "instrument_id"):
+            Condition.true(
+                first.instrument_id in self.kernel.cache.instrument_ids(),
+                f"`Instrument` {first.instrument_id} for the given data not found in the cache. "
+                "Add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            # Check client has been registered
+            self._add_market_data_client_if_not_exists(first.instrument_id.venue)
+            data_added_str = f"{first.instrument_id} {type(first).__name__}"
+        elif isinstance(first, Bar):
+            Condition.true(
+                first.bar_type.instrument_id in self.kernel.cache.instrument_ids(),
+                f"`Instrument` {first.bar_type.instrument_id} for the given data not found in the cache. "
+                "Add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            Condition.equal(
+                first.bar_type.aggregation_source,
+                AggregationSource.EXTERNAL,
+                "bar_type.aggregation_source",
+                "required source",
+            )
+            data_added_str = f"{first.bar_type} {type(first).__name__}"
+        else:
+            Condition.not_none(client_id, "client_id")
+            # Check client has been registered
+            self._add_data_client_if_not_exists(client_id)
+            if isinstance(first, CustomData):
+                data_added_str = f"{type(first.data).__name__} "
+
+        return data_added_str
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -676,7 +898,7 @@ cdef class BacktestEngine:
         bytes
 
         """
-        return pickle.dumps(self._data)
+        return pickle.dumps(self._data_iterator.data())
 
     def load_pickled_data(self, bytes data) -> None:
         """
@@ -696,11 +918,86 @@ cdef class BacktestEngine:
         """
         Condition.not_none(data, "data")
 
-        self._data = pickle.loads(data)
+        cdef list loaded = pickle.loads(data)
+
+        self._data_iterator.clear()
+        self._data_iterator.add_stream(self._next_stream_name(), loaded)
 
         self._log.info(
-            f"Loaded {len(self._data):,} data "
-            f"element{'' if len(data) == 1 else 's'} from pickle",
+            f"Loaded {len(loaded):,} data "
+            f"element{'' if len(loaded) == 1 else 's'} from pickle",
+        )
+
+    def dump_arrow_data(self, path: os.PathLike[str] | str, int batch_size = 10_000) -> None:
+        """
+        Write the internal data to an on-disk data cache at the given directory.
+
+        Market data (order book deltas, quotes, trades and bars) is written as Arrow IPC
+        files per instrument (or bar type), all other data is pickled. The cache can be
+        reopened with `load_arrow_data` from any process, avoiding re-wrangling the data.
+
+        Parameters
+        ----------
+        path : PathLike[str] | str
+            The directory to write the data cache to.
+        batch_size : int, default 10_000
+            The maximum number of rows per Arrow record batch (the decoding granularity).
+
+        Raises
+        ------
+        ValueError
+            If the engine has no list-backed or columnar data.
+        FileExistsError
+            If a data cache already exists at `path`.
+
+        """
+        cdef list data = self._data_iterator.data()
+        Condition.not_empty(data, "data")
+
+        cdef list entries = write_data_cache(data, path, batch_size=batch_size)
+
+        self._log.info(
+            f"Wrote {len(data):,} data "
+            f"element{'' if len(data) == 1 else 's'} to {len(entries)} "
+            f"file{'' if len(entries) == 1 else 's'} at {path}",
+        )
+
+    def load_arrow_data(self, path: os.PathLike[str] | str) -> None:
+        """
+        Load the data cache at the given directory into the internal data streams.
+
+        Each file of the cache is added as a separate stream, with Arrow IPC files
+        memory-mapped and decoded one record batch at a time as the backtest runs
+        (rather than decoding all data up front). The streams can be rewound, so the
+        engine can be `reset()` and run again.
+
+        Parameters
+        ----------
+        path : PathLike[str] | str
+            The directory of the data cache (written by `dump_arrow_data`).
+
+        Raises
+        ------
+        FileNotFoundError
+            If no data cache exists at `path`.
+
+        Warnings
+        --------
+        This low-level direct access method makes the following assumptions:
+         - The data cache was written by a call to `.dump_arrow_data()`.
+         - All required instruments have been added to the engine.
+
+        """
+        cdef list sources = open_data_cache(path)
+
+        self._data_iterator.clear()
+        for source in sources:
+            self._data_iterator.add_stream(source.name, source)
+
+        cdef uint64_t count = sum([len(source) for source in sources])
+        self._log.info(
+            f"Loaded {count:,} data "
+            f"element{'' if count == 1 else 's'} from {path}",
         )
 
     def add_actor(self, actor: Actor) -> None:
@@ -826,9 +1123,19 @@ cdef class BacktestEngine:
         self._run_config_id = None
         self._run_id = None
 
+        # Rewind data streams to their start
+        self._data_iterator.reset()
+
+        if self._profiler is not None:
+            self._profiler.reset()
+
+        if self._statistics is not None:
+            self._statistics.reset()
+        self._stop_requested = False
+
         # Reset timing
         self._iteration = 0
-        self._index = 0
+        self._last_data_ns = 0
         self._run_started = None
         self._run_finished = None
         self._backtest_start = None
@@ -843,9 +1150,8 @@ cdef class BacktestEngine:
         Does not clear added instruments.
 
         """
-        self._data.clear()
-        self._data_len = 0
-        self._index = 0
+        self._data_iterator.clear()
+        self._last_data_ns = 0
 
     def clear_actors(self) -> None:
         """
@@ -904,8 +1210,10 @@ cdef class BacktestEngine:
         Parameters
         ----------
         start : datetime or str or int, optional
-            The start datetime (UTC) for the backtest run.
-            If ``None`` engine runs from the start of the data.
+            The start datetime (UTC) for the backtest run. If before data which has
+            already been run, then the data streams are rewound and seek to `start`.
+            If ``None`` engine runs from the next data (the start of the data, or
+            continuing from where the previous run ended if not `reset()`).
         end : datetime or str or int, optional
             The end datetime (UTC) for the backtest run.
             If ``None`` engine runs to the end of the data.
@@ -918,9 +1226,13 @@ cdef class BacktestEngine:
         Raises
         ------
         ValueError
-            If no data has been added to the engine.
+            If there is no data to run (no data has been added to the engine, or all
+            data has been run and `start` is ``None``).
         ValueError
             If the `start` is >= the `end` datetime.
+        ValueError
+            If the `start` is before data which has already been run, and the data
+            streams cannot be rewound (such as generators).
 
         """
         self._run(start, end, run_config_id)
@@ -962,6 +1274,161 @@ cdef class BacktestEngine:
 
         self._log_post_run()
 
+    def fork(self, callback: Callable[[BacktestEngine], Any]) -> Any:
+        """
+        Call the given callback with a copy-on-write fork of the engine in its current
+        state, returning the callbacks result.
+
+        This allows a warmed-up engine (such as after `run(end=..., streaming=True)`) to be
+        used as a checkpoint which variants branch from, without replaying data from the start.
+        The fork is a child process with a complete copy of the engines state (cache, portfolio,
+        accounts, matching engines, clocks, data cursor, actors and strategies), so any changes
+        made by the callback do not affect this engine.
+
+        Parameters
+        ----------
+        callback : Callable[[BacktestEngine], Any]
+            The callback to call with the forked engine (for instance to continue the run
+            and return `get_result()`). The return value must be picklable.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        RuntimeError
+            If the platform does not support forking processes, or the multiprocessing
+            start method is not 'fork'.
+        Exception
+            Any exception raised by `callback` in the forked process.
+
+        Warnings
+        --------
+        Forking a process with other live threads is unsafe, as only the calling thread is
+        copied into the fork (locks held by other threads are never released). Forking must
+        be opted into by setting the multiprocessing start method to 'fork', and should only
+        be used when no other threads are running (such as a Rust logging writer thread, so
+        use the Cython logging system). Otherwise use `BacktestNode.run_parallel`, which
+        spawns fresh worker processes.
+
+        Only iterable data streams which are not shared with other processes should be used
+        with forking (list data and catalog query results are safe).
+
+        """
+        return self.fork_map(lambda engine, _: callback(engine), [None])[0]
+
+    def fork_map(
+        self,
+        callback: Callable[[BacktestEngine, Any], Any],
+        args: list[Any],
+        max_workers: int | None = None,
+    ) -> list[Any]:
+        """
+        Call the given callback with a copy-on-write fork of the engine in its current
+        state for each of the given arguments, returning the results in order.
+
+        Parameters
+        ----------
+        callback : Callable[[BacktestEngine, Any], Any]
+            The callback to call with each forked engine and argument.
+            The return value must be picklable.
+        args : list[Any]
+            The arguments for each fork (such as strategy parameter variants).
+        max_workers : int, optional
+            The maximum number of concurrent forks. If ``None`` then will use the
+            number of processors on the machine.
+
+        Returns
+        -------
+        list[Any]
+
+        Raises
+        ------
+        RuntimeError
+            If the platform does not support forking processes, or the multiprocessing
+            start method is not 'fork'.
+        Exception
+            The first exception raised by `callback` in a forked process (all forks
+            are completed first).
+
+        Warnings
+        --------
+        See `fork` for when forking an engine is safe.
+
+        """
+        Condition.not_none(callback, "callback")
+        Condition.not_none(args, "args")
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Forking a `BacktestEngine` is not supported on this platform")
+        if multiprocessing.get_start_method() != "fork":
+            raise RuntimeError(
+                "Forking a `BacktestEngine` requires the 'fork' multiprocessing start method "
+                "(opt in with `multiprocessing.set_start_method('fork')`)",
+            )
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        Condition.positive_int(max_workers, "max_workers")
+
+        cdef list results = [None] * len(args)
+        cdef list errors = [None] * len(args)
+        cdef dict running = {}  # pid -> (index, path)
+        cdef int next_index = 0
+        cdef int index
+        cdef str path
+
+        while next_index < len(args) or running:
+            while next_index < len(args) and len(running) < max_workers:
+                fd, path = tempfile.mkstemp(prefix="nautilus-fork-")
+                os.close(fd)
+                pid = os.fork()
+                if pid == 0:
+                    _run_forked_callback(self, callback, args[next_index], path)
+                running[pid] = (next_index, path)
+                next_index += 1
+
+            # Wait on the oldest fork (only reaping the forks created here)
+            pid = next(iter(running))
+            os.waitpid(pid, 0)
+            index, path = running.pop(pid)
+            try:
+                with open(path, "rb") as f:
+                    ok, value = pickle.load(f)
+            except Exception as e:  # Forked process exited without writing its result
+                ok, value = False, RuntimeError(f"Forked engine process failed: {e!r}")
+            finally:
+                os.remove(path)
+
+            if ok:
+                results[index] = value
+            else:
+                errors[index] = value
+
+        for error in errors:
+            if error is not None:
+                raise error
+
+        return results
+
+    def get_profile_report(self) -> pd.DataFrame | None:
+        """
+        Return the profile report of wall time per component from the last run.
+
+        The data engine, each simulated venue, time event callbacks and each message bus
+        subscription handler (such as actor and strategy `handle_*` methods) are reported
+        separately, ordered by self time descending.
+
+        Returns
+        -------
+        pd.DataFrame or ``None``
+            ``None`` if profiling is not enabled (see `BacktestEngineConfig.profile`).
+
+        """
+        if self._profiler is None:
+            return None
+        return self._profiler.report()
+
     def get_result(self):
         """
         Return the backtest result from the last run.
@@ -987,14 +1454,103 @@ cdef class BacktestEngine:
             backtest_start=maybe_dt_to_unix_nanos(self._backtest_start),
             backtest_end=maybe_dt_to_unix_nanos(self._backtest_end),
             elapsed_time=(self._backtest_end - self._backtest_start).total_seconds(),
-            iterations=self._index,
+            iterations=self._iteration,
             total_events=self._kernel.exec_engine.event_count,
             total_orders=self._kernel.cache.orders_total_count(),
             total_positions=self._kernel.cache.positions_total_count(),
             stats_pnls=stats_pnls,
             stats_returns=self._kernel.portfolio.analyzer.get_performance_stats_returns(),
+            profile=self._profiler.report().to_dict(orient="index") if self._profiler is not None else None,
+            stopped_early=self._stop_requested,
+            stats_incremental=self._statistics.snapshot() if self._statistics is not None else None,
         )
 
+    def run_walk_forward(
+        self,
+        windows: list[tuple[datetime | str | int, datetime | str | int]],
+        bint carry_state = False,
+    ) -> list[BacktestResult]:
+        """
+        Run a walk-forward backtest over the given time windows, returning a result
+        for each window.
+
+        Each window seeks directly to its start (binary searching the data streams),
+        rather than iterating all preceding data.
+
+        If `carry_state` is False then the engine is reset between windows, so each
+        window is run independently from the start of its window. Otherwise the
+        engine state (orders, positions, account balances) is carried over from one
+        window into the next, with the backtest ended following the final window.
+
+        Parameters
+        ----------
+        windows : list[tuple[datetime | str | int, datetime | str | int]]
+            The (start, end) datetimes (UTC) for each window.
+        carry_state : bool, default False
+            If the engine state should be carried over between windows.
+
+        Returns
+        -------
+        list[BacktestResult]
+
+        Raises
+        ------
+        ValueError
+            If `windows` is empty.
+        ValueError
+            If `carry_state` and the `windows` are not sorted and non-overlapping.
+
+        Notes
+        -----
+        When carrying state the `stats_incremental` of each result covers the positions
+        closed within its window, whereas the portfolio analyzer statistics (`stats_pnls`
+        and `stats_returns`) are only calculated when the backtest ends following the
+        final window. Data at a boundary shared by two windows is only run in the first
+        of them.
+
+        """
+        Condition.not_empty(windows, "windows")
+
+        cdef list bounds = [
+            (pd.to_datetime(start, utc=True), pd.to_datetime(end, utc=True))
+            for start, end in windows
+        ]
+        cdef int i
+        if carry_state:
+            for i in range(1, len(bounds)):
+                Condition.true(
+                    bounds[i][0] >= bounds[i - 1][1],
+                    "windows were not sorted and non-overlapping",
+                )
+
+        cdef list results = []
+        for i, (start, end) in enumerate(bounds):
+            if not carry_state:
+                if i > 0:
+                    self.reset()
+                self.run(start, end)
+                results.append(self.get_result())
+                continue
+
+            if self._statistics is not None:
+                self._statistics.reset()
+            self._stop_requested = False
+            run_start = start
+            if i > 0 and start <= bounds[i - 1][1]:
+                # Data at the shared boundary was already run in the previous window
+                run_start = bounds[i - 1][1] + pd.Timedelta(1, unit="ns")
+            self._run(run_start, end)
+            if i == len(bounds) - 1:
+                self.end()
+            else:
+                self._backtest_end = self.kernel.clock.utc_now()
+            result = self.get_result()
+            result.backtest_start = start.value
+            result.elapsed_time = (self._backtest_end - start).total_seconds()
+            results.append(result)
+
+        return results
+
     def _run(
         self,
         start: datetime | str | int | None = None,
@@ -1005,21 +1561,37 @@ cdef class BacktestEngine:
         cdef uint64_t end_ns
         # Time range check and set
         if start is None:
-            # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            # Set `start` to the next data (start of data if not yet run)
+            Condition.false(self._data_iterator.is_done_c(), "No data to run")
+            start_ns = self._data_iterator.peek_ts_init()
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = start.value
+            if self._last_data_ns >= start_ns:
+                # Data from `start` has already been run, so seek backwards from the start
+                Condition.true(
+                    self._data_iterator.is_rewindable,
+                    "data streams were not rewindable to seek back to start",
+                )
+                self._data_iterator.reset()
+                self._last_data_ns = 0
+            Condition.false(self._data_iterator.is_done_c(), "No data to run")
         if end is None:
-            # Set `end` to end of data
-            end_ns = self._data[-1].ts_init
-            end = unix_nanos_to_dt(end_ns)
+            # Set `end` to end of data (unknown for iterable streams)
+            last_ts_init = self._data_iterator.last_ts_init()
+            if last_ts_init is None:
+                end_ns = UINT64_MAX
+            else:
+                end_ns = last_ts_init
+                end = unix_nanos_to_dt(end_ns)
         else:
             end = pd.to_datetime(end, utc=True)
             end_ns = end.value
         Condition.true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
+
+        # Cache venues for processing in the main loop
+        self._exchanges = list(self._venues.values())
 
         # Set clocks
         cdef TestClock clock
@@ -1033,6 +1605,10 @@ cdef class BacktestEngine:
             self._run_id = UUID4()
             self._run_started = pd.Timestamp.utcnow()
             self._backtest_start = start
+            if self._statistics is not None:
+                self._statistics.set_starting_balances(
+                    [b for exchange in self._venues.values() for b in exchange.starting_balances],
+                )
             for exchange in self._venues.values():
                 exchange.initialize_account()
                 ###################################################################################
@@ -1061,61 +1637,70 @@ cdef class BacktestEngine:
 
         self._log_run(start, end)
 
-        # Set data stream length
-        self._data_len = len(self._data)
-
-        # Set starting index
-        cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        # Advance data streams to the start
+        if self._data_iterator.peek_ts_init() < start_ns:
+            self._data_iterator.seek_c(start_ns)
+            self._last_data_ns = max(self._last_data_ns, start_ns - 1)  # Data before start passed
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef bint force_stop = False
         cdef uint64_t last_ns = 0
         cdef uint64_t raw_handlers_count = 0
-        cdef Data data = self._next()
+        # A stop request is checked before taking each data element, so the remaining
+        # data is left in the iterator
+        cdef Data data = None if self._stop_requested else self._next(end_ns)
         cdef CVec raw_handlers
         cdef SimulatedExchange venue
+        cdef int kind
+        cdef Profiler profiler = self._profiler
+        cdef uint64_t ts_loop_start = 0
+        cdef uint64_t ts_start = 0
+        if profiler is not None:
+            ts_loop_start = profiler.start()
         try:
             while data is not None:
-                if data.ts_init > end_ns:
-                    # End of backtest
-                    break
                 if data.ts_init > last_ns:
                     # Advance clocks to the next data time
                     raw_handlers = self._advance_time(data.ts_init)
                     raw_handlers_count = raw_handlers.len
 
                 # Process data through venue
-                if isinstance(data, OrderBookDelta):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_order_book_delta(data)
-                elif isinstance(data, OrderBookDeltas):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_order_book_deltas(data)
-                elif isinstance(data, QuoteTick):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_quote_tick(data)
-                elif isinstance(data, TradeTick):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_trade_tick(data)
-                elif isinstance(data, Bar):
-                    venue = self._venues[data.bar_type.instrument_id.venue]
-                    venue.process_bar(data)
-                elif isinstance(data, InstrumentStatus):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_instrument_status(data)
-
-                self._data_engine.process(data)
-
-                # Process all exchange messages
-                for exchange in self._venues.values():
-                    exchange.process(data.ts_init)
+                venue = None
+                if profiler is not None:
+                    ts_start = profiler.start()
+                kind = self._data_kind(data)
+                if kind == DATA_KIND_QUOTE_TICK:
+                    venue = self._venues[(<QuoteTick>data).instrument_id.venue]
+                    venue.process_quote_tick(<QuoteTick>data)
+                elif kind == DATA_KIND_TRADE_TICK:
+                    venue = self._venues[(<TradeTick>data).instrument_id.venue]
+                    venue.process_trade_tick(<TradeTick>data)
+                elif kind == DATA_KIND_BAR:
+                    venue = self._venues[(<Bar>data).bar_type.instrument_id.venue]
+                    venue.process_bar(<Bar>data)
+                elif kind == DATA_KIND_ORDER_BOOK_DELTA:
+                    venue = self._venues[(<OrderBookDelta>data).instrument_id.venue]
+                    venue.process_order_book_delta(<OrderBookDelta>data)
+                elif kind == DATA_KIND_ORDER_BOOK_DELTAS:
+                    venue = self._venues[(<OrderBookDeltas>data).instrument_id.venue]
+                    venue.process_order_book_deltas(<OrderBookDeltas>data)
+                elif kind == DATA_KIND_INSTRUMENT_STATUS:
+                    venue = self._venues[(<InstrumentStatus>data).instrument_id.venue]
+                    venue.process_instrument_status(<InstrumentStatus>data)
+
+                if profiler is None:
+                    self._data_engine.process(data)
+                else:
+                    profiler.stop(venue if venue is not None else "BacktestEngine.dispatch", ts_start)
+                    ts_start = profiler.start()
+                    self._data_engine.process(data)
+                    profiler.stop("DataEngine.process", ts_start)
+
+                # Process exchange messages (only venues with pending work)
+                self._process_exchanges(data.ts_init)
 
                 last_ns = data.ts_init
-                data = self._next()
+                data = None if self._stop_requested else self._next(end_ns)
                 if data is None or data.ts_init > last_ns:
                     # Finally process the time events
                     self._process_raw_time_event_handlers(
@@ -1132,6 +1717,9 @@ cdef class BacktestEngine:
         except AccountError as e:
             force_stop = True
             self._log.error(f"Stopping backtest from {e}")
+        finally:
+            if profiler is not None:
+                profiler.stop("BacktestEngine.run", ts_loop_start)
         # ---------------------------------------------------------------------#
 
         if force_stop:
@@ -1150,11 +1738,42 @@ cdef class BacktestEngine:
             )
             vec_time_event_handlers_drop(raw_handlers)
 
-    cdef Data _next(self):
-        cdef uint64_t cursor = self._index
-        self._index += 1
-        if cursor < self._data_len:
-            return self._data[cursor]
+    cdef Data _next(self, uint64_t end_ns):
+        # Data beyond `end_ns` is left in the iterator for a subsequent run
+        if self._data_iterator.is_done_c() or self._data_iterator.peek_ts_init() > end_ns:
+            return None
+
+        cdef Data data = self._data_iterator.next_c()
+        self._last_data_ns = data.ts_init
+        return data
+
+    cdef int _data_kind(self, Data data):
+        cdef type data_type = type(data)
+        cdef object kind = self._dispatch_table.get(data_type)
+        if kind is not None:
+            return kind
+
+        # Resolve subclasses once, then cache against the concrete type
+        kind = DATA_KIND_OTHER
+        for base_type, base_kind in list(self._dispatch_table.items()):
+            if base_kind != DATA_KIND_OTHER and issubclass(data_type, base_type):
+                kind = base_kind
+                break
+
+        self._dispatch_table[data_type] = kind
+        return kind
+
+    cdef void _process_exchanges(self, uint64_t ts_now):
+        cdef SimulatedExchange exchange
+        cdef uint64_t ts_start
+        for exchange in self._exchanges:
+            if exchange.has_pending_work(ts_now):
+                if self._profiler is None:
+                    exchange.process(ts_now)
+                else:
+                    ts_start = self._profiler.start()
+                    exchange.process(ts_now)
+                    self._profiler.stop(exchange, ts_start)
 
     cdef CVec _advance_time(self, uint64_t ts_now):
         cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
@@ -1202,6 +1821,7 @@ cdef class BacktestEngine:
             PyObject *raw_callback
             object callback
             SimulatedExchange exchange
+            uint64_t ts_start
         for i in range(raw_handler_vec.len):
             raw_handler = <TimeEventHandler_t>raw_handlers[i]
             ts_event_init = raw_handler.event.ts_init
@@ -1218,13 +1838,17 @@ cdef class BacktestEngine:
             # Cast raw `PyObject *` to a `PyObject`
             raw_callback = <PyObject *>raw_handler.callback_ptr
             callback = <object>raw_callback
-            callback(event)
+            if self._profiler is None:
+                callback(event)
+            else:
+                ts_start = self._profiler.start()
+                callback(event)
+                self._profiler.stop(callback, ts_start)
 
             if ts_event_init != ts_last_init:
                 # Process exchange messages
                 ts_last_init = ts_event_init
-                for exchange in self._venues.values():
-                    exchange.process(ts_event_init)
+                self._process_exchanges(ts_event_init)
 
     def _get_log_color_code(self):
         return "\033[36m" if logging_is_colored() else ""
@@ -1265,6 +1889,23 @@ cdef class BacktestEngine:
         self._log.info(f"Batch end:      {end}")
         self._log.info(f"{color}-----------------------------------------------------------------")
 
+    def _log_profile(self, elapsed_time, int top_n = 10):
+        cdef str color = self._get_log_color_code()
+        self._log.info(f"{color}=================================================================")
+        self._log.info(f"{color} PROFILE")
+        self._log.info(f"{color}=================================================================")
+        if elapsed_time is not None and elapsed_time.total_seconds() > 0:
+            self._log.info(f"Events/sec: {self._iteration / elapsed_time.total_seconds():,.0f}")
+
+        self._log.info(f"Top {top_n} consumers (by self time):")
+        for s in self._profiler.stats()[:top_n]:
+            self._log.info(
+                f"{s.name}: calls={s.count:,}, "
+                f"self={s.self_ns / 1e6:,.3f}ms, "
+                f"total={s.total_ns / 1e6:,.3f}ms, "
+                f"mean={s.total_ns / s.count / 1e3:,.3f}us",
+            )
+
     def _log_post_run(self):
         if self._run_finished and self._run_started:
             elapsed_time = self._run_finished - self._run_started
@@ -1300,6 +1941,9 @@ cdef class BacktestEngine:
 
         self._log.info(f"Total positions: {len(positions):,}")
 
+        if self._profiler is not None:
+            self._log_profile(elapsed_time)
+
         if not self._config.run_analysis:
             return
 
@@ -1401,3 +2045,524 @@ cdef class BacktestEngine:
                 clock=self._kernel.clock,
             )
             self._kernel.data_engine.register_client(client)
+
+
+cdef enum DataKind:
+    DATA_KIND_OTHER = 0
+    DATA_KIND_ORDER_BOOK_DELTA = 1
+    DATA_KIND_ORDER_BOOK_DELTAS = 2
+    DATA_KIND_QUOTE_TICK = 3
+    DATA_KIND_TRADE_TICK = 4
+    DATA_KIND_BAR = 5
+    DATA_KIND_INSTRUMENT_STATUS = 6
+
+
+def _run_forked_callback(engine, callback, arg, str path) -> None:
+    # Runs in the forked child process, which must never return to the callers frame
+    try:
+        try:
+            result = (True, callback(engine, arg))
+            payload = pickle.dumps(result)
+        except BaseException as e:
+            try:
+                payload = pickle.dumps((False, e))
+            except Exception:  # Exception not picklable
+                payload = pickle.dumps((False, RuntimeError(repr(e))))
+        with open(path, "wb") as f:
+            f.write(payload)
+    finally:
+        os._exit(0)
+
+
+cdef class BacktestDataStream:
+    """
+    Provides a single time-ordered stream of data for a `BacktestDataIterator`.
+
+    The `source` can be a list of data (which can be rewound), a re-iterable object such as a
+    catalog query result (rewound by calling `iter()` on it again), or a one-shot iterator
+    such as a generator. Iterables may yield either single `Data` objects or lists of `Data`
+    (chunks), which are buffered up to `chunk_size` elements at a time.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stream.
+    source : list[Data] or Iterable[Data | list[Data]]
+        The time-ordered data source for the stream.
+    priority : int
+        The priority of the stream when breaking `ts_init` ties (lower is first).
+    chunk_size : int
+        The maximum number of elements to buffer from an iterable source.
+
+    Warnings
+    --------
+    The `source` must already be sorted by `ts_init` (this is not checked).
+
+    """
+
+    def __init__(
+        self,
+        str name not None,
+        source not None,
+        int priority,
+        int chunk_size,
+    ) -> None:
+        Condition.valid_string(name, "name")
+        Condition.positive_int(chunk_size, "chunk_size")
+
+        self.name = name
+        self.priority = priority
+        self.is_rewindable = isinstance(source, list) or iter(source) is not source
+        self.head = None
+
+        self._source = source
+        self._iterator = None
+        self._chunk = []
+        self._cursor = 0
+        self._chunk_size = chunk_size
+
+        self.rewind()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name}, priority={self.priority})"
+
+    @property
+    def source(self):
+        """
+        Return the data source for the stream.
+
+        Returns
+        -------
+        list[Data] or Iterable[Data | list[Data]]
+
+        """
+        return self._source
+
+    cdef void rewind(self):
+        # Rewinds the stream to its start and primes the `head` (one-shot
+        # iterators cannot be rewound, and so continue from their current position)
+        if isinstance(self._source, list):
+            self._iterator = None
+            self._chunk = self._source
+            self._cursor = 0
+        elif self.is_rewindable:
+            self._iterator = iter(self._source)
+            self._chunk = []
+            self._cursor = 0
+        elif self._iterator is None:
+            self._iterator = self._source
+        else:
+            return  # Head is still valid
+
+        self.head = self.next_c()
+
+    cdef int64_t seek(self, uint64_t ts_ns):
+        # Advances the stream to the first element with `ts_init >= ts_ns` (never rewinds),
+        # binary searching the buffered elements and skipping whole chunks where possible.
+        # Returns the number of elements skipped.
+        if self.head is None or self.head.ts_init >= ts_ns:
+            return 0
+
+        cdef:
+            int64_t skipped = 1  # The current head
+            Py_ssize_t lo
+            Py_ssize_t hi
+            Py_ssize_t mid
+            Data data
+        while True:
+            lo = self._cursor
+            hi = len(self._chunk)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                data = self._chunk[mid]
+                if data.ts_init < ts_ns:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            skipped += lo - self._cursor
+            self._cursor = lo
+            if lo < len(self._chunk) or self._iterator is None:
+                break
+            self._chunk = self._pull_chunk()
+            self._cursor = 0
+            if not self._chunk:
+                break
+
+        self.head = self.next_c()
+        return skipped
+
+    cdef Data next_c(self):
+        if self._cursor >= len(self._chunk):
+            if self._iterator is None:
+                return None
+            self._chunk = self._pull_chunk()
+            self._cursor = 0
+            if not self._chunk:
+                return None
+
+        cdef Data data = self._chunk[self._cursor]
+        self._cursor += 1
+        return data
+
+    cdef list _pull_chunk(self):
+        cdef list chunk = []
+        for item in self._iterator:
+            if isinstance(item, list):
+                chunk.extend(item)
+            else:
+                chunk.append(item)
+            if len(chunk) >= self._chunk_size:
+                break
+        return chunk
+
+
+cdef class BarColumnsStream(BacktestDataStream):
+    """
+    Provides a data stream which materializes bars from `BarColumns` one row at a time.
+
+    Only the current `head` bar is held as an object, all other rows remain in the columns.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stream.
+    source : BarColumns
+        The bar columns for the stream.
+    priority : int
+        The priority of the stream when breaking `ts_init` ties (lower is first).
+    chunk_size : int
+        Not used for columnar streams (rows are materialized individually).
+
+    """
+
+    def __init__(
+        self,
+        str name not None,
+        BarColumns source not None,
+        int priority,
+        int chunk_size,
+    ) -> None:
+        self._columns = source
+        super().__init__(
+            name=name,
+            source=source,
+            priority=priority,
+            chunk_size=chunk_size,
+        )
+
+    cdef void rewind(self):
+        self._cursor = 0
+        self.head = self.next_c()
+
+    cdef int64_t seek(self, uint64_t ts_ns):
+        if self.head is None or self.head.ts_init >= ts_ns:
+            return 0
+
+        cdef:
+            Py_ssize_t head_index = self._cursor - 1
+            Py_ssize_t lo = self._cursor
+            Py_ssize_t hi = self._columns.size
+            Py_ssize_t mid
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._columns.ts_init_at_c(mid) < ts_ns:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        self._cursor = lo
+        self.head = self.next_c()
+        return lo - head_index
+
+    cdef Data next_c(self):
+        if self._cursor >= self._columns.size:
+            return None
+
+        cdef Bar bar = self._columns.bar_at_c(self._cursor)
+        self._cursor += 1
+        return bar
+
+
+cdef class BacktestDataIterator:
+    """
+    Provides a k-way merge of multiple time-ordered data streams by `ts_init`.
+
+    Each stream is expected to already be sorted by `ts_init`. Memory held by the iterator
+    is bounded by the number of streams multiplied by the `chunk_size` for iterable sources
+    (list sources are held as given). Ties on `ts_init` are broken in the order streams
+    were added.
+
+    Parameters
+    ----------
+    chunk_size : int, default 10_000
+        The maximum number of elements to buffer per iterable stream.
+
+    Raises
+    ------
+    ValueError
+        If `chunk_size` is not positive (> 0).
+
+    """
+
+    def __init__(self, int chunk_size = 10_000) -> None:
+        Condition.positive_int(chunk_size, "chunk_size")
+
+        self._streams = {}
+        self._heap = []
+        self._next_priority = 0
+        self._chunk_size = chunk_size
+
+    @property
+    def stream_names(self) -> list[str]:
+        """
+        Return the names of the streams added to the iterator (in priority order).
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return list(self._streams)
+
+    @property
+    def is_rewindable(self) -> bool:
+        """
+        Return whether all streams in the iterator can be rewound.
+
+        Returns
+        -------
+        bool
+
+        """
+        cdef BacktestDataStream stream
+        for stream in self._streams.values():
+            if not stream.is_rewindable:
+                return False
+        return True
+
+    def add_stream(self, str name, source) -> BacktestDataStream:
+        """
+        Add a time-ordered data stream to the iterator.
+
+        Parameters
+        ----------
+        name : str
+            The unique name for the stream.
+        source : list[Data], Iterable[Data | list[Data]] or BarColumns
+            The time-ordered data source for the stream.
+
+        Returns
+        -------
+        BacktestDataStream
+
+        Raises
+        ------
+        ValueError
+            If `name` is not a valid string.
+        ValueError
+            If a stream with `name` has already been added.
+
+        """
+        Condition.not_in(name, self._streams, "name", "_streams")
+
+        stream_cls = BarColumnsStream if isinstance(source, BarColumns) else BacktestDataStream
+        cdef BacktestDataStream stream = stream_cls(
+            name=name,
+            source=source,
+            priority=self._next_priority,
+            chunk_size=self._chunk_size,
+        )
+        self._next_priority += 1
+        self._streams[name] = stream
+        self._push(stream)
+
+        return stream
+
+    def remove_stream(self, str name) -> None:
+        """
+        Remove the data stream with the given name from the iterator.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stream to remove.
+
+        Raises
+        ------
+        KeyError
+            If no stream with `name` has been added.
+
+        """
+        self._streams.pop(name)
+        self._rebuild_heap()
+
+    def get_stream(self, str name) -> BacktestDataStream | None:
+        """
+        Return the data stream with the given name (if found).
+
+        Parameters
+        ----------
+        name : str
+            The name of the stream.
+
+        Returns
+        -------
+        BacktestDataStream or ``None``
+
+        """
+        return self._streams.get(name)
+
+    def data(self) -> list[Data]:
+        """
+        Return all data from the list-backed and columnar streams merged by `ts_init`.
+
+        Iterable-backed streams are not included, as listing them would consume them.
+        Columnar streams are materialized into `Bar` objects.
+
+        Returns
+        -------
+        list[Data]
+
+        """
+        cdef list sources = []
+        for stream in self._streams.values():
+            if isinstance(stream.source, list):
+                sources.append(stream.source)
+            elif isinstance(stream.source, BarColumns):
+                sources.append(stream.source.to_bars())
+        if len(sources) == 1:
+            return sources[0].copy()
+        return list(heapq.merge(*sources, key=lambda x: x.ts_init))
+
+    def last_ts_init(self) -> int | None:
+        """
+        Return the greatest `ts_init` across all streams (if known).
+
+        Returns
+        -------
+        int or ``None``
+            ``None`` if there are no streams, or any stream is iterable-backed without a
+            `ts_init_last` property (the last timestamp cannot be known without consuming
+            the stream).
+
+        """
+        cdef uint64_t last = 0
+        cdef BacktestDataStream stream
+        for stream in self._streams.values():
+            if isinstance(stream.source, list):
+                if stream.source:
+                    last = max(last, stream.source[-1].ts_init)
+                continue
+            if not hasattr(stream.source, "ts_init_last"):
+                return None
+            if stream.source.ts_init_last is not None:
+                last = max(last, stream.source.ts_init_last)
+        return last if self._streams else None
+
+    def reset(self) -> None:
+        """
+        Rewind all streams to their start.
+
+        One-shot iterator streams (such as generators) cannot be rewound, and will
+        continue from their current position.
+
+        """
+        cdef BacktestDataStream stream
+        for stream in self._streams.values():
+            stream.rewind()
+        self._rebuild_heap()
+
+    def clear(self) -> None:
+        """
+        Clear all streams from the iterator.
+
+        """
+        self._streams.clear()
+        self._heap.clear()
+        self._next_priority = 0
+
+    def is_done(self) -> bool:
+        """
+        Return whether all streams have been exhausted.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.is_done_c()
+
+    def next(self) -> Data | None:
+        """
+        Return the next data element in `ts_init` order (if any).
+
+        Returns
+        -------
+        Data or ``None``
+
+        """
+        return self.next_c()
+
+    def seek(self, ts_ns: int) -> int:
+        """
+        Advance all streams to their first data element with `ts_init` >= `ts_ns`.
+
+        Streams are never rewound by seeking (call `reset()` first to seek backwards).
+        List-backed and columnar streams are binary searched, iterable-backed streams
+        are binary searched within each buffered chunk.
+
+        Parameters
+        ----------
+        ts_ns : int
+            UNIX timestamp (nanoseconds) to seek to.
+
+        Returns
+        -------
+        int
+            The number of data elements skipped.
+
+        """
+        return self.seek_c(ts_ns)
+
+    cdef int64_t seek_c(self, uint64_t ts_ns):
+        cdef int64_t skipped = 0
+        cdef BacktestDataStream stream
+        for stream in self._streams.values():
+            skipped += stream.seek(ts_ns)
+        self._rebuild_heap()
+        return skipped
+
+    cdef void _push(self, BacktestDataStream stream):
+        if stream.head is not None:
+            heapq.heappush(self._heap, (stream.head.ts_init, stream.priority, stream))
+
+    cdef void _rebuild_heap(self):
+        self._heap = [
+            (s.head.ts_init, s.priority, s)
+            for s in self._streams.values()
+            if s.head is not None
+        ]
+        heapq.heapify(self._heap)
+
+    cdef Data next_c(self):
+        if not self._heap:
+            return None
+
+        cdef BacktestDataStream stream = self._heap[0][2]
+        cdef Data data = stream.head
+        cdef Data next_head = stream.next_c()
+        stream.head = next_head
+
+        if next_head is None:
+            heapq.heappop(self._heap)
+        else:
+            heapq.heapreplace(self._heap, (next_head.ts_init, stream.priority, stream))
+
+        return data
+
+    cdef uint64_t peek_ts_init(self):
+        # Caller must check `is_done_c()` first
+        return self._heap[0][0]
+
+    cdef bint is_done_c(self):
+        return not self._heap
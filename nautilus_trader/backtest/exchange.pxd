@@ -104,7 +104,7 @@ cdef class SimulatedExchange:
     cdef dict _matching_engines
     cdef object _message_queue
     cdef list _inflight_queue
-    cdef dict _inflight_counter
+    cdef uint64_t _inflight_sequence
 
 # -- REGISTRATION ---------------------------------------------------------------------------------
 
@@ -138,6 +138,7 @@ cdef class SimulatedExchange:
     cpdef void process_trade_tick(self, TradeTick tick)
     cpdef void process_bar(self, Bar bar)
     cpdef void process_instrument_status(self, InstrumentStatus data)
+    cpdef bint has_pending_work(self, uint64_t ts_now)
     cpdef void process(self, uint64_t ts_now)
     cpdef void reset(self)
 
@@ -15,6 +15,7 @@
 
 from collections import deque
 from decimal import Decimal
+from heapq import heappop
 from heapq import heappush
 
 from nautilus_trader.common.config import InvalidConfiguration
@@ -228,7 +229,7 @@ cdef class SimulatedExchange:
 
         self._message_queue = deque()
         self._inflight_queue: list[tuple[(uint64_t, uint64_t), TradingCommand]] = []
-        self._inflight_counter: dict[uint64_t, uint64_t] = {}
+        self._inflight_sequence = 0
 
     def __repr__(self) -> str:
         return (
@@ -631,19 +632,10 @@ cdef class SimulatedExchange:
             heappush(self._inflight_queue, self.generate_inflight_command(command))
 
     cdef tuple generate_inflight_command(self, TradingCommand command):
-        cdef uint64_t ts
-        if isinstance(command, (SubmitOrder, SubmitOrderList)):
-            ts = command.ts_init + self.latency_model.insert_latency_nanos
-        elif isinstance(command, ModifyOrder):
-            ts = command.ts_init + self.latency_model.update_latency_nanos
-        elif isinstance(command, (CancelOrder, CancelAllOrders, BatchCancelOrders)):
-            ts = command.ts_init + self.latency_model.cancel_latency_nanos
-        else:
-            raise ValueError(f"invalid `TradingCommand`, was {command}")  # pragma: no cover (design-time error)
-        if ts not in self._inflight_counter:
-            self._inflight_counter[ts] = 0
-        self._inflight_counter[ts] += 1
-        cdef (uint64_t, uint64_t) key = (ts, self._inflight_counter[ts])
+        cdef uint64_t ts = command.ts_init + self.latency_model.get_latency(command)
+        # The sequence breaks timestamp ties in the order commands were sent
+        self._inflight_sequence += 1
+        cdef (uint64_t, uint64_t) key = (ts, self._inflight_sequence)
         return key, command
 
     cpdef void process_order_book_delta(self, OrderBookDelta delta):
@@ -808,6 +800,30 @@ cdef class SimulatedExchange:
 
         matching_engine.process_status(data.action)
 
+    cpdef bint has_pending_work(self, uint64_t ts_now):
+        """
+        Return whether the exchange has work to process at the given time.
+
+        This is the case when there are queued trading commands, in-flight commands
+        due at or before `ts_now`, or simulation modules (which are processed on
+        every call to `process`).
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            The current UNIX timestamp (nanoseconds).
+
+        Returns
+        -------
+        bool
+
+        """
+        if self._message_queue or self.modules:
+            return True
+        if not self._inflight_queue:
+            return False
+        return self._inflight_queue[0][0][0] <= ts_now
+
     cpdef void process(self, uint64_t ts_now):
         """
         Process the exchange to the given time.
@@ -829,8 +845,7 @@ cdef class SimulatedExchange:
             ts = self._inflight_queue[0][0][0]
             if ts <= ts_now:
                 # Place message on queue to be processed
-                self._message_queue.appendleft(self._inflight_queue.pop(0)[1])
-                self._inflight_counter.pop(ts, None)
+                self._message_queue.appendleft(heappop(self._inflight_queue)[1])
             else:
                 break
 
@@ -862,7 +877,7 @@ cdef class SimulatedExchange:
 
         self._message_queue = deque()
         self._inflight_queue.clear()
-        self._inflight_counter.clear()
+        self._inflight_sequence = 0
 
         self._log.info("Reset")
 
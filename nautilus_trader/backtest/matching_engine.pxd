@@ -147,7 +147,9 @@ cdef class OrderMatchingEngine:
     cpdef void process_status(self, MarketStatusAction status)
     cpdef void process_auction_book(self, OrderBook book)
     cdef void _process_trade_ticks_from_bar(self, Bar bar)
+    cdef bint _process_trade_tick_step(self, TradeTick tick, bint is_first)
     cdef void _process_quote_ticks_from_bar(self)
+    cdef bint _process_quote_tick_step(self, QuoteTick tick, bint is_first)
 
 # -- TRADING COMMANDS -----------------------------------------------------------------------------
 
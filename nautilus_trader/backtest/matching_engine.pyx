@@ -585,6 +585,9 @@ cdef class OrderMatchingEngine:
         #         )
 
     cdef void _process_trade_ticks_from_bar(self, Bar bar):
+        # Processes the bar as a path of trade ticks from open -> high -> low -> close in a
+        # single pass, only updating the book and iterating the engine for the first step and
+        # any step at which a held order could be matched (or triggered)
         cdef Quantity size = Quantity(bar.volume.as_double() / 4.0, bar._mem.volume.precision)
 
         # Create reusable tick
@@ -598,43 +601,60 @@ cdef class OrderMatchingEngine:
             bar.ts_event,
         )
 
+        cdef bint is_first = True
+        cdef bint is_synced = True  # If the book reflects the last step
+
         # Open
         if not self._core.is_last_initialized or bar._mem.open.raw != self._core.last_raw:  # Direct memory comparison
-            self._book.update_trade_tick(tick)
-            self.iterate(tick.ts_init)
-            self._core.set_last_raw(bar._mem.open.raw)
-
-        cdef str trade_id_str  # Assigned below
+            is_synced = self._process_trade_tick_step(tick, is_first)
+            is_first = False
 
         # High
         if bar._mem.high.raw > self._core.last_raw:  # Direct memory comparison
             tick._mem.price = bar._mem.high  # Direct memory assignment
             tick._mem.aggressor_side = AggressorSide.BUYER  # Direct memory assignment
-            trade_id_str = self._generate_trade_id_str()
-            tick._mem.trade_id = trade_id_new(pystr_to_cstr(trade_id_str))
-            self._book.update_trade_tick(tick)
-            self.iterate(tick.ts_init)
-            self._core.set_last_raw(bar._mem.high.raw)
+            is_synced = self._process_trade_tick_step(tick, is_first)
+            is_first = False
 
         # Low
         if bar._mem.low.raw < self._core.last_raw:  # Direct memory comparison
             tick._mem.price = bar._mem.low  # Direct memory assignment
             tick._mem.aggressor_side = AggressorSide.SELLER
-            trade_id_str = self._generate_trade_id_str()
-            tick._mem.trade_id = trade_id_new(pystr_to_cstr(trade_id_str))
-            self._book.update_trade_tick(tick)
-            self.iterate(tick.ts_init)
-            self._core.set_last_raw(bar._mem.low.raw)
+            is_synced = self._process_trade_tick_step(tick, is_first)
+            is_first = False
 
         # Close
         if bar._mem.close.raw != self._core.last_raw:  # Direct memory comparison
             tick._mem.price = bar._mem.close  # Direct memory assignment
             tick._mem.aggressor_side = AggressorSide.BUYER if bar._mem.close.raw > self._core.last_raw else AggressorSide.SELLER
-            trade_id_str = self._generate_trade_id_str()
-            tick._mem.trade_id = trade_id_new(pystr_to_cstr(trade_id_str))
+            is_synced = self._process_trade_tick_step(tick, is_first)
+
+        if not is_synced:
+            self._book.update_trade_tick(tick)  # Leave the book at the last price
+
+    cdef bint _process_trade_tick_step(self, TradeTick tick, bint is_first):
+        # Processes a single step of a bar path (the tick price is already assigned),
+        # returning whether the step was processed through the book and engine
+        cdef int64_t price_raw = tick._mem.price.raw
+        cdef str trade_id_str
+        if (
+            is_first
+            or self._core.has_trailing_stop_orders()
+            or self._core.is_crossed(price_raw, price_raw)
+        ):
+            if not is_first:
+                trade_id_str = self._generate_trade_id_str()
+                tick._mem.trade_id = trade_id_new(pystr_to_cstr(trade_id_str))
             self._book.update_trade_tick(tick)
             self.iterate(tick.ts_init)
-            self._core.set_last_raw(bar._mem.close.raw)
+            self._core.set_last_raw(price_raw)
+            return True
+
+        # No orders can be matched at this price, so only move the market
+        self._core.set_bid_raw(price_raw)
+        self._core.set_ask_raw(price_raw)
+        self._core.set_last_raw(price_raw)
+        return False
 
     cdef void _process_quote_ticks_from_bar(self):
         if self._last_bid_bar is None or self._last_ask_bar is None:
@@ -658,30 +678,46 @@ cdef class OrderMatchingEngine:
         )
 
         # Open
-        self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+        self._process_quote_tick_step(tick, True)
 
         # High
         tick._mem.bid_price = self._last_bid_bar._mem.high  # Direct memory assignment
         tick._mem.ask_price = self._last_ask_bar._mem.high  # Direct memory assignment
-        self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+        self._process_quote_tick_step(tick, False)
 
         # Low
         tick._mem.bid_price = self._last_bid_bar._mem.low  # Assigning memory directly
         tick._mem.ask_price = self._last_ask_bar._mem.low  # Assigning memory directly
-        self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+        self._process_quote_tick_step(tick, False)
 
         # Close
         tick._mem.bid_price = self._last_bid_bar._mem.close  # Assigning memory directly
         tick._mem.ask_price = self._last_ask_bar._mem.close  # Assigning memory directly
-        self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+        if not self._process_quote_tick_step(tick, False):
+            self._book.update_quote_tick(tick)  # Leave the book at the close
 
         self._last_bid_bar = None
         self._last_ask_bar = None
 
+    cdef bint _process_quote_tick_step(self, QuoteTick tick, bint is_first):
+        # Processes a single step of a bar path (the tick prices are already assigned),
+        # returning whether the step was processed through the book and engine
+        cdef int64_t bid_raw = tick._mem.bid_price.raw
+        cdef int64_t ask_raw = tick._mem.ask_price.raw
+        if (
+            is_first
+            or self._core.has_trailing_stop_orders()
+            or self._core.is_crossed(bid_raw, ask_raw)
+        ):
+            self._book.update_quote_tick(tick)
+            self.iterate(tick.ts_init)
+            return True
+
+        # No orders can be matched at these prices, so only move the market
+        self._core.set_bid_raw(bid_raw)
+        self._core.set_ask_raw(ask_raw)
+        return False
+
 # -- TRADING COMMANDS -----------------------------------------------------------------------------
 
     cpdef void process_order(self, Order order, AccountId account_id):
@@ -2296,6 +2332,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Reindex the order at its updated price levels (if held)
+        self._core.update_order(order)
+
     cdef void _generate_order_canceled(self, Order order, VenueOrderId venue_order_id):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
@@ -2328,6 +2367,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Reindex the triggered order at its limit price (if held)
+        self._core.update_order(order)
+
     cdef void _generate_order_expired(self, Order order):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
@@ -15,6 +15,7 @@
 
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.execution.messages cimport TradingCommand
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
@@ -47,6 +48,49 @@ cdef class LatencyModel:
     cdef readonly uint64_t cancel_latency_nanos
     """The latency (nanoseconds) for order cancel messages to reach the exchange.\n\n:returns: `int`"""
 
+    cpdef uint64_t get_latency(self, TradingCommand command)
+
+
+cdef class LatencyDistribution:
+    cpdef object sample(self, rng, int size)
+
+
+cdef class FixedLatency(LatencyDistribution):
+    cdef readonly uint64_t latency_nanos
+    """The latency (nanoseconds).\n\n:returns: `int`"""
+
+
+cdef class LogNormalLatency(LatencyDistribution):
+    cdef readonly uint64_t median_nanos
+    """The median latency (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly double sigma
+    """The standard deviation of the log latency.\n\n:returns: `double`"""
+    cdef readonly uint64_t min_nanos
+    """The minimum latency (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly object max_nanos
+    """The maximum latency (nanoseconds).\n\n:returns: `int` or ``None``"""
+
+
+cdef class EmpiricalLatency(LatencyDistribution):
+    cdef object _lows
+    cdef object _widths
+    cdef object _probs
+
+
+cdef class _LatencySampler:
+    cdef LatencyDistribution _distribution
+    cdef object _rng
+    cdef int _batch_size
+    cdef uint64_t[::1] _buffer
+    cdef Py_ssize_t _cursor
+
+    cdef uint64_t next(self)
+
+
+cdef class SampledLatencyModel(LatencyModel):
+    cdef list _samplers
+    cdef dict _instrument_models
+
 
 cdef class FeeModel:
     cpdef Money get_commission(self, Order order, Quantity fill_qty, Price fill_px, Instrument instrument)
@@ -56,6 +100,9 @@ cdef class MakerTakerFeeModel(FeeModel):
     pass
 
 cdef class FixedFeeModel(FeeModel):
-    cdef Money _commission
     cdef Money _zero_commission
-    cdef bint _charge_commission_once
+
+    cdef readonly Money commission
+    """The fixed commission amount for trades.\n\n:returns: `Money`"""
+    cdef readonly bint charge_commission_once
+    """If the commission is charged once per order (rather than per fill).\n\n:returns: `bool`"""
@@ -13,12 +13,22 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import math
 import random
 
+import numpy as np
+
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport LiquiditySide
+from nautilus_trader.execution.messages cimport BatchCancelOrders
+from nautilus_trader.execution.messages cimport CancelAllOrders
+from nautilus_trader.execution.messages cimport CancelOrder
+from nautilus_trader.execution.messages cimport ModifyOrder
+from nautilus_trader.execution.messages cimport SubmitOrder
+from nautilus_trader.execution.messages cimport SubmitOrderList
+from nautilus_trader.execution.messages cimport TradingCommand
 from nautilus_trader.model.functions cimport liquidity_side_to_str
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
@@ -118,6 +128,22 @@ cdef class FillModel:
             return probability >= random.random()
 
 
+cdef int _LATENCY_INSERT = 0
+cdef int _LATENCY_UPDATE = 1
+cdef int _LATENCY_CANCEL = 2
+
+
+cdef int _latency_kind(TradingCommand command) except -1:
+    if isinstance(command, (SubmitOrder, SubmitOrderList)):
+        return _LATENCY_INSERT
+    elif isinstance(command, ModifyOrder):
+        return _LATENCY_UPDATE
+    elif isinstance(command, (CancelOrder, CancelAllOrders, BatchCancelOrders)):
+        return _LATENCY_CANCEL
+    else:
+        raise ValueError(f"invalid `TradingCommand`, was {command}")  # pragma: no cover (design-time error)
+
+
 cdef class LatencyModel:
     """
     Provides a latency model for simulated exchange message I/O.
@@ -162,6 +188,316 @@ cdef class LatencyModel:
         self.update_latency_nanos = base_latency_nanos + update_latency_nanos
         self.cancel_latency_nanos = base_latency_nanos + cancel_latency_nanos
 
+    cpdef uint64_t get_latency(self, TradingCommand command):
+        """
+        Return the latency (nanoseconds) for the given command to reach the exchange.
+
+        Parameters
+        ----------
+        command : TradingCommand
+            The command sent to the exchange.
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        ValueError
+            If `command` is not an order insert, update or cancel command.
+
+        """
+        cdef int kind = _latency_kind(command)
+        if kind == _LATENCY_INSERT:
+            return self.insert_latency_nanos
+        elif kind == _LATENCY_UPDATE:
+            return self.update_latency_nanos
+        else:
+            return self.cancel_latency_nanos
+
+
+cdef class LatencyDistribution:
+    """
+    Provides an abstract distribution of latencies for a `SampledLatencyModel`.
+    """
+
+    cpdef object sample(self, rng, int size):
+        """
+        Return latencies (nanoseconds) sampled from the distribution.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator
+            The random number generator to sample with.
+        size : int
+            The number of latencies to sample.
+
+        Returns
+        -------
+        np.ndarray[np.uint64]
+
+        """
+        raise NotImplementedError("Method 'sample' must be implemented in a subclass.")  # pragma: no cover
+
+
+cdef class FixedLatency(LatencyDistribution):
+    """
+    Provides a fixed latency distribution.
+
+    Parameters
+    ----------
+    latency_nanos : int
+        The latency (nanoseconds).
+
+    Raises
+    ------
+    ValueError
+        If `latency_nanos` is negative (< 0).
+
+    """
+
+    def __init__(self, uint64_t latency_nanos):
+        Condition.not_negative_int(latency_nanos, "latency_nanos")
+
+        self.latency_nanos = latency_nanos
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(latency_nanos={self.latency_nanos})"
+
+    cpdef object sample(self, rng, int size):
+        return np.full(size, self.latency_nanos, dtype=np.uint64)
+
+
+cdef class LogNormalLatency(LatencyDistribution):
+    """
+    Provides a lognormal latency distribution (a common fit for network latencies,
+    which have a long right tail).
+
+    Parameters
+    ----------
+    median_nanos : int
+        The median latency (nanoseconds).
+    sigma : double
+        The standard deviation of the underlying normal distribution (the log of the latency).
+    min_nanos : int, default 0
+        The minimum latency (nanoseconds), sampled latencies are clipped to this value.
+    max_nanos : int, optional
+        The maximum latency (nanoseconds), sampled latencies are clipped to this value.
+
+    Raises
+    ------
+    ValueError
+        If `median_nanos` is not positive (> 0).
+    ValueError
+        If `sigma` is negative (< 0).
+    ValueError
+        If `max_nanos` is less than `min_nanos`.
+
+    """
+
+    def __init__(
+        self,
+        uint64_t median_nanos,
+        double sigma,
+        uint64_t min_nanos = 0,
+        max_nanos: int | None = None,
+    ):
+        Condition.positive_int(median_nanos, "median_nanos")
+        Condition.not_negative(sigma, "sigma")
+        if max_nanos is not None:
+            Condition.true(max_nanos >= min_nanos, "`max_nanos` was less than `min_nanos`")
+
+        self.median_nanos = median_nanos
+        self.sigma = sigma
+        self.min_nanos = min_nanos
+        self.max_nanos = max_nanos
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"median_nanos={self.median_nanos}, "
+            f"sigma={self.sigma}, "
+            f"min_nanos={self.min_nanos}, "
+            f"max_nanos={self.max_nanos})"
+        )
+
+    cpdef object sample(self, rng, int size):
+        values = rng.lognormal(mean=math.log(self.median_nanos), sigma=self.sigma, size=size)
+        values = np.clip(np.rint(values), self.min_nanos, self.max_nanos)
+        return values.astype(np.uint64)
+
+
+cdef class EmpiricalLatency(LatencyDistribution):
+    """
+    Provides an empirical latency distribution from a histogram of observed latencies.
+
+    Bins are sampled in proportion to their counts, then latencies are sampled
+    uniformly within the bin.
+
+    Parameters
+    ----------
+    bin_edges_nanos : list[int]
+        The increasing bin edges (nanoseconds) of the histogram.
+    counts : list[int]
+        The counts of observed latencies for each bin.
+
+    Raises
+    ------
+    ValueError
+        If the length of `bin_edges_nanos` is not one more than the length of `counts`.
+    ValueError
+        If `bin_edges_nanos` is not increasing.
+    ValueError
+        If any count is negative, or all counts are zero.
+
+    """
+
+    def __init__(self, list bin_edges_nanos not None, list counts not None):
+        Condition.not_empty(counts, "counts")
+        Condition.equal(len(bin_edges_nanos), len(counts) + 1, "len(bin_edges_nanos)", "len(counts) + 1")
+
+        edges = np.asarray(bin_edges_nanos, dtype=np.float64)
+        weights = np.asarray(counts, dtype=np.float64)
+        Condition.true(bool(np.all(np.diff(edges) > 0)), "`bin_edges_nanos` was not increasing")
+        Condition.true(bool(edges[0] >= 0), "`bin_edges_nanos` was negative")
+        Condition.true(bool(np.all(weights >= 0) and weights.sum() > 0), "invalid `counts`")
+
+        self._lows = edges[:-1]
+        self._widths = np.diff(edges)
+        self._probs = weights / weights.sum()
+
+    @staticmethod
+    def from_samples(latencies_nanos, int bins = 50) -> EmpiricalLatency:
+        """
+        Return an empirical latency distribution from the given observed latencies.
+
+        Parameters
+        ----------
+        latencies_nanos : array_like[int]
+            The observed latencies (nanoseconds).
+        bins : int, default 50
+            The number of histogram bins.
+
+        Returns
+        -------
+        EmpiricalLatency
+
+        Raises
+        ------
+        ValueError
+            If `latencies_nanos` is empty.
+        ValueError
+            If `bins` is not positive (> 0).
+
+        """
+        Condition.positive_int(bins, "bins")
+        values = np.asarray(latencies_nanos, dtype=np.float64)
+        Condition.true(values.size > 0, "`latencies_nanos` was empty")
+
+        if values.min() == values.max():
+            edges = [values.min(), values.min() + 1]
+            return EmpiricalLatency(edges, [values.size])
+
+        counts, edges = np.histogram(values, bins=bins)
+        return EmpiricalLatency(edges.tolist(), counts.tolist())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(bins={len(self._probs)})"
+
+    cpdef object sample(self, rng, int size):
+        bins = rng.choice(len(self._probs), size=size, p=self._probs)
+        values = self._lows[bins] + rng.random(size) * self._widths[bins]
+        return np.floor(values).astype(np.uint64)
+
+
+cdef class _LatencySampler:
+    # Buffers latencies sampled in bulk from a distribution
+
+    def __init__(self, LatencyDistribution distribution, rng, int batch_size):
+        self._distribution = distribution
+        self._rng = rng
+        self._batch_size = batch_size
+        self._buffer = np.empty(0, dtype=np.uint64)
+        self._cursor = 0
+
+    cdef uint64_t next(self):
+        if self._cursor >= self._buffer.shape[0]:
+            self._buffer = np.ascontiguousarray(
+                self._distribution.sample(self._rng, self._batch_size),
+                dtype=np.uint64,
+            )
+            self._cursor = 0
+
+        cdef uint64_t value = self._buffer[self._cursor]
+        self._cursor += 1
+        return value
+
+
+cdef class SampledLatencyModel(LatencyModel):
+    """
+    Provides a stochastic latency model for simulated exchange message I/O, with
+    latencies sampled from the given distributions.
+
+    Latencies are sampled in bulk (`batch_size` at a time) from a single seeded random
+    number generator, so runs with the same `random_seed` are reproducible. As each
+    command samples its own latency, commands can reach the exchange in a different
+    order than they were sent.
+
+    Parameters
+    ----------
+    insert_latency : LatencyDistribution
+        The distribution of order insert latencies.
+    update_latency : LatencyDistribution, optional
+        The distribution of order update latencies (if None then uses `insert_latency`).
+    cancel_latency : LatencyDistribution, optional
+        The distribution of order cancel latencies (if None then uses `insert_latency`).
+    instrument_models : dict[InstrumentId, LatencyModel], optional
+        The latency models for specific instruments (overriding the distributions).
+    random_seed : int, optional
+        The random seed (if None then no random seed).
+    batch_size : int, default 1024
+        The number of latencies to sample from a distribution at a time.
+
+    Raises
+    ------
+    ValueError
+        If `batch_size` is not positive (> 0).
+    TypeError
+        If `random_seed` is not None and not of type `int`.
+
+    """
+
+    def __init__(
+        self,
+        LatencyDistribution insert_latency not None,
+        LatencyDistribution update_latency = None,
+        LatencyDistribution cancel_latency = None,
+        dict instrument_models = None,
+        random_seed: int | None = None,
+        int batch_size = 1024,
+    ):
+        Condition.positive_int(batch_size, "batch_size")
+        if random_seed is not None:
+            Condition.type(random_seed, int, "random_seed")
+
+        super().__init__(base_latency_nanos=0)
+
+        rng = np.random.default_rng(random_seed)
+        self._samplers = [
+            _LatencySampler(insert_latency, rng, batch_size),
+            _LatencySampler(update_latency or insert_latency, rng, batch_size),
+            _LatencySampler(cancel_latency or insert_latency, rng, batch_size),
+        ]
+        self._instrument_models = instrument_models or {}
+
+    cpdef uint64_t get_latency(self, TradingCommand command):
+        cdef LatencyModel model = self._instrument_models.get(command.instrument_id)
+        if model is not None:
+            return model.get_latency(command)
+
+        cdef _LatencySampler sampler = self._samplers[_latency_kind(command)]
+        return sampler.next()
+
 
 cdef class FeeModel:
     """
@@ -261,9 +597,9 @@ cdef class FixedFeeModel(FeeModel):
     ):
         Condition.positive(commission, "commission")
 
-        self._commission = commission
+        self.commission = commission
+        self.charge_commission_once = charge_commission_once
         self._zero_commission = Money(0, commission.currency)
-        self._charge_commission_once = charge_commission_once
 
     cpdef Money get_commission(
         self,
@@ -272,7 +608,7 @@ cdef class FixedFeeModel(FeeModel):
         Price fill_px,
         Instrument instrument,
     ):
-        if not self._charge_commission_once or order.filled_qty == 0:
-            return self._commission
+        if not self.charge_commission_once or order.filled_qty == 0:
+            return self.commission
         else:
             return self._zero_commission
@@ -13,6 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import multiprocessing
+import sys
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 from decimal import Decimal
 
 import pandas as pd
@@ -132,20 +137,45 @@ class BacktestNode:
         """
         return list(self._engines.values())
 
-    def run(self) -> list[BacktestResult]:
+    def run(
+        self,
+        max_workers: int | None = None,
+        max_worker_memory_bytes: int | None = None,
+    ) -> list[BacktestResult]:
         """
-        Run the backtest node which will synchronously execute the list of loaded
-        backtest run configs.
+        Run the backtest node which will execute the list of loaded backtest run configs.
+
+        By default the runs are executed synchronously in this process. If `max_workers`
+        is specified then the runs are fanned out to a pool of worker processes
+        (see `run_parallel`), with results returned in the order of the configs.
 
         Any exceptions raised from a backtest will be printed to stdout and
         the next backtest run will commence (if any).
 
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of worker processes to run backtests in parallel.
+            If ``None`` then backtests are run sequentially in this process.
+        max_worker_memory_bytes : int, optional
+            The maximum address space (bytes) for each worker process (parallel runs only).
+
         Returns
         -------
         list[BacktestResult]
             The results of the backtest runs.
 
         """
+        if max_workers is not None:
+            indexed_results = sorted(
+                self._run_parallel(
+                    max_workers=max_workers,
+                    max_worker_memory_bytes=max_worker_memory_bytes,
+                ),
+                key=lambda x: x[0],
+            )
+            return [result for _, result in indexed_results]
+
         results: list[BacktestResult] = []
         for config in self._configs:
             try:
@@ -165,6 +195,111 @@ class BacktestNode:
 
         return results
 
+    def run_parallel(
+        self,
+        max_workers: int | None = None,
+        max_worker_memory_bytes: int | None = None,
+    ) -> Generator[BacktestResult, None, None]:
+        """
+        Run the loaded backtest run configs in parallel across a pool of worker processes.
+
+        Each worker builds its own engine and loads its data from the catalog, so the
+        engines are not retained by this node (`get_engine` will return ``None``).
+        Results are yielded as each backtest run completes.
+
+        Any exceptions raised from a backtest (including a worker exceeding its memory
+        limit) will be printed to stdout and the other backtest runs will continue.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of worker processes. If ``None`` then will use the
+            number of processors on the machine.
+        max_worker_memory_bytes : int, optional
+            The maximum address space (bytes) for each worker process. Only applied
+            on platforms supporting `resource.RLIMIT_AS`.
+
+        Yields
+        ------
+        BacktestResult
+            The result of each backtest run (in order of completion).
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is not positive (> 0).
+        ValueError
+            If `max_worker_memory_bytes` is not positive (> 0).
+
+        """
+        for _, result in self._run_parallel(max_workers, max_worker_memory_bytes):
+            yield result
+
+    def _run_parallel(
+        self,
+        max_workers: int | None,
+        max_worker_memory_bytes: int | None,
+    ) -> Generator[tuple[int, BacktestResult], None, None]:
+        if max_workers is not None:
+            PyCondition.positive_int(max_workers, "max_workers")
+        if max_worker_memory_bytes is not None:
+            PyCondition.positive_int(max_worker_memory_bytes, "max_worker_memory_bytes")
+
+        # Spawn fresh worker processes (forking a process with live Rust threads is unsafe),
+        # each worker process is used for a single run to release its memory on completion.
+        executor_kwargs = {}
+        if sys.version_info >= (3, 11):
+            executor_kwargs["max_tasks_per_child"] = 1
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_backtest_worker,
+            initargs=(max_worker_memory_bytes,),
+            **executor_kwargs,
+        ) as executor:
+            futures = {
+                executor.submit(_run_backtest_worker, config): (i, config)
+                for i, config in enumerate(self._configs)
+            }
+            for future in as_completed(futures):
+                i, config = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Broad catch all prevents a single backtest run from halting
+                    # the execution of the other backtests (such as a zero balance exception).
+                    Logger(type(self).__name__).error(f"Error running backtest: {e!r}")
+                    Logger(type(self).__name__).info(f"Config: {config}")
+                    continue
+
+                yield i, result
+
+    def create_engine(self, config: BacktestRunConfig) -> BacktestEngine:
+        """
+        Create a backtest engine for the given run config.
+
+        The engine venues and instruments are added from the config, whereas the
+        data is not loaded (see `load_data_config` and `load_engine_data`). The
+        engine is retained by the node and released on `dispose`.
+
+        Parameters
+        ----------
+        config : BacktestRunConfig
+            The backtest run configuration for the engine.
+
+        Returns
+        -------
+        BacktestEngine
+
+        """
+        return self._create_engine(
+            run_config_id=config.id,
+            config=config.engine,
+            venue_configs=config.venues,
+            data_configs=config.data,
+        )
+
     def _validate_configs(self, configs: list[BacktestRunConfig]) -> None:  # noqa: C901
         venue_ids: list[Venue] = []
         for config in configs:
@@ -266,7 +401,24 @@ class BacktestNode:
 
         return engine
 
-    def _load_engine_data(self, engine: BacktestEngine, result: CatalogDataResult) -> None:
+    @classmethod
+    def load_engine_data(cls, engine: BacktestEngine, result: CatalogDataResult) -> None:
+        """
+        Add the data from the given catalog data result to the backtest engine.
+
+        Parameters
+        ----------
+        engine : BacktestEngine
+            The engine to add the data to.
+        result : CatalogDataResult
+            The catalog data result to add (see `load_data_config`).
+
+        Raises
+        ------
+        ValueError
+            If the data is not a Nautilus type and `result.client_id` is ``None``.
+
+        """
         if is_nautilus_class(result.data_cls):
             engine.add_data(data=result.data)
         else:
@@ -342,20 +494,13 @@ class BacktestNode:
                 session=session,
             )
 
-        # Stream data
-        for chunk in session.to_query_result():
-            engine.add_data(
-                data=capsule_to_list(chunk),
-                validate=False,  # Cannot validate mixed type stream
-                sort=True,  # Temporarily sorting  # Already sorted from kmerge
-            )
-            engine.run(
-                run_config_id=run_config_id,
-                streaming=True,
-            )
-            engine.clear_data()
-
-        engine.end()
+        # Stream data (chunks are pulled lazily by the engines data iterator)
+        engine.add_data_stream(
+            data=(capsule_to_list(chunk) for chunk in session.to_query_result()),
+            name="catalog",
+            validate=False,  # Cannot validate mixed type stream (already sorted from kmerge)
+        )
+        engine.run(run_config_id=run_config_id)
         engine.dispose()
 
     def _run_oneshot(
@@ -384,7 +529,7 @@ class BacktestNode:
             engine.logger.info(
                 f"Read {len(result.data):,} events from parquet in {pd.Timedelta(t1 - t0)}s.",
             )
-            self._load_engine_data(engine=engine, result=result)
+            self.load_engine_data(engine=engine, result=result)
             t2 = pd.Timestamp.now()
             engine.logger.info(f"Engine load took {pd.Timedelta(t2 - t1)}s")
 
@@ -422,3 +567,29 @@ class BacktestNode:
         for engine in self.get_engines():
             if not engine.trader.is_disposed:
                 engine.dispose()
+
+
+def _init_backtest_worker(max_memory_bytes: int | None) -> None:
+    if max_memory_bytes is None:
+        return
+
+    try:
+        import resource
+    except ImportError:  # Platform does not support resource limits
+        return
+
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory_bytes, max_memory_bytes))
+
+
+def _run_backtest_worker(config: BacktestRunConfig) -> BacktestResult:
+    node = BacktestNode(configs=[config])
+    try:
+        return node._run(
+            run_config_id=config.id,
+            engine_config=config.engine,
+            venue_configs=config.venues,
+            data_configs=config.data,
+            batch_size_bytes=config.batch_size_bytes,
+        )
+    finally:
+        node.dispose()
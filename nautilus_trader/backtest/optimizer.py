@@ -0,0 +1,534 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import itertools
+import multiprocessing
+import pickle
+import random
+from collections.abc import Callable
+from collections.abc import Generator
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import msgspec
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from nautilus_trader.analysis.incremental import IncrementalStatistics
+from nautilus_trader.backtest.config import BacktestEngineConfig
+from nautilus_trader.backtest.config import BacktestRunConfig
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.results import BacktestResult
+from nautilus_trader.cache.config import CacheConfig
+from nautilus_trader.common.component import Logger
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_trader.persistence.catalog.types import CatalogDataResult
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+from nautilus_trader.trading.config import ImportableStrategyConfig
+from nautilus_trader.trading.config import StrategyFactory
+
+
+# Data types which can be shared between processes as Arrow IPC buffers,
+# all other data types are shared as pickled bytes.
+ARROW_SHAREABLE_DATA_TYPES: tuple[type, ...] = (OrderBookDelta, QuoteTick, TradeTick, Bar)
+
+
+@dataclass(frozen=True)
+class SharedDataHandle:
+    """
+    Represents a handle to data loaded into a named shared memory block.
+    """
+
+    name: str
+    size: int
+    data_cls: type
+    client_id: ClientId | None
+    is_arrow: bool
+
+
+def data_to_shared_memory(result: CatalogDataResult) -> tuple[SharedMemory, SharedDataHandle]:
+    """
+    Copy the data from the given catalog result into a new shared memory block.
+
+    Arrow shareable data types are written as an Arrow IPC stream, all other
+    data types are pickled.
+
+    Parameters
+    ----------
+    result : CatalogDataResult
+        The loaded catalog data to share.
+
+    Returns
+    -------
+    tuple[SharedMemory, SharedDataHandle]
+        The shared memory block (which the caller owns and must unlink) and
+        a picklable handle to attach to it from other processes.
+
+    """
+    is_arrow = result.data_cls in ARROW_SHAREABLE_DATA_TYPES
+    if is_arrow:
+        table: pa.Table = ArrowSerializer.serialize_batch(result.data, data_cls=result.data_cls)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        payload = sink.getvalue()
+    else:
+        payload = pa.py_buffer(pickle.dumps(result.data))
+
+    shm = SharedMemory(create=True, size=max(payload.size, 1))
+    shm.buf[: payload.size] = memoryview(payload)
+
+    handle = SharedDataHandle(
+        name=shm.name,
+        size=payload.size,
+        data_cls=result.data_cls,
+        client_id=result.client_id,
+        is_arrow=is_arrow,
+    )
+    return shm, handle
+
+
+def data_from_shared_memory(handle: SharedDataHandle) -> list[Data]:
+    """
+    Decode the data held in the shared memory block for the given handle.
+
+    Arrow IPC buffers are read zero-copy from shared memory before decoding.
+
+    Parameters
+    ----------
+    handle : SharedDataHandle
+        The handle for the shared memory block.
+
+    Returns
+    -------
+    list[Data]
+
+    """
+    shm = SharedMemory(name=handle.name)
+    view = shm.buf[: handle.size]
+    try:
+        if handle.is_arrow:
+            table = pa.ipc.open_stream(pa.py_buffer(view)).read_all()
+            pyo3_data = ArrowSerializer.deserialize(data_cls=handle.data_cls, batch=table)
+            del table  # Release references to the shared buffer prior to closing
+            return handle.data_cls.from_pyo3_list(pyo3_data)
+        else:
+            return pickle.loads(view)  # noqa: S301 (data was pickled by this process tree)
+    finally:
+        view.release()
+        shm.close()
+
+
+class ParameterSweep:
+    """
+    Provides a parameter sweep optimizer for a trading strategy over a backtest run
+    configuration.
+
+    Each `BacktestDataConfig` is loaded from the catalog once and shared across all
+    variants. Variants are run by resetting a single engine (per worker) with
+    `BacktestEngine.reset()`, rather than rebuilding an engine and reloading data
+    for every variant. When running with multiple workers, the loaded data is shared
+    with the worker processes via shared memory (as Arrow IPC buffers where possible).
+
+    Parameters
+    ----------
+    run_config : BacktestRunConfig
+        The base run configuration providing the venues, data and engine for every variant.
+        Any strategies already in the engine config will be run alongside each variant.
+    strategy : ImportableStrategyConfig
+        The base strategy configuration, to which each variants parameters are applied.
+    objective : str or Callable[[BacktestResult], float], default 'Sharpe Ratio (252 days)'
+        The objective to rank variants by. A string is the name of a `PortfolioAnalyzer`
+        statistic (returns statistics are searched first, then PnL statistics).
+    maximize : bool, default True
+        If the objective should be maximized (otherwise minimized).
+    max_workers : int, optional
+        The maximum number of worker processes. If ``None`` then all variants
+        are run sequentially in this process.
+    stop_condition : Callable[[IncrementalStatistics], bool], optional
+        The condition for abandoning a variant early (see
+        `BacktestEngine.set_stop_condition`). Must be picklable when running with
+        multiple workers.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not positive (> 0).
+
+    """
+
+    def __init__(
+        self,
+        run_config: BacktestRunConfig,
+        strategy: ImportableStrategyConfig,
+        objective: str | Callable[[BacktestResult], float] = "Sharpe Ratio (252 days)",
+        maximize: bool = True,
+        max_workers: int | None = None,
+        stop_condition: Callable[[IncrementalStatistics], bool] | None = None,
+    ) -> None:
+        PyCondition.type(run_config, BacktestRunConfig, "run_config")
+        PyCondition.type(strategy, ImportableStrategyConfig, "strategy")
+        if max_workers is not None:
+            PyCondition.positive_int(max_workers, "max_workers")
+
+        # Statistics are only calculated during post-run analysis, and instruments
+        # must be retained in the cache between engine resets.
+        engine_config = run_config.engine or BacktestEngineConfig()
+        cache_config = msgspec.structs.replace(
+            engine_config.cache or CacheConfig(),
+            drop_instruments_on_reset=False,
+        )
+        engine_config = msgspec.structs.replace(
+            engine_config,
+            cache=cache_config,
+            run_analysis=True,
+        )
+
+        self._run_config = msgspec.structs.replace(run_config, engine=engine_config)
+        self._strategy = strategy
+        self._objective = objective
+        self._maximize = maximize
+        self._max_workers = max_workers
+        self._stop_condition = stop_condition
+        self._log = Logger(type(self).__name__)
+
+    @staticmethod
+    def grid(params: dict[str, Sequence[Any]]) -> list[dict[str, Any]]:
+        """
+        Return the cartesian product of the given parameter values.
+
+        Parameters
+        ----------
+        params : dict[str, Sequence[Any]]
+            The candidate values for each strategy config parameter.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+
+        """
+        keys = list(params)
+        return [dict(zip(keys, values)) for values in itertools.product(*params.values())]
+
+    @staticmethod
+    def sample(
+        params: dict[str, Sequence[Any] | Callable[[random.Random], Any]],
+        n_iter: int,
+        seed: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Return randomly sampled parameter variants.
+
+        Parameters
+        ----------
+        params : dict[str, Sequence[Any] | Callable[[random.Random], Any]]
+            The candidate values (sampled uniformly), or a sampling function taking
+            the random number generator, for each strategy config parameter.
+        n_iter : int
+            The number of variants to sample.
+        seed : int, optional
+            The seed for the random number generator.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+
+        Raises
+        ------
+        ValueError
+            If `n_iter` is not positive (> 0).
+
+        """
+        PyCondition.positive_int(n_iter, "n_iter")
+
+        rng = random.Random(seed)  # noqa: S311 (not used for security)
+        variants: list[dict[str, Any]] = []
+        for _ in range(n_iter):
+            variant: dict[str, Any] = {}
+            for key, values in params.items():
+                variant[key] = values(rng) if callable(values) else rng.choice(values)
+            variants.append(variant)
+
+        return variants
+
+    def run_grid(self, params: dict[str, Sequence[Any]]) -> pd.DataFrame:
+        """
+        Run a grid search over the cartesian product of the given parameter values.
+
+        Parameters
+        ----------
+        params : dict[str, Sequence[Any]]
+            The candidate values for each strategy config parameter.
+
+        Returns
+        -------
+        pd.DataFrame
+            The ranked results table.
+
+        """
+        return self.run(self.grid(params))
+
+    def run_random(
+        self,
+        params: dict[str, Sequence[Any] | Callable[[random.Random], Any]],
+        n_iter: int,
+        seed: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Run a random search over the given parameter distributions.
+
+        Parameters
+        ----------
+        params : dict[str, Sequence[Any] | Callable[[random.Random], Any]]
+            The candidate values (sampled uniformly), or a sampling function taking
+            the random number generator, for each strategy config parameter.
+        n_iter : int
+            The number of variants to run.
+        seed : int, optional
+            The seed for the random number generator.
+
+        Returns
+        -------
+        pd.DataFrame
+            The ranked results table.
+
+        """
+        return self.run(self.sample(params, n_iter=n_iter, seed=seed))
+
+    def run(self, variants: list[dict[str, Any]]) -> pd.DataFrame:
+        """
+        Run the given strategy parameter variants.
+
+        Parameters
+        ----------
+        variants : list[dict[str, Any]]
+            The strategy config parameter overrides for each variant.
+
+        Returns
+        -------
+        pd.DataFrame
+            The ranked results table, with a row per variant which completed.
+
+        Raises
+        ------
+        ValueError
+            If `variants` is empty.
+
+        """
+        PyCondition.not_empty(variants, "variants")
+
+        rows: list[dict[str, Any]] = []
+        for i, result in self._run_variants(variants):
+            row: dict[str, Any] = dict(variants[i])
+            row["objective"] = self.objective_value(result)
+            row["stopped_early"] = result.stopped_early
+            row["total_orders"] = result.total_orders
+            row["total_positions"] = result.total_positions
+            for currency, stats in result.stats_pnls.items():
+                for name, value in stats.items():
+                    row[f"{name} {currency}"] = value
+            row.update(result.stats_returns)
+            rows.append(row)
+
+        df = pd.DataFrame(rows)
+        if df.empty:
+            return df
+
+        df = df.sort_values(
+            by="objective",
+            ascending=not self._maximize,
+            na_position="last",
+            kind="stable",
+        ).reset_index(drop=True)
+        df.index = pd.RangeIndex(start=1, stop=len(df) + 1, name="rank")
+
+        return df
+
+    def objective_value(self, result: BacktestResult) -> float:
+        """
+        Return the objective value for the given backtest result.
+
+        Parameters
+        ----------
+        result : BacktestResult
+            The backtest result.
+
+        Returns
+        -------
+        float
+            NaN if the objective statistic was not found in the result.
+
+        """
+        if callable(self._objective):
+            return float(self._objective(result))
+
+        value = result.stats_returns.get(self._objective)
+        if value is None:
+            for stats in result.stats_pnls.values():
+                value = stats.get(self._objective)
+                if value is not None:
+                    break
+
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def _load_data(self) -> list[CatalogDataResult]:
+        results: list[CatalogDataResult] = []
+        for config in self._run_config.data:
+            result = BacktestNode.load_data_config(config)
+            if not result.data:
+                self._log.warning(f"No data found for {config}")
+                continue
+            results.append(result)
+
+        return results
+
+    def _run_variants(
+        self,
+        variants: list[dict[str, Any]],
+    ) -> Generator[tuple[int, BacktestResult], None, None]:
+        data = self._load_data()
+        indexed_variants = list(enumerate(variants))
+
+        if self._max_workers is None:
+            yield from _run_variants_on_engine(
+                run_config=self._run_config,
+                strategy=self._strategy,
+                data=data,
+                indexed_variants=indexed_variants,
+                stop_condition=self._stop_condition,
+            )
+            return
+
+        shared: list[SharedMemory] = []
+        try:
+            handles: list[SharedDataHandle] = []
+            for result in data:
+                shm, handle = data_to_shared_memory(result)
+                shared.append(shm)
+                handles.append(handle)
+
+            # One engine per worker, with variants dealt round-robin between workers
+            n_chunks = min(self._max_workers, len(indexed_variants))
+            chunks = [indexed_variants[i::n_chunks] for i in range(n_chunks)]
+
+            with ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _run_variants_worker,
+                        self._run_config,
+                        self._strategy,
+                        handles,
+                        chunk,
+                        self._stop_condition,
+                    )
+                    for chunk in chunks
+                ]
+                for future in as_completed(futures):
+                    try:
+                        worker_results = future.result()
+                    except Exception as e:
+                        self._log.error(f"Error running sweep worker: {e!r}")
+                        continue
+
+                    yield from worker_results
+        finally:
+            for shm in shared:
+                shm.close()
+                shm.unlink()
+
+
+def _run_variants_worker(
+    run_config: BacktestRunConfig,
+    strategy: ImportableStrategyConfig,
+    handles: list[SharedDataHandle],
+    indexed_variants: list[tuple[int, dict[str, Any]]],
+    stop_condition: Callable[[IncrementalStatistics], bool] | None = None,
+) -> list[tuple[int, BacktestResult]]:
+    data = [
+        CatalogDataResult(
+            data_cls=handle.data_cls,
+            data=data_from_shared_memory(handle),
+            client_id=handle.client_id,
+        )
+        for handle in handles
+    ]
+    return list(
+        _run_variants_on_engine(
+            run_config=run_config,
+            strategy=strategy,
+            data=data,
+            indexed_variants=indexed_variants,
+            stop_condition=stop_condition,
+        ),
+    )
+
+
+def _run_variants_on_engine(
+    run_config: BacktestRunConfig,
+    strategy: ImportableStrategyConfig,
+    data: list[CatalogDataResult],
+    indexed_variants: list[tuple[int, dict[str, Any]]],
+    stop_condition: Callable[[IncrementalStatistics], bool] | None = None,
+) -> Generator[tuple[int, BacktestResult], None, None]:
+    node = BacktestNode(configs=[run_config])
+    engine: BacktestEngine = node.create_engine(run_config)
+
+    engine.set_stop_condition(stop_condition)
+
+    try:
+        for result in data:
+            node.load_engine_data(engine=engine, result=result)
+
+        for i, params in indexed_variants:
+            variant_config = ImportableStrategyConfig(
+                strategy_path=strategy.strategy_path,
+                config_path=strategy.config_path,
+                config={**strategy.config, **params},
+            )
+            variant = StrategyFactory.create(variant_config)
+
+            engine.reset()
+            engine.add_strategy(variant)
+            try:
+                engine.run(run_config_id=run_config.id)
+                result = engine.get_result()
+            except Exception as e:
+                # Broad catch all prevents a single variant from halting the sweep
+                Logger("ParameterSweep").error(f"Error running variant {params}: {e!r}")
+                continue
+            finally:
+                engine.trader.remove_strategy(variant.id)
+
+            yield i, result
+    finally:
+        engine.dispose()
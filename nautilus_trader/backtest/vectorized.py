@@ -0,0 +1,474 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
+from nautilus_trader.backtest.columns import BarColumns
+from nautilus_trader.backtest.models import FeeModel
+from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import FixedFeeModel
+from nautilus_trader.backtest.models import MakerTakerFeeModel
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+
+@dataclass(frozen=True)
+class VectorizedPosition:
+    """
+    Represents a position (from open to flat) within a vectorized backtest.
+
+    This provides the `Position` fields used by the `PortfolioAnalyzer` statistics.
+
+    """
+
+    id: PositionId
+    entry: OrderSide
+    avg_px_open: float
+    avg_px_close: float
+    peak_qty: float
+    realized_pnl: Money
+    realized_return: float
+    ts_opened: int
+    ts_closed: int
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Return whether the position is closed (flat).
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.ts_closed > 0
+
+
+@dataclass
+class VectorizedBacktestResult:
+    """
+    Represents the results of a single vectorized backtest run.
+    """
+
+    instrument_id: str
+    iterations: int
+    total_orders: int
+    total_positions: int
+    balance_starting: float
+    balance_final: float
+    stats_pnls: dict[str, dict[str, float]]
+    stats_returns: dict[str, Any]
+    stats_general: dict[str, Any]
+    fills: pd.DataFrame
+    positions: list[VectorizedPosition]
+
+
+class _PositionTracker:
+    # Applies fills to a single netting position, following the `Position` accounting
+    # (and `ExecutionEngine` position flips) so statistics match the event-driven engine
+    def __init__(self, instrument: Instrument, currency_precision: int) -> None:
+        self._instrument_id = instrument.id.value
+        self._multiplier = float(instrument.multiplier)
+        self._size_precision = instrument.size_precision
+        self._currency = instrument.get_settlement_currency()
+        self._currency_precision = currency_precision
+        self.positions: list[VectorizedPosition] = []
+        self.balance_change = 0.0
+        self._signed_qty = 0.0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._entry = OrderSide.NO_ORDER_SIDE
+        self._avg_px_open = 0.0
+        self._avg_px_close = 0.0
+        self._close_qty = 0.0
+        self._peak_qty = 0.0
+        self._realized_pnl = 0.0
+        self._realized_return = 0.0
+        self._ts_opened = 0
+
+    def apply(self, side: int, qty: float, px: float, commission: float, ts: int) -> None:
+        open_qty = abs(self._signed_qty)
+        if self._signed_qty != 0.0 and side * self._signed_qty < 0.0 and qty > open_qty:
+            # Flip position, splitting the commission in proportion to the fill
+            commission_close = round(commission * open_qty / qty, self._currency_precision)
+            self._apply(side, open_qty, px, commission_close, ts)
+            self._apply(side, qty - open_qty, px, commission - commission_close, ts)
+        else:
+            self._apply(side, qty, px, commission, ts)
+
+    def _apply(self, side: int, qty: float, px: float, commission: float, ts: int) -> None:
+        realized_pnl = -commission
+        open_qty = abs(self._signed_qty)
+        if self._signed_qty == 0.0:
+            self._entry = OrderSide.BUY if side > 0 else OrderSide.SELL
+            self._avg_px_open = px
+            self._ts_opened = ts
+        elif side * self._signed_qty > 0.0:
+            self._avg_px_open = (self._avg_px_open * open_qty + px * qty) / (open_qty + qty)
+        else:
+            direction = 1.0 if self._signed_qty > 0.0 else -1.0
+            if self._close_qty == 0.0:
+                self._avg_px_close = px
+            else:
+                self._avg_px_close = (self._avg_px_close * self._close_qty + px * qty) / (
+                    self._close_qty + qty
+                )
+            self._close_qty += qty
+            self._realized_return = (
+                direction * (self._avg_px_close - self._avg_px_open) / self._avg_px_open
+            )
+            points = direction * (px - self._avg_px_open)
+            realized_pnl += min(qty, open_qty) * self._multiplier * points
+
+        realized_pnl = round(realized_pnl, self._currency_precision)
+        self._realized_pnl = round(self._realized_pnl + realized_pnl, self._currency_precision)
+        self.balance_change += realized_pnl
+
+        self._signed_qty = round(self._signed_qty + side * qty, self._size_precision)
+        self._peak_qty = max(self._peak_qty, abs(self._signed_qty))
+        if self._signed_qty == 0.0:
+            self.positions.append(self._position(ts_closed=ts))
+            self._reset()
+
+    def _position(self, ts_closed: int) -> VectorizedPosition:
+        return VectorizedPosition(
+            id=PositionId(f"{self._instrument_id}-{len(self.positions) + 1:03d}"),
+            entry=self._entry,
+            avg_px_open=self._avg_px_open,
+            avg_px_close=self._avg_px_close,
+            peak_qty=self._peak_qty,
+            realized_pnl=Money(self._realized_pnl, self._currency),
+            realized_return=self._realized_return,
+            ts_opened=self._ts_opened,
+            ts_closed=ts_closed,
+        )
+
+    def all_positions(self) -> list[VectorizedPosition]:
+        if self._signed_qty == 0.0:
+            return self.positions
+        return [*self.positions, self._position(ts_closed=0)]  # Open position
+
+
+class VectorizedBacktester:
+    """
+    Provides a vectorized backtester for pre-screening target position signals
+    against arrays of prices.
+
+    Signals are translated into market orders at each index where the target position
+    changes, and filled at the price for that index (the bar close, or the top of book
+    quote for the order side). The fills apply the same instrument precision and
+    multiplier, `FillModel` slippage probability (one tick, as per L1 execution in the
+    `OrderMatchingEngine`) and `FeeModel` commissions as the event-driven engine, and
+    are then accounted as a netting position on a margin account. The resulting
+    positions are passed through a `PortfolioAnalyzer` with the default statistics, so
+    results are comparable with a `BacktestEngine` run of the same signals.
+
+    The screening assumes the full order quantity is available at the fill price
+    (no book depth or volume limits), and that orders are filled without latency.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the backtest.
+    starting_balance : Money
+        The starting account balance (must be in the instrument settlement currency).
+    fee_model : FeeModel, optional
+        The fee model for fill commissions (if None then uses a `MakerTakerFeeModel`,
+        as per the default venue configuration).
+    fill_model : FillModel, optional
+        The fill model for slippage (if None then no slippage).
+    random_seed : int, optional
+        The random seed for the slippage draws (if None then no random seed).
+
+    Raises
+    ------
+    ValueError
+        If `instrument` is inverse.
+    ValueError
+        If `starting_balance` currency is not the instrument settlement currency.
+    TypeError
+        If `fee_model` is not a `MakerTakerFeeModel` or `FixedFeeModel`.
+    ValueError
+        If a `FixedFeeModel` commission currency is not the instrument settlement currency.
+
+    """
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        starting_balance: Money,
+        fee_model: FeeModel | None = None,
+        fill_model: FillModel | None = None,
+        random_seed: int | None = None,
+    ) -> None:
+        PyCondition.not_none(instrument, "instrument")
+        PyCondition.not_none(starting_balance, "starting_balance")
+        PyCondition.false(instrument.is_inverse, "inverse instruments are not supported")
+        currency = instrument.get_settlement_currency()
+        PyCondition.equal(
+            starting_balance.currency,
+            currency,
+            "starting_balance.currency",
+            "settlement_currency",
+        )
+
+        fee_model = fee_model or MakerTakerFeeModel()
+        PyCondition.type(fee_model, (MakerTakerFeeModel, FixedFeeModel), "fee_model")
+        if isinstance(fee_model, FixedFeeModel):
+            PyCondition.equal(
+                fee_model.commission.currency,
+                currency,
+                "fee_model.commission.currency",
+                "settlement_currency",
+            )
+
+        self.instrument = instrument
+        self.starting_balance = starting_balance
+        self.fee_model = fee_model
+        self.fill_model = fill_model or FillModel()
+        self._rng = np.random.default_rng(random_seed)
+
+    def run_bars(
+        self,
+        bars: BarColumns,
+        target_positions=None,
+        order_quantities=None,
+    ) -> VectorizedBacktestResult:
+        """
+        Run a vectorized backtest of the given signals over the given bars.
+
+        Orders are filled at the bar close (the top of book after a bar is processed
+        by the `OrderMatchingEngine`).
+
+        Parameters
+        ----------
+        bars : BarColumns
+            The bars for the backtest.
+        target_positions : array_like[float], optional
+            The signed target position quantity at each bar (NaN to hold the position).
+        order_quantities : array_like[float], optional
+            The signed market order quantity at each bar (zero or NaN for no order).
+
+        Returns
+        -------
+        VectorizedBacktestResult
+
+        Raises
+        ------
+        ValueError
+            If both or neither of `target_positions` and `order_quantities` are given.
+        ValueError
+            If the signals length is not equal to the number of bars.
+
+        """
+        PyCondition.not_none(bars, "bars")
+
+        closes = bars.as_double("close")
+        return self._run(bars.ts_inits, closes, closes, target_positions, order_quantities)
+
+    def run_prices(
+        self,
+        ts_init,
+        prices,
+        target_positions=None,
+        order_quantities=None,
+    ) -> VectorizedBacktestResult:
+        """
+        Run a vectorized backtest of the given signals over the given prices.
+
+        Both buy and sell orders are filled at the price (such as trade or bar close prices).
+
+        Parameters
+        ----------
+        ts_init : array_like[int]
+            The UNIX timestamps (nanoseconds) for each price.
+        prices : array_like[float]
+            The prices.
+        target_positions : array_like[float], optional
+            The signed target position quantity at each price (NaN to hold the position).
+        order_quantities : array_like[float], optional
+            The signed market order quantity at each price (zero or NaN for no order).
+
+        Returns
+        -------
+        VectorizedBacktestResult
+
+        Raises
+        ------
+        ValueError
+            If both or neither of `target_positions` and `order_quantities` are given.
+        ValueError
+            If the array lengths are not equal.
+
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        return self._run(ts_init, prices, prices, target_positions, order_quantities)
+
+    def run_quotes(
+        self,
+        ts_init,
+        bid_prices,
+        ask_prices,
+        target_positions=None,
+        order_quantities=None,
+    ) -> VectorizedBacktestResult:
+        """
+        Run a vectorized backtest of the given signals over the given quotes.
+
+        Buy orders are filled at the ask price, and sell orders at the bid price.
+
+        Parameters
+        ----------
+        ts_init : array_like[int]
+            The UNIX timestamps (nanoseconds) for each quote.
+        bid_prices : array_like[float]
+            The best bid prices.
+        ask_prices : array_like[float]
+            The best ask prices.
+        target_positions : array_like[float], optional
+            The signed target position quantity at each quote (NaN to hold the position).
+        order_quantities : array_like[float], optional
+            The signed market order quantity at each quote (zero or NaN for no order).
+
+        Returns
+        -------
+        VectorizedBacktestResult
+
+        Raises
+        ------
+        ValueError
+            If both or neither of `target_positions` and `order_quantities` are given.
+        ValueError
+            If the array lengths are not equal.
+
+        """
+        return self._run(ts_init, bid_prices, ask_prices, target_positions, order_quantities)
+
+    def _run(
+        self,
+        ts_init,
+        bid_prices,
+        ask_prices,
+        target_positions,
+        order_quantities,
+    ) -> VectorizedBacktestResult:
+        PyCondition.true(
+            (target_positions is None) != (order_quantities is None),
+            "exactly one of `target_positions` or `order_quantities` must be given",
+        )
+
+        ts_init = np.asarray(ts_init, dtype=np.uint64)
+        bids = np.asarray(bid_prices, dtype=np.float64)
+        asks = np.asarray(ask_prices, dtype=np.float64)
+        signals = np.asarray(
+            target_positions if target_positions is not None else order_quantities,
+            dtype=np.float64,
+        )
+        count = len(ts_init)
+        PyCondition.equal(len(bids), count, "len(bid_prices)", "len(ts_init)")
+        PyCondition.equal(len(asks), count, "len(ask_prices)", "len(ts_init)")
+        PyCondition.equal(len(signals), count, "len(signals)", "len(ts_init)")
+
+        # Translate signals into signed order quantities (at instrument size precision)
+        size_precision = self.instrument.size_precision
+        if target_positions is not None:
+            targets = pd.Series(signals).ffill().fillna(0.0).to_numpy()
+            targets = np.round(targets, size_precision)
+            orders = np.diff(targets, prepend=0.0)
+        else:
+            orders = np.nan_to_num(signals, nan=0.0)
+        orders = np.round(orders, size_precision)
+
+        indexes = np.flatnonzero(orders)
+        sides = np.sign(orders[indexes])
+        quantities = np.abs(orders[indexes])
+        prices = np.where(sides > 0, asks[indexes], bids[indexes])
+
+        # Apply slippage of one tick against the order side
+        prob_slippage = self.fill_model.prob_slippage
+        if prob_slippage > 0.0:
+            slipped = self._rng.random(len(indexes)) < prob_slippage
+            prices = prices + sides * slipped * self.instrument.price_increment.as_double()
+        prices = np.round(prices, self.instrument.price_precision)
+
+        currency = self.instrument.get_settlement_currency()
+        commissions = np.round(self._commissions(quantities, prices), currency.precision)
+
+        # Position accounting is path dependent, so is applied over the fills only
+        tracker = _PositionTracker(self.instrument, currency.precision)
+        ts_fills = ts_init[indexes]
+        for side, qty, px, commission, ts in zip(
+            sides.tolist(),
+            quantities.tolist(),
+            prices.tolist(),
+            commissions.tolist(),
+            ts_fills.tolist(),
+        ):
+            tracker.apply(side, qty, px, commission, ts)
+
+        positions = tracker.all_positions()
+        balance_final = Money(
+            self.starting_balance.as_double() + tracker.balance_change,
+            currency,
+        )
+
+        analyzer = PortfolioAnalyzer()
+        analyzer.register_default_statistics()
+        analyzer.calculate_statistics_from_balances(
+            starting_balances={currency: self.starting_balance},
+            balances={currency: balance_final},
+            positions=positions,
+        )
+
+        fills = pd.DataFrame(
+            {
+                "ts_init": ts_fills,
+                "side": np.where(sides > 0, "BUY", "SELL"),
+                "quantity": quantities,
+                "price": prices,
+                "commission": commissions,
+            },
+        )
+
+        return VectorizedBacktestResult(
+            instrument_id=self.instrument.id.value,
+            iterations=count,
+            total_orders=len(indexes),
+            total_positions=len(positions),
+            balance_starting=self.starting_balance.as_double(),
+            balance_final=balance_final.as_double(),
+            stats_pnls={currency.code: analyzer.get_performance_stats_pnls(currency)},
+            stats_returns=analyzer.get_performance_stats_returns(),
+            stats_general=analyzer.get_performance_stats_general(),
+            fills=fills,
+            positions=positions,
+        )
+
+    def _commissions(self, quantities: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        # All signals are filled as market orders (taker), in a single fill per order
+        if isinstance(self.fee_model, FixedFeeModel):
+            return np.full(len(quantities), self.fee_model.commission.as_double())
+
+        notionals = quantities * float(self.instrument.multiplier) * prices
+        return notionals * float(self.instrument.taker_fee)
@@ -14,6 +14,9 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.cache.history cimport BarHistory
+from nautilus_trader.cache.history cimport QuoteTickHistory
+from nautilus_trader.cache.history cimport TradeTickHistory
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.core.rust.model cimport PriceType
@@ -67,6 +70,9 @@ cdef class CacheFacade:
     cpdef bint has_quote_ticks(self, InstrumentId instrument_id)
     cpdef bint has_trade_ticks(self, InstrumentId instrument_id)
     cpdef bint has_bars(self, BarType bar_type)
+    cpdef QuoteTickHistory quote_tick_history(self, InstrumentId instrument_id)
+    cpdef TradeTickHistory trade_tick_history(self, InstrumentId instrument_id)
+    cpdef BarHistory bar_history(self, BarType bar_type)
 
     cpdef double get_xrate(
         self,
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.cache.history cimport BarHistory
+from nautilus_trader.cache.history cimport QuoteTickHistory
+from nautilus_trader.cache.history cimport TradeTickHistory
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarType
@@ -115,6 +118,18 @@ cdef class CacheFacade:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `has_bars` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef QuoteTickHistory quote_tick_history(self, InstrumentId instrument_id):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `quote_tick_history` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef TradeTickHistory trade_tick_history(self, InstrumentId instrument_id):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `trade_tick_history` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef BarHistory bar_history(self, BarType bar_type):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `bar_history` must be implemented in the subclass")  # pragma: no cover
+
     cpdef double get_xrate(
         self,
         Venue venue,
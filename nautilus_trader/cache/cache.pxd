@@ -21,6 +21,9 @@ from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.cache.history cimport BarHistory
+from nautilus_trader.cache.history cimport QuoteTickHistory
+from nautilus_trader.cache.history cimport TradeTickHistory
 from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.rust.model cimport AggregationSource
@@ -67,6 +70,9 @@ cdef class Cache(CacheFacade):
     cdef dict _bars
     cdef dict _bars_bid
     cdef dict _bars_ask
+    cdef dict _quote_tick_histories
+    cdef dict _trade_tick_histories
+    cdef dict _bar_histories
     cdef dict _currencies
     cdef dict _instruments
     cdef dict _synthetics
@@ -75,6 +81,8 @@ cdef class Cache(CacheFacade):
     cdef dict _order_lists
     cdef dict _positions
     cdef dict _position_snapshots
+    cdef set _orders_unloaded
+    cdef set _positions_unloaded
 
     cdef dict _index_venue_account
     cdef dict _index_venue_orders
@@ -104,12 +112,19 @@ cdef class Cache(CacheFacade):
     cdef set _index_actors
     cdef set _index_strategies
     cdef set _index_exec_algorithms
+    cdef dict _index_order_query
+    cdef dict _index_order_query_status
+    cdef dict _index_position_query
+    cdef dict _index_position_query_state
     cdef bint _drop_instruments_on_reset
+    cdef bint _lazy_load_closed
 
     cdef readonly int tick_capacity
     """The caches tick capacity.\n\n:returns: `int`"""
     cdef readonly int bar_capacity
     """The caches bar capacity.\n\n:returns: `int`"""
+    cdef readonly int history_capacity
+    """The caches columnar market data history capacity (zero if not enabled).\n\n:returns: `int`"""
     cdef readonly bint snapshot_orders
     """If order state snapshots should be persisted.\n\n:returns: `bool`"""
     cdef readonly bint snapshot_positions
@@ -136,10 +151,24 @@ cdef class Cache(CacheFacade):
     cdef void _cache_venue_account_id(self, AccountId account_id)
     cdef void _build_indexes_from_orders(self)
     cdef void _build_indexes_from_positions(self)
+    cdef void _index_order(self, Order order)
+    cdef void _index_position(self, Position position)
+    cdef Order _load_order(self, ClientOrderId client_order_id)
+    cdef Position _load_position(self, PositionId position_id)
+    cdef bint _is_position_orders_unloaded(self, set position_ids)
+    cdef void _load_unloaded_orders(self)
+    cdef void _load_related_closed_orders(self)
+    cdef void _load_unloaded_positions(self)
+    cdef QuoteTickHistory _quote_tick_history(self, InstrumentId instrument_id)
+    cdef TradeTickHistory _trade_tick_history(self, InstrumentId instrument_id)
+    cdef BarHistory _bar_history(self, BarType bar_type)
     cdef set _build_order_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
-    cdef set _build_position_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef void _update_order_query_index(self, Order order, str status)
+    cdef void _update_position_query_index(self, Position position, str status)
+    cdef list _get_orders_for_query(self, str status, Venue venue, InstrumentId instrument_id, StrategyId strategy_id, OrderSide side)
+    cdef list _get_positions_for_query(self, str status, Venue venue, InstrumentId instrument_id, StrategyId strategy_id, PositionSide side)
+    cdef int _query_count(self, dict index, tuple key)
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side)
-    cdef list _get_positions_for_ids(self, set position_ids, PositionSide side)
     cdef void _assign_position_id_to_contingencies(self, Order order)
     cpdef Money calculate_unrealized_pnl(self, Position position)
 
@@ -17,6 +17,7 @@ import copy
 import pickle
 import time
 import uuid
+from bisect import bisect_left
 from collections import deque
 from decimal import Decimal
 
@@ -31,6 +32,9 @@ from libc.stdint cimport uint64_t
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.cache.history cimport BarHistory
+from nautilus_trader.cache.history cimport QuoteTickHistory
+from nautilus_trader.cache.history cimport TradeTickHistory
 from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.correctness cimport Condition
@@ -71,6 +75,57 @@ from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+cdef list _query_index_keys(
+    str status,
+    Venue venue,
+    InstrumentId instrument_id,
+    StrategyId strategy_id,
+    int side,
+    int no_side,
+):
+    # Returns every query key the item is a member of, with ``None`` (or `no_side`)
+    # for any filter which was not specified by the query.
+    cdef list keys = []
+    for v in (None, venue):
+        for i in (None, instrument_id):
+            for s in (None, strategy_id):
+                keys.append((status, v, i, s, no_side))
+                if side != no_side:
+                    keys.append((status, v, i, s, side))
+    return keys
+
+
+cdef void _query_index_insert(dict index, list keys, object value):
+    cdef:
+        tuple key
+        list values
+        Py_ssize_t i
+    for key in keys:
+        values = index.get(key)
+        if values is None:
+            index[key] = [value]
+            continue
+        i = bisect_left(values, value)
+        if i == len(values) or values[i] != value:
+            values.insert(i, value)
+
+
+cdef void _query_index_remove(dict index, list keys, object value):
+    cdef:
+        tuple key
+        list values
+        Py_ssize_t i
+    for key in keys:
+        values = index.get(key)
+        if values is None:
+            continue
+        i = bisect_left(values, value)
+        if i < len(values) and values[i] == value:
+            del values[i]
+            if not values:
+                del index[key]
+
+
 cdef class Cache(CacheFacade):
     """
     Provides a common object cache for market and execution related data.
@@ -109,8 +164,10 @@ cdef class Cache(CacheFacade):
 
         # Configuration
         self._drop_instruments_on_reset = config.drop_instruments_on_reset
+        self._lazy_load_closed = config.lazy_load_closed
         self.tick_capacity = config.tick_capacity
         self.bar_capacity = config.bar_capacity
+        self.history_capacity = config.history_capacity or 0
         self.snapshot_orders = snapshot_orders
         self.snapshot_positions = snapshot_positions
 
@@ -123,6 +180,9 @@ cdef class Cache(CacheFacade):
         self._bars: dict[BarType, deque[Bar]] = {}
         self._bars_bid: dict[InstrumentId, Bar] = {}
         self._bars_ask: dict[InstrumentId, Bar] = {}
+        self._quote_tick_histories: dict[InstrumentId, QuoteTickHistory] = {}
+        self._trade_tick_histories: dict[InstrumentId, TradeTickHistory] = {}
+        self._bar_histories: dict[BarType, BarHistory] = {}
         self._currencies: dict[str, Currency] = {}
         self._instruments: dict[InstrumentId, Instrument] = {}
         self._synthetics: dict[InstrumentId, SyntheticInstrument] = {}
@@ -131,6 +191,8 @@ cdef class Cache(CacheFacade):
         self._order_lists: dict[OrderListId, OrderList] = {}
         self._positions: dict[PositionId, Position] = {}
         self._position_snapshots: dict[PositionId, list[bytes]] = {}
+        self._orders_unloaded: set[ClientOrderId] = set()  # Closed orders to load on first access
+        self._positions_unloaded: set[PositionId] = set()  # Closed positions to load on first access
 
         # Cache index
         self._index_venue_account: dict[Venue, AccountId] = {}
@@ -162,6 +224,12 @@ cdef class Cache(CacheFacade):
         self._index_strategies: set[StrategyId] = set()
         self._index_exec_algorithms: set[ExecAlgorithmId] = set()
 
+        # Query index: (status, venue, instrument_id, strategy_id, side) -> sorted IDs
+        self._index_order_query: dict[tuple, list[ClientOrderId]] = {}
+        self._index_order_query_status: dict[ClientOrderId, str | None] = {}
+        self._index_position_query: dict[tuple, list[PositionId]] = {}
+        self._index_position_query_state: dict[PositionId, tuple] = {}
+
         self._log.info("READY")
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -267,8 +335,15 @@ cdef class Cache(CacheFacade):
         """
         self._log.debug(f"Loading orders from database")
 
+        self._orders_unloaded = set()
+
         if self._database is not None:
-            self._orders = self._database.load_orders()
+            if self._lazy_load_closed:
+                self._orders_unloaded = self._database.load_index_orders_closed()
+                self._orders = self._database.load_orders(self._orders_unloaded)
+                self._load_related_closed_orders()
+            else:
+                self._orders = self._database.load_orders()
             self._index_order_position = self._database.load_index_order_position()
             self._index_order_client = self._database.load_index_order_client()
         else:
@@ -286,6 +361,13 @@ cdef class Cache(CacheFacade):
             color=LogColor.BLUE if self._orders else LogColor.NORMAL,
         )
 
+        count = len(self._orders_unloaded)
+        if count:
+            self._log.info(
+                f"Deferred loading {count} closed order{'' if count == 1 else 's'} until first access",
+                color=LogColor.BLUE,
+            )
+
     cpdef void cache_order_lists(self):
         """
         Clear the current order lists cache and load order lists using cached orders.
@@ -330,8 +412,14 @@ cdef class Cache(CacheFacade):
         """
         self._log.debug(f"Loading positions from database")
 
+        self._positions_unloaded = set()
+
         if self._database is not None:
-            self._positions = self._database.load_positions()
+            if self._lazy_load_closed:
+                self._positions_unloaded = self._database.load_index_positions_closed()
+                self._positions = self._database.load_positions(self._positions_unloaded)
+            else:
+                self._positions = self._database.load_positions()
         else:
             self._positions = {}
 
@@ -341,6 +429,13 @@ cdef class Cache(CacheFacade):
             color=LogColor.BLUE if self._positions else LogColor.NORMAL
         )
 
+        count = len(self._positions_unloaded)
+        if count:
+            self._log.info(
+                f"Deferred loading {count} closed position{'' if count == 1 else 's'} until first access",
+                color=LogColor.BLUE,
+            )
+
     cpdef void build_index(self):
         """
         Clear the current cache index and re-build.
@@ -498,7 +593,7 @@ cdef class Cache(CacheFacade):
                 error_count += 1
 
         for client_order_id in self._index_order_position:
-            if client_order_id not in self._orders:
+            if client_order_id not in self._orders and client_order_id not in self._orders_unloaded:
                 self._log.error(
                     f"{failure} in _index_order_position: "
                     f"{repr(client_order_id)} not found in self._cached_orders"
@@ -538,13 +633,17 @@ cdef class Cache(CacheFacade):
                     )
                     error_count += 1
 
-        for instrument_id in self._index_instrument_positions:
-            if instrument_id not in self._index_instrument_orders:
-                self._log.error(
-                    f"{failure} in _index_instrument_positions: "
-                    f"{repr(instrument_id)} not found in self._index_instrument_orders"
-                )
-                error_count += 1
+        for instrument_id, position_ids in self._index_instrument_positions.items():
+            if instrument_id in self._index_instrument_orders:
+                continue
+            # The orders for the positions may be closed orders not yet loaded
+            if self._orders_unloaded and self._is_position_orders_unloaded(position_ids):
+                continue
+            self._log.error(
+                f"{failure} in _index_instrument_positions: "
+                f"{repr(instrument_id)} not found in self._index_instrument_orders"
+            )
+            error_count += 1
 
         for client_order_ids in self._index_strategy_orders.values():
             for client_order_id in client_order_ids:
@@ -718,6 +817,10 @@ cdef class Cache(CacheFacade):
         self._index_actors.clear()
         self._index_strategies.clear()
         self._index_exec_algorithms.clear()
+        self._index_order_query.clear()
+        self._index_order_query_status.clear()
+        self._index_position_query.clear()
+        self._index_position_query_state.clear()
 
         self._log.debug(f"Cleared index")
 
@@ -737,6 +840,9 @@ cdef class Cache(CacheFacade):
         self._bars.clear()
         self._bars_bid.clear()
         self._bars_ask.clear()
+        self._quote_tick_histories.clear()
+        self._trade_tick_histories.clear()
+        self._bar_histories.clear()
         self._currencies.clear()
         self._synthetics.clear()
         self._accounts.clear()
@@ -744,6 +850,8 @@ cdef class Cache(CacheFacade):
         self._order_lists.clear()
         self._positions.clear()
         self._position_snapshots.clear()
+        self._orders_unloaded.clear()
+        self._positions_unloaded.clear()
         self.clear_index()
 
         if self._drop_instruments_on_reset:
@@ -784,117 +892,255 @@ cdef class Cache(CacheFacade):
         self._index_venue_account[Venue(account_id.get_issuer())] = account_id
 
     cdef void _build_indexes_from_orders(self):
-        cdef ClientOrderId client_order_id
         cdef Order order
-        for client_order_id, order in self._orders.items():
-            # 1: Build _index_venue_orders -> {Venue, {ClientOrderId}}
-            if order.instrument_id.venue not in self._index_venue_orders:
-                self._index_venue_orders[order.instrument_id.venue] = set()
-            self._index_venue_orders[order.instrument_id.venue].add(client_order_id)
-
-            # 2: Build _index_venue_order_ids -> {VenueOrderId, ClientOrderId}
-            if order.venue_order_id is not None:
-                self._index_venue_order_ids[order.venue_order_id] = order.client_order_id
-                self._index_client_order_ids[order.client_order_id] = order.venue_order_id
-
-            # 3: Build _index_order_position -> {ClientOrderId, PositionId}
-            if order.position_id is not None:
-                self._index_order_position[client_order_id] = order.position_id
-
-            # 4: Build _index_order_strategy -> {ClientOrderId, StrategyId}
-            self._index_order_strategy[client_order_id] = order.strategy_id
-
-            # 5: Build _index_instrument_orders -> {InstrumentId, {ClientOrderId}}
-            if order.instrument_id not in self._index_instrument_orders:
-                self._index_instrument_orders[order.instrument_id] = set()
-            self._index_instrument_orders[order.instrument_id].add(client_order_id)
-
-            # 6: Build _index_strategy_orders -> {StrategyId, {ClientOrderId}}
-            if order.strategy_id not in self._index_strategy_orders:
-                self._index_strategy_orders[order.strategy_id] = set()
-            self._index_strategy_orders[order.strategy_id].add(client_order_id)
-
-            # 7: Build _index_exec_algorithm_orders -> {ExecAlgorithmId, {ClientOrderId}}
-            if order.exec_algorithm_id is not None:
-                if order.exec_algorithm_id not in self._index_exec_algorithm_orders:
-                    self._index_exec_algorithm_orders[order.exec_algorithm_id] = set()
-                self._index_exec_algorithm_orders[order.exec_algorithm_id].add(order.client_order_id)
-
-            # 8: Build _index_exec_spawn_orders -> {ClientOrderId, {ClientOrderId}}
-            if order.exec_algorithm_id is not None:
-                if order.exec_spawn_id not in self._index_exec_spawn_orders:
-                    self._index_exec_spawn_orders[order.exec_spawn_id] = set()
-                self._index_exec_spawn_orders[order.exec_spawn_id].add(order.client_order_id)
+        for order in self._orders.values():
+            self._index_order(order)
+
+    cdef void _index_order(self, Order order):
+        cdef ClientOrderId client_order_id = order.client_order_id
+
+        # 1: Build _index_venue_orders -> {Venue, {ClientOrderId}}
+        if order.instrument_id.venue not in self._index_venue_orders:
+            self._index_venue_orders[order.instrument_id.venue] = set()
+        self._index_venue_orders[order.instrument_id.venue].add(client_order_id)
+
+        # 2: Build _index_venue_order_ids -> {VenueOrderId, ClientOrderId}
+        if order.venue_order_id is not None:
+            self._index_venue_order_ids[order.venue_order_id] = order.client_order_id
+            self._index_client_order_ids[order.client_order_id] = order.venue_order_id
+
+        # 3: Build _index_order_position -> {ClientOrderId, PositionId}
+        if order.position_id is not None:
+            self._index_order_position[client_order_id] = order.position_id
+
+        # 4: Build _index_order_strategy -> {ClientOrderId, StrategyId}
+        self._index_order_strategy[client_order_id] = order.strategy_id
+
+        # 5: Build _index_instrument_orders -> {InstrumentId, {ClientOrderId}}
+        if order.instrument_id not in self._index_instrument_orders:
+            self._index_instrument_orders[order.instrument_id] = set()
+        self._index_instrument_orders[order.instrument_id].add(client_order_id)
+
+        # 6: Build _index_strategy_orders -> {StrategyId, {ClientOrderId}}
+        if order.strategy_id not in self._index_strategy_orders:
+            self._index_strategy_orders[order.strategy_id] = set()
+        self._index_strategy_orders[order.strategy_id].add(client_order_id)
+
+        # 7: Build _index_exec_algorithm_orders -> {ExecAlgorithmId, {ClientOrderId}}
+        if order.exec_algorithm_id is not None:
+            if order.exec_algorithm_id not in self._index_exec_algorithm_orders:
+                self._index_exec_algorithm_orders[order.exec_algorithm_id] = set()
+            self._index_exec_algorithm_orders[order.exec_algorithm_id].add(order.client_order_id)
 
-            # 9: Build _index_orders -> {ClientOrderId}
-            self._index_orders.add(client_order_id)
+        # 8: Build _index_exec_spawn_orders -> {ClientOrderId, {ClientOrderId}}
+        if order.exec_algorithm_id is not None:
+            if order.exec_spawn_id not in self._index_exec_spawn_orders:
+                self._index_exec_spawn_orders[order.exec_spawn_id] = set()
+            self._index_exec_spawn_orders[order.exec_spawn_id].add(order.client_order_id)
 
-            # 10: Build _index_orders_open -> {ClientOrderId}
-            if order.is_open_c():
-                self._index_orders_open.add(client_order_id)
+        # 9: Build _index_orders -> {ClientOrderId}
+        self._index_orders.add(client_order_id)
 
-            # 11: Build _index_orders_closed -> {ClientOrderId}
-            if order.is_closed_c():
-                self._index_orders_closed.add(client_order_id)
+        # 10: Build _index_orders_open -> {ClientOrderId}
+        if order.is_open_c():
+            self._index_orders_open.add(client_order_id)
 
-            # 12: Build _index_orders_emulated -> {ClientOrderId}
-            if order.emulation_trigger != TriggerType.NO_TRIGGER and not order.is_closed_c():
-                self._index_orders_emulated.add(client_order_id)
+        # 11: Build _index_orders_closed -> {ClientOrderId}
+        if order.is_closed_c():
+            self._index_orders_closed.add(client_order_id)
 
-            # 13: Build _index_orders_inflight -> {ClientOrderId}
-            if order.is_inflight_c():
-                self._index_orders_inflight.add(client_order_id)
+        # 12: Build _index_orders_emulated -> {ClientOrderId}
+        if order.emulation_trigger != TriggerType.NO_TRIGGER and not order.is_closed_c():
+            self._index_orders_emulated.add(client_order_id)
 
-            # 14: Build _index_strategies -> {StrategyId}
-            self._index_strategies.add(order.strategy_id)
+        # 13: Build _index_orders_inflight -> {ClientOrderId}
+        if order.is_inflight_c():
+            self._index_orders_inflight.add(client_order_id)
 
-            # 15: Build _index_strategies -> {ExecAlgorithmId}
-            if order.exec_algorithm_id is not None:
-                self._index_exec_algorithms.add(order.exec_algorithm_id)
+        # 14: Build _index_strategies -> {StrategyId}
+        self._index_strategies.add(order.strategy_id)
+
+        # 15: Build _index_strategies -> {ExecAlgorithmId}
+        if order.exec_algorithm_id is not None:
+            self._index_exec_algorithms.add(order.exec_algorithm_id)
+
+        # 16: Build _index_order_query -> {(status, ...), [ClientOrderId]}
+        if order.is_open_c():
+            self._update_order_query_index(order, "open")
+        elif order.is_closed_c():
+            self._update_order_query_index(order, "closed")
+        else:
+            self._update_order_query_index(order, None)
 
     cdef void _build_indexes_from_positions(self):
-        cdef ClientOrderId client_order_id
-        cdef PositionId position_id
         cdef Position position
-        for position_id, position in self._positions.items():
-            # 1: Build _index_venue_positions -> {Venue, {PositionId}}
-            if position.instrument_id.venue not in self._index_venue_positions:
-                self._index_venue_positions[position.instrument_id.venue] = set()
-            self._index_venue_positions[position.instrument_id.venue].add(position_id)
+        for position in self._positions.values():
+            self._index_position(position)
 
-            # 2: Build _index_position_strategy -> {PositionId, StrategyId}
-            if position.strategy_id is not None:
-                self._index_position_strategy[position_id] = position.strategy_id
+    cdef void _index_position(self, Position position):
+        cdef PositionId position_id = position.id
+        cdef ClientOrderId client_order_id
 
-            # 3: Build _index_position_orders -> {PositionId, {ClientOrderId}}
-            if position_id not in self._index_position_orders:
-                self._index_position_orders[position_id] = set()
-            index_position_orders = self._index_position_orders[position_id]
-            for client_order_id in position.client_order_ids_c():
-                index_position_orders.add(client_order_id)
-
-            # 4: Build _index_instrument_positions -> {InstrumentId, {PositionId}}
-            if position.instrument_id not in self._index_instrument_positions:
-                self._index_instrument_positions[position.instrument_id] = set()
-            self._index_instrument_positions[position.instrument_id].add(position_id)
-
-            # 5: Build _index_strategy_positions -> {StrategyId, {PositionId}}
-            if position.strategy_id is not None and position.strategy_id not in self._index_strategy_positions:
-                self._index_strategy_positions[position.strategy_id] = set()
-            self._index_strategy_positions[position.strategy_id].add(position.id)
-
-            # 6: Build _index_positions -> {PositionId}
-            self._index_positions.add(position_id)
-
-            # 7: Build _index_positions_open -> {PositionId}
-            if position.is_open_c():
-                self._index_positions_open.add(position_id)
-            # 8: Build _index_positions_closed -> {PositionId}
-            elif position.is_closed_c():
-                self._index_positions_closed.add(position_id)
-
-            # 9: Build _index_strategies -> {StrategyId}
-            self._index_strategies.add(position.strategy_id)
+        # 1: Build _index_venue_positions -> {Venue, {PositionId}}
+        if position.instrument_id.venue not in self._index_venue_positions:
+            self._index_venue_positions[position.instrument_id.venue] = set()
+        self._index_venue_positions[position.instrument_id.venue].add(position_id)
+
+        # 2: Build _index_position_strategy -> {PositionId, StrategyId}
+        if position.strategy_id is not None:
+            self._index_position_strategy[position_id] = position.strategy_id
+
+        # 3: Build _index_position_orders -> {PositionId, {ClientOrderId}}
+        if position_id not in self._index_position_orders:
+            self._index_position_orders[position_id] = set()
+        index_position_orders = self._index_position_orders[position_id]
+        for client_order_id in position.client_order_ids_c():
+            index_position_orders.add(client_order_id)
+
+        # 4: Build _index_instrument_positions -> {InstrumentId, {PositionId}}
+        if position.instrument_id not in self._index_instrument_positions:
+            self._index_instrument_positions[position.instrument_id] = set()
+        self._index_instrument_positions[position.instrument_id].add(position_id)
+
+        # 5: Build _index_strategy_positions -> {StrategyId, {PositionId}}
+        if position.strategy_id is not None and position.strategy_id not in self._index_strategy_positions:
+            self._index_strategy_positions[position.strategy_id] = set()
+        self._index_strategy_positions[position.strategy_id].add(position.id)
+
+        # 6: Build _index_positions -> {PositionId}
+        self._index_positions.add(position_id)
+
+        # 7: Build _index_positions_open -> {PositionId}
+        if position.is_open_c():
+            self._index_positions_open.add(position_id)
+        # 8: Build _index_positions_closed -> {PositionId}
+        elif position.is_closed_c():
+            self._index_positions_closed.add(position_id)
+
+        # 9: Build _index_strategies -> {StrategyId}
+        self._index_strategies.add(position.strategy_id)
+
+        # 10: Build _index_position_query -> {(status, ...), [PositionId]}
+        if position.is_open_c():
+            self._update_position_query_index(position, "open")
+        elif position.is_closed_c():
+            self._update_position_query_index(position, "closed")
+        else:
+            self._update_position_query_index(position, None)
+
+    cdef Order _load_order(self, ClientOrderId client_order_id):
+        self._orders_unloaded.discard(client_order_id)
+
+        cdef Order order = self._database.load_order(client_order_id)
+        if order is None:
+            return None
+
+        self._orders[client_order_id] = order
+        self._index_order(order)
+        self._log.debug(f"Loaded {order} on first access")
+
+        return order
+
+    cdef Position _load_position(self, PositionId position_id):
+        self._positions_unloaded.discard(position_id)
+
+        cdef Position position = self._database.load_position(position_id)
+        if position is None:
+            return None
+
+        self._positions[position_id] = position
+        self._index_position(position)
+        self._log.debug(f"Loaded {position} on first access")
+
+        return position
+
+    cdef bint _is_position_orders_unloaded(self, set position_ids):
+        cdef:
+            PositionId position_id
+            ClientOrderId client_order_id
+        for position_id in position_ids:
+            for client_order_id in self._positions[position_id].client_order_ids:
+                if client_order_id not in self._orders_unloaded:
+                    return False
+        return True
+
+    cdef void _load_unloaded_orders(self):
+        # Loads all closed orders deferred on start, for queries which may include them
+        if not self._orders_unloaded:
+            return
+
+        cdef dict orders = self._database.load_orders(set(self._orders))
+
+        cdef Order order
+        for order in orders.values():
+            if order.client_order_id not in self._orders_unloaded:
+                continue  # Not deferred (removed from the cache)
+            self._orders[order.client_order_id] = order
+            self._index_order(order)
+
+        cdef int count = len(self._orders_unloaded)
+        self._orders_unloaded.clear()
+        self._log.debug(f"Loaded {count} deferred closed order{'' if count == 1 else 's'}")
+
+    cdef void _load_related_closed_orders(self):
+        # Loads deferred closed orders which are contingent with, or in an order list with,
+        # an open order, so contingencies and order lists are rebuilt complete
+        cdef:
+            set client_order_ids = set()
+            set order_list_ids = set()
+            Order order
+            ClientOrderId client_order_id
+        for order in self._orders.values():
+            if order.parent_order_id is not None:
+                client_order_ids.add(order.parent_order_id)
+            for client_order_id in order.linked_order_ids or []:
+                client_order_ids.add(client_order_id)
+            if (
+                order.order_list_id is not None
+                and order.contingency_type == ContingencyType.NO_CONTINGENCY
+            ):
+                # Members are not linked, so are only known once loaded
+                order_list_ids.add(order.order_list_id)
+
+        client_order_ids.intersection_update(self._orders_unloaded)
+        if not client_order_ids and not order_list_ids:
+            return
+
+        cdef list orders = []
+        if order_list_ids:
+            orders = list(self._database.load_orders(set(self._orders)).values())
+        else:
+            for client_order_id in client_order_ids:
+                orders.append(self._database.load_order(client_order_id))
+
+        for order in orders:
+            if order is None or order.client_order_id not in self._orders_unloaded:
+                continue
+            if (
+                order.client_order_id not in client_order_ids
+                and order.order_list_id not in order_list_ids
+            ):
+                continue  # Unrelated to any open order
+            self._orders[order.client_order_id] = order
+            self._orders_unloaded.discard(order.client_order_id)
+
+    cdef void _load_unloaded_positions(self):
+        # Loads all closed positions deferred on start, for queries which may include them
+        if not self._positions_unloaded:
+            return
+
+        cdef dict positions = self._database.load_positions(set(self._positions))
+
+        cdef Position position
+        for position in positions.values():
+            if position.id not in self._positions_unloaded:
+                continue  # Not deferred (removed from the cache)
+            self._positions[position.id] = position
+            self._index_position(position)
+
+        cdef int count = len(self._positions_unloaded)
+        self._positions_unloaded.clear()
+        self._log.debug(f"Loaded {count} deferred closed position{'' if count == 1 else 's'}")
 
     cdef void _assign_position_id_to_contingencies(self, Order order):
         cdef:
@@ -1152,6 +1398,9 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        if self.history_capacity > 0:
+            self._quote_tick_history(instrument_id).append(tick)
+
     cpdef void add_trade_tick(self, TradeTick tick):
         """
         Add the given trade tick to the cache.
@@ -1174,6 +1423,9 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        if self.history_capacity > 0:
+            self._trade_tick_history(instrument_id).append(tick)
+
     cpdef void add_bar(self, Bar bar):
         """
         Add the given bar to the cache.
@@ -1195,6 +1447,9 @@ cdef class Cache(CacheFacade):
 
         bars.appendleft(bar)
 
+        if self.history_capacity > 0:
+            self._bar_history(bar.bar_type).append(bar)
+
         cdef PriceType price_type = <PriceType>bar._mem.bar_type.spec.price_type
         if price_type == PriceType.BID:
             self._bars_bid[bar.bar_type.instrument_id] = bar
@@ -1238,6 +1493,12 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        cdef QuoteTickHistory quote_history
+        if self.history_capacity > 0:
+            quote_history = self._quote_tick_history(instrument_id)
+            for tick in ticks:
+                quote_history.append(tick)
+
     cpdef void add_trade_ticks(self, list ticks):
         """
         Add the given trade ticks to the cache.
@@ -1275,6 +1536,12 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        cdef TradeTickHistory trade_history
+        if self.history_capacity > 0:
+            trade_history = self._trade_tick_history(instrument_id)
+            for tick in ticks:
+                trade_history.append(tick)
+
     cpdef void add_bars(self, list bars):
         """
         Add the given bars to the cache.
@@ -1312,6 +1579,12 @@ cdef class Cache(CacheFacade):
         for bar in bars:
             cached_bars.appendleft(bar)
 
+        cdef BarHistory bar_history
+        if self.history_capacity > 0:
+            bar_history = self._bar_history(bar_type)
+            for bar in bars:
+                bar_history.append(bar)
+
         bar = bars[-1]
         cdef PriceType price_type = <PriceType>bar._mem.bar_type.spec.price_type
         if price_type == PriceType.BID:
@@ -1544,6 +1817,8 @@ cdef class Cache(CacheFacade):
         else:
             self._index_orders_emulated.add(order.client_order_id)
 
+        self._update_order_query_index(order, None)
+
         self._log.debug(f"Added {order}")
 
         if position_id is not None:
@@ -1695,6 +1970,8 @@ cdef class Cache(CacheFacade):
         else:
             instrument_positions.add(position.id)
 
+        self._update_position_query_index(position, "open")
+
         self._log.debug(f"Added Position(id={position.id.to_str()}, strategy_id={position.strategy_id.to_str()})")
 
         if self._database is None:
@@ -1844,10 +2121,12 @@ cdef class Cache(CacheFacade):
         if order.is_open_c():
             self._index_orders_closed.discard(order.client_order_id)
             self._index_orders_open.add(order.client_order_id)
+            self._update_order_query_index(order, "open")
         elif order.is_closed_c():
             self._index_orders_open.discard(order.client_order_id)
             self._index_orders_pending_cancel.discard(order.client_order_id)
             self._index_orders_closed.add(order.client_order_id)
+            self._update_order_query_index(order, "closed")
 
         # Update emulation
         if order.is_closed_c() or order.emulation_trigger == TriggerType.NO_TRIGGER:
@@ -1892,9 +2171,13 @@ cdef class Cache(CacheFacade):
         if position.is_open_c():
             self._index_positions_open.add(position.id)
             self._index_positions_closed.discard(position.id)
+            self._update_position_query_index(position, "open")
         elif position.is_closed_c():
             self._index_positions_closed.add(position.id)
             self._index_positions_open.discard(position.id)
+            self._update_position_query_index(position, "closed")
+        else:
+            self._update_position_query_index(position, None)
 
         if self._database is None:
             return
@@ -2382,6 +2665,87 @@ cdef class Cache(CacheFacade):
 
         return self.bar_count(bar_type) > 0
 
+    cpdef QuoteTickHistory quote_tick_history(self, InstrumentId instrument_id):
+        """
+        Return the columnar quote tick history for the given instrument ID (if found).
+
+        The history is only kept when the cache is configured with a `history_capacity`.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the history to get.
+
+        Returns
+        -------
+        QuoteTickHistory or ``None``
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        return self._quote_tick_histories.get(instrument_id)
+
+    cpdef TradeTickHistory trade_tick_history(self, InstrumentId instrument_id):
+        """
+        Return the columnar trade tick history for the given instrument ID (if found).
+
+        The history is only kept when the cache is configured with a `history_capacity`.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the history to get.
+
+        Returns
+        -------
+        TradeTickHistory or ``None``
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        return self._trade_tick_histories.get(instrument_id)
+
+    cpdef BarHistory bar_history(self, BarType bar_type):
+        """
+        Return the columnar bar history for the given bar type (if found).
+
+        The history is only kept when the cache is configured with a `history_capacity`.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the history to get.
+
+        Returns
+        -------
+        BarHistory or ``None``
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+
+        return self._bar_histories.get(bar_type)
+
+    cdef QuoteTickHistory _quote_tick_history(self, InstrumentId instrument_id):
+        cdef QuoteTickHistory history = self._quote_tick_histories.get(instrument_id)
+        if history is None:
+            history = QuoteTickHistory(instrument_id, self.history_capacity)
+            self._quote_tick_histories[instrument_id] = history
+        return history
+
+    cdef TradeTickHistory _trade_tick_history(self, InstrumentId instrument_id):
+        cdef TradeTickHistory history = self._trade_tick_histories.get(instrument_id)
+        if history is None:
+            history = TradeTickHistory(instrument_id, self.history_capacity)
+            self._trade_tick_histories[instrument_id] = history
+        return history
+
+    cdef BarHistory _bar_history(self, BarType bar_type):
+        cdef BarHistory history = self._bar_histories.get(bar_type)
+        if history is None:
+            history = BarHistory(bar_type, self.history_capacity)
+            self._bar_histories[bar_type] = history
+        return history
+
     cpdef double get_xrate(
         self,
         Venue venue,
@@ -2702,29 +3066,163 @@ cdef class Cache(CacheFacade):
 
         return query
 
-    cdef set _build_position_query_filter_set(
+    cdef void _update_order_query_index(self, Order order, str status):
+        # Index the order as a member of all orders and, when a `status` of 'open' or
+        # 'closed' is given, move it into the query keys for that status.
+        cdef ClientOrderId client_order_id = order.client_order_id
+        cdef str current = None
+        if client_order_id not in self._index_order_query_status:
+            _query_index_insert(
+                self._index_order_query,
+                _query_index_keys(
+                    "all",
+                    order.instrument_id.venue,
+                    order.instrument_id,
+                    order.strategy_id,
+                    order.side,
+                    OrderSide.NO_ORDER_SIDE,
+                ),
+                client_order_id,
+            )
+            self._index_order_query_status[client_order_id] = None
+        else:
+            current = self._index_order_query_status[client_order_id]
+
+        if status is None or status == current:
+            return  # No change
+
+        if current is not None:
+            _query_index_remove(
+                self._index_order_query,
+                _query_index_keys(
+                    current,
+                    order.instrument_id.venue,
+                    order.instrument_id,
+                    order.strategy_id,
+                    order.side,
+                    OrderSide.NO_ORDER_SIDE,
+                ),
+                client_order_id,
+            )
+
+        _query_index_insert(
+            self._index_order_query,
+            _query_index_keys(
+                status,
+                order.instrument_id.venue,
+                order.instrument_id,
+                order.strategy_id,
+                order.side,
+                OrderSide.NO_ORDER_SIDE,
+            ),
+            client_order_id,
+        )
+        self._index_order_query_status[client_order_id] = status
+
+    cdef void _update_position_query_index(self, Position position, str status):
+        # Index the position as a member of all positions and, when a `status` of 'open'
+        # or 'closed' is given, the query keys for that status (positions can change side).
+        cdef PositionId position_id = position.id
+        cdef tuple current = self._index_position_query_state.get(position_id)
+        if status is None:
+            status = None if current is None else current[0]
+
+        cdef tuple state = (status, position.side)
+        if state == current:
+            return  # No change
+
+        cdef str s
+        if current is not None:
+            for s in ("all", current[0]):
+                if s is None:
+                    continue
+                _query_index_remove(
+                    self._index_position_query,
+                    _query_index_keys(
+                        s,
+                        position.instrument_id.venue,
+                        position.instrument_id,
+                        position.strategy_id,
+                        current[1],
+                        PositionSide.NO_POSITION_SIDE,
+                    ),
+                    position_id,
+                )
+
+        for s in ("all", status):
+            if s is None:
+                continue
+            _query_index_insert(
+                self._index_position_query,
+                _query_index_keys(
+                    s,
+                    position.instrument_id.venue,
+                    position.instrument_id,
+                    position.strategy_id,
+                    position.side,
+                    PositionSide.NO_POSITION_SIDE,
+                ),
+                position_id,
+            )
+        self._index_position_query_state[position_id] = state
+
+    cdef list _get_orders_for_query(
         self,
+        str status,
         Venue venue,
         InstrumentId instrument_id,
         StrategyId strategy_id,
+        OrderSide side,
     ):
-        cdef set query = None
+        if status != "open":
+            self._load_unloaded_orders()
 
-        # Build potential query set
-        if venue is not None:
-            query = self._index_venue_positions.get(venue, set())
-        if instrument_id is not None:
-            if query is None:
-                query = self._index_instrument_positions.get(instrument_id, set())
-            else:
-                query = query.intersection(self._index_instrument_positions.get(instrument_id, set()))
-        if strategy_id is not None:
-            if query is None:
-                query = self._index_strategy_positions.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_positions.get(strategy_id, set()))
+        cdef list orders = []
+        cdef list client_order_ids = self._index_order_query.get(
+            (status, venue, instrument_id, strategy_id, side),
+        )
+        if not client_order_ids:
+            return orders
 
-        return query
+        cdef ClientOrderId client_order_id
+        try:
+            for client_order_id in client_order_ids:
+                orders.append(self._orders[client_order_id])
+        except KeyError as e:
+            self._log.error(f"Cannot find `Order` object in cached orders {e}")
+
+        return orders
+
+    cdef list _get_positions_for_query(
+        self,
+        str status,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+        PositionSide side,
+    ):
+        if status != "open":
+            self._load_unloaded_positions()
+
+        cdef list positions = []
+        cdef list position_ids = self._index_position_query.get(
+            (status, venue, instrument_id, strategy_id, side),
+        )
+        if not position_ids:
+            return positions
+
+        cdef PositionId position_id
+        try:
+            for position_id in position_ids:
+                positions.append(self._positions[position_id])
+        except KeyError as e:
+            self._log.error(f"Cannot find `Position` object in cached positions {e}")
+
+        return positions
+
+    cdef int _query_count(self, dict index, tuple key):
+        cdef list ids = index.get(key)
+        return 0 if ids is None else len(ids)
 
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side):
         cdef list orders = []
@@ -2745,22 +3243,6 @@ cdef class Cache(CacheFacade):
 
         return orders
 
-    cdef list _get_positions_for_ids(self, set position_ids, PositionSide side):
-        cdef list positions = []
-
-        cdef:
-            PositionId position_id
-            Position position
-        try:
-            for position_id in sorted(position_ids):
-                position = self._positions[position_id]
-                if side == PositionSide.NO_POSITION_SIDE or side == position.side:
-                    positions.append(position)
-        except KeyError as e:
-            self._log.error(f"Cannot find `Position` object in cached positions {e}")
-
-        return positions
-
     cpdef set client_order_ids(
         self,
         Venue venue = None,
@@ -2784,12 +3266,17 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
+        self._load_unloaded_orders()
 
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders
-        else:
-            return self._index_orders.intersection(query)
+
+        return set(
+            self._index_order_query.get(
+                ("all", venue, instrument_id, strategy_id, OrderSide.NO_ORDER_SIDE),
+                (),
+            ),
+        )
 
     cpdef set client_order_ids_open(
         self,
@@ -2814,12 +3301,15 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_open
-        else:
-            return self._index_orders_open.intersection(query)
+
+        return set(
+            self._index_order_query.get(
+                ("open", venue, instrument_id, strategy_id, OrderSide.NO_ORDER_SIDE),
+                (),
+            ),
+        )
 
     cpdef set client_order_ids_closed(
         self,
@@ -2844,12 +3334,17 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
+        self._load_unloaded_orders()
 
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_closed
-        else:
-            return self._index_orders_closed.intersection(query)
+
+        return set(
+            self._index_order_query.get(
+                ("closed", venue, instrument_id, strategy_id, OrderSide.NO_ORDER_SIDE),
+                (),
+            ),
+        )
 
     cpdef set client_order_ids_emulated(
         self,
@@ -2953,12 +3448,17 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
-        cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
+        self._load_unloaded_positions()
 
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions
-        else:
-            return self._index_positions.intersection(query)
+
+        return set(
+            self._index_position_query.get(
+                ("all", venue, instrument_id, strategy_id, PositionSide.NO_POSITION_SIDE),
+                (),
+            ),
+        )
 
     cpdef set position_open_ids(
         self,
@@ -2983,12 +3483,15 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
-        cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions_open
-        else:
-            return self._index_positions_open.intersection(query)
+
+        return set(
+            self._index_position_query.get(
+                ("open", venue, instrument_id, strategy_id, PositionSide.NO_POSITION_SIDE),
+                (),
+            ),
+        )
 
     cpdef set position_closed_ids(
         self,
@@ -3013,12 +3516,17 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
-        cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
+        self._load_unloaded_positions()
 
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions_closed
-        else:
-            return self._index_positions_closed.intersection(query)
+
+        return set(
+            self._index_position_query.get(
+                ("closed", venue, instrument_id, strategy_id, PositionSide.NO_POSITION_SIDE),
+                (),
+            ),
+        )
 
     cpdef set actor_ids(self):
         """
@@ -3059,6 +3567,9 @@ cdef class Cache(CacheFacade):
         """
         Return the order matching the given client order ID (if found).
 
+        If the cache was configured with `lazy_load_closed` then a closed order
+        not yet loaded is loaded from the database on first access.
+
         Returns
         -------
         Order or ``None``
@@ -3066,7 +3577,11 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        return self._orders.get(client_order_id)
+        cdef Order order = self._orders.get(client_order_id)
+        if order is None and client_order_id in self._orders_unloaded:
+            order = self._load_order(client_order_id)
+
+        return order
 
     cpdef ClientOrderId client_order_id(self, VenueOrderId venue_order_id):
         """
@@ -3140,8 +3655,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._get_orders_for_query("all", venue, instrument_id, strategy_id, side)
 
     cpdef list orders_open(
         self,
@@ -3171,8 +3685,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_open(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._get_orders_for_query("open", venue, instrument_id, strategy_id, side)
 
     cpdef list orders_closed(
         self,
@@ -3202,8 +3715,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_closed(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._get_orders_for_query("closed", venue, instrument_id, strategy_id, side)
 
     cpdef list orders_emulated(
         self,
@@ -3283,6 +3795,8 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
+        self._load_unloaded_orders()
+
         cdef set client_order_ids = self._index_position_orders.get(position_id)
         if not client_order_ids:
             return []
@@ -3305,7 +3819,7 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        return client_order_id in self._index_orders
+        return client_order_id in self._index_orders or client_order_id in self._orders_unloaded
 
     cpdef bint is_order_open(self, ClientOrderId client_order_id):
         """
@@ -3341,7 +3855,10 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        return client_order_id in self._index_orders_closed
+        return (
+            client_order_id in self._index_orders_closed
+            or client_order_id in self._orders_unloaded
+        )
 
     cpdef bint is_order_emulated(self, ClientOrderId client_order_id):
         """
@@ -3423,7 +3940,10 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.orders_open(venue, instrument_id, strategy_id, side))
+        return self._query_count(
+            self._index_order_query,
+            ("open", venue, instrument_id, strategy_id, side),
+        )
 
     cpdef int orders_closed_count(
         self,
@@ -3451,7 +3971,12 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.orders_closed(venue, instrument_id, strategy_id, side))
+        self._load_unloaded_orders()
+
+        return self._query_count(
+            self._index_order_query,
+            ("closed", venue, instrument_id, strategy_id, side),
+        )
 
     cpdef int orders_emulated_count(
         self,
@@ -3535,7 +4060,12 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.orders(venue, instrument_id, strategy_id, side))
+        self._load_unloaded_orders()
+
+        return self._query_count(
+            self._index_order_query,
+            ("all", venue, instrument_id, strategy_id, side),
+        )
 
 # -- ORDER LIST QUERIES ---------------------------------------------------------------------------
 
@@ -3788,6 +4318,9 @@ cdef class Cache(CacheFacade):
         """
         Return the position associated with the given ID (if found).
 
+        If the cache was configured with `lazy_load_closed` then a closed position
+        not yet loaded is loaded from the database on first access.
+
         Parameters
         ----------
         position_id : PositionId
@@ -3800,7 +4333,11 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return self._positions.get(position_id)
+        cdef Position position = self._positions.get(position_id)
+        if position is None and position_id in self._positions_unloaded:
+            position = self._load_position(position_id)
+
+        return position
 
     cpdef Position position_for_order(self, ClientOrderId client_order_id):
         """
@@ -3822,7 +4359,7 @@ cdef class Cache(CacheFacade):
         if position_id is None:
             return None
 
-        return self._positions.get(position_id)
+        return self.position(position_id)
 
     cpdef PositionId position_id(self, ClientOrderId client_order_id):
         """
@@ -3896,8 +4433,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, side)
+        return self._get_positions_for_query("all", venue, instrument_id, strategy_id, side)
 
     cpdef list positions_open(
         self,
@@ -3927,8 +4463,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_open_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, side)
+        return self._get_positions_for_query("open", venue, instrument_id, strategy_id, side)
 
     cpdef list positions_closed(
         self,
@@ -3955,8 +4490,13 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_closed_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, PositionSide.NO_POSITION_SIDE)
+        return self._get_positions_for_query(
+            "closed",
+            venue,
+            instrument_id,
+            strategy_id,
+            PositionSide.NO_POSITION_SIDE,
+        )
 
     cpdef bint position_exists(self, PositionId position_id):
         """
@@ -3974,7 +4514,7 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return position_id in self._index_positions
+        return position_id in self._index_positions or position_id in self._positions_unloaded
 
     cpdef bint is_position_open(self, PositionId position_id):
         """
@@ -4012,7 +4552,7 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return position_id in self._index_positions_closed
+        return position_id in self._index_positions_closed or position_id in self._positions_unloaded
 
     cpdef int positions_open_count(
         self,
@@ -4040,7 +4580,10 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.positions_open(venue, instrument_id, strategy_id, side))
+        return self._query_count(
+            self._index_position_query,
+            ("open", venue, instrument_id, strategy_id, side),
+        )
 
     cpdef int positions_closed_count(
         self,
@@ -4065,7 +4608,12 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.positions_closed(venue, instrument_id, strategy_id))
+        self._load_unloaded_positions()
+
+        return self._query_count(
+            self._index_position_query,
+            ("closed", venue, instrument_id, strategy_id, PositionSide.NO_POSITION_SIDE),
+        )
 
     cpdef int positions_total_count(
         self,
@@ -4093,7 +4641,12 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.positions(venue, instrument_id, strategy_id, side))
+        self._load_unloaded_positions()
+
+        return self._query_count(
+            self._index_position_query,
+            ("all", venue, instrument_id, strategy_id, side),
+        )
 
 # -- STRATEGY QUERIES -----------------------------------------------------------------------------
 
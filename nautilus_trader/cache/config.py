@@ -43,12 +43,44 @@ class CacheConfig(NautilusConfig, frozen=True):
         If the traders instance ID is used for keys.
     flush_on_start : bool, default False
         If database should be flushed on start.
+    write_behind : bool, default False
+        If state mutations are queued and written to the database in batches by a
+        background thread, rather than synchronously on the calling thread.
+        Pending writes to the same key are coalesced so only the latest is written.
+        Leave as ``False`` if every mutation must be handed to the database before
+        the call returns.
+    write_behind_interval_ms : PositiveInt, default 10
+        The interval (milliseconds) between write-behind batches.
+    write_behind_queue_size : PositiveInt, default 100_000
+        The maximum number of pending write-behind mutations, beyond which pending
+        mutations are written on the calling thread.
+    checkpoint_interval : PositiveInt, optional
+        The number of events between materialized checkpoints of each order and
+        position, so recovery loads the latest checkpoint plus the tail of events
+        rather than replaying every event. Checkpoints are pickled and so can only be
+        loaded by the same version which wrote them. If ``None`` then no checkpoints
+        are written or loaded.
+    checkpoint_compaction : bool, default False
+        If the stored events superseded by each checkpoint should be compacted (down to
+        the last event). The full event history is then no longer stored, and compacted
+        orders and positions can only be recovered with `checkpoint_interval` set.
     drop_instruments_on_reset : bool, default True
         If instruments data should be dropped from the caches memory on reset.
     tick_capacity : PositiveInt, default 10_000
         The maximum length for internal tick dequeues.
     bar_capacity : PositiveInt, default 10_000
         The maximum length for internal bar dequeues.
+    history_capacity : PositiveInt, optional
+        The capacity of the columnar (NumPy ring buffer) market data history kept per
+        instrument and bar type, in addition to the object dequeues.
+        If ``None`` then no columnar history is kept.
+    lazy_load_closed : bool, default False
+        If only orders and positions which are not closed are loaded from the database
+        on start, with closed orders and positions loaded on first access through
+        ``Cache.order(...)`` and ``Cache.position(...)``. Queries which may include
+        closed orders or positions (such as ``Cache.orders(...)``, ``Cache.orders_closed(...)``
+        and their counts) load all deferred ones on first call. Closed orders which are
+        contingent with, or in an order list with, an open order are always loaded on start.
 
     """
 
@@ -59,6 +91,13 @@ class CacheConfig(NautilusConfig, frozen=True):
     use_trader_prefix: bool = True
     use_instance_id: bool = False
     flush_on_start: bool = False
+    write_behind: bool = False
+    write_behind_interval_ms: PositiveInt = 10
+    write_behind_queue_size: PositiveInt = 100_000
+    checkpoint_interval: PositiveInt | None = None
+    checkpoint_compaction: bool = False
     drop_instruments_on_reset: bool = True
     tick_capacity: PositiveInt = 10_000
     bar_capacity: PositiveInt = 10_000
+    history_capacity: PositiveInt | None = None
+    lazy_load_closed: bool = False
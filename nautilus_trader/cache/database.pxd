@@ -13,10 +13,72 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.common.component cimport Logger
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
+cdef class CacheWriteBehindQueue:
+    cdef Logger _log
+    cdef object _backing
+    cdef Serializer _serializer
+    cdef dict _pending
+    cdef uint64_t _sequence
+    cdef object _lock
+    cdef object _write_lock
+    cdef object _stop_event
+    cdef object _thread
+    cdef bint _is_running
+
+    cdef readonly int max_queue_size
+    """The maximum number of pending mutations.\n\n:returns: `int`"""
+    cdef readonly int interval_ms
+    """The interval (milliseconds) between batches.\n\n:returns: `int`"""
+    cdef readonly uint64_t queued_count
+    """The count of mutations queued.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t coalesced_count
+    """The count of pending mutations replaced by a later mutation to the same key.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t written_count
+    """The count of mutations written to the database.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t failed_count
+    """The count of mutations which failed to write.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t batch_count
+    """The count of batches written.\n\n:returns: `uint64_t`"""
+
+    cpdef bint is_running(self)
+    cpdef int qsize(self)
+    cpdef void start(self)
+    cpdef void stop(self)
+    cpdef void flush(self)
+    cpdef void put(self, str op, str key, list payload=*, obj=*)
+
+    cdef object _coalesce_key(self, str op, str key, list payload)
+
+
 cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
     cdef Serializer _serializer
     cdef object _backing
+    cdef int _checkpoint_interval
+    cdef bint _checkpoint_compaction
+
+    cdef readonly CacheWriteBehindQueue write_behind
+    """The write-behind queue for the adapter (``None`` if writes are synchronous).\n\n:returns: `CacheWriteBehindQueue` or ``None``"""
+
+    cpdef void flush_writes(self)
+
+    cdef list _read(self, str key)
+    cdef list _read_bulk(self, list keys)
+    cdef list _keys(self, str pattern)
+    cdef void _insert(self, str key, list payload)
+    cdef void _insert_object(self, str key, obj)
+    cdef void _update_object(self, str key, obj)
+    cdef void _delete(self, str key, list payload=*)
+    cdef Order _order_from_events(self, list result, list checkpoint)
+    cdef Position _position_from_events(self, list result, list checkpoint, dict instruments)
+    cdef list _read_checkpoints(self, list keys)
+    cdef object _load_checkpoint(self, bytes checkpoint)
+    cdef void _checkpoint(self, str key, obj)
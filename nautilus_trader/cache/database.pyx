@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pickle
+import threading
 import warnings
 
 import msgspec
@@ -27,6 +29,7 @@ from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.accounting.factory cimport AccountFactory
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
 from nautilus_trader.common.actor cimport Actor
+from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport format_iso8601
 from nautilus_trader.core.rust.common cimport LogColor
@@ -92,8 +95,227 @@ cdef str _INDEX_POSITIONS_CLOSED = "index:positions_closed"
 
 cdef str _SNAPSHOTS_ORDERS = "snapshots:orders"
 cdef str _SNAPSHOTS_POSITIONS = "snapshots:positions"
+cdef str _CHECKPOINTS = "checkpoints"
+cdef bytes _COMPACT = b"compact"
 cdef str _HEARTBEAT = "health:heartbeat"
 
+cdef int _BULK_READ_SIZE = 1000
+
+
+cdef str _INDEX_PREFIX = "index:"
+cdef tuple _APPEND_PREFIXES = (
+    f"{_ACCOUNTS}:",
+    f"{_ORDERS}:",
+    f"{_POSITIONS}:",
+    "snapshots:",
+)
+
+
+cdef class CacheWriteBehindQueue:
+    """
+    Provides a write-behind queue of cache database mutations.
+
+    Mutations are queued on the calling thread, then serialized and written to
+    the backing database in batches by a background thread every `interval_ms`.
+    Pending mutations to the same key are coalesced so only the latest is written:
+     - Single value keys (general objects, currencies, instruments, synthetics,
+       actor and strategy state, heartbeat) keep the last insert or delete.
+     - Index sets and hashes keep the last insert or delete per member.
+     - List appends (account, order and position events, and state snapshots)
+       are never coalesced, and are written in the order they were queued.
+
+    When `max_queue_size` mutations are pending, they are written on the calling
+    thread before it returns, so no mutation is ever dropped.
+
+    Parameters
+    ----------
+    backing : nautilus_pyo3.RedisCacheDatabase
+        The backing database to write to.
+    serializer : Serializer
+        The serializer for queued objects.
+    max_queue_size : int, default 100_000
+        The maximum number of pending mutations.
+    interval_ms : int, default 10
+        The interval (milliseconds) between batches.
+
+    Raises
+    ------
+    ValueError
+        If `max_queue_size` is not positive (> 0).
+    ValueError
+        If `interval_ms` is not positive (> 0).
+
+    Warnings
+    --------
+    Queued objects are serialized from the background thread, and so must not
+    be mutated after being queued.
+    """
+
+    def __init__(
+        self,
+        backing not None,
+        Serializer serializer not None,
+        int max_queue_size = 100_000,
+        int interval_ms = 10,
+    ) -> None:
+        Condition.positive_int(max_queue_size, "max_queue_size")
+        Condition.positive_int(interval_ms, "interval_ms")
+
+        self._log = Logger(type(self).__name__)
+        self._backing = backing
+        self._serializer = serializer
+        self._pending = {}
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._is_running = False
+
+        self.max_queue_size = max_queue_size
+        self.interval_ms = interval_ms
+
+        # Counters
+        self.queued_count = 0
+        self.coalesced_count = 0
+        self.written_count = 0
+        self.failed_count = 0
+        self.batch_count = 0
+
+    cpdef bint is_running(self):
+        """
+        Return whether the background writer thread is running.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._is_running
+
+    cpdef int qsize(self):
+        """
+        Return the number of mutations currently pending.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._pending)
+
+    cpdef void start(self):
+        """
+        Start the background writer thread.
+
+        """
+        if self._is_running:
+            self._log.warning("Write-behind queue already running")
+            return
+
+        self._is_running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=type(self).__name__,
+            daemon=True,
+        )
+        self._thread.start()
+
+    cpdef void stop(self):
+        """
+        Stop the background writer thread, then flush any pending mutations.
+
+        """
+        if self._is_running:
+            self._is_running = False
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+        self.flush()
+
+    cpdef void flush(self):
+        """
+        Write all pending mutations on the calling thread.
+
+        """
+        cdef dict batch
+        cdef str op
+        cdef str key
+        cdef list payload
+        with self._write_lock:
+            # Swap and write under the lock so batches are written in queue order
+            with self._lock:
+                batch = self._pending
+                self._pending = {}
+
+            if not batch:
+                return
+
+            for op, key, payload, obj in batch.values():
+                try:
+                    if obj is not None:
+                        payload = [self._serializer.serialize(obj)]
+                    if op == "insert":
+                        self._backing.insert(key, payload)
+                    elif op == "update":
+                        self._backing.update(key, payload)
+                    else:  # delete
+                        self._backing.delete(key, payload)
+                    self.written_count += 1
+                except Exception as e:
+                    self.failed_count += 1
+                    self._log.error(f"Cannot {op} '{key}': {e!r}")
+
+            self.batch_count += 1
+
+    cpdef void put(self, str op, str key, list payload = None, obj = None):
+        """
+        Queue the given mutation of `key`.
+
+        Parameters
+        ----------
+        op : str, {'insert', 'update', 'delete'}
+            The database operation.
+        key : str
+            The key to mutate.
+        payload : list[bytes], optional
+            The serialized payload for the operation.
+        obj : object, optional
+            The object to serialize as the payload when the mutation is written
+            (takes precedence over `payload`).
+
+        """
+        cdef tuple entry = (op, key, payload, obj)
+        cdef object coalesce_key = self._coalesce_key(op, key, payload)
+        cdef bint is_full
+        with self._lock:
+            if coalesce_key is None:
+                self._sequence += 1
+                coalesce_key = self._sequence
+            elif self._pending.pop(coalesce_key, None) is not None:
+                # Re-inserted so the mutation keeps its position relative to other keys
+                self.coalesced_count += 1
+            self._pending[coalesce_key] = entry
+            self.queued_count += 1
+            is_full = len(self._pending) >= self.max_queue_size
+
+        if is_full:
+            self.flush()
+
+    cdef object _coalesce_key(self, str op, str key, list payload):
+        if key.startswith(_INDEX_PREFIX):
+            return (key, payload[0])
+        if op == "update" or key.startswith(_APPEND_PREFIXES):
+            return None  # List appends are never coalesced
+        return (key,)
+
+    def _run(self) -> None:
+        cdef double interval_secs = self.interval_ms / 1000.0
+        while not self._stop_event.wait(interval_secs):
+            self.flush()
+
 
 cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
     """
@@ -153,8 +375,16 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         self._log.info(f"{config.flush_on_start=}", LogColor.BLUE)
         self._log.info(f"{config.use_trader_prefix=}", LogColor.BLUE)
         self._log.info(f"{config.use_instance_id=}", LogColor.BLUE)
+        self._log.info(f"{config.write_behind=}", LogColor.BLUE)
+        self._log.info(f"{config.checkpoint_interval=}", LogColor.BLUE)
+        self._log.info(f"{config.checkpoint_compaction=}", LogColor.BLUE)
+        if config.write_behind:
+            self._log.info(f"{config.write_behind_interval_ms=}", LogColor.BLUE)
+            self._log.info(f"{config.write_behind_queue_size=}", LogColor.BLUE)
 
         self._serializer = serializer
+        self._checkpoint_interval = config.checkpoint_interval or 0
+        self._checkpoint_compaction = config.checkpoint_compaction
 
         self._backing = nautilus_pyo3.RedisCacheDatabase(
             trader_id=nautilus_pyo3.TraderId(trader_id.value),
@@ -162,6 +392,16 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             config_json=msgspec.json.encode(config),
         )
 
+        self.write_behind = None
+        if config.write_behind:
+            self.write_behind = CacheWriteBehindQueue(
+                backing=self._backing,
+                serializer=serializer,
+                max_queue_size=config.write_behind_queue_size,
+                interval_ms=config.write_behind_interval_ms,
+            )
+            self.write_behind.start()
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cpdef void close(self):
@@ -170,6 +410,8 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         """
         self._log.debug("Closing cache database adapter")
+        if self.write_behind is not None:
+            self.write_behind.stop()  # Flushes pending writes
         self._backing.close()
         self._log.info("Closed cache database adapter")
 
@@ -179,9 +421,60 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         """
         self._log.debug("Flushing cache database")
+        self.flush_writes()
         self._backing.flushdb()
         self._log.info("Flushed cache database", LogColor.BLUE)
 
+    cpdef void flush_writes(self):
+        """
+        Write any pending write-behind mutations to the database on the calling thread.
+
+        """
+        if self.write_behind is not None:
+            self.write_behind.flush()
+
+    cdef list _read(self, str key):
+        self.flush_writes()  # Read your own writes
+        return self._backing.read(key)
+
+    cdef list _read_bulk(self, list keys):
+        self.flush_writes()  # Read your own writes
+
+        cdef list results = []
+        cdef int i
+        for i in range(0, len(keys), _BULK_READ_SIZE):
+            results.extend(self._backing.read_bulk(keys[i:i + _BULK_READ_SIZE]))
+
+        return results
+
+    cdef list _keys(self, str pattern):
+        self.flush_writes()  # Read your own writes
+        return self._backing.keys(pattern)
+
+    cdef void _insert(self, str key, list payload):
+        if self.write_behind is not None:
+            self.write_behind.put("insert", key, payload)
+        else:
+            self._backing.insert(key, payload)
+
+    cdef void _insert_object(self, str key, obj):
+        if self.write_behind is not None:
+            self.write_behind.put("insert", key, None, obj)
+        else:
+            self._backing.insert(key, [self._serializer.serialize(obj)])
+
+    cdef void _update_object(self, str key, obj):
+        if self.write_behind is not None:
+            self.write_behind.put("update", key, None, obj)
+        else:
+            self._backing.update(key, [self._serializer.serialize(obj)])
+
+    cdef void _delete(self, str key, list payload = None):
+        if self.write_behind is not None:
+            self.write_behind.put("delete", key, payload)
+        else:
+            self._backing.delete(key, payload)
+
     cpdef list[str] keys(self, str pattern = "*"):
         """
         Return all keys in the database matching the given `pattern`.
@@ -210,7 +503,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         Condition.valid_string(pattern, "pattern")
 
-        return self._backing.keys(pattern)
+        return self._keys(pattern)
 
     cpdef dict load(self):
         """
@@ -223,7 +516,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         cdef dict general = {}
 
-        cdef list general_keys = self._backing.keys(f"{_GENERAL}:*")
+        cdef list general_keys = self._keys(f"{_GENERAL}:*")
         if not general_keys:
             return general
 
@@ -233,7 +526,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             bytes value_bytes
         for key in general_keys:
             key = key.split(':', maxsplit=1)[1]
-            result = self._backing.read(key)
+            result = self._read(key)
             value_bytes = result[0]
             if value_bytes is not None:
                 key = key.split(':', maxsplit=1)[1]
@@ -252,7 +545,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         cdef dict currencies = {}
 
-        cdef list currency_keys = self._backing.keys(f"{_CURRENCIES}*")
+        cdef list currency_keys = self._keys(f"{_CURRENCIES}*")
         if not currency_keys:
             return currencies
 
@@ -280,7 +573,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         cdef dict instruments = {}
 
-        cdef list instrument_keys = self._backing.keys(f"{_INSTRUMENTS}*")
+        cdef list instrument_keys = self._keys(f"{_INSTRUMENTS}*")
         if not instrument_keys:
             return instruments
 
@@ -308,7 +601,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         cdef dict synthetics = {}
 
-        cdef list synthetic_keys = self._backing.keys(f"{_SYNTHETICS}*")
+        cdef list synthetic_keys = self._keys(f"{_SYNTHETICS}*")
         if not synthetic_keys:
             return synthetics
 
@@ -336,7 +629,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         cdef dict accounts = {}
 
-        cdef list account_keys = self._backing.keys(f"{_ACCOUNTS}*")
+        cdef list account_keys = self._keys(f"{_ACCOUNTS}*")
         if not account_keys:
             return accounts
 
@@ -354,10 +647,17 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         return accounts
 
-    cpdef dict load_orders(self):
+    cpdef dict load_orders(self, set exclude = None):
         """
         Load all orders from the database.
 
+        The event lists are read in pipelined batches rather than one order at a time.
+
+        Parameters
+        ----------
+        exclude : set[ClientOrderId], optional
+            The client order IDs of orders not to load.
+
         Returns
         -------
         dict[ClientOrderId, Order]
@@ -365,27 +665,47 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         cdef dict orders = {}
 
-        cdef list order_keys = self._backing.keys(f"{_ORDERS}*")
+        cdef list order_keys = self._keys(f"{_ORDERS}*")
         if not order_keys:
             return orders
 
+        cdef list keys = []
+        cdef list checkpoint_keys = []
         cdef:
             str key
             ClientOrderId client_order_id
-            Order order
         for key in order_keys:
             client_order_id = ClientOrderId(key.rsplit(':', maxsplit=1)[1])
-            order = self.load_order(client_order_id)
+            if exclude is not None and client_order_id in exclude:
+                continue
+            key = f"{_ORDERS}:{client_order_id.to_str()}"
+            keys.append(key)
+            checkpoint_keys.append(f"{_CHECKPOINTS}:{key}")
+
+        cdef:
+            list result
+            list checkpoint
+            Order order
+        cdef list checkpoints = self._read_checkpoints(checkpoint_keys)
+        for result, checkpoint in zip(self._read_bulk(keys), checkpoints):
+            order = self._order_from_events(result, checkpoint)
 
             if order is not None:
                 orders[order.client_order_id] = order
 
         return orders
 
-    cpdef dict load_positions(self):
+    cpdef dict load_positions(self, set exclude = None):
         """
         Load all positions from the database.
 
+        The event lists are read in pipelined batches rather than one position at a time.
+
+        Parameters
+        ----------
+        exclude : set[PositionId], optional
+            The IDs of positions not to load.
+
         Returns
         -------
         dict[PositionId, Position]
@@ -393,23 +713,70 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         cdef dict positions = {}
 
-        cdef list position_keys = self._backing.keys(f"{_POSITIONS}*")
+        cdef list position_keys = self._keys(f"{_POSITIONS}*")
         if not position_keys:
             return positions
 
+        cdef list keys = []
+        cdef list checkpoint_keys = []
         cdef:
             str key
             PositionId position_id
-            Position position
         for key in position_keys:
             position_id = PositionId(key.rsplit(':', maxsplit=1)[1])
-            position = self.load_position(position_id)
+            if exclude is not None and position_id in exclude:
+                continue
+            key = f"{_POSITIONS}:{position_id.to_str()}"
+            keys.append(key)
+            checkpoint_keys.append(f"{_CHECKPOINTS}:{key}")
+
+        cdef dict instruments = {}
+        cdef:
+            list result
+            list checkpoint
+            Position position
+        cdef list checkpoints = self._read_checkpoints(checkpoint_keys)
+        for result, checkpoint in zip(self._read_bulk(keys), checkpoints):
+            position = self._position_from_events(result, checkpoint, instruments)
 
             if position is not None:
                 positions[position.id] = position
 
         return positions
 
+    cpdef set load_index_orders_closed(self):
+        """
+        Load the closed orders index from the database.
+
+        Returns
+        -------
+        set[ClientOrderId]
+
+        """
+        cdef list result = self._read(_INDEX_ORDERS_CLOSED)
+        return {ClientOrderId(member.decode()) for member in result}
+
+    cpdef set load_index_positions_closed(self):
+        """
+        Load the closed positions index from the database.
+
+        Returns
+        -------
+        set[PositionId]
+
+        """
+        cdef list result = self._read(_INDEX_POSITIONS_CLOSED)
+
+        cdef set position_ids = set()
+        cdef bytes member
+        for member in result:
+            try:
+                position_ids.add(PositionId(member.decode()))
+            except (UnicodeDecodeError, ValueError):
+                continue  # Legacy entry of a serialized event rather than a position ID
+
+        return position_ids
+
     cpdef dict load_index_order_position(self):
         """
         Load the order to position index from the database.
@@ -419,7 +786,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         dict[ClientOrderId, PositionId]
 
         """
-        cdef list result = self._backing.read(_INDEX_ORDER_POSITION)
+        cdef list result = self._read(_INDEX_ORDER_POSITION)
         if not result:
             return {}
 
@@ -435,7 +802,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         dict[ClientOrderId, ClientId]
 
         """
-        cdef list result = self._backing.read(_INDEX_ORDER_CLIENT)
+        cdef list result = self._read(_INDEX_ORDER_CLIENT)
         if not result:
             return {}
 
@@ -459,7 +826,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(code, "code")
 
         cdef str key = f"{_CURRENCIES}:{code}"
-        cdef list result = self._backing.read(key)
+        cdef list result = self._read(key)
 
         if not result:
             return None
@@ -492,7 +859,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(instrument_id, "instrument_id")
 
         cdef str key = f"{_INSTRUMENTS}:{instrument_id.to_str()}"
-        cdef list result = self._backing.read(key)
+        cdef list result = self._read(key)
         if not result:
             return None
 
@@ -524,7 +891,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.true(instrument_id.is_synthetic(), "instrument_id was not for a synthetic instrument")
 
         cdef str key = f"{_SYNTHETICS}:{instrument_id.to_str()}"
-        cdef list result = self._backing.read(key)
+        cdef list result = self._read(key)
         if not result:
             return None
 
@@ -549,7 +916,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(account_id, "account_id")
 
         cdef str key = f"{_ACCOUNTS}:{account_id.to_str()}"
-        cdef list result = self._backing.read(key)
+        cdef list result = self._read(key)
         if not result:
             return None
 
@@ -579,24 +946,42 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(client_order_id, "client_order_id")
 
         cdef str key = f"{_ORDERS}:{client_order_id.to_str()}"
-        cdef list result = self._backing.read(key)
+        cdef list checkpoint = self._read_checkpoints([f"{_CHECKPOINTS}:{key}"])[0]
+        return self._order_from_events(self._read(key), checkpoint)
 
+    cdef Order _order_from_events(self, list result, list checkpoint):
         # Check there is at least one event to pop
         if not result:
             return None
 
-        cdef OrderInitialized init = self._serializer.deserialize(result.pop(0))
-        cdef Order order = OrderUnpacker.from_init_c(init)
+        cdef Order order = None
+        if checkpoint:
+            order = self._load_checkpoint(checkpoint[0])
 
+        # Events already materialized in the checkpoint are skipped
+        cdef set checkpoint_ids = set()
+        cdef set event_ids = set()
         cdef int event_count = 0
+        cdef OrderInitialized init
+        if order is not None:
+            checkpoint_ids = {event.id for event in order._events}
+            event_count = len(checkpoint_ids)
+        else:
+            init = self._serializer.deserialize(result.pop(0))
+            order = OrderUnpacker.from_init_c(init)
+            event_ids.add(init.id)
+
         cdef bytes event_bytes
         cdef OrderEvent event
         for event_bytes in result:
             event = self._serializer.deserialize(event_bytes)
+            if event.id in checkpoint_ids:
+                continue
 
             # Check event integrity
-            if event in order._events:
+            if event.id in event_ids:
                 raise RuntimeError(f"Corrupt cache with duplicate event for order {event}")
+            event_ids.add(event.id)
 
             if event_count > 0 and isinstance(event, OrderInitialized):
                 if event.order_type == OrderType.MARKET:
@@ -631,37 +1016,91 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(position_id, "position_id")
 
         cdef str key = f"{_POSITIONS}:{position_id.to_str()}"
-        cdef list result = self._backing.read(key)
+        cdef list checkpoint = self._read_checkpoints([f"{_CHECKPOINTS}:{key}"])[0]
+        return self._position_from_events(self._read(key), checkpoint, {})
 
+    cdef Position _position_from_events(self, list result, list checkpoint, dict instruments):
         # Check there is at least one event to pop
         if not result:
             return None
 
-        cdef OrderFilled initial_fill = self._serializer.deserialize(result.pop(0))
-        cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
-        if instrument is None:
-            self._log.error(
-                f"Cannot load position: "
-                f"no instrument found for {initial_fill.instrument_id}",
-            )
-            return
-
-        cdef Position position = Position(instrument, initial_fill)
+        cdef Position position = None
+        if checkpoint:
+            position = self._load_checkpoint(checkpoint[0])
+
+        # Events already materialized in the checkpoint are skipped
+        cdef set checkpoint_ids = set()
+        cdef set event_ids = set()
+        cdef OrderFilled initial_fill
+        cdef Instrument instrument
+        if position is not None:
+            checkpoint_ids = {fill.id for fill in position._events}
+        else:
+            initial_fill = self._serializer.deserialize(result.pop(0))
+            instrument = instruments.get(initial_fill.instrument_id)
+            if instrument is None:
+                instrument = self.load_instrument(initial_fill.instrument_id)
+                instruments[initial_fill.instrument_id] = instrument
+            if instrument is None:
+                self._log.error(
+                    f"Cannot load position: "
+                    f"no instrument found for {initial_fill.instrument_id}",
+                )
+                return
+
+            position = Position(instrument, initial_fill)
+            event_ids.add(initial_fill.id)
 
         cdef:
             bytes event_bytes
             OrderFilled fill
         for event_bytes in result:
             event = self._serializer.deserialize(event_bytes)
+            if event.id in checkpoint_ids:
+                continue
 
             # Check event integrity
-            if event in position._events:
+            if event.id in event_ids:
                 raise RuntimeError(f"Corrupt cache with duplicate event for position {event}")
+            event_ids.add(event.id)
 
             position.apply(event)
 
         return position
 
+    cdef list _read_checkpoints(self, list keys):
+        if self._checkpoint_interval == 0:
+            return [None] * len(keys)  # Checkpoints disabled
+
+        return self._read_bulk(keys)
+
+    cdef object _load_checkpoint(self, bytes checkpoint):
+        # A checkpoint which cannot be loaded is not skipped, as the events it
+        # supersedes may have been compacted
+        try:
+            return pickle.loads(checkpoint)
+        except Exception as e:
+            raise RuntimeError(
+                f"Cannot load checkpoint (checkpoints can only be loaded by the "
+                f"version which wrote them): {e!r}",
+            ) from e
+
+    cdef void _checkpoint(self, str key, obj):
+        cdef bytes checkpoint
+        try:
+            checkpoint = pickle.dumps(obj)
+        except Exception as e:
+            self._log.warning(f"Cannot checkpoint {obj!r}: {e!r}")
+            return
+
+        # Replaces the previous checkpoint, and compacts the superseded events
+        # in the same transaction if compaction is enabled
+        cdef list payload = [checkpoint]
+        if self._checkpoint_compaction:
+            payload.append(_COMPACT)
+
+        self._insert(f"{_CHECKPOINTS}:{key}", payload)
+
     cpdef dict load_actor(self, ComponentId component_id):
         """
         Load the state for the given actor.
@@ -679,7 +1118,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(component_id, "component_id")
 
         cdef str key = f"{_ACTORS}:{component_id.to_str()}:state"
-        cdef list result = self._backing.read(key)
+        cdef list result = self._read(key)
         if not result:
             return {}
 
@@ -698,7 +1137,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(component_id, "component_id")
 
         cdef str key = f"{_ACTORS}:{component_id.to_str()}:state"
-        self._backing.delete(key)
+        self._delete(key)
 
         self._log.info(f"Deleted {repr(component_id)}")
 
@@ -719,7 +1158,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(strategy_id, "strategy_id")
 
         cdef str key = f"{_STRATEGIES}:{strategy_id.to_str()}:state"
-        cdef list result = self._backing.read(key)
+        cdef list result = self._read(key)
         if not result:
             return {}
 
@@ -738,7 +1177,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(strategy_id, "strategy_id")
 
         cdef str key = f"{_STRATEGIES}:{strategy_id.to_str()}:state"
-        self._backing.delete(key)
+        self._delete(key)
 
         self._log.info(f"Deleted {repr(strategy_id)}")
 
@@ -757,7 +1196,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(key, "key")
         Condition.not_none(value, "value")
 
-        self._backing.insert(f"{_GENERAL}:{key}", [value])
+        self._insert(f"{_GENERAL}:{key}", [value])
         self._log.debug(f"Added general object {key}")
 
     cpdef void add_currency(self, Currency currency):
@@ -780,8 +1219,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         }
 
         cdef key = f"{_CURRENCIES}:{currency.code}"
-        cdef list payload = [self._serializer.serialize(currency_map)]
-        self._backing.insert(key, payload)
+        self._insert_object(key, currency_map)
 
         self._log.debug(f"Added currency {currency.code}")
 
@@ -798,8 +1236,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(instrument, "instrument")
 
         cdef str key = f"{_INSTRUMENTS}:{instrument.id.to_str()}"
-        cdef list payload = [self._serializer.serialize(instrument)]
-        self._backing.insert(key, payload)
+        self._insert_object(key, instrument)
 
         self._log.debug(f"Added instrument {instrument.id}")
 
@@ -816,8 +1253,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(synthetic, "synthetic")
 
         cdef str key = f"{_SYNTHETICS}:{synthetic.id.value}"
-        cdef list payload = [self._serializer.serialize(synthetic)]
-        self._backing.insert(key, payload)
+        self._insert_object(key, synthetic)
 
         self._log.debug(f"Added synthetic instrument {synthetic.id}")
 
@@ -834,8 +1270,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(account, "account")
 
         cdef str key = f"{_ACCOUNTS}:{account.id.value}"
-        cdef list payload = [self._serializer.serialize(account.last_event_c())]
-        self._backing.insert(key, payload)
+        self._insert_object(key, account.last_event_c())
 
         self._log.debug(f"Added {account}")
 
@@ -857,15 +1292,14 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         cdef client_order_id_str = order.client_order_id.to_str()
         cdef str key = f"{_ORDERS}:{client_order_id_str}"
-        cdef list payload = [self._serializer.serialize(order.last_event_c())]
-        self._backing.insert(key, payload)
+        self._insert_object(key, order.last_event_c())
 
         cdef bytes client_order_id_bytes = client_order_id_str.encode()
-        payload = [client_order_id_bytes]
-        self._backing.insert(_INDEX_ORDERS, payload)
+        cdef list payload = [client_order_id_bytes]
+        self._insert(_INDEX_ORDERS, payload)
 
         if order.emulation_trigger != TriggerType.NO_TRIGGER:
-            self._backing.insert(_INDEX_ORDERS_EMULATED, payload)
+            self._insert(_INDEX_ORDERS_EMULATED, payload)
 
         self._log.debug(f"Added {order}")
 
@@ -873,7 +1307,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             self.index_order_position(order.client_order_id, position_id)
         if client_id is not None:
             payload = [client_order_id_bytes, client_id.to_str().encode()]
-            self._backing.insert(_INDEX_ORDER_CLIENT, payload)
+            self._insert(_INDEX_ORDER_CLIENT, payload)
             self._log.debug(f"Indexed {order.client_order_id!r} -> {client_id!r}")
 
     cpdef void add_position(self, Position position):
@@ -890,12 +1324,11 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         cdef str position_id_str = position.id.to_str()
         cdef str key = f"{_POSITIONS}:{position_id_str}"
-        cdef list payload = [self._serializer.serialize(position.last_event_c())]
-        self._backing.insert(key, payload)
+        self._insert_object(key, position.last_event_c())
 
         cdef bytes position_id_bytes = position_id_str.encode()
-        self._backing.insert(_INDEX_POSITIONS, [position_id_bytes])
-        self._backing.insert(_INDEX_POSITIONS_OPEN, [position_id_bytes])
+        self._insert(_INDEX_POSITIONS, [position_id_bytes])
+        self._insert(_INDEX_POSITIONS_OPEN, [position_id_bytes])
 
         self._log.debug(f"Added {position}")
 
@@ -915,7 +1348,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(venue_order_id, "venue_order_id")
 
         cdef list payload = [client_order_id.to_str().encode(), venue_order_id.to_str().encode()]
-        self._backing.insert(_INDEX_ORDER_IDS, payload)
+        self._insert(_INDEX_ORDER_IDS, payload)
 
         self._log.debug(f"Indexed {client_order_id!r} -> {venue_order_id!r}")
 
@@ -935,7 +1368,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(position_id, "position_id")
 
         cdef list payload = [client_order_id.to_str().encode(), position_id.to_str().encode()]
-        self._backing.insert(_INDEX_ORDER_POSITION, payload)
+        self._insert(_INDEX_ORDER_POSITION, payload)
 
         self._log.debug(f"Indexed {client_order_id!r} -> {position_id!r}")
 
@@ -954,8 +1387,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef dict state = actor.save()  # Extract state dictionary from strategy
 
         cdef key = f"{_ACTORS}:{actor.id.value}:state"
-        cdef list payload = [self._serializer.serialize(state)]
-        self._backing.insert(key, payload)
+        self._insert_object(key, state)
 
         self._log.debug(f"Saved actor state for {actor.id.value}")
 
@@ -974,8 +1406,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef dict state = strategy.save()  # Extract state dictionary from strategy
 
         cdef key = f"{_STRATEGIES}:{strategy.id.value}:state"
-        cdef list payload = [self._serializer.serialize(state)]
-        self._backing.insert(key, payload)
+        self._insert_object(key, state)
 
         self._log.debug(f"Saved strategy state for {strategy.id.value}")
 
@@ -991,8 +1422,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(account, "account")
 
         cdef str key = f"{_ACCOUNTS}:{account.id.to_str()}"
-        cdef list payload = [self._serializer.serialize(account.last_event_c())]
-        self._backing.update(key, payload)
+        self._update_object(key, account.last_event_c())
 
         self._log.debug(f"Updated {account}")
 
@@ -1010,34 +1440,37 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         cdef str client_order_id_str = order.client_order_id.to_str()
         cdef str key = f"{_ORDERS}:{client_order_id_str}"
-        cdef list payload = [self._serializer.serialize(order.last_event_c())]
-        self._backing.update(key, payload)
+        self._update_object(key, order.last_event_c())
+
+        cdef int interval = self._checkpoint_interval
+        if interval > 0 and order.event_count_c() % interval == 0:
+            self._checkpoint(key, order)
 
         if order.venue_order_id is not None:
             # Assumes order_id does not change
             self.index_venue_order_id(order.client_order_id, order.venue_order_id)
 
-        payload = [client_order_id_str.encode()]
+        cdef list payload = [client_order_id_str.encode()]
 
         # Update in-flight state
         if order.is_inflight_c():
-            self._backing.insert(_INDEX_ORDERS_INFLIGHT, payload)
+            self._insert(_INDEX_ORDERS_INFLIGHT, payload)
         else:
-            self._backing.delete(_INDEX_ORDERS_INFLIGHT, payload)
+            self._delete(_INDEX_ORDERS_INFLIGHT, payload)
 
         # Update open/closed state
         if order.is_open_c():
-            self._backing.delete(_INDEX_ORDERS_CLOSED, payload)
-            self._backing.insert(_INDEX_ORDERS_OPEN, payload)
+            self._delete(_INDEX_ORDERS_CLOSED, payload)
+            self._insert(_INDEX_ORDERS_OPEN, payload)
         elif order.is_closed_c():
-            self._backing.delete(_INDEX_ORDERS_OPEN, payload)
-            self._backing.insert(_INDEX_ORDERS_CLOSED, payload)
+            self._delete(_INDEX_ORDERS_OPEN, payload)
+            self._insert(_INDEX_ORDERS_CLOSED, payload)
 
         # Update emulation state
         if order.emulation_trigger == TriggerType.NO_TRIGGER:
-            self._backing.delete(_INDEX_ORDERS_EMULATED, payload)
+            self._delete(_INDEX_ORDERS_EMULATED, payload)
         else:
-            self._backing.insert(_INDEX_ORDERS_EMULATED, payload)
+            self._insert(_INDEX_ORDERS_EMULATED, payload)
 
         self._log.debug(f"Updated {order}")
 
@@ -1054,16 +1487,21 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(position, "position")
 
         cdef str position_id_str = position.id.to_str()
-        cdef str key = f"{_POSITIONS}:{position.id.to_str()}"
-        cdef list payload = [self._serializer.serialize(position.last_event_c())]
-        self._backing.update(key, payload)
+        cdef str key = f"{_POSITIONS}:{position_id_str}"
+        self._update_object(key, position.last_event_c())
+
+        cdef int interval = self._checkpoint_interval
+        if interval > 0 and position.event_count_c() % interval == 0:
+            self._checkpoint(key, position)
+
+        cdef list payload = [position_id_str.encode()]
 
         if position.is_open_c():
-            self._backing.insert(_INDEX_POSITIONS_OPEN, payload)
-            self._backing.delete(_INDEX_POSITIONS_CLOSED, payload)
+            self._insert(_INDEX_POSITIONS_OPEN, payload)
+            self._delete(_INDEX_POSITIONS_CLOSED, payload)
         elif position.is_closed_c():
-            self._backing.insert(_INDEX_POSITIONS_CLOSED, payload)
-            self._backing.delete(_INDEX_POSITIONS_OPEN, payload)
+            self._insert(_INDEX_POSITIONS_CLOSED, payload)
+            self._delete(_INDEX_POSITIONS_OPEN, payload)
 
         self._log.debug(f"Updated {position}")
 
@@ -1080,8 +1518,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(order, "order")
 
         cdef str key = f"{_SNAPSHOTS_ORDERS}:{order.client_order_id.to_str()}"
-        cdef list payload = [self._serializer.serialize(order.to_dict())]
-        self._backing.insert(key, payload)
+        self._insert_object(key, order.to_dict())
 
         self._log.debug(f"Added state snapshot {order}")
 
@@ -1109,8 +1546,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         position_state["ts_snapshot"] = ts_snapshot
 
         cdef str key = f"{_SNAPSHOTS_POSITIONS}:{position.id.to_str()}"
-        cdef list payload = [self._serializer.serialize(position_state)]
-        self._backing.insert(key, payload)
+        self._insert_object(key, position_state)
 
         self._log.debug(f"Added state snapshot {position}")
 
@@ -1127,6 +1563,6 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(timestamp, "timestamp")
 
         cdef timestamp_str = format_iso8601(timestamp)
-        self._backing.insert(_HEARTBEAT, [timestamp_str.encode()])
+        self._insert(_HEARTBEAT, [timestamp_str.encode()])
 
         self._log.debug(f"Set last heartbeat {timestamp_str}")
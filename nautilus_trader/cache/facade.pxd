@@ -63,8 +63,10 @@ cdef class CacheDatabaseFacade:
     cpdef dict load_instruments(self)
     cpdef dict load_synthetics(self)
     cpdef dict load_accounts(self)
-    cpdef dict load_orders(self)
-    cpdef dict load_positions(self)
+    cpdef dict load_orders(self, set exclude=*)
+    cpdef dict load_positions(self, set exclude=*)
+    cpdef set load_index_orders_closed(self)
+    cpdef set load_index_positions_closed(self)
     cpdef dict load_index_order_position(self)
     cpdef dict load_index_order_client(self)
     cpdef Currency load_currency(self, str code)
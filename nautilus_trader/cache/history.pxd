@@ -0,0 +1,105 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class DataHistory:
+    cdef object _ts_events_arr
+    cdef object _ts_inits_arr
+    cdef uint64_t[::1] _ts_events
+    cdef uint64_t[::1] _ts_inits
+    cdef Py_ssize_t _index
+
+    cdef readonly int capacity
+    """The maximum number of rows held by the history.\n\n:returns: `int`"""
+    cdef readonly Py_ssize_t count
+    """The current number of rows held by the history.\n\n:returns: `int`"""
+
+    cpdef void clear(self)
+    cdef Py_ssize_t _next(self, uint64_t ts_event, uint64_t ts_init)
+    cdef Py_ssize_t _position(self, int index)
+    cdef object _last(self, object arr, object n, bint copy=*)
+
+
+cdef class QuoteTickHistory(DataHistory):
+    cdef object _bid_prices_arr
+    cdef object _ask_prices_arr
+    cdef object _bid_sizes_arr
+    cdef object _ask_sizes_arr
+    cdef double[::1] _bid_prices
+    cdef double[::1] _ask_prices
+    cdef double[::1] _bid_sizes
+    cdef double[::1] _ask_sizes
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the history.\n\n:returns: `InstrumentId`"""
+    cdef readonly uint8_t price_precision
+    """The price precision for the history.\n\n:returns: `uint8`"""
+    cdef readonly uint8_t size_precision
+    """The size precision for the history.\n\n:returns: `uint8`"""
+
+    cpdef void append(self, QuoteTick tick)
+    cpdef QuoteTick quote_tick(self, int index=*)
+
+
+cdef class TradeTickHistory(DataHistory):
+    cdef object _prices_arr
+    cdef object _sizes_arr
+    cdef object _aggressor_sides_arr
+    cdef object _trade_ids_arr
+    cdef double[::1] _prices
+    cdef double[::1] _sizes
+    cdef uint8_t[::1] _aggressor_sides
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the history.\n\n:returns: `InstrumentId`"""
+    cdef readonly uint8_t price_precision
+    """The price precision for the history.\n\n:returns: `uint8`"""
+    cdef readonly uint8_t size_precision
+    """The size precision for the history.\n\n:returns: `uint8`"""
+
+    cpdef void append(self, TradeTick tick)
+    cpdef TradeTick trade_tick(self, int index=*)
+
+
+cdef class BarHistory(DataHistory):
+    cdef object _opens_arr
+    cdef object _highs_arr
+    cdef object _lows_arr
+    cdef object _closes_arr
+    cdef object _volumes_arr
+    cdef double[::1] _opens
+    cdef double[::1] _highs
+    cdef double[::1] _lows
+    cdef double[::1] _closes
+    cdef double[::1] _volumes
+
+    cdef readonly BarType bar_type
+    """The bar type for the history.\n\n:returns: `BarType`"""
+    cdef readonly uint8_t price_precision
+    """The price precision for the history.\n\n:returns: `uint8`"""
+    cdef readonly uint8_t size_precision
+    """The size precision for the history.\n\n:returns: `uint8`"""
+
+    cpdef void append(self, Bar bar)
+    cpdef Bar bar(self, int index=*)
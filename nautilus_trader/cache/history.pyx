@@ -0,0 +1,763 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_SCALAR
+from nautilus_trader.core.rust.model cimport AggressorSide
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport TradeId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+
+
+cdef class DataHistory:
+    """
+    The base class for fixed-capacity columnar histories of market data.
+
+    Each column is a NumPy ring buffer which is written twice (at the row position and
+    again offset by the capacity), so that the last N rows are always available as a
+    single contiguous, read-only array view in chronological order (oldest first).
+    Views alias the ring buffer, so are only valid until the next append (when the
+    oldest rows are overwritten); pass ``copy=True`` to an accessor to hold the values.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of rows held by the history.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    Warnings
+    --------
+    This class should not be used directly, but through a concrete subclass.
+
+    """
+
+    def __init__(self, int capacity) -> None:
+        Condition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self.count = 0
+        self._index = -1
+
+        self._ts_events_arr = np.zeros(capacity * 2, dtype=np.uint64)
+        self._ts_inits_arr = np.zeros(capacity * 2, dtype=np.uint64)
+        self._ts_events = self._ts_events_arr
+        self._ts_inits = self._ts_inits_arr
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(capacity={self.capacity}, count={self.count})"
+
+    cpdef void clear(self):
+        """
+        Clear all rows from the history.
+
+        """
+        self.count = 0
+        self._index = -1
+
+    def ts_events(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` UNIX timestamps (nanoseconds) when the data events occurred.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._last(self._ts_events_arr, n, copy)
+
+    def ts_inits(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` UNIX timestamps (nanoseconds) when the data objects were initialized.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._last(self._ts_inits_arr, n, copy)
+
+    cdef Py_ssize_t _next(self, uint64_t ts_event, uint64_t ts_init):
+        self._index += 1
+        if self._index == self.capacity:
+            self._index = 0
+        if self.count < self.capacity:
+            self.count += 1
+
+        cdef Py_ssize_t mirror = self._index + self.capacity
+        self._ts_events[self._index] = ts_event
+        self._ts_events[mirror] = ts_event
+        self._ts_inits[self._index] = ts_init
+        self._ts_inits[mirror] = ts_init
+
+        return self._index
+
+    cdef Py_ssize_t _position(self, int index):
+        # Returns the position of the row at `index` (where 0 is the latest), or -1
+        if index < 0 or index >= self.count:
+            return -1
+        return self._index + self.capacity - index
+
+    cdef object _last(self, object arr, object n, bint copy=False):
+        cdef Py_ssize_t size = self.count
+        if n is not None:
+            Condition.not_negative_int(n, "n")
+            size = min(<Py_ssize_t>n, self.count)
+
+        cdef Py_ssize_t end = self._index + self.capacity + 1
+        view = arr[end - size:end]
+        if copy:
+            return view.copy()
+        view.flags.writeable = False
+        return view
+
+
+cdef class QuoteTickHistory(DataHistory):
+    """
+    Provides a fixed-capacity columnar history of quote ticks for a single instrument.
+
+    Prices and sizes are held as `float64` columns, with `QuoteTick` objects only
+    materialized on demand.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the history.
+    capacity : int
+        The maximum number of rows held by the history.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity) -> None:
+        super().__init__(capacity)
+
+        self.instrument_id = instrument_id
+        self.price_precision = 0
+        self.size_precision = 0
+
+        self._bid_prices_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._ask_prices_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._bid_sizes_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._ask_sizes_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._bid_prices = self._bid_prices_arr
+        self._ask_prices = self._ask_prices_arr
+        self._bid_sizes = self._bid_sizes_arr
+        self._ask_sizes = self._ask_sizes_arr
+
+    cpdef void append(self, QuoteTick tick):
+        """
+        Append the given tick to the history (overwriting the oldest row if full).
+
+        Parameters
+        ----------
+        tick : QuoteTick
+            The tick to append.
+
+        """
+        if self.count == 0:
+            self.price_precision = tick._mem.bid_price.precision
+            self.size_precision = tick._mem.bid_size.precision
+
+        cdef Py_ssize_t i = self._next(tick._mem.ts_event, tick._mem.ts_init)
+        cdef Py_ssize_t m = i + self.capacity
+        cdef double bid_price = tick._mem.bid_price.raw / FIXED_SCALAR
+        cdef double ask_price = tick._mem.ask_price.raw / FIXED_SCALAR
+        cdef double bid_size = tick._mem.bid_size.raw / FIXED_SCALAR
+        cdef double ask_size = tick._mem.ask_size.raw / FIXED_SCALAR
+        self._bid_prices[i] = bid_price
+        self._bid_prices[m] = bid_price
+        self._ask_prices[i] = ask_price
+        self._ask_prices[m] = ask_price
+        self._bid_sizes[i] = bid_size
+        self._bid_sizes[m] = bid_size
+        self._ask_sizes[i] = ask_size
+        self._ask_sizes[m] = ask_size
+
+    def bid_prices(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` bid prices.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._bid_prices_arr, n, copy)
+
+    def ask_prices(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` ask prices.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._ask_prices_arr, n, copy)
+
+    def bid_sizes(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` bid sizes.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._bid_sizes_arr, n, copy)
+
+    def ask_sizes(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` ask sizes.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._ask_sizes_arr, n, copy)
+
+    def mid_prices(self, n: int | None = None):
+        """
+        Return the last `n` mid prices.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The computed array (oldest first).
+
+        """
+        return (self._last(self._bid_prices_arr, n) + self._last(self._ask_prices_arr, n)) / 2.0
+
+    cpdef QuoteTick quote_tick(self, int index = 0):
+        """
+        Return the quote tick materialized from the row at the given index (if found).
+
+        Last quote tick if no index specified.
+
+        Parameters
+        ----------
+        index : int, optional
+            The index for the quote tick to get (0 is the latest).
+
+        Returns
+        -------
+        QuoteTick or ``None``
+            If no tick at the index then returns ``None``.
+
+        """
+        cdef Py_ssize_t i = self._position(index)
+        if i == -1:
+            return None
+
+        return QuoteTick(
+            instrument_id=self.instrument_id,
+            bid_price=Price(self._bid_prices[i], self.price_precision),
+            ask_price=Price(self._ask_prices[i], self.price_precision),
+            bid_size=Quantity(self._bid_sizes[i], self.size_precision),
+            ask_size=Quantity(self._ask_sizes[i], self.size_precision),
+            ts_event=self._ts_events[i],
+            ts_init=self._ts_inits[i],
+        )
+
+    def to_quote_ticks(self, n: int | None = None) -> list[QuoteTick]:
+        """
+        Return the last `n` rows materialized as quote ticks.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+
+        Returns
+        -------
+        list[QuoteTick]
+            The ticks (oldest first).
+
+        """
+        cdef int size = len(self.ts_inits(n))
+        return [self.quote_tick(i) for i in range(size - 1, -1, -1)]
+
+
+cdef class TradeTickHistory(DataHistory):
+    """
+    Provides a fixed-capacity columnar history of trade ticks for a single instrument.
+
+    Prices and sizes are held as `float64` columns, with `TradeTick` objects only
+    materialized on demand.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the history.
+    capacity : int
+        The maximum number of rows held by the history.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity) -> None:
+        super().__init__(capacity)
+
+        self.instrument_id = instrument_id
+        self.price_precision = 0
+        self.size_precision = 0
+
+        self._prices_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._sizes_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._aggressor_sides_arr = np.zeros(capacity * 2, dtype=np.uint8)
+        self._trade_ids_arr = np.empty(capacity, dtype=object)
+        self._prices = self._prices_arr
+        self._sizes = self._sizes_arr
+        self._aggressor_sides = self._aggressor_sides_arr
+
+    cpdef void append(self, TradeTick tick):
+        """
+        Append the given tick to the history (overwriting the oldest row if full).
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The tick to append.
+
+        """
+        if self.count == 0:
+            self.price_precision = tick._mem.price.precision
+            self.size_precision = tick._mem.size.precision
+
+        cdef Py_ssize_t i = self._next(tick._mem.ts_event, tick._mem.ts_init)
+        cdef Py_ssize_t m = i + self.capacity
+        cdef double price = tick._mem.price.raw / FIXED_SCALAR
+        cdef double size = tick._mem.size.raw / FIXED_SCALAR
+        self._prices[i] = price
+        self._prices[m] = price
+        self._sizes[i] = size
+        self._sizes[m] = size
+        self._aggressor_sides[i] = <uint8_t>tick._mem.aggressor_side
+        self._aggressor_sides[m] = <uint8_t>tick._mem.aggressor_side
+        self._trade_ids_arr[i] = tick.trade_id
+
+    def prices(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` trade prices.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._prices_arr, n, copy)
+
+    def sizes(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` trade sizes.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._sizes_arr, n, copy)
+
+    def aggressor_sides(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` trade aggressor sides (as `AggressorSide` values).
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[uint8]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._aggressor_sides_arr, n, copy)
+
+    cpdef TradeTick trade_tick(self, int index = 0):
+        """
+        Return the trade tick materialized from the row at the given index (if found).
+
+        Last trade tick if no index specified.
+
+        Parameters
+        ----------
+        index : int, optional
+            The index for the trade tick to get (0 is the latest).
+
+        Returns
+        -------
+        TradeTick or ``None``
+            If no tick at the index then returns ``None``.
+
+        """
+        cdef Py_ssize_t i = self._position(index)
+        if i == -1:
+            return None
+
+        return TradeTick(
+            instrument_id=self.instrument_id,
+            price=Price(self._prices[i], self.price_precision),
+            size=Quantity(self._sizes[i], self.size_precision),
+            aggressor_side=<AggressorSide>self._aggressor_sides[i],
+            trade_id=self._trade_ids_arr[i % self.capacity],
+            ts_event=self._ts_events[i],
+            ts_init=self._ts_inits[i],
+        )
+
+    def to_trade_ticks(self, n: int | None = None) -> list[TradeTick]:
+        """
+        Return the last `n` rows materialized as trade ticks.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+
+        Returns
+        -------
+        list[TradeTick]
+            The ticks (oldest first).
+
+        """
+        cdef int size = len(self.ts_inits(n))
+        return [self.trade_tick(i) for i in range(size - 1, -1, -1)]
+
+
+cdef class BarHistory(DataHistory):
+    """
+    Provides a fixed-capacity columnar history of bars for a single bar type.
+
+    Prices and volumes are held as `float64` columns, with `Bar` objects only
+    materialized on demand.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type for the history.
+    capacity : int
+        The maximum number of rows held by the history.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, BarType bar_type not None, int capacity) -> None:
+        super().__init__(capacity)
+
+        self.bar_type = bar_type
+        self.price_precision = 0
+        self.size_precision = 0
+
+        self._opens_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._highs_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._lows_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._closes_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._volumes_arr = np.zeros(capacity * 2, dtype=np.float64)
+        self._opens = self._opens_arr
+        self._highs = self._highs_arr
+        self._lows = self._lows_arr
+        self._closes = self._closes_arr
+        self._volumes = self._volumes_arr
+
+    cpdef void append(self, Bar bar):
+        """
+        Append the given bar to the history (overwriting the oldest row if full).
+
+        Parameters
+        ----------
+        bar : Bar
+            The bar to append.
+
+        """
+        if self.count == 0:
+            self.price_precision = bar._mem.open.precision
+            self.size_precision = bar._mem.volume.precision
+
+        cdef Py_ssize_t i = self._next(bar._mem.ts_event, bar._mem.ts_init)
+        cdef Py_ssize_t m = i + self.capacity
+        cdef double open_price = bar._mem.open.raw / FIXED_SCALAR
+        cdef double high_price = bar._mem.high.raw / FIXED_SCALAR
+        cdef double low_price = bar._mem.low.raw / FIXED_SCALAR
+        cdef double close_price = bar._mem.close.raw / FIXED_SCALAR
+        cdef double volume = bar._mem.volume.raw / FIXED_SCALAR
+        self._opens[i] = open_price
+        self._opens[m] = open_price
+        self._highs[i] = high_price
+        self._highs[m] = high_price
+        self._lows[i] = low_price
+        self._lows[m] = low_price
+        self._closes[i] = close_price
+        self._closes[m] = close_price
+        self._volumes[i] = volume
+        self._volumes[m] = volume
+
+    def opens(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` open prices.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._opens_arr, n, copy)
+
+    def highs(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` high prices.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._highs_arr, n, copy)
+
+    def lows(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` low prices.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._lows_arr, n, copy)
+
+    def closes(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` close prices.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._closes_arr, n, copy)
+
+    def volumes(self, n: int | None = None, copy: bool = False):
+        """
+        Return the last `n` volumes.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+        copy : bool, default False
+            If a copy should be returned, rather than a read-only view of the ring buffer
+            which is only valid until the next append.
+
+        Returns
+        -------
+        np.ndarray[float64]
+            The read-only array view, or a copy if `copy` (oldest first).
+
+        """
+        return self._last(self._volumes_arr, n, copy)
+
+    cpdef Bar bar(self, int index = 0):
+        """
+        Return the bar materialized from the row at the given index (if found).
+
+        Last bar if no index specified.
+
+        Parameters
+        ----------
+        index : int, optional
+            The index for the bar to get (0 is the latest).
+
+        Returns
+        -------
+        Bar or ``None``
+            If no bar at the index then returns ``None``.
+
+        """
+        cdef Py_ssize_t i = self._position(index)
+        if i == -1:
+            return None
+
+        return Bar(
+            bar_type=self.bar_type,
+            open=Price(self._opens[i], self.price_precision),
+            high=Price(self._highs[i], self.price_precision),
+            low=Price(self._lows[i], self.price_precision),
+            close=Price(self._closes[i], self.price_precision),
+            volume=Quantity(self._volumes[i], self.size_precision),
+            ts_event=self._ts_events[i],
+            ts_init=self._ts_inits[i],
+        )
+
+    def to_bars(self, n: int | None = None) -> list[Bar]:
+        """
+        Return the last `n` rows materialized as bars.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows to return. If ``None`` then returns all rows.
+
+        Returns
+        -------
+        list[Bar]
+            The bars (oldest first).
+
+        """
+        cdef int size = len(self.ts_inits(n))
+        return [self.bar(i) for i in range(size - 1, -1, -1)]
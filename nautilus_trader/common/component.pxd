@@ -21,6 +21,8 @@ from cpython.datetime cimport tzinfo
 from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.common.profiler cimport MessageBusMetrics
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.fsm cimport FiniteStateMachine
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.message cimport Request
@@ -245,6 +247,65 @@ cdef class Component:
     )
 
 
+cdef class _TopicTrieNode:
+    cdef dict children
+    cdef list values
+
+
+cdef class TopicTrie:
+    cdef _TopicTrieNode _root
+
+    cdef readonly int count
+    """The count of values held in the trie.\n\n:returns: `int`"""
+
+    cpdef void add(self, str key, value)
+    cpdef bint remove(self, str key, value)
+    cpdef list get(self, str key)
+    cpdef list match_pattern(self, str pattern)
+    cpdef list match_topic(self, str topic)
+    cdef void _match_pattern(self, _TopicTrieNode node, str pattern, Py_ssize_t j, set visited, list results)
+    cdef void _match_topic(self, _TopicTrieNode node, str topic, Py_ssize_t i, set visited, list results)
+
+
+cdef class ExternalPublisher:
+    cdef Logger _log
+    cdef object _database
+    cdef Serializer _serializer
+    cdef object _queue
+    cdef object _not_empty
+    cdef object _not_full
+    cdef object _write_lock
+    cdef object _thread
+    cdef bint _is_running
+
+    cdef readonly int max_queue_size
+    """The maximum number of messages held in the queue.\n\n:returns: `int`"""
+    cdef readonly int max_batch_size
+    """The maximum number of messages written per batch.\n\n:returns: `int`"""
+    cdef readonly int max_latency_ms
+    """The maximum time (milliseconds) a message waits before its batch is written.\n\n:returns: `int`"""
+    cdef readonly str backpressure
+    """The policy applied when the queue is full.\n\n:returns: `str`"""
+    cdef readonly uint64_t queued_count
+    """The count of messages queued for publishing.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t dropped_count
+    """The count of messages dropped due to backpressure.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t flushed_count
+    """The count of messages written to the database.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t failed_count
+    """The count of messages which failed to serialize or write.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t batch_count
+    """The count of batches written to the database.\n\n:returns: `uint64_t`"""
+
+    cpdef bint is_running(self)
+    cpdef int qsize(self)
+    cpdef void start(self)
+    cpdef void stop(self)
+    cpdef void flush(self)
+    cpdef bint publish(self, str topic, msg)
+    cdef int _write_batch(self)
+
+
 cdef class MessageBus:
     cdef Clock _clock
     cdef Logger _log
@@ -253,9 +314,15 @@ cdef class MessageBus:
     cdef dict[str, Subscription[:]] _patterns
     cdef dict[str, object] _endpoints
     cdef dict[UUID4, object] _correlation_index
+    cdef dict _sequences
+    cdef TopicTrie _topic_trie
+    cdef TopicTrie _pattern_trie
+    cdef dict[type, dict] _channels
+    cdef dict[str, list] _topic_channels
     cdef tuple[type] _publishable_types
     cdef bint _has_backing
-    cdef bint _resolved
+    cdef uint64_t _sequence
+    cdef Profiler _profiler
 
     cdef readonly TraderId trader_id
     """The trader ID associated with the bus.\n\n:returns: `TraderId`"""
@@ -275,6 +342,10 @@ cdef class MessageBus:
     """The count of responses processed by the bus.\n\n:returns: `uint64_t`"""
     cdef readonly uint64_t pub_count
     """The count of messages published by the bus.\n\n:returns: `uint64_t`"""
+    cdef readonly ExternalPublisher external_publisher
+    """The asynchronous batched publisher for external streams (if configured).\n\n:returns: `ExternalPublisher` or ``None``"""
+    cdef readonly MessageBusMetrics metrics
+    """The per-topic and per-handler metrics for the bus (if enabled).\n\n:returns: `MessageBusMetrics` or ``None``"""
 
     cpdef list endpoints(self)
     cpdef list topics(self)
@@ -284,6 +355,8 @@ cdef class MessageBus:
     cpdef bint is_pending_request(self, UUID4 request_id)
 
     cpdef void dispose(self)
+    cpdef void set_profiler(self, Profiler profiler)
+    cpdef void set_metrics(self, MessageBusMetrics metrics)
     cpdef void register(self, str endpoint, handler)
     cpdef void deregister(self, str endpoint, handler)
     cpdef void send(self, str endpoint, msg)
@@ -293,7 +366,14 @@ cdef class MessageBus:
     cpdef void unsubscribe(self, str topic, handler)
     cpdef void publish(self, str topic, msg)
     cdef void publish_c(self, str topic, msg)
+    cpdef TypedChannel channel(self, type data_cls, key, str topic)
+    cdef TypedChannel get_channel_c(self, type data_cls, key)
+    cpdef void publish_channel(self, TypedChannel channel, msg)
+    cdef void publish_channel_c(self, TypedChannel channel, msg)
+    cdef void _dispatch(self, str topic, Subscription[:] subs, msg)
+    cdef void _set_subscriptions(self, str topic, subs)
     cdef Subscription[:] _resolve_subscriptions(self, str topic)
+    cdef list _sort_subscriptions(self, list subs)
 
 
 cdef bint is_matching(str topic, str pattern)
@@ -308,6 +388,19 @@ cdef class Subscription:
     """The priority for the subscription.\n\n:returns: `int`"""
 
 
+cdef class TypedChannel:
+    cdef Subscription[:] _subscriptions
+
+    cdef readonly type data_cls
+    """The data class for the channel.\n\n:returns: `type`"""
+    cdef readonly object key
+    """The key for the channel.\n\n:returns: `object`"""
+    cdef readonly str topic
+    """The equivalent string topic for the channel.\n\n:returns: `str`"""
+
+    cpdef list subscriptions(self)
+
+
 cdef class Throttler:
     cdef Clock _clock
     cdef Logger _log
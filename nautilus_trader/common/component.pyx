@@ -17,8 +17,10 @@ import asyncio
 import copy
 import socket
 import sys
+import threading
 import traceback
 from collections import deque
+from time import perf_counter_ns
 from typing import Any
 from typing import Callable
 
@@ -46,6 +48,8 @@ from libc.stdint cimport uint64_t
 from libc.stdio cimport printf
 
 from nautilus_trader.common.messages cimport ComponentStateChanged
+from nautilus_trader.common.profiler cimport MessageBusMetrics
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.datetime cimport maybe_dt_to_unix_nanos
@@ -1936,6 +1940,238 @@ cdef class Component:
         )
 
 
+_BACKPRESSURE_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+cdef class ExternalPublisher:
+    """
+    Provides an asynchronous batched publisher of messages to external streams.
+
+    Messages are handed to a bounded queue on the publishing thread, then
+    serialized and written to the database in batches by a background thread.
+    A batch is written once `max_batch_size` messages are queued, or at most
+    `max_latency_ms` after the previous write.
+
+    When the queue is full the `backpressure` policy applies:
+     - 'drop_oldest' drops the oldest queued message to make room.
+     - 'drop_newest' drops the message being published.
+     - 'block' blocks the publishing thread until the queue has room.
+
+    Parameters
+    ----------
+    database : nautilus_pyo3.RedisMessageBusDatabase
+        The backing database to write to.
+    serializer : Serializer
+        The serializer for messages.
+    max_queue_size : int, default 100_000
+        The maximum number of messages held in the queue.
+    max_batch_size : int, default 1000
+        The maximum number of messages written per batch.
+    max_latency_ms : int, default 10
+        The maximum time (milliseconds) a message waits before its batch is written.
+    backpressure : str, {'drop_oldest', 'drop_newest', 'block'}, default 'drop_oldest'
+        The policy applied when the queue is full.
+
+    Raises
+    ------
+    ValueError
+        If `max_queue_size` is not positive (> 0).
+    ValueError
+        If `max_batch_size` is not positive (> 0).
+    ValueError
+        If `max_latency_ms` is not positive (> 0).
+    ValueError
+        If `backpressure` is not a valid policy.
+
+    Warnings
+    --------
+    The `serializer` is called from the background thread, and so must not be
+    used concurrently elsewhere.
+    """
+
+    def __init__(
+        self,
+        database not None,
+        Serializer serializer not None,
+        int max_queue_size = 100_000,
+        int max_batch_size = 1000,
+        int max_latency_ms = 10,
+        str backpressure = "drop_oldest",
+    ) -> None:
+        Condition.positive_int(max_queue_size, "max_queue_size")
+        Condition.positive_int(max_batch_size, "max_batch_size")
+        Condition.positive_int(max_latency_ms, "max_latency_ms")
+        Condition.is_in(backpressure, _BACKPRESSURE_POLICIES, "backpressure", "_BACKPRESSURE_POLICIES")
+
+        self._log = Logger(type(self).__name__)
+        self._database = database
+        self._serializer = serializer
+        self._queue = deque()
+        self._not_empty = threading.Condition()
+        self._not_full = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._is_running = False
+
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.max_latency_ms = max_latency_ms
+        self.backpressure = backpressure
+
+        # Counters
+        self.queued_count = 0
+        self.dropped_count = 0
+        self.flushed_count = 0
+        self.failed_count = 0
+        self.batch_count = 0
+
+    cpdef bint is_running(self):
+        """
+        Return whether the background writer thread is running.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._is_running
+
+    cpdef int qsize(self):
+        """
+        Return the number of messages currently queued.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._queue)
+
+    cpdef void start(self):
+        """
+        Start the background writer thread.
+
+        """
+        if self._is_running:
+            self._log.warning("Publisher already running")
+            return
+
+        self._is_running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name=type(self).__name__,
+            daemon=True,
+        )
+        self._thread.start()
+
+    cpdef void stop(self):
+        """
+        Stop the background writer thread, then flush any remaining messages.
+
+        """
+        if self._is_running:
+            self._is_running = False
+            with self._not_empty:
+                self._not_empty.notify()
+            with self._not_full:
+                self._not_full.notify_all()
+            self._thread.join()
+            self._thread = None
+
+        self.flush()
+
+    cpdef void flush(self):
+        """
+        Write all queued messages on the calling thread.
+
+        """
+        while self._write_batch() > 0:
+            pass
+
+    cpdef bint publish(self, str topic, msg: Any):
+        """
+        Queue the given message for publishing on the given `topic`.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to publish on.
+        msg : object
+            The message to publish.
+
+        Returns
+        -------
+        bool
+            ``False`` if the message was dropped, else ``True``.
+
+        """
+        if len(self._queue) >= self.max_queue_size:
+            if self.backpressure == "drop_newest":
+                self.dropped_count += 1
+                return False
+            elif self.backpressure == "drop_oldest":
+                try:
+                    self._queue.popleft()
+                    self.dropped_count += 1
+                except IndexError:
+                    pass  # Drained by the writer in the meantime
+            else:  # block
+                with self._not_full:
+                    while len(self._queue) >= self.max_queue_size and self._is_running:
+                        self._not_full.wait()
+
+        self._queue.append((topic, msg))
+        self.queued_count += 1
+
+        if len(self._queue) == self.max_batch_size:
+            with self._not_empty:
+                self._not_empty.notify()
+
+        return True
+
+    def _run(self) -> None:
+        cdef double timeout_secs = self.max_latency_ms / 1000.0
+        while self._is_running:
+            with self._not_empty:
+                if len(self._queue) < self.max_batch_size:
+                    self._not_empty.wait(timeout_secs)
+            self.flush()
+
+    cdef int _write_batch(self):
+        cdef list batch = []
+        cdef str topic
+        cdef bytes payload
+        with self._write_lock:
+            # Pop and write under the lock so batches are written in queue order
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.popleft())
+                except IndexError:
+                    break  # Queue empty
+
+            if not batch:
+                return 0
+
+            with self._not_full:
+                self._not_full.notify_all()
+
+            for topic, msg in batch:
+                try:
+                    if isinstance(msg, bytes):
+                        payload = msg
+                    else:
+                        payload = self._serializer.serialize(msg)
+                    self._database.publish(topic, payload)
+                    self.flushed_count += 1
+                except Exception as e:
+                    self.failed_count += 1
+                    self._log.error(f"Cannot publish {type(msg).__name__} on '{topic}': {e!r}")
+
+            self.batch_count += 1
+
+        return len(batch)
+
+
 cdef class MessageBus:
     """
     Provides a generic message bus to facilitate various messaging patterns.
@@ -2041,6 +2277,8 @@ cdef class MessageBus:
         self._log.info(f"{config.use_instance_id=}", LogColor.BLUE)
         self._log.info(f"{config.streams_prefix=}", LogColor.BLUE)
         self._log.info(f"{config.types_filter=}", LogColor.BLUE)
+        self._log.info(f"{config.external_async=}", LogColor.BLUE)
+        self._log.info(f"{config.metrics_sample_rate=}", LogColor.BLUE)
 
         # Copy and clear `types_filter` before passing down to the core MessageBus
         cdef list types_filter = copy.copy(config.types_filter)
@@ -2051,10 +2289,31 @@ cdef class MessageBus:
         self._patterns: dict[str, Subscription[:]] = {}
         self._subscriptions: dict[Subscription, list[str]] = {}
         self._correlation_index: dict[UUID4, Callable[[Any], None]] = {}
+        self._sequences: dict[Subscription, int] = {}
+        self._topic_trie = TopicTrie()  # Published topics
+        self._pattern_trie = TopicTrie()  # Subscription topic patterns
+        self._channels: dict[type, dict[Any, TypedChannel]] = {}
+        self._topic_channels: dict[str, list[TypedChannel]] = {}
         self._publishable_types = tuple(_EXTERNAL_PUBLISHABLE_TYPES)
         if types_filter is not None:
             self._publishable_types = tuple(o for o in _EXTERNAL_PUBLISHABLE_TYPES if o not in types_filter)
-        self._resolved = False
+        self._sequence = 0
+        self._profiler = None
+        self.metrics = None
+        if config.metrics_sample_rate is not None:
+            self.metrics = MessageBusMetrics(sample_rate=config.metrics_sample_rate)
+
+        self.external_publisher = None
+        if config.external_async and database is not None and serializer is not None:
+            self.external_publisher = ExternalPublisher(
+                database=database,
+                serializer=serializer,
+                max_queue_size=config.external_queue_size,
+                max_batch_size=config.external_batch_size,
+                max_latency_ms=config.external_batch_interval_ms,
+                backpressure=config.external_backpressure,
+            )
+            self.external_publisher.start()
 
         # Counters
         self.sent_count = 0
@@ -2176,11 +2435,38 @@ cdef class MessageBus:
         """
         self._log.debug("Closing message bus")
 
+        if self.external_publisher is not None:
+            self.external_publisher.stop()
+
         if self._database is not None:
             self._database.close()
 
         self._log.info("Closed message bus")
 
+    cpdef void set_profiler(self, Profiler profiler):
+        """
+        Set the profiler for attributing the wall time of subscription handlers.
+
+        Parameters
+        ----------
+        profiler : Profiler, optional
+            The profiler for the bus. If ``None`` then profiling is disabled.
+
+        """
+        self._profiler = profiler
+
+    cpdef void set_metrics(self, MessageBusMetrics metrics):
+        """
+        Set the metrics for recording per-topic publish counts and per-handler times.
+
+        Parameters
+        ----------
+        metrics : MessageBusMetrics, optional
+            The metrics for the bus. If ``None`` then metrics are disabled.
+
+        """
+        self.metrics = metrics
+
     cpdef void register(self, str endpoint, handler: Callable[[Any], None]):
         """
         Register the given `handler` to receive messages at the `endpoint` address.
@@ -2381,22 +2667,30 @@ cdef class MessageBus:
             self._log.debug(f"{sub} already exists")
             return
 
-        cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
-
-        cdef str pattern
-        cdef list subs
-        for pattern in patterns:
-            if is_matching(topic, pattern):
-                subs = list(self._patterns[pattern])
-                subs.append(sub)
-                subs = sorted(subs, reverse=True)
-                self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
-                matches.append(pattern)
+        self._sequence += 1
+        self._sequences[sub] = self._sequence
+        self._pattern_trie.add(topic, sub)
 
-        self._subscriptions[sub] = sorted(matches)
+        # Add to the resolved subscriptions of all published topics matching the
+        # subscription, after any existing subscriptions of the same or higher priority
+        cdef list matches = self._topic_trie.match_pattern(topic)
 
-        self._resolved = False
+        cdef str published
+        cdef list subs
+        cdef int index
+        cdef Subscription existing
+        for published in matches:
+            subs = list(self._patterns[published])
+            index = len(subs)
+            while index > 0:
+                existing = subs[index - 1]
+                if existing.priority >= priority:
+                    break
+                index -= 1
+            subs.insert(index, sub)
+            self._set_subscriptions(published, np.ascontiguousarray(subs, dtype=Subscription))
+
+        self._subscriptions[sub] = matches
 
         self._log.debug(f"Added {sub}")
 
@@ -2436,12 +2730,11 @@ cdef class MessageBus:
         for pattern in patterns:
             subs = list(self._patterns[pattern])
             subs.remove(sub)
-            subs = sorted(subs, reverse=True)
-            self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
+            self._set_subscriptions(pattern, np.ascontiguousarray(subs, dtype=Subscription))
 
         del self._subscriptions[sub]
-
-        self._resolved = False
+        del self._sequences[sub]
+        self._pattern_trie.remove(topic, sub)
 
         self._log.debug(f"Removed {sub}")
 
@@ -2462,8 +2755,6 @@ cdef class MessageBus:
         """
         self.publish_c(topic, msg)
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cdef void publish_c(self, str topic, msg: Any):
         Condition.not_none(topic, "topic")
         Condition.not_none(msg, "msg")
@@ -2471,84 +2762,210 @@ cdef class MessageBus:
         # Get all subscriptions matching topic pattern
         # Note: cannot use truthiness on array
         cdef Subscription[:] subs = self._patterns.get(topic)
-        if subs is None or (not self._resolved and len(subs) == 0):
+        if subs is None:
             # Add the topic pattern and get matching subscribers
             subs = self._resolve_subscriptions(topic)
-            self._resolved = True
+
+        self._dispatch(topic, subs, msg)
+
+    cpdef TypedChannel channel(self, type data_cls, key: Any, str topic):
+        """
+        Return the typed channel for the given `data_cls` and `key`.
+
+        If the channel does not yet exist then it will be created for the given
+        equivalent string `topic`, otherwise `topic` is ignored.
+
+        Publishing through a channel reaches the same subscribers as publishing on
+        its topic (including wildcard subscribers) without formatting the topic or
+        resolving subscriptions per message.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data class for the channel.
+        key : object
+            The key for the channel (typically an `InstrumentId` or `BarType`).
+        topic : str
+            The equivalent string topic for the channel.
+
+        Returns
+        -------
+        TypedChannel
+
+        Raises
+        ------
+        ValueError
+            If `topic` is not a valid string.
+
+        """
+        Condition.not_none(data_cls, "data_cls")
+        Condition.not_none(key, "key")
+
+        cdef TypedChannel channel = self.get_channel_c(data_cls, key)
+        if channel is not None:
+            return channel
+
+        channel = TypedChannel(data_cls=data_cls, key=key, topic=topic)
+
+        cdef Subscription[:] subs = self._patterns.get(topic)
+        if subs is None:
+            subs = self._resolve_subscriptions(topic)
+        channel._subscriptions = subs
+
+        cdef dict channels = self._channels.get(data_cls)
+        if channels is None:
+            channels = {}
+            self._channels[data_cls] = channels
+        channels[key] = channel
+
+        cdef list topic_channels = self._topic_channels.get(topic)
+        if topic_channels is None:
+            topic_channels = []
+            self._topic_channels[topic] = topic_channels
+        topic_channels.append(channel)
+
+        self._log.debug(f"Added {channel}")
+
+        return channel
+
+    cdef TypedChannel get_channel_c(self, type data_cls, key: Any):
+        cdef dict channels = self._channels.get(data_cls)
+        if channels is None:
+            return None
+        return channels.get(key)
+
+    cpdef void publish_channel(self, TypedChannel channel, msg: Any):
+        """
+        Publish the given message on the given typed `channel`.
+
+        Subscription handlers will receive the message in priority order
+        (highest first).
+
+        Parameters
+        ----------
+        channel : TypedChannel
+            The channel to publish on.
+        msg : object
+            The message to publish.
+
+        """
+        self.publish_channel_c(channel, msg)
+
+    cdef void publish_channel_c(self, TypedChannel channel, msg: Any):
+        Condition.not_none(channel, "channel")
+        Condition.not_none(msg, "msg")
+
+        self._dispatch(channel.topic, channel._subscriptions, msg)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _dispatch(self, str topic, Subscription[:] subs, msg: Any):
+        cdef bint is_sampled = False
+        if self.metrics is not None:
+            is_sampled = self.metrics.record_publish(topic)
 
         # Send message to all matched subscribers
         cdef:
             int i
             Subscription sub
+            uint64_t ts_start
+            uint64_t ts_sample
         for i in range(len(subs)):
             sub = subs[i]
-            sub.handler(msg)
+            if is_sampled:
+                ts_sample = perf_counter_ns()
+            if self._profiler is None:
+                sub.handler(msg)
+            else:
+                ts_start = self._profiler.start()
+                sub.handler(msg)
+                self._profiler.stop(sub, ts_start)
+            if is_sampled:
+                self.metrics.record_handler(sub, perf_counter_ns() - ts_sample)
 
         # Publish externally (if configured)
         cdef bytes payload_bytes
         if self._database is not None and self.serializer is not None:
             if isinstance(msg, self._publishable_types):
-                if isinstance(msg, bytes):
-                    payload_bytes = msg
+                if self.external_publisher is not None:
+                    # Serialized and written in batches off the publishing thread
+                    self.external_publisher.publish(topic, msg)
                 else:
-                    payload_bytes = self.serializer.serialize(msg)
-                self._database.publish(
-                    topic,
-                    payload_bytes,
-                )
+                    if isinstance(msg, bytes):
+                        payload_bytes = msg
+                    else:
+                        payload_bytes = self.serializer.serialize(msg)
+                    self._database.publish(
+                        topic,
+                        payload_bytes,
+                    )
 
         self.pub_count += 1
 
-    cdef Subscription[:] _resolve_subscriptions(self, str topic):
-        cdef list subs_list = []
-        cdef Subscription existing_sub
-        # Copy to handle subscription changes on iteration
-        for existing_sub in self._subscriptions.copy():
-            if is_matching(topic, existing_sub.topic):
-                subs_list.append(existing_sub)
-
-        subs_list = sorted(subs_list, reverse=True)
-        cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
-        self._patterns[topic] = subs_array
-
-        cdef list matches
-        for sub in subs_array:
-            matches = self._subscriptions.get(sub, [])
-            if topic not in matches:
-                matches.append(topic)
-            self._subscriptions[sub] = sorted(matches)
+    cdef void _set_subscriptions(self, str topic, subs):
+        self._patterns[topic] = subs
 
-        return subs_array
+        # Keep the precomputed subscriptions of any typed channels in sync
+        cdef list channels = self._topic_channels.get(topic)
+        if channels is None:
+            return
 
+        cdef TypedChannel channel
+        for channel in channels:
+            channel._subscriptions = subs
 
-cdef inline bint is_matching(str topic, str pattern):
-    # Get length of string and wildcard pattern
-    cdef int n = len(topic)
-    cdef int m = len(pattern)
+    cdef Subscription[:] _resolve_subscriptions(self, str topic):
+        cdef list subs_list = self._sort_subscriptions(self._pattern_trie.match_topic(topic))
+        subs_ndarray = np.ascontiguousarray(subs_list, dtype=Subscription)
+        self._set_subscriptions(topic, subs_ndarray)
+        cdef Subscription[:] subs_array = subs_ndarray
+        self._topic_trie.add(topic, topic)
 
-    # Create a DP lookup table
-    cdef np.ndarray[np.int8_t, ndim=2] t = np.empty((n + 1, m + 1), dtype=np.int8)
-    t.fill(False)
+        cdef Subscription sub
+        for sub in subs_list:
+            self._subscriptions[sub].append(topic)
 
-    # If both pattern and string are empty: match
-    t[0, 0] = True
+        return subs_array
 
-    # Handle empty string case (i == 0)
-    cdef int j
-    for j in range(1, m + 1):
-        if pattern[j - 1] == '*':
-            t[0, j] = t[0, j - 1]
+    cdef list _sort_subscriptions(self, list subs):
+        # Sort by priority (highest first), then in the order subscribed
+        cdef list decorated = [(-sub.priority, self._sequences[sub], sub) for sub in subs]
+        decorated.sort()
+        return [d[2] for d in decorated]
 
-    # Build a matrix in a bottom-up manner
-    cdef int i
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            if pattern[j - 1] == '*':
-                t[i, j] = t[i - 1, j] or t[i, j - 1]
-            elif pattern[j - 1] == '?' or topic[i - 1] == pattern[j - 1]:
-                t[i, j] = t[i - 1, j - 1]
 
-    return t[n, m]
+cdef inline bint is_matching(str topic, str pattern):
+    # Greedy wildcard matching with backtracking to the last `*` (no allocations)
+    cdef Py_ssize_t n = len(topic)
+    cdef Py_ssize_t m = len(pattern)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t star_j = -1
+    cdef Py_ssize_t star_i = 0
+    cdef Py_UCS4 p
+    while i < n:
+        if j < m:
+            p = pattern[j]
+            if p == u"*":
+                star_j = j
+                star_i = i
+                j += 1
+                continue
+            if p == u"?" or p == topic[i]:
+                i += 1
+                j += 1
+                continue
+        if star_j == -1:
+            return False
+        # Extend the last `*` by one character and retry
+        j = star_j + 1
+        star_i += 1
+        i = star_i
+
+    while j < m and pattern[j] == u"*":
+        j += 1
+
+    return j == m
 
 
 # Python wrapper for test access
@@ -2556,6 +2973,247 @@ def is_matching_py(str topic, str pattern) -> bool:
     return is_matching(topic, pattern)
 
 
+cdef class _TopicTrieNode:
+
+    def __init__(self):
+        self.children = {}
+        self.values = []
+
+
+cdef class TopicTrie:
+    """
+    Provides a character trie of topics for wildcard matching.
+
+    Keys can be matched in either direction: against a pattern (with the keys as
+    literal topics), or against a topic (with the keys as patterns). Shared prefixes
+    are only compared once, and branches which cannot match are never visited, so
+    matching does not scale with the number of keys.
+
+    Wildcard characters follow the `MessageBus` patterns, where `*` matches zero or
+    more characters and `?` matches a single character.
+
+    """
+
+    def __init__(self):
+        self._root = _TopicTrieNode()
+        self.count = 0
+
+    cpdef void add(self, str key, value):
+        """
+        Add the given value for the given key.
+
+        Parameters
+        ----------
+        key : str
+            The key (topic or pattern) for the value.
+        value : object
+            The value to add.
+
+        """
+        Condition.not_none(key, "key")
+
+        cdef _TopicTrieNode node = self._root
+        cdef _TopicTrieNode child
+        cdef Py_UCS4 c
+        for c in key:
+            child = node.children.get(c)
+            if child is None:
+                child = _TopicTrieNode()
+                node.children[c] = child
+            node = child
+
+        node.values.append(value)
+        self.count += 1
+
+    cpdef bint remove(self, str key, value):
+        """
+        Remove the given value for the given key.
+
+        Nodes left without values or children are pruned.
+
+        Parameters
+        ----------
+        key : str
+            The key (topic or pattern) for the value.
+        value : object
+            The value to remove.
+
+        Returns
+        -------
+        bool
+            True if the value was removed, else False (not found).
+
+        """
+        Condition.not_none(key, "key")
+
+        cdef list path = []
+        cdef _TopicTrieNode node = self._root
+        cdef Py_UCS4 c
+        for c in key:
+            path.append((node, c))
+            node = node.children.get(c)
+            if node is None:
+                return False
+
+        if value not in node.values:
+            return False
+
+        node.values.remove(value)
+        self.count -= 1
+
+        cdef _TopicTrieNode parent
+        while path and not node.values and not node.children:
+            parent, c = path.pop()
+            del parent.children[c]
+            node = parent
+
+        return True
+
+    cpdef list get(self, str key):
+        """
+        Return the values for the given key (exact match).
+
+        Parameters
+        ----------
+        key : str
+            The key (topic or pattern) for the values.
+
+        Returns
+        -------
+        list
+
+        """
+        cdef _TopicTrieNode node = self._root
+        cdef Py_UCS4 c
+        for c in key:
+            node = node.children.get(c)
+            if node is None:
+                return []
+
+        return list(node.values)
+
+    cpdef list match_pattern(self, str pattern):
+        """
+        Return the values for all keys (as literal topics) matching the given pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            The pattern to match. May include wildcard characters `*` and `?`.
+
+        Returns
+        -------
+        list
+
+        Notes
+        -----
+        Allocates a set of visited (node, position) states for each call, so is intended
+        for resolving on subscribe or the first publish to a topic (not per message).
+
+        """
+        Condition.not_none(pattern, "pattern")
+
+        cdef list results = []
+        self._match_pattern(self._root, pattern, 0, set(), results)
+        return results
+
+    cpdef list match_topic(self, str topic):
+        """
+        Return the values for all keys (as patterns) matching the given topic.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to match.
+
+        Returns
+        -------
+        list
+
+        Notes
+        -----
+        Allocates a set of visited (node, position) states for each call, so is intended
+        for resolving on subscribe or the first publish to a topic (not per message).
+
+        """
+        Condition.not_none(topic, "topic")
+
+        cdef list results = []
+        self._match_topic(self._root, topic, 0, set(), results)
+        return results
+
+    cdef void _match_pattern(
+        self,
+        _TopicTrieNode node,
+        str pattern,
+        Py_ssize_t j,
+        set visited,
+        list results,
+    ):
+        # Each (node, position) state is only visited once, which bounds the
+        # traversal for patterns with multiple wildcards
+        cdef tuple state = (node, j)
+        if state in visited:
+            return
+        visited.add(state)
+
+        if j == len(pattern):
+            results.extend(node.values)
+            return
+
+        cdef Py_UCS4 p = pattern[j]
+        cdef _TopicTrieNode child
+        if p == u"*":
+            self._match_pattern(node, pattern, j + 1, visited, results)
+            for child in node.children.values():
+                self._match_pattern(child, pattern, j, visited, results)
+        elif p == u"?":
+            for child in node.children.values():
+                self._match_pattern(child, pattern, j + 1, visited, results)
+        else:
+            child = node.children.get(p)
+            if child is not None:
+                self._match_pattern(child, pattern, j + 1, visited, results)
+
+    cdef void _match_topic(
+        self,
+        _TopicTrieNode node,
+        str topic,
+        Py_ssize_t i,
+        set visited,
+        list results,
+    ):
+        cdef tuple state = (node, i)
+        if state in visited:
+            return
+        visited.add(state)
+
+        cdef Py_ssize_t n = len(topic)
+        if i == n:
+            results.extend(node.values)
+
+        cdef _TopicTrieNode child = node.children.get(u"*")
+        cdef Py_ssize_t k
+        if child is not None:
+            for k in range(i, n + 1):
+                self._match_topic(child, topic, k, visited, results)
+
+        if i == n:
+            return
+
+        child = node.children.get(u"?")
+        if child is not None:
+            self._match_topic(child, topic, i + 1, visited, results)
+
+        cdef Py_UCS4 c = topic[i]
+        if c == u"*" or c == u"?":
+            return  # Already matched by the wildcard children
+
+        child = node.children.get(c)
+        if child is not None:
+            self._match_topic(child, topic, i + 1, visited, results)
+
+
 cdef class Subscription:
     """
     Represents a subscription to a particular topic.
@@ -2629,6 +3287,65 @@ cdef class Subscription:
         )
 
 
+cdef class TypedChannel:
+    """
+    Represents a typed publishing channel for a data class and key.
+
+    The channel holds the resolved subscriptions for its equivalent string topic,
+    which the message bus keeps up to date as handlers subscribe and unsubscribe
+    (including wildcard subscriptions). Publishing through the channel therefore
+    reaches exactly the same handlers, in the same order, as publishing on the topic.
+
+    This is an internal class intended to be used by the message bus, channels
+    should be obtained with `MessageBus.channel`.
+
+    Parameters
+    ----------
+    data_cls : type
+        The data class for the channel.
+    key : object
+        The key for the channel (typically an `InstrumentId` or `BarType`).
+    topic : str
+        The equivalent string topic for the channel.
+
+    Raises
+    ------
+    ValueError
+        If `topic` is not a valid string.
+    """
+
+    def __init__(
+        self,
+        type data_cls not None,
+        key not None,
+        str topic,
+    ):
+        Condition.valid_string(topic, "topic")
+
+        self.data_cls = data_cls
+        self.key = key
+        self.topic = topic
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"data_cls={self.data_cls.__name__}, "
+            f"key={self.key}, "
+            f"topic={self.topic})"
+        )
+
+    cpdef list subscriptions(self):
+        """
+        Return the resolved subscriptions for the channel in handling order.
+
+        Returns
+        -------
+        list[Subscription]
+
+        """
+        return list(self._subscriptions)
+
+
 cdef class Throttler:
     """
     Provides a generic throttler which can either buffer or drop messages.
@@ -326,6 +326,20 @@ class MessageBusConfig(NautilusConfig, frozen=True):
         many traders to be configured to write to the same streams.
     types_filter : list[type], optional
         A list of serializable types **not** to publish externally.
+    external_async : bool, default False
+        If messages are published externally from a bounded background queue, being
+        serialized and written in batches off the publishing thread.
+    external_queue_size : PositiveInt, default 100_000
+        The maximum number of messages held in the external publishing queue.
+    external_batch_size : PositiveInt, default 1000
+        The maximum number of messages written per external publishing batch.
+    external_batch_interval_ms : PositiveInt, default 10
+        The maximum time (milliseconds) a message waits before its batch is written.
+    external_backpressure : str, {'drop_oldest', 'drop_newest', 'block'}, default 'drop_oldest'
+        The policy applied when the external publishing queue is full.
+    metrics_sample_rate : PositiveInt, optional
+        If set then per-topic publish counts and per-handler execution times are
+        recorded (see `MessageBus.metrics`), timing handlers for every Nth publish.
 
     """
 
@@ -339,6 +353,12 @@ class MessageBusConfig(NautilusConfig, frozen=True):
     use_instance_id: bool = False
     streams_prefix: str = "streams"
     types_filter: list[type] | None = None
+    external_async: bool = False
+    external_queue_size: PositiveInt = 100_000
+    external_batch_size: PositiveInt = 1000
+    external_batch_interval_ms: PositiveInt = 10
+    external_backpressure: str = "drop_oldest"
+    metrics_sample_rate: PositiveInt | None = None
 
 
 class InstrumentProviderConfig(NautilusConfig, frozen=True):
@@ -0,0 +1,75 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef class ProfileStats:
+    cdef readonly str name
+    """The name of the profiled component or handler.\n\n:returns: `str`"""
+    cdef readonly uint64_t count
+    """The count of profiled calls.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t total_ns
+    """The cumulative wall time (nanoseconds) including nested profiled calls.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t self_ns
+    """The cumulative wall time (nanoseconds) excluding nested profiled calls.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t max_ns
+    """The maximum wall time (nanoseconds) for a single call.\n\n:returns: `uint64_t`"""
+
+
+cdef class Profiler:
+    cdef dict _stats
+    cdef list _stack
+    cdef uint64_t _child_ns
+
+    cpdef uint64_t start(self)
+    cpdef void stop(self, object key, uint64_t start_ns)
+    cpdef void reset(self)
+    cpdef list stats(self)
+
+
+cdef class HandlerMetrics:
+    cdef uint64_t[::1] _samples
+    cdef Py_ssize_t _index
+
+    cdef readonly str name
+    """The name of the handler.\n\n:returns: `str`"""
+    cdef readonly uint64_t count
+    """The count of timed (sampled) calls.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t total_ns
+    """The cumulative wall time (nanoseconds) of timed calls.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t max_ns
+    """The maximum wall time (nanoseconds) for a single timed call.\n\n:returns: `uint64_t`"""
+
+    cdef void record(self, uint64_t elapsed_ns)
+    cpdef double percentile(self, double q)
+
+
+cdef class MessageBusMetrics:
+    cdef dict _topics
+    cdef dict _handlers
+    cdef uint64_t _publish_count
+
+    cdef readonly int sample_rate
+    """The rate at which publishes are sampled for handler timing (every Nth).\n\n:returns: `int`"""
+    cdef readonly int reservoir_size
+    """The number of most recent timings held per handler for percentiles.\n\n:returns: `int`"""
+
+    cdef bint record_publish(self, str topic)
+    cdef void record_handler(self, object key, uint64_t elapsed_ns)
+    cpdef dict topic_counts(self)
+    cpdef list handler_metrics(self)
+    cpdef dict snapshot(self)
+    cpdef void reset(self)
@@ -0,0 +1,398 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from time import perf_counter_ns
+
+import numpy as np
+import pandas as pd
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class ProfileStats:
+    """
+    Represents the cumulative wall time statistics for a single profiled key.
+
+    Parameters
+    ----------
+    name : str
+        The name of the profiled component or handler.
+
+    """
+
+    def __init__(self, str name not None) -> None:
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.self_ns = 0
+        self.max_ns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"name={self.name}, "
+            f"count={self.count}, "
+            f"total_ns={self.total_ns}, "
+            f"self_ns={self.self_ns}, "
+            f"max_ns={self.max_ns})"
+        )
+
+
+cdef class Profiler:
+    """
+    Provides a low level wall time profiler with per-component attribution.
+
+    Each timed section is bracketed with `start()` and `stop(key, start_ns)`. Sections may
+    be nested, in which case the time spent in nested sections is attributed to them and
+    excluded from the `self_ns` of the enclosing section (the `total_ns` includes it).
+
+    Keys may be strings, or objects which are resolved to a name on first use (such as
+    bound handler methods, message bus subscriptions or components with an `id`).
+
+    """
+
+    def __init__(self) -> None:
+        self._stats = {}
+        self._stack = []
+        self._child_ns = 0
+
+    cpdef uint64_t start(self):
+        """
+        Start a timed section.
+
+        Returns
+        -------
+        uint64_t
+            The start time (nanoseconds) to pass to `stop`.
+
+        """
+        self._stack.append(self._child_ns)
+        self._child_ns = 0
+        return perf_counter_ns()
+
+    cpdef void stop(self, object key, uint64_t start_ns):
+        """
+        Stop the timed section started at `start_ns`, attributing its time to `key`.
+
+        Parameters
+        ----------
+        key : object
+            The key for the profiled component or handler.
+        start_ns : uint64_t
+            The start time returned from the matching call to `start`.
+
+        """
+        cdef uint64_t elapsed_ns = perf_counter_ns() - start_ns
+        cdef uint64_t child_ns = self._child_ns
+        self._child_ns = (self._stack.pop() if self._stack else 0) + elapsed_ns
+
+        cdef ProfileStats stats = self._stats.get(key)
+        if stats is None:
+            stats = ProfileStats(_key_name(key))
+            self._stats[key] = stats
+
+        stats.count += 1
+        stats.total_ns += elapsed_ns
+        stats.self_ns += elapsed_ns - child_ns if elapsed_ns > child_ns else 0
+        if elapsed_ns > stats.max_ns:
+            stats.max_ns = elapsed_ns
+
+    cpdef void reset(self):
+        """
+        Reset the profiler by clearing all statistics.
+
+        """
+        self._stats.clear()
+        self._stack.clear()
+        self._child_ns = 0
+
+    cpdef list stats(self):
+        """
+        Return the statistics for all profiled keys, ordered by `self_ns` descending.
+
+        Statistics for keys which resolve to the same name are merged.
+
+        Returns
+        -------
+        list[ProfileStats]
+
+        """
+        cdef dict merged = {}
+        cdef ProfileStats stats
+        cdef ProfileStats existing
+        for stats in self._stats.values():
+            existing = merged.get(stats.name)
+            if existing is None:
+                existing = ProfileStats(stats.name)
+                merged[stats.name] = existing
+            existing.count += stats.count
+            existing.total_ns += stats.total_ns
+            existing.self_ns += stats.self_ns
+            existing.max_ns = max(existing.max_ns, stats.max_ns)
+
+        return sorted(merged.values(), key=lambda s: s.self_ns, reverse=True)
+
+    def report(self) -> pd.DataFrame:
+        """
+        Return a report of the profiled components and handlers.
+
+        The report is ordered by self time descending, so the top consumers are first.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        cdef list stats = self.stats()
+        cdef uint64_t self_total_ns = sum([s.self_ns for s in stats])
+
+        report = pd.DataFrame(
+            [
+                {
+                    "name": s.name,
+                    "calls": s.count,
+                    "total_ms": s.total_ns / 1e6,
+                    "self_ms": s.self_ns / 1e6,
+                    "self_pct": 100.0 * s.self_ns / self_total_ns if self_total_ns else 0.0,
+                    "mean_us": s.total_ns / s.count / 1e3,
+                    "max_us": s.max_ns / 1e3,
+                    "calls_per_sec": s.count / (s.total_ns / 1e9) if s.total_ns else 0.0,
+                }
+                for s in stats
+            ],
+            columns=[
+                "name",
+                "calls",
+                "total_ms",
+                "self_ms",
+                "self_pct",
+                "mean_us",
+                "max_us",
+                "calls_per_sec",
+            ],
+        )
+        return report.set_index("name")
+
+
+cdef class HandlerMetrics:
+    """
+    Represents the execution time metrics for a single message bus handler.
+
+    The most recent `reservoir_size` timings are held in a ring buffer, from which
+    percentiles are calculated on query.
+
+    Parameters
+    ----------
+    name : str
+        The name of the handler.
+    reservoir_size : int
+        The number of most recent timings to hold for percentiles.
+
+    """
+
+    def __init__(self, str name not None, int reservoir_size) -> None:
+        self._samples = np.zeros(reservoir_size, dtype=np.uint64)
+        self._index = 0
+
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"name={self.name}, "
+            f"count={self.count}, "
+            f"total_ns={self.total_ns}, "
+            f"max_ns={self.max_ns})"
+        )
+
+    cdef void record(self, uint64_t elapsed_ns):
+        self._samples[self._index] = elapsed_ns
+        self._index += 1
+        if self._index == self._samples.shape[0]:
+            self._index = 0
+
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    cpdef double percentile(self, double q):
+        """
+        Return the percentile of the most recent timings (nanoseconds).
+
+        Parameters
+        ----------
+        q : double
+            The percentile to compute, in the range [0, 100].
+
+        Returns
+        -------
+        double
+            The percentile, or zero if no calls have been timed.
+
+        """
+        cdef Py_ssize_t filled = min(self.count, self._samples.shape[0])
+        if filled == 0:
+            return 0.0
+        return float(np.percentile(np.asarray(self._samples[:filled]), q))
+
+
+cdef class MessageBusMetrics:
+    """
+    Provides low overhead per-topic and per-handler metrics for a message bus.
+
+    Publish counts are recorded per topic for every message. Handler execution
+    times are recorded for every `sample_rate`-th publish only, so the cost of
+    timing can be bounded on busy buses (a `sample_rate` of 1 times every call).
+
+    Parameters
+    ----------
+    sample_rate : int, default 1
+        The rate at which publishes are sampled for handler timing (every Nth).
+    reservoir_size : int, default 1024
+        The number of most recent timings held per handler for percentiles.
+
+    Raises
+    ------
+    ValueError
+        If `sample_rate` is not positive (> 0).
+    ValueError
+        If `reservoir_size` is not positive (> 0).
+
+    """
+
+    def __init__(self, int sample_rate = 1, int reservoir_size = 1024) -> None:
+        Condition.positive_int(sample_rate, "sample_rate")
+        Condition.positive_int(reservoir_size, "reservoir_size")
+
+        self._topics = {}
+        self._handlers = {}
+        self._publish_count = 0
+
+        self.sample_rate = sample_rate
+        self.reservoir_size = reservoir_size
+
+    cdef bint record_publish(self, str topic):
+        # Return whether handler times should be recorded for this publish
+        self._topics[topic] = self._topics.get(topic, 0) + 1
+        self._publish_count += 1
+        return self._publish_count % self.sample_rate == 0
+
+    cdef void record_handler(self, object key, uint64_t elapsed_ns):
+        cdef HandlerMetrics metrics = self._handlers.get(key)
+        if metrics is None:
+            metrics = HandlerMetrics(_key_name(key), self.reservoir_size)
+            self._handlers[key] = metrics
+
+        metrics.record(elapsed_ns)
+
+    cpdef dict topic_counts(self):
+        """
+        Return the publish counts per topic.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return dict(self._topics)
+
+    cpdef list handler_metrics(self):
+        """
+        Return the metrics for all timed handlers, ordered by `total_ns` descending.
+
+        Returns
+        -------
+        list[HandlerMetrics]
+
+        """
+        return sorted(self._handlers.values(), key=lambda m: m.total_ns, reverse=True)
+
+    cpdef dict snapshot(self):
+        """
+        Return a snapshot of the metrics of plain values (suitable for JSON export).
+
+        Handler `est_total_ns` scales the timed `total_ns` by the `sample_rate`.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        """
+        cdef HandlerMetrics m
+        return {
+            "sample_rate": self.sample_rate,
+            "publish_count": self._publish_count,
+            "topics": dict(self._topics),
+            "handlers": [
+                {
+                    "name": m.name,
+                    "count": m.count,
+                    "total_ns": m.total_ns,
+                    "est_total_ns": m.total_ns * self.sample_rate,
+                    "mean_ns": m.total_ns / m.count if m.count else 0.0,
+                    "max_ns": m.max_ns,
+                    "p50_ns": m.percentile(50.0),
+                    "p90_ns": m.percentile(90.0),
+                    "p99_ns": m.percentile(99.0),
+                }
+                for m in self.handler_metrics()
+            ],
+        }
+
+    cpdef void reset(self):
+        """
+        Reset the metrics by clearing all topic counts and handler timings.
+
+        """
+        self._topics.clear()
+        self._handlers.clear()
+        self._publish_count = 0
+
+
+cdef str _key_name(object key):
+    if isinstance(key, str):
+        return key
+
+    handler = getattr(key, "handler", None)
+    if handler is not None and not callable(key):
+        # Message bus subscription
+        return f"{_callable_name(handler)}[{key.topic}]"
+
+    if callable(key):
+        return _callable_name(key)
+
+    component_id = getattr(key, "id", None)
+    if component_id is not None:
+        return f"{type(key).__name__}({component_id})"
+
+    return type(key).__name__
+
+
+cdef str _callable_name(object func):
+    owner = getattr(func, "__self__", None)
+    cdef str name = getattr(func, "__name__", None) or type(func).__name__
+    if owner is None:
+        return getattr(func, "__qualname__", name)
+
+    owner_id = getattr(owner, "id", None)
+    if owner_id is None:
+        return f"{type(owner).__name__}.{name}"
+    return f"{owner_id}.{name}"
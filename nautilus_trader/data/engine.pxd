@@ -143,6 +143,9 @@ cdef class DataEngine(Component):
     cpdef void _handle_instrument(self, Instrument instrument)
     cpdef void _handle_order_book_delta(self, OrderBookDelta delta)
     cpdef void _handle_order_book_deltas(self, OrderBookDeltas deltas)
+    cdef void _publish_deltas(self, OrderBookDeltas deltas)
+    cdef void _publish_channel(self, type cls, object key, Data data)
+    cdef str _channel_topic(self, type cls, object key)
     cpdef void _handle_order_book_depth(self, OrderBookDepth10 depth)
     cpdef void _handle_quote_tick(self, QuoteTick tick)
     cpdef void _handle_trade_tick(self, TradeTick tick)
@@ -47,6 +47,7 @@ from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
+from nautilus_trader.common.component cimport TypedChannel
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
@@ -1392,24 +1393,14 @@ cdef class DataEngine(Component):
                     instrument_id=delta.instrument_id,
                     deltas=buffer_deltas
                 )
-                self._msgbus.publish_c(
-                    topic=f"data.book.deltas"
-                        f".{deltas.instrument_id.venue}"
-                        f".{deltas.instrument_id.symbol}",
-                    msg=deltas,
-                )
+                self._publish_deltas(deltas)
                 buffer_deltas.clear()
         else:
             deltas = OrderBookDeltas(
                 instrument_id=delta.instrument_id,
                 deltas=[delta]
             )
-            self._msgbus.publish_c(
-                 topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
-                msg=deltas,
-            )
+            self._publish_deltas(deltas)
 
     cpdef void _handle_order_book_deltas(self, OrderBookDeltas deltas):
         cdef OrderBookDeltas deltas_to_publish = None
@@ -1432,28 +1423,42 @@ cdef class DataEngine(Component):
                         instrument_id=deltas.instrument_id,
                         deltas=buffer_deltas,
                     )
-                    self._msgbus.publish_c(
-                        topic=f"data.book.deltas"
-                            f".{deltas.instrument_id.venue}"
-                            f".{deltas.instrument_id.symbol}",
-                        msg=deltas_to_publish,
-                    )
+                    self._publish_deltas(deltas_to_publish)
                     buffer_deltas.clear()
         else:
-            self._msgbus.publish_c(
-                topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
-                msg=deltas,
-            )
+            self._publish_deltas(deltas)
+
+    cdef void _publish_deltas(self, OrderBookDeltas deltas):
+        self._publish_channel(OrderBookDeltas, deltas.instrument_id, deltas)
+
+    cdef void _publish_channel(self, type cls, object key, Data data):
+        cdef TypedChannel channel = self._msgbus.get_channel_c(cls, key)
+        if channel is None:
+            channel = self._msgbus.channel(cls, key, self._channel_topic(cls, key))
+
+        self._msgbus.publish_channel_c(channel, data)
+
+    cdef str _channel_topic(self, type cls, object key):
+        if cls is Bar:
+            return f"data.bars.{key}"
+
+        cdef InstrumentId instrument_id = key
+        cdef str prefix
+        if cls is OrderBookDeltas:
+            prefix = "data.book.deltas"
+        elif cls is OrderBookDepth10:
+            prefix = "data.book.depth"
+        elif cls is QuoteTick:
+            prefix = "data.quotes"
+        elif cls is TradeTick:
+            prefix = "data.trades"
+        else:
+            raise ValueError(f"No channel topic for {cls.__name__}")
+
+        return f"{prefix}.{instrument_id.venue}.{instrument_id.symbol}"
 
     cpdef void _handle_order_book_depth(self, OrderBookDepth10 depth):
-        self._msgbus.publish_c(
-            topic=f"data.book.depth"
-                  f".{depth.instrument_id.venue}"
-                  f".{depth.instrument_id.symbol}",
-            msg=depth,
-        )
+        self._publish_channel(OrderBookDepth10, depth.instrument_id, depth)
 
     cpdef void _handle_quote_tick(self, QuoteTick tick):
         self._cache.add_quote_tick(tick)
@@ -1463,12 +1468,7 @@ cdef class DataEngine(Component):
         if synthetics is not None:
             self._update_synthetics_with_quote(synthetics, tick)
 
-        self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
-            msg=tick,
-        )
+        self._publish_channel(QuoteTick, tick.instrument_id, tick)
 
     cpdef void _handle_trade_tick(self, TradeTick tick):
         self._cache.add_trade_tick(tick)
@@ -1478,12 +1478,7 @@ cdef class DataEngine(Component):
         if synthetics is not None:
             self._update_synthetics_with_trade(synthetics, tick)
 
-        self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
-            msg=tick,
-        )
+        self._publish_channel(TradeTick, tick.instrument_id, tick)
 
     cpdef void _handle_bar(self, Bar bar):
         cdef BarType bar_type = bar.bar_type
@@ -1522,7 +1517,7 @@ cdef class DataEngine(Component):
         if not bar.is_revision:
             self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar_type}", msg=bar)
+        self._publish_channel(Bar, bar_type, bar)
 
     cpdef void _handle_instrument_status(self, InstrumentStatus data):
         self._msgbus.publish_c(topic=f"data.status.{data.instrument_id.venue}.{data.instrument_id.symbol}", msg=data)
@@ -25,6 +25,22 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
 
+cdef class OrderLadder:
+    cdef list _keys
+    cdef dict _levels
+
+    cdef readonly int count
+    """The count of orders in the ladder.\n\n:returns: `int`"""
+
+    cdef void add(self, int64_t key, Order order)
+    cdef void remove(self, int64_t key, Order order)
+    cdef void clear(self)
+    cdef int64_t min_key(self)
+    cdef int64_t max_key(self)
+    cdef void collect_ge(self, int64_t key, bint descending, list orders)
+    cdef void collect_le(self, int64_t key, bint descending, list orders)
+
+
 cdef class MatchingCore:
     cdef InstrumentId _instrument_id
     cdef Price _price_increment
@@ -41,8 +57,12 @@ cdef class MatchingCore:
     cdef object _fill_limit_order
 
     cdef dict _orders
-    cdef list _orders_bid
-    cdef list _orders_ask
+    cdef dict _index
+    cdef OrderLadder _bid_limits
+    cdef OrderLadder _bid_stops
+    cdef OrderLadder _ask_limits
+    cdef OrderLadder _ask_stops
+    cdef int _trailing_stop_count
 
 # -- QUERIES --------------------------------------------------------------------------------------
 
@@ -51,6 +71,8 @@ cdef class MatchingCore:
     cpdef list get_orders(self)
     cpdef list get_orders_bid(self)
     cpdef list get_orders_ask(self)
+    cdef bint is_crossed(self, int64_t bid_raw, int64_t ask_raw)
+    cdef bint has_trailing_stop_orders(self)
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -61,6 +83,9 @@ cdef class MatchingCore:
     cpdef void reset(self)
     cpdef void add_order(self, Order order)
     cdef void _add_order(self, Order order)
+    cdef void _index_order(self, Order order)
+    cdef OrderLadder _ladder_for(self, Order order)
+    cpdef void update_order(self, Order order)
     cdef void sort_bid_orders(self)
     cdef void sort_ask_orders(self)
     cpdef void delete_order(self, Order order)
@@ -80,4 +105,5 @@ cdef class MatchingCore:
     cdef LiquiditySide _determine_order_liquidity(self, bint initial, OrderSide side, Price price, Price trigger_price)
 
 
+cdef list merge_ladders(OrderLadder first, OrderLadder second, bint descending)
 cdef int64_t order_sort_key(Order order)
@@ -13,8 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from bisect import bisect_left
+from bisect import bisect_right
+from bisect import insort
 from typing import Callable
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -27,10 +31,100 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
 
+cdef inline bint _is_trailing_stop(Order order):
+    return (
+        order.order_type == OrderType.TRAILING_STOP_MARKET
+        or order.order_type == OrderType.TRAILING_STOP_LIMIT
+    )
+
+
+cdef class OrderLadder:
+    """
+    Provides a price-level ladder of orders for a `MatchingCore`.
+
+    Orders are held in FIFO queues at each level, with the levels keyed by raw price
+    and held in ascending order, so that adding and removing orders is a binary search
+    over the levels rather than over every order.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[int] = []
+        self._levels: dict[int, list[Order]] = {}
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(levels={len(self._keys)}, count={self.count})"
+
+    cdef void add(self, int64_t key, Order order):
+        cdef list level = self._levels.get(key)
+        if level is None:
+            level = []
+            self._levels[key] = level
+            insort(self._keys, key)
+
+        level.append(order)
+        self.count += 1
+
+    cdef void remove(self, int64_t key, Order order):
+        cdef list level = self._levels.get(key)
+        if level is None:
+            return  # pragma: no cover (design-time error)
+
+        level.remove(order)
+        self.count -= 1
+
+        if not level:
+            del self._levels[key]
+            self._keys.pop(bisect_left(self._keys, key))
+
+    cdef void clear(self):
+        self._keys.clear()
+        self._levels.clear()
+        self.count = 0
+
+    cdef int64_t min_key(self):
+        # Assumes the ladder is not empty
+        return self._keys[0]
+
+    cdef int64_t max_key(self):
+        # Assumes the ladder is not empty
+        return self._keys[-1]
+
+    cdef void collect_ge(self, int64_t key, bint descending, list orders):
+        # Extends `orders` with all orders at levels >= `key`
+        cdef Py_ssize_t start = bisect_left(self._keys, key)
+        cdef Py_ssize_t i
+        if descending:
+            for i in range(len(self._keys) - 1, start - 1, -1):
+                orders.extend(self._levels[self._keys[i]])
+        else:
+            for i in range(start, len(self._keys)):
+                orders.extend(self._levels[self._keys[i]])
+
+    cdef void collect_le(self, int64_t key, bint descending, list orders):
+        # Extends `orders` with all orders at levels <= `key`
+        cdef Py_ssize_t stop = bisect_right(self._keys, key)
+        cdef Py_ssize_t i
+        if descending:
+            for i in range(stop - 1, -1, -1):
+                orders.extend(self._levels[self._keys[i]])
+        else:
+            for i in range(stop):
+                orders.extend(self._levels[self._keys[i]])
+
+
 cdef class MatchingCore:
     """
     Provides a generic order matching core.
 
+    Resting orders are indexed into price-level ladders for each side: a limit ladder
+    for limit and if-touched orders (keyed by price, or trigger price until triggered),
+    and a stop ladder for untriggered stop orders (keyed by trigger price). Each
+    iteration then only matches the orders whose level has been crossed by the market.
+
     Parameters
     ----------
     instrument_id : InstrumentId
@@ -72,8 +166,12 @@ cdef class MatchingCore:
 
         # Orders
         self._orders: dict[ClientOrderId, Order] = {}
-        self._orders_bid: list[Order] = []
-        self._orders_ask: list[Order] = []
+        self._index: dict[ClientOrderId, tuple[OrderLadder, int]] = {}
+        self._bid_limits = OrderLadder()
+        self._bid_stops = OrderLadder()
+        self._ask_limits = OrderLadder()
+        self._ask_stops = OrderLadder()
+        self._trailing_stop_count = 0
 
     @property
     def instrument_id(self) -> InstrumentId:
@@ -167,13 +265,26 @@ cdef class MatchingCore:
         return client_order_id in self._orders
 
     cpdef list get_orders(self):
-        return self._orders_bid + self._orders_ask
+        return self.get_orders_bid() + self.get_orders_ask()
 
     cpdef list get_orders_bid(self):
-        return self._orders_bid
+        return merge_ladders(self._bid_limits, self._bid_stops, descending=True)
 
     cpdef list get_orders_ask(self):
-        return self._orders_ask
+        return merge_ladders(self._ask_limits, self._ask_stops, descending=False)
+
+    cdef bint is_crossed(self, int64_t bid_raw, int64_t ask_raw):
+        # Return whether any held order would be matched (or triggered) by the given
+        # market, checking only the best level of each ladder
+        return (
+            (self._bid_limits.count > 0 and self._bid_limits.max_key() >= ask_raw)
+            or (self._bid_stops.count > 0 and self._bid_stops.min_key() <= ask_raw)
+            or (self._ask_limits.count > 0 and self._ask_limits.min_key() <= bid_raw)
+            or (self._ask_stops.count > 0 and self._ask_stops.max_key() >= bid_raw)
+        )
+
+    cdef bint has_trailing_stop_orders(self):
+        return self._trailing_stop_count > 0
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -191,8 +302,12 @@ cdef class MatchingCore:
 
     cpdef void reset(self):
         self._orders.clear()
-        self._orders_bid.clear()
-        self._orders_ask.clear()
+        self._index.clear()
+        self._bid_limits.clear()
+        self._bid_stops.clear()
+        self._ask_limits.clear()
+        self._ask_stops.clear()
+        self._trailing_stop_count = 0
         self.bid_raw = 0
         self.ask_raw = 0
         self.last_raw = 0
@@ -209,42 +324,102 @@ cdef class MatchingCore:
     cdef void _add_order(self, Order order):
         # Index order
         self._orders[order.client_order_id] = order
+        self._index_order(order)
+
+    cdef void _index_order(self, Order order):
+        cdef OrderLadder ladder = self._ladder_for(order)
+        cdef int64_t key = order_sort_key(order)
+
+        cdef tuple entry = self._index.get(order.client_order_id)
+        if entry is not None:
+            if entry[0] is ladder and entry[1] == key:
+                return  # Index unchanged
+            (<OrderLadder>entry[0]).remove(entry[1], order)
+        elif _is_trailing_stop(order):
+            self._trailing_stop_count += 1
+
+        ladder.add(key, order)
+        self._index[order.client_order_id] = (ladder, key)
+
+    cdef OrderLadder _ladder_for(self, Order order):
+        cdef bint is_stop = (
+            order.order_type == OrderType.STOP_MARKET
+            or order.order_type == OrderType.TRAILING_STOP_MARKET
+            or (
+                (order.order_type == OrderType.STOP_LIMIT or order.order_type == OrderType.TRAILING_STOP_LIMIT)
+                and not order.is_triggered
+            )
+        )
 
         if order.side == OrderSide.BUY:
-            self._orders_bid.append(order)
-            self.sort_bid_orders()
+            return self._bid_stops if is_stop else self._bid_limits
         elif order.side == OrderSide.SELL:
-            self._orders_ask.append(order)
-            self.sort_ask_orders()
+            return self._ask_stops if is_stop else self._ask_limits
         else:
             raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
 
+    cpdef void update_order(self, Order order):
+        """
+        Update the index of the given order following a change to its price,
+        trigger price or triggered state.
+
+        An order moved to a new price level is queued behind the orders already
+        resting at that level. If the order is not held by the core then this
+        method has no effect.
+
+        Parameters
+        ----------
+        order : Order
+            The order to update.
+
+        """
+        Condition.not_none(order, "order")
+
+        if order.client_order_id not in self._index:
+            return
+
+        self._index_order(order)
+
     cdef void sort_bid_orders(self):
-        self._orders_bid.sort(key=order_sort_key, reverse=True)
+        cdef Order order
+        for order in self.get_orders_bid():
+            self._index_order(order)
 
     cdef void sort_ask_orders(self):
-        self._orders_ask.sort(key=order_sort_key)
+        cdef Order order
+        for order in self.get_orders_ask():
+            self._index_order(order)
 
     cpdef void delete_order(self, Order order):
         Condition.not_none(order, "order")
 
         self._orders.pop(order.client_order_id, None)
 
-        if order.side == OrderSide.BUY:
-            if order in self._orders_bid:
-                self._orders_bid.remove(order)
-        elif order.side == OrderSide.SELL:
-            if order in self._orders_ask:
-                self._orders_ask.remove(order)
-        else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+        cdef tuple entry = self._index.pop(order.client_order_id, None)
+        if entry is not None:
+            (<OrderLadder>entry[0]).remove(entry[1], order)
+            if _is_trailing_stop(order):
+                self._trailing_stop_count -= 1
 
     cpdef void iterate(self, uint64_t timestamp_ns):
+        # Collect only the orders whose level has been crossed by the market, prior to
+        # matching (as the fill and trigger handlers can add and delete orders)
+        cdef list orders = []
+        if self.is_ask_initialized:
+            self._bid_limits.collect_ge(self.ask_raw, True, orders)  # Matched when ask <= price
+            self._bid_stops.collect_le(self.ask_raw, True, orders)  # Triggered when ask >= trigger
+        if self.is_bid_initialized:
+            self._ask_limits.collect_le(self.bid_raw, False, orders)  # Matched when bid >= price
+            self._ask_stops.collect_ge(self.bid_raw, False, orders)  # Triggered when bid <= trigger
+
         cdef Order order
-        for order in self._orders_bid + self._orders_ask:  # Lists implicitly copied
+        for order in orders:
             if order.is_closed_c():
                 continue  # Orders state has changed since iteration started  # pragma: no cover
             self.match_order(order)
+            if order.client_order_id in self._index and not order.is_closed_c():
+                # Triggered stop limit orders move to the limit ladder
+                self._index_order(order)
 
 # -- MATCHING -------------------------------------------------------------------------------------
 
@@ -421,6 +596,39 @@ cdef class MatchingCore:
         return LiquiditySide.TAKER
 
 
+cdef list merge_ladders(OrderLadder first, OrderLadder second, bint descending):
+    # Merges the orders of both ladders into a single list in level order,
+    # with the orders of `first` ahead of `second` at equal levels
+    cdef list keys_first = first._keys[::-1] if descending else first._keys
+    cdef list keys_second = second._keys[::-1] if descending else second._keys
+    cdef Py_ssize_t n_first = len(keys_first)
+    cdef Py_ssize_t n_second = len(keys_second)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef int64_t key_first
+    cdef int64_t key_second
+    cdef list orders = []
+    while i < n_first and j < n_second:
+        key_first = keys_first[i]
+        key_second = keys_second[j]
+        if key_first == key_second or (key_first > key_second) == descending:
+            orders.extend(first._levels[key_first])
+            i += 1
+        else:
+            orders.extend(second._levels[key_second])
+            j += 1
+
+    while i < n_first:
+        orders.extend(first._levels[keys_first[i]])
+        i += 1
+
+    while j < n_second:
+        orders.extend(second._levels[keys_second[j]])
+        j += 1
+
+    return orders
+
+
 cdef inline int64_t order_sort_key(Order order):
     cdef Price trigger_price
     cdef Price price
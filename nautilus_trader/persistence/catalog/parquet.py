@@ -28,6 +28,7 @@ from pathlib import Path
 from typing import Any, NamedTuple
 
 import fsspec
+import msgspec
 import pandas as pd
 import pyarrow as pa
 import pyarrow.dataset as pds
@@ -56,6 +57,7 @@ from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
+from nautilus_trader.persistence.funcs import STREAM_MANIFEST_FILENAME
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import combine_filters
 from nautilus_trader.persistence.funcs import urisafe_instrument_id
@@ -69,6 +71,8 @@ TimestampLike = int | str | float
 class FeatherFile(NamedTuple):
     path: str
     class_name: str
+    ts_min: int | None = None
+    ts_max: int | None = None
 
 
 _NAUTILUS_PATH = "NAUTILUS_PATH"
@@ -691,15 +695,32 @@ class ParquetDataCatalog(BaseDataCatalog):
     def read_backtest(self, instance_id: str, **kwargs: Any) -> list[Data]:
         return self._read_feather(kind="backtest", instance_id=instance_id, **kwargs)
 
+    def compact_live_run(self, instance_id: str, **kwargs: Any) -> int:
+        return self._compact_stream(kind="live", instance_id=instance_id, **kwargs)
+
+    def compact_backtest(self, instance_id: str, **kwargs: Any) -> int:
+        return self._compact_stream(kind="backtest", instance_id=instance_id, **kwargs)
+
     def _read_feather(
         self,
         kind: str,
         instance_id: str,
         raise_on_failed_deserialize: bool = False,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
     ) -> list[Data]:
+        start_ns = pd.Timestamp(start).value if start is not None else None
+        end_ns = pd.Timestamp(end).value if end is not None else None
+
         class_mapping: dict[str, type] = {class_to_filename(cls): cls for cls in list_schemas()}
         data = defaultdict(list)
         for feather_file in self._list_feather_files(kind=kind, instance_id=instance_id):
+            if start_ns is not None and feather_file.ts_max is not None:
+                if feather_file.ts_max < start_ns:
+                    continue  # Segment ends before the range
+            if end_ns is not None and feather_file.ts_min is not None:
+                if feather_file.ts_min > end_ns:
+                    continue  # Segment starts after the range
             path = feather_file.path
             cls_name = feather_file.class_name
             table: pa.Table = self._read_feather_file(path=path)
@@ -713,6 +734,13 @@ class ParquetDataCatalog(BaseDataCatalog):
             try:
                 data_cls = class_mapping[cls_name]
                 objs = self._handle_table_nautilus(table=table, data_cls=data_cls)
+                if start_ns is not None or end_ns is not None:
+                    objs = [
+                        o
+                        for o in objs
+                        if (start_ns is None or o.ts_init >= start_ns)
+                        and (end_ns is None or o.ts_init <= end_ns)
+                    ]
                 data[cls_name].extend(objs)
             except Exception as e:
                 if raise_on_failed_deserialize:
@@ -727,6 +755,20 @@ class ParquetDataCatalog(BaseDataCatalog):
     ) -> Generator[FeatherFile, None, None]:
         prefix = f"{self.path}/{kind}/{urisafe_instrument_id(instance_id)}"
 
+        manifest = self._read_stream_manifest(prefix)
+        if manifest is not None:
+            # Rotated file segments (compacted segments are read from Parquet)
+            for segment in manifest["segments"]:
+                if segment["rows"] == 0:
+                    continue
+                yield FeatherFile(
+                    path=segment.get("parquet_path") or f"{prefix}/{segment['path']}",
+                    class_name=segment["cls"],
+                    ts_min=segment["ts_min"],
+                    ts_max=segment["ts_max"],
+                )
+            return
+
         # Non-instrument feather files
         for fn in self.fs.glob(f"{prefix}/*.feather"):
             cls_name = fn.replace(prefix + "/", "").replace(".feather", "")
@@ -743,9 +785,86 @@ class ParquetDataCatalog(BaseDataCatalog):
     ) -> pa.Table | None:
         if not self.fs.exists(path):
             return None
+        if path.endswith(".parquet"):
+            return pq.read_table(path, filesystem=self.fs)
         try:
             with self.fs.open(path) as f:
                 reader = pa.ipc.open_stream(f)
                 return reader.read_all()
         except (pa.ArrowInvalid, OSError):
             return None
+
+    def _read_stream_manifest(self, prefix: str) -> dict[str, Any] | None:
+        path = f"{prefix}/{STREAM_MANIFEST_FILENAME}"
+        if not self.fs.exists(path):
+            return None
+        with self.fs.open(path, "rb") as f:
+            return msgspec.json.decode(f.read())
+
+    def _compact_stream(
+        self,
+        kind: str,
+        instance_id: str,
+        delete_segments: bool = True,
+    ) -> int:
+        """
+        Compact the closed file segments of a rotated stream into Parquet files.
+
+        Each closed segment is written to the data path for its type and identifier
+        (as per `write_data`), and the manifest updated so that subsequent reads of
+        the stream use the Parquet files.
+
+        Parameters
+        ----------
+        kind : str
+            The stream kind ('backtest' or 'live').
+        instance_id : str
+            The instance ID of the stream.
+        delete_segments : bool, default True
+            If the compacted feather file segments should be deleted.
+
+        Returns
+        -------
+        int
+            The number of segments compacted.
+
+        """
+        prefix = f"{self.path}/{kind}/{urisafe_instrument_id(instance_id)}"
+        manifest = self._read_stream_manifest(prefix)
+        if manifest is None:
+            return 0
+
+        class_mapping: dict[str, type] = {class_to_filename(cls): cls for cls in list_schemas()}
+        count = 0
+        for segment in manifest["segments"]:
+            if not segment["closed"] or segment.get("parquet_path") or segment["rows"] == 0:
+                continue
+
+            feather_path = f"{prefix}/{segment['path']}"
+            table = self._read_feather_file(path=feather_path)
+            if table is None:
+                continue
+
+            path = self._make_path(
+                data_cls=class_mapping[segment["cls"]],
+                instrument_id=segment["identifier"],
+            )
+            name = pathlib.Path(segment["path"]).stem
+            parquet_path = f"{path}/{urisafe_instrument_id(instance_id)}-{name}.parquet"
+            self.fs.mkdirs(path, exist_ok=True)
+            pq.write_table(
+                table,
+                where=parquet_path,
+                filesystem=self.fs,
+                row_group_size=self.max_rows_per_group,
+            )
+
+            segment["parquet_path"] = parquet_path
+            if delete_segments:
+                self.fs.rm(feather_path)
+            count += 1
+
+        with self.fs.open(f"{prefix}/{STREAM_MANIFEST_FILENAME}", "wb") as f:
+            f.write(msgspec.json.encode(manifest))
+
+        return count
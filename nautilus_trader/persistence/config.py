@@ -18,6 +18,7 @@ from __future__ import annotations
 import fsspec
 
 from nautilus_trader.common.config import NautilusConfig
+from nautilus_trader.common.config import PositiveInt
 
 
 class StreamingConfig(NautilusConfig, frozen=True):
@@ -39,6 +40,17 @@ class StreamingConfig(NautilusConfig, frozen=True):
     include_types : list[type], optional
         A list of Arrow serializable types to write.
         If this is specified then **only** the included types will be written.
+    batch_size : PositiveInt, default 1000
+        The maximum number of rows buffered per table before being written as a record batch.
+    batch_interval_ms : PositiveInt, optional
+        The maximum interval (milliseconds) rows are buffered before being written.
+        If ``None`` then defaults to the `flush_interval_ms`.
+    use_thread : bool, default False
+        If record batches are serialized and written on a background thread.
+    rotation_size_bytes : PositiveInt, optional
+        The file size (bytes) after which each table is rotated to a new file segment.
+    rotation_interval_ms : PositiveInt, optional
+        The time window (milliseconds) of `ts_init` covered by each file segment.
 
     """
 
@@ -48,6 +60,11 @@ class StreamingConfig(NautilusConfig, frozen=True):
     flush_interval_ms: int | None = None
     replace_existing: bool = False
     include_types: list[type] | None = None
+    batch_size: PositiveInt = 1000
+    batch_interval_ms: PositiveInt | None = None
+    use_thread: bool = False
+    rotation_size_bytes: PositiveInt | None = None
+    rotation_interval_ms: PositiveInt | None = None
 
     @property
     def fs(self):
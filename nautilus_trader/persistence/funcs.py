@@ -20,6 +20,7 @@ from nautilus_trader.model.identifiers import InstrumentId
 
 INVALID_WINDOWS_CHARS = r'<>:"/\|?* '
 CUSTOM_DATA_PREFIX = "custom_"
+STREAM_MANIFEST_FILENAME = "manifest.json"
 
 # Taken from https://github.com/dask/dask/blob/261bf174931580230717abca93fe172e166cc1e8/dask/utils.py
 byte_sizes = {
@@ -14,10 +14,13 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime
+import queue
+import threading
 from io import TextIOWrapper
 from typing import Any, BinaryIO
 
 import fsspec
+import msgspec
 import pyarrow as pa
 from fsspec.compression import AbstractBufferedFile
 from pyarrow import RecordBatchStreamWriter
@@ -33,6 +36,7 @@ from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.funcs import STREAM_MANIFEST_FILENAME
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import urisafe_instrument_id
 from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
@@ -57,6 +61,31 @@ class StreamingFeatherWriter:
     include_types : list[type], optional
         A list of Arrow serializable types to write.
         If this is specified then **only** the included types will be written.
+    batch_size : int, default 1000
+        The maximum number of rows buffered per table before being written as a record batch.
+    batch_interval_ms : int, optional
+        The maximum interval (milliseconds) rows are buffered before being written.
+        If ``None`` then defaults to the `flush_interval_ms`.
+    use_thread : bool, default False
+        If record batches are serialized and written on a background thread, rather than
+        the thread calling `write`.
+    rotation_size_bytes : int, optional
+        The file size (bytes) after which a table's current file segment is closed and
+        a new segment started.
+    rotation_interval_ms : int, optional
+        The time window (milliseconds) of each file segment, based on the `ts_init` of
+        the written objects (windows are aligned to the UNIX epoch).
+
+    Raises
+    ------
+    ValueError
+        If `batch_size` is not positive (> 0).
+
+    Notes
+    -----
+    If rotation is enabled then each table is written as numbered file segments
+    (e.g. `quote_tick/AUDUSD.SIM-000001.feather`), and a manifest of every segment's
+    path, type and `ts_init` range is maintained at `manifest.json` in the `path`.
 
     """
 
@@ -67,7 +96,18 @@ class StreamingFeatherWriter:
         flush_interval_ms: int | None = None,
         replace: bool = False,
         include_types: list[type] | None = None,
+        batch_size: int = 1000,
+        batch_interval_ms: int | None = None,
+        use_thread: bool = False,
+        rotation_size_bytes: int | None = None,
+        rotation_interval_ms: int | None = None,
     ) -> None:
+        PyCondition.positive_int(batch_size, "batch_size")
+        if rotation_size_bytes is not None:
+            PyCondition.positive_int(rotation_size_bytes, "rotation_size_bytes")
+        if rotation_interval_ms is not None:
+            PyCondition.positive_int(rotation_interval_ms, "rotation_interval_ms")
+
         self.path = path
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(fs_protocol)
         self.fs.makedirs(self.fs._parent(self.path), exist_ok=True)
@@ -94,12 +134,42 @@ class StreamingFeatherWriter:
             "trade_tick",
         }
         self._instruments: dict[InstrumentId, Instrument] = {}
+
+        # File segments (rotated by size or ts_init time window)
+        self.rotation_size_bytes = rotation_size_bytes
+        self.rotation_interval_ns = (rotation_interval_ms or 0) * 1_000_000
+        self._is_rotating = rotation_size_bytes is not None or rotation_interval_ms is not None
+        self._streams: dict[object, tuple[str, pa.Schema, str, str | None]] = {}
+        self._segments: list[dict[str, Any]] = []
+        self._current_segments: dict[object, dict[str, Any]] = {}
+
         self._create_writers()
 
         self.flush_interval_ms = datetime.timedelta(milliseconds=flush_interval_ms or 1000)
         self._last_flush = datetime.datetime(1970, 1, 1)  # Default value to begin
         self.missing_writers: set[type] = set()
 
+        # Row buffers per writer key, written as record batches
+        self.batch_size = batch_size
+        self.batch_interval_ms = datetime.timedelta(
+            milliseconds=batch_interval_ms or flush_interval_ms or 1000,
+        )
+        self._buffers: dict[object, list[object]] = {}
+        self._buffer_classes: dict[object, type] = {}
+        self._buffer_lock = threading.Lock()
+        self._last_batch = datetime.datetime(1970, 1, 1)  # Default value to begin
+
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        if use_thread:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=type(self).__name__,
+                daemon=True,
+            )
+            self._thread.start()
+
     @property
     def is_closed(self) -> bool:
         """
@@ -112,7 +182,12 @@ class StreamingFeatherWriter:
         """
         return all(self._files[table_name].closed for table_name in self._files)
 
-    def _create_writer(self, cls: type, table_name: str | None = None) -> None:
+    def _create_writer(
+        self,
+        cls: type,
+        table_name: str | None = None,
+        identifier: str | None = None,
+    ) -> None:
         # Check if an include types filter has been specified
         if self.include_types is not None and cls not in self.include_types:
             return
@@ -128,9 +203,8 @@ class StreamingFeatherWriter:
         full_path = f"{self.path}/{table_name}.feather"
 
         self.fs.makedirs(self.fs._parent(full_path), exist_ok=True)
-        f = self.fs.open(full_path, "wb")
-        self._files[table_name] = f
-        self._writers[table_name] = pa.ipc.new_stream(f, schema)
+        self._streams[table_name] = (full_path, schema, class_to_filename(cls), identifier)
+        self._writers[table_name] = self._open_segment(table_name)
 
         self.logger.info(f"Created writer for table '{table_name}'")
 
@@ -153,12 +227,84 @@ class StreamingFeatherWriter:
         self.fs.makedirs(folder, exist_ok=True)
 
         full_path = f"{folder}/{urisafe_instrument_id(obj.instrument_id.value)}.feather"
-        f = self.fs.open(full_path, "wb")
-        self._files[key] = f
-        self._instrument_writers[key] = pa.ipc.new_stream(f, schema)
+        self._streams[key] = (full_path, schema, class_to_filename(cls), obj.instrument_id.value)
+        self._instrument_writers[key] = self._open_segment(key)
 
         self.logger.info(f"Created writer for table '{table_name}'")
 
+    def _open_segment(self, key: object) -> RecordBatchStreamWriter:
+        full_path, schema, cls_name, identifier = self._streams[key]
+        segment: dict[str, Any] = {
+            "path": full_path,
+            "cls": cls_name,
+            "identifier": identifier,
+            "rows": 0,
+            "ts_min": None,
+            "ts_max": None,
+            "window": None,
+            "closed": False,
+        }
+        if self._is_rotating:
+            number = sum(1 for s in self._segments if s["key"] == key) + 1
+            segment["path"] = full_path.replace(".feather", f"-{number:06d}.feather")
+
+        segment["key"] = key
+        self._segments.append(segment)
+        self._current_segments[key] = segment
+
+        f = self.fs.open(segment["path"], "wb")
+        self._files[key] = f
+        return pa.ipc.new_stream(f, schema)
+
+    def _rotate_segment(self, key: object) -> None:
+        if isinstance(key, tuple):
+            writers: dict = self._instrument_writers
+        else:
+            writers = self._writers
+
+        writers[key].close()
+        self._files[key].close()
+        self._current_segments[key]["closed"] = True
+        writers[key] = self._open_segment(key)
+        self.write_manifest()
+
+    def write_manifest(self) -> None:
+        """
+        Write the manifest of file segments (only if rotation is enabled).
+        """
+        if not self._is_rotating:
+            return
+
+        prefix = f"{self.path}/"
+        manifest_path = f"{self.path}/{STREAM_MANIFEST_FILENAME}"
+
+        # Retain the Parquet paths of any segments compacted by the catalog
+        compacted: dict[str, str] = {}
+        if self.fs.exists(manifest_path):
+            with self.fs.open(manifest_path, "rb") as f:
+                for s in msgspec.json.decode(f.read())["segments"]:
+                    if s.get("parquet_path"):
+                        compacted[s["path"]] = s["parquet_path"]
+
+        segments = [
+            {
+                "path": s["path"].replace(prefix, "", 1),
+                "cls": s["cls"],
+                "identifier": s["identifier"],
+                "rows": s["rows"],
+                "ts_min": s["ts_min"],
+                "ts_max": s["ts_max"],
+                "closed": s["closed"],
+            }
+            for s in self._segments
+        ]
+        for segment in segments:
+            if segment["path"] in compacted:
+                segment["parquet_path"] = compacted[segment["path"]]
+
+        with self.fs.open(manifest_path, "wb") as f:
+            f.write(msgspec.json.encode({"segments": segments}))
+
     def _extract_obj_metadata(
         self,
         obj: TradeTick | QuoteTick | Bar | OrderBookDelta,
@@ -225,7 +371,11 @@ class StreamingFeatherWriter:
             if table.startswith("custom_signal"):
                 self._create_writer(cls=cls)
             elif table.startswith(("bar", "binance_bar")):
-                self._create_writer(cls=cls, table_name=table)
+                self._create_writer(
+                    cls=cls,
+                    table_name=table,
+                    identifier=str(obj.bar_type),  # type: ignore
+                )
             elif table in self._per_instrument_writers:
                 key = (table, obj.instrument_id.value)  # type: ignore
                 if key not in self._instrument_writers:
@@ -237,28 +387,166 @@ class StreamingFeatherWriter:
             else:
                 return
 
+        buffer_key: object = table
         if table in self._per_instrument_writers:
-            writer: RecordBatchStreamWriter = self._instrument_writers[(table, obj.instrument_id.value)]  # type: ignore
+            buffer_key = (table, obj.instrument_id.value)  # type: ignore
+            if buffer_key not in self._instrument_writers:
+                return
+
+        with self._buffer_lock:
+            buffer = self._buffers.get(buffer_key)
+            if buffer is None:
+                buffer = []
+                self._buffers[buffer_key] = buffer
+                self._buffer_classes[buffer_key] = cls
+            buffer.append(obj)
+            is_full = len(buffer) >= self.batch_size
+
+        if is_full:
+            self._submit_buffer(buffer_key)
+
+        if self._thread is None:
+            self.check_flush()
+
+    def _submit_buffer(self, key: object) -> None:
+        with self._buffer_lock:
+            objs = self._buffers.get(key)
+            if not objs:
+                return
+            self._buffers[key] = []
+            cls = self._buffer_classes[key]
+
+        if self._queue is not None:
+            self._queue.put((key, cls, objs))
         else:
-            writer: RecordBatchStreamWriter = self._writers[table]  # type: ignore
+            self._write_batch(key, cls, objs)
 
-        serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
-        if not serialized:
+    def _write_batch(self, key: object, cls: type, objs: list[Any]) -> None:
+        if not self.rotation_interval_ns:
+            self._write_segment(key, cls, objs, window=None)
             return
 
+        # Split into runs of objects within the same time window
+        start = 0
+        window = objs[0].ts_init // self.rotation_interval_ns
+        for i in range(1, len(objs)):
+            next_window = objs[i].ts_init // self.rotation_interval_ns
+            if next_window != window:
+                self._write_segment(key, cls, objs[start:i], window=window)
+                start = i
+                window = next_window
+        self._write_segment(key, cls, objs[start:], window=window)
+
+    def _write_segment(self, key: object, cls: type, objs: list[Any], window: int | None) -> None:
+        segment = self._current_segments[key]
+        if window is not None:
+            if segment["rows"] > 0 and segment["window"] != window:
+                self._rotate_segment(key)
+                segment = self._current_segments[key]
+            segment["window"] = window
+
+        if isinstance(key, tuple):
+            writer: RecordBatchStreamWriter = self._instrument_writers[key]  # type: ignore
+        else:
+            writer: RecordBatchStreamWriter = self._writers[key]  # type: ignore
+
         try:
-            writer.write_table(serialized)
-            self.check_flush()
+            serialized = ArrowSerializer.serialize_batch(objs, data_cls=cls)
         except Exception as e:
-            self.logger.error(f"Failed to serialize {cls=}")
+            self.logger.error(f"Failed to serialize batch of {len(objs)} {cls=}")
             self.logger.error(f"ERROR = `{e}`")
-            self.logger.debug(f"data = {obj}")
+            # Write individually so only the objects which fail to serialize are dropped
+            objs = self._write_each(writer, cls, objs)
+            if not objs:
+                return
+        else:
+            if not serialized:
+                return
+            writer.write_table(serialized)
+
+        ts_min = min(obj.ts_init for obj in objs)
+        ts_max = max(obj.ts_init for obj in objs)
+        segment["rows"] += len(objs)
+        if segment["ts_min"] is None or ts_min < segment["ts_min"]:
+            segment["ts_min"] = ts_min
+        if segment["ts_max"] is None or ts_max > segment["ts_max"]:
+            segment["ts_max"] = ts_max
+
+        if (
+            self.rotation_size_bytes is not None
+            and self._files[key].tell() >= self.rotation_size_bytes
+        ):
+            self._rotate_segment(key)
+
+    def _write_each(
+        self,
+        writer: RecordBatchStreamWriter,
+        cls: type,
+        objs: list[Any],
+    ) -> list[Any]:
+        written: list[Any] = []
+        for obj in objs:
+            try:
+                serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
+            except Exception as e:
+                self.logger.error(f"Failed to serialize {cls=}")
+                self.logger.error(f"ERROR = `{e}`")
+                self.logger.debug(f"data = {obj}")
+                continue
+            if serialized:
+                writer.write_table(serialized)
+                written.append(obj)
+        return written
+
+    def _run(self) -> None:
+        assert self._queue is not None  # Type checking
+        timeout_secs = self.batch_interval_ms.total_seconds()
+        while True:
+            try:
+                item = self._queue.get(timeout=timeout_secs)
+            except queue.Empty:
+                item = None
+            else:
+                try:
+                    if item is None:
+                        return  # Closing
+                    elif callable(item):
+                        item()
+                    else:
+                        self._write_batch(*item)
+                except Exception as e:
+                    # Keep the thread alive so `flush` and `close` never block on the queue
+                    self.logger.error(f"Error writing on background thread: {e!r}")
+                finally:
+                    self._queue.task_done()
+
+            # Write partial buffers and flush streams on their intervals
+            now = datetime.datetime.now()
+            try:
+                if now - self._last_batch > self.batch_interval_ms:
+                    self._last_batch = now
+                    self.flush_buffers()
+                if now - self._last_flush > self.flush_interval_ms:
+                    self._last_flush = now
+                    self._flush_streams()
+            except Exception as e:
+                self.logger.error(f"Error flushing on background thread: {e!r}")
+
+    def flush_buffers(self) -> None:
+        """
+        Write all buffered rows as record batches (on the background thread if used).
+        """
+        for key in tuple(self._buffers):
+            self._submit_buffer(key)
 
     def check_flush(self) -> None:
         """
         Flush all stream writers if current time greater than the next flush interval.
         """
         now = datetime.datetime.now()
+        if now - self._last_batch > self.batch_interval_ms:
+            self.flush_buffers()
+            self._last_batch = now
         if now - self._last_flush > self.flush_interval_ms:
             self.flush()
             self._last_flush = now
@@ -266,21 +554,43 @@ class StreamingFeatherWriter:
     def flush(self) -> None:
         """
         Flush all stream writers.
+
+        Any buffered rows are written first. If a background thread is used, then
+        blocks until all pending record batches have been written.
         """
-        for stream in self._files.values():
+        self.flush_buffers()
+        if self._queue is not None:
+            self._queue.put(self._flush_streams)
+            self._queue.join()
+        else:
+            self._flush_streams()
+
+    def _flush_streams(self) -> None:
+        for stream in tuple(self._files.values()):
             if not stream.closed:
                 stream.flush()
+        self.write_manifest()
 
     def close(self) -> None:
         """
         Flush and close all stream writers.
         """
         self.flush()
+        if self._thread is not None:
+            self._queue.put(None)  # type: ignore [union-attr]
+            self._thread.join()
+            self._thread = None
         for wcls in tuple(self._writers):
             self._writers[wcls].close()
             del self._writers[wcls]
+        for wkey in tuple(self._instrument_writers):
+            self._instrument_writers[wkey].close()
+            del self._instrument_writers[wkey]
         for fcls in self._files:
             self._files[fcls].close()
+        for segment in self._current_segments.values():
+            segment["closed"] = True
+        self.write_manifest()
 
 
 def generate_signal_class(name: str, value_type: type) -> type:
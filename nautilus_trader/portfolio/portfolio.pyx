@@ -26,7 +26,6 @@ total risk exposures and total net positions.
 
 from decimal import Decimal
 
-from nautilus_trader.analysis import statistics
 from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
 
 from nautilus_trader.accounting.accounts.base cimport Account
@@ -112,24 +111,7 @@ cdef class Portfolio(PortfolioFacade):
 
         self.analyzer = PortfolioAnalyzer()
 
-        # Register default statistics
-        self.analyzer.register_statistic(statistics.winner_max.MaxWinner())
-        self.analyzer.register_statistic(statistics.winner_avg.AvgWinner())
-        self.analyzer.register_statistic(statistics.winner_min.MinWinner())
-        self.analyzer.register_statistic(statistics.loser_min.MinLoser())
-        self.analyzer.register_statistic(statistics.loser_avg.AvgLoser())
-        self.analyzer.register_statistic(statistics.loser_max.MaxLoser())
-        self.analyzer.register_statistic(statistics.expectancy.Expectancy())
-        self.analyzer.register_statistic(statistics.win_rate.WinRate())
-        self.analyzer.register_statistic(statistics.returns_volatility.ReturnsVolatility())
-        self.analyzer.register_statistic(statistics.returns_avg.ReturnsAverage())
-        self.analyzer.register_statistic(statistics.returns_avg_loss.ReturnsAverageLoss())
-        self.analyzer.register_statistic(statistics.returns_avg_win.ReturnsAverageWin())
-        self.analyzer.register_statistic(statistics.sharpe_ratio.SharpeRatio())
-        self.analyzer.register_statistic(statistics.sortino_ratio.SortinoRatio())
-        self.analyzer.register_statistic(statistics.profit_factor.ProfitFactor())
-        self.analyzer.register_statistic(statistics.risk_return_ratio.RiskReturnRatio())
-        self.analyzer.register_statistic(statistics.long_ratio.LongRatio())
+        self.analyzer.register_default_statistics()
 
         # Register endpoints
         self._msgbus.register(endpoint="Portfolio.update_account", handler=self.update_account)
@@ -521,6 +521,11 @@ class NautilusKernel:
             fs_protocol=config.fs_protocol,
             flush_interval_ms=config.flush_interval_ms,
             include_types=config.include_types,
+            batch_size=config.batch_size,
+            batch_interval_ms=config.batch_interval_ms,
+            use_thread=config.use_thread,
+            rotation_size_bytes=config.rotation_size_bytes,
+            rotation_interval_ms=config.rotation_interval_ms,
         )
         self._trader.subscribe("*", self._writer.write)
         self._log.info(f"Writing data & events to {path}")
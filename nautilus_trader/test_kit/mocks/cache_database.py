@@ -73,11 +73,17 @@ class MockCacheDatabase(CacheDatabaseFacade):
     def load_accounts(self) -> dict:
         return self.accounts.copy()
 
-    def load_orders(self) -> dict:
-        return self.orders.copy()
+    def load_orders(self, exclude: set[ClientOrderId] | None = None) -> dict:
+        return {k: v for k, v in self.orders.items() if exclude is None or k not in exclude}
 
-    def load_positions(self) -> dict:
-        return self.positions.copy()
+    def load_positions(self, exclude: set[PositionId] | None = None) -> dict:
+        return {k: v for k, v in self.positions.items() if exclude is None or k not in exclude}
+
+    def load_index_orders_closed(self) -> set[ClientOrderId]:
+        return {k for k, v in self.orders.items() if v.is_closed}
+
+    def load_index_positions_closed(self) -> set[PositionId]:
+        return {k for k, v in self.positions.items() if v.is_closed}
 
     def load_currency(self, code: str) -> Currency:
         return self.currencies.get(code)
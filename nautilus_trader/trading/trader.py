@@ -650,7 +650,8 @@ class Trader(Component):
         """
         Remove the strategy with the given `strategy_id`.
 
-        Will stop the strategy first if state is ``RUNNING``.
+        Will stop the strategy first if state is ``RUNNING``, then unsubscribe all of
+        its handlers from the message bus (including any it did not unsubscribe on stop).
 
         Parameters
         ----------
@@ -672,6 +673,10 @@ class Trader(Component):
         if strategy.is_running:
             strategy.stop()
 
+        for subscription in self._msgbus.subscriptions():
+            if getattr(subscription.handler, "__self__", None) is strategy:
+                self._msgbus.unsubscribe(topic=subscription.topic, handler=subscription.handler)
+
         self._strategies.pop(strategy_id)
         deregister_component_clock(self._instance_id, strategy.clock)
 
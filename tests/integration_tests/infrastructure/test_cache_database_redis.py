@@ -316,6 +316,89 @@ class TestCacheDatabaseAdapter:
         # Assert
         assert self.database.load_order(order.client_order_id) == order
 
+    @pytest.mark.asyncio
+    async def test_update_order_with_write_behind_writes_all_events_on_close(self):
+        # Arrange
+        database = CacheDatabaseAdapter(
+            trader_id=self.trader_id,
+            instance_id=UUID4(),
+            serializer=MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True),
+            config=CacheConfig(
+                database=DatabaseConfig(),
+                write_behind=True,
+                write_behind_interval_ms=60_000,
+            ),
+        )
+        order = self.strategy.order_factory.stop_market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        # Act
+        database.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        database.update_order(order)
+        order.apply(TestEventStubs.order_accepted(order))
+        database.update_order(order)
+
+        queued = database.write_behind.qsize()
+        database.close()
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: self.database.load_order(order.client_order_id) == order)
+
+        # Assert
+        assert queued > 0
+        assert database.write_behind.qsize() == 0
+        assert self.database.load_order(order.client_order_id) == order
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("checkpoint_compaction", [False, True])
+    async def test_update_order_with_checkpoint_interval_loads_from_checkpoint(
+        self,
+        checkpoint_compaction: bool,
+    ):
+        # Arrange
+        database = CacheDatabaseAdapter(
+            trader_id=self.trader_id,
+            instance_id=UUID4(),
+            serializer=MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True),
+            config=CacheConfig(
+                database=DatabaseConfig(),
+                checkpoint_interval=2,
+                checkpoint_compaction=checkpoint_compaction,
+            ),
+        )
+        order = self.strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        # Act
+        database.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        database.update_order(order)
+        order.apply(TestEventStubs.order_accepted(order))
+        database.update_order(order)
+        order.apply(TestEventStubs.order_filled(order, instrument=_AUDUSD_SIM))
+        database.update_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: database.load_order(order.client_order_id) == order)
+
+        # Assert
+        loaded = database.load_order(order.client_order_id)
+        assert loaded == order
+        assert loaded.event_count == order.event_count
+        assert loaded.events == order.events
+        assert loaded.is_closed
+
+        database.close()
+
     @pytest.mark.asyncio
     async def test_update_order_for_closed_order(self):
         # Arrange
@@ -947,6 +1030,43 @@ class TestCacheDatabaseAdapter:
         # Assert
         assert result == {order.client_order_id: order}
 
+    @pytest.mark.asyncio
+    async def test_load_orders_with_closed_excluded(self):
+        # Arrange
+        open_order = self.strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        closed_order = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        self.database.add_order(open_order)
+        self.database.add_order(closed_order)
+        for order, event in (
+            (open_order, TestEventStubs.order_submitted(open_order)),
+            (open_order, TestEventStubs.order_accepted(open_order)),
+            (closed_order, TestEventStubs.order_submitted(closed_order)),
+            (closed_order, TestEventStubs.order_rejected(closed_order)),
+        ):
+            order.apply(event)
+            self.database.update_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: self.database.load_index_orders_closed())
+
+        # Act
+        closed_ids = self.database.load_index_orders_closed()
+        result = self.database.load_orders(closed_ids)
+
+        # Assert
+        assert closed_ids == {closed_order.client_order_id}
+        assert result == {open_order.client_order_id: open_order}
+
     @pytest.mark.asyncio
     async def test_load_positions_cache_when_no_positions(self):
         # Arrange, Act
@@ -174,3 +174,43 @@ def test_run_with_ema_cross_strategy(benchmark):
         engine.run(start=start, end=end)
 
     benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
+
+
+def test_run_with_many_venues(benchmark):
+    def setup():
+        config = BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True))
+        engine = BacktestEngine(config=config)
+
+        # Setup one active venue with data, and many idle venues (which should not be
+        # processed on every iteration as they have no pending work)
+        for i in range(12):
+            venue = Venue(f"SIM{i}")
+            engine.add_venue(
+                venue=venue,
+                oms_type=OmsType.HEDGING,
+                account_type=AccountType.MARGIN,
+                base_currency=USD,
+                starting_balances=[Money(1_000_000, USD)],
+            )
+            engine.add_instrument(TestInstrumentProvider.default_fx_ccy("USD/JPY", venue))
+
+        # Setup data
+        instrument = TestInstrumentProvider.default_fx_ccy("USD/JPY", Venue("SIM0"))
+        wrangler = QuoteTickDataWrangler(instrument)
+        provider = TestDataProvider()
+        ticks = wrangler.process_bar_data(
+            bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv"),
+            ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv"),
+        )
+        engine.add_data(ticks)
+
+        start = datetime(2013, 2, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+        end = datetime(2013, 3, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+
+        return (engine, start, end), {}
+
+    def run(engine, start, end):
+        engine.add_strategy(Strategy())
+        engine.run(start=start, end=end)
+
+    benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
@@ -0,0 +1,70 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+def _create_cache(open_count: int, closed_count: int) -> Cache:
+    cache = Cache()
+    order_factory = OrderFactory(
+        trader_id=TestIdStubs.trader_id(),
+        strategy_id=StrategyId("S-001"),
+        clock=TestClock(),
+    )
+
+    for i in range(open_count + closed_count):
+        order = order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        cache.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        cache.update_order(order)
+        if i < closed_count:
+            order.apply(TestEventStubs.order_rejected(order))
+        else:
+            order.apply(TestEventStubs.order_accepted(order))
+        cache.update_order(order)
+
+    return cache
+
+
+@pytest.mark.parametrize("closed_count", [0, 10_000])
+def test_orders_open_query_with_closed_orders(benchmark, closed_count):
+    cache = _create_cache(open_count=10, closed_count=closed_count)
+
+    benchmark.pedantic(
+        cache.orders_open,
+        kwargs={"instrument_id": AUDUSD_SIM.id, "strategy_id": StrategyId("S-001")},
+        iterations=10_000,
+        rounds=1,
+    )
+    # Query cost is proportional to the number of open orders (not the closed order count)
@@ -0,0 +1,72 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.execution.matching_core import MatchingCore
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestMatchingCorePerformance:
+    def setup(self):
+        # Fixture Setup
+        order_factory = OrderFactory(
+            trader_id=TraderId("TESTER-000"),
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+        self.core = MatchingCore(
+            instrument_id=AUDUSD_SIM.id,
+            price_increment=AUDUSD_SIM.price_increment,
+            trigger_stop_order=lambda order: None,
+            fill_market_order=lambda order: None,
+            fill_limit_order=lambda order: None,
+        )
+
+        # Resting orders across 100 price levels per side
+        self.orders = [
+            order_factory.limit(
+                AUDUSD_SIM.id,
+                side,
+                Quantity.from_int(100_000),
+                Price(price, 5),
+            )
+            for i in range(500)
+            for side, price in (
+                (OrderSide.BUY, 0.79900 - (i % 100) * 0.00001),
+                (OrderSide.SELL, 0.80100 + (i % 100) * 0.00001),
+            )
+        ]
+
+    def _add_and_delete_orders(self):
+        for order in self.orders:
+            self.core.add_order(order)
+        for order in self.orders:
+            self.core.delete_order(order)
+
+    def test_add_and_delete_orders(self, benchmark):
+        benchmark.pedantic(
+            target=self._add_and_delete_orders,
+            iterations=10,
+            rounds=1,
+        )
@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.component import is_matching_py
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+TOPICS = [f"data.quotes.SIM.SYM{i:05d}/USD" for i in range(5_000)]
+
+
+def _create_msgbus() -> MessageBus:
+    return MessageBus(
+        trader_id=TestIdStubs.trader_id(),
+        clock=TestClock(),
+    )
+
+
+def _publish_all(msgbus: MessageBus) -> None:
+    for topic in TOPICS:
+        msgbus.publish(topic, "MESSAGE")
+
+
+def test_is_matching(benchmark):
+    benchmark.pedantic(
+        is_matching_py,
+        args=("data.quotes.SIM.SYM00001/USD", "data.*.SIM.*"),
+        iterations=100_000,
+        rounds=1,
+    )
+
+
+def test_subscribe_wildcards_after_topics_published(benchmark):
+    def setup():
+        msgbus = _create_msgbus()
+        _publish_all(msgbus)
+        return (msgbus,), {}
+
+    def subscribe(msgbus):
+        for i in range(100):
+            msgbus.subscribe(f"data.quotes.SIM.SYM{i:03d}*", [].append)
+
+    benchmark.pedantic(subscribe, setup=setup, rounds=10)
+
+
+def test_resolve_topics_with_subscriptions(benchmark):
+    def setup():
+        msgbus = _create_msgbus()
+        for topic in TOPICS[:500]:
+            msgbus.subscribe(topic, [].append)
+        msgbus.subscribe("data.quotes.*", [].append)
+        return (msgbus,), {}
+
+    benchmark.pedantic(_publish_all, setup=setup, rounds=10)
+
+
+def test_publish_to_resolved_topic(benchmark):
+    msgbus = _create_msgbus()
+    msgbus.subscribe("data.quotes.*", [].append)
+    msgbus.publish(TOPICS[0], "MESSAGE")
+
+    benchmark.pedantic(
+        msgbus.publish,
+        args=(TOPICS[0], "MESSAGE"),
+        iterations=100_000,
+        rounds=1,
+    )
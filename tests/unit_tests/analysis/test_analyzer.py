@@ -25,6 +25,7 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
@@ -80,6 +81,31 @@ class TestPortfolioAnalyzer:
         # Assert
         assert self.analyzer.statistic("Sharpe Ratio (252 days)") is None
 
+    def test_register_default_statistics(self):
+        # Arrange, Act
+        self.analyzer.register_default_statistics()
+
+        # Assert
+        assert self.analyzer.statistic("Sharpe Ratio (252 days)") is not None
+        assert self.analyzer.statistic("Win Rate") is not None
+        assert self.analyzer.statistic("Long Ratio") is not None
+
+    def test_calculate_statistics_from_balances(self):
+        # Arrange
+        starting = Money(1_000_000, USD)
+        balance = Money(1_000_500, USD)
+
+        # Act
+        self.analyzer.calculate_statistics_from_balances(
+            starting_balances={USD: starting},
+            balances={USD: balance},
+            positions=[],
+        )
+
+        # Assert
+        assert self.analyzer.total_pnl(USD) == 500.0
+        assert self.analyzer.total_pnl_percentage(USD) == 0.05
+
     def test_get_realized_pnls_when_no_data_returns_none(self):
         # Arrange, Act
         result = self.analyzer.realized_pnls()
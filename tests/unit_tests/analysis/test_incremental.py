@@ -0,0 +1,91 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import math
+
+import pandas as pd
+import pytest
+
+from nautilus_trader.analysis.incremental import IncrementalStatistics
+from nautilus_trader.analysis.statistics.sharpe_ratio import SharpeRatio
+from nautilus_trader.analysis.statistics.sortino_ratio import SortinoRatio
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.objects import Money
+
+
+NANOS_PER_HOUR = 3_600_000_000_000
+
+
+class TestIncrementalStatistics:
+    def test_instantiate_with_no_updates(self):
+        # Arrange
+        stats = IncrementalStatistics()
+
+        # Act, Assert
+        assert stats.position_count == 0
+        assert stats.currencies == []
+        assert math.isnan(stats.returns_mean())
+        assert math.isnan(stats.sharpe_ratio())
+        assert math.isnan(stats.sortino_ratio())
+        assert stats.realized_pnl() == 0.0
+        assert stats.max_drawdown() == 0.0
+
+    def test_ratios_match_portfolio_statistics(self):
+        # Arrange
+        returns = [0.01, -0.02, 0.005, 0.03, -0.01, 0.002, -0.004, 0.02]
+        ts_closed = [i * 29 * NANOS_PER_HOUR for i in range(len(returns))]  # Includes empty days
+        series = pd.Series(returns, index=pd.to_datetime(ts_closed, utc=True))
+        stats = IncrementalStatistics()
+
+        # Act
+        for value, ts in zip(returns, ts_closed):
+            stats.update(Money(1.0, USD), value, ts)
+
+        # Assert
+        assert stats.sharpe_ratio() == pytest.approx(SharpeRatio().calculate_from_returns(series))
+        assert stats.sortino_ratio() == pytest.approx(
+            SortinoRatio().calculate_from_returns(series),
+        )
+
+    def test_drawdown_tracks_realized_equity_from_starting_balance(self):
+        # Arrange
+        stats = IncrementalStatistics()
+        stats.set_starting_balances([Money(1_000, USD)])
+
+        # Act
+        for pnl in [100, -300, 50, 400, -100]:
+            stats.update(Money(pnl, USD), 0.0, 0)
+
+        # Assert
+        assert stats.realized_pnl(USD) == 150.0
+        assert stats.max_drawdown(USD) == 300.0
+        assert stats.max_drawdown_pct(USD) == pytest.approx(300.0 / 1_100.0)
+        assert stats.drawdown(USD) == 100.0
+        assert stats.win_rate(USD) == 0.6
+        assert stats.position_count == 5
+
+    def test_reset_keeps_starting_balances(self):
+        # Arrange
+        stats = IncrementalStatistics()
+        stats.set_starting_balances([Money(1_000, USD)])
+        stats.update(Money(-500, USD), -0.5, 0)
+
+        # Act
+        stats.reset()
+        stats.update(Money(-100, USD), -0.1, 0)
+
+        # Assert
+        assert stats.max_drawdown_pct(USD) == pytest.approx(0.1)
+        assert stats.snapshot()["Positions"] == 1
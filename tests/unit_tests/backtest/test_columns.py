@@ -0,0 +1,146 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.backtest.columns import BarColumns
+from nautilus_trader.backtest.engine import BacktestDataIterator
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.wranglers import BarDataWrangler
+from nautilus_trader.test_kit.providers import TestDataProvider
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+def _make_bars(count: int) -> list[Bar]:
+    bar_type = TestDataStubs.bartype_audusd_1min_bid()
+    return [
+        Bar(
+            bar_type=bar_type,
+            open=Price.from_str("1.00002"),
+            high=Price.from_str("1.00004"),
+            low=Price.from_str("1.00001"),
+            close=Price(1.00003 + i * 0.00001, 5),
+            volume=Quantity.from_int(1_000_000),
+            ts_event=i,
+            ts_init=i,
+        )
+        for i in range(count)
+    ]
+
+
+class TestBarColumns:
+    def test_from_bars_round_trips_to_bars(self):
+        # Arrange
+        bars = _make_bars(3)
+
+        # Act
+        columns = BarColumns.from_bars(bars)
+
+        # Assert
+        assert len(columns) == 3
+        assert columns.bar_type == bars[0].bar_type
+        assert columns.price_precision == 5
+        assert columns.size_precision == 0
+        assert columns.ts_init_first == 0
+        assert columns.ts_init_last == 2
+        assert columns.to_bars() == bars
+        assert list(columns) == bars
+        assert columns.bar_at(-1) == bars[-1]
+
+    def test_as_double_returns_float_column(self):
+        # Arrange
+        columns = BarColumns.from_bars(_make_bars(2))
+
+        # Act
+        closes = columns.as_double("close")
+
+        # Assert
+        assert closes.dtype == np.float64
+        assert np.allclose(closes, [1.00003, 1.00004])
+
+    def test_bar_at_out_of_range_raises_index_error(self):
+        # Arrange
+        columns = BarColumns.from_bars(_make_bars(1))
+
+        # Act, Assert
+        with pytest.raises(IndexError):
+            columns.bar_at(1)
+
+    def test_unequal_column_lengths_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BarColumns(
+                bar_type=TestDataStubs.bartype_audusd_1min_bid(),
+                price_precision=5,
+                size_precision=0,
+                opens=np.zeros(2, dtype=np.int64),
+                highs=np.zeros(2, dtype=np.int64),
+                lows=np.zeros(2, dtype=np.int64),
+                closes=np.zeros(2, dtype=np.int64),
+                volumes=np.zeros(2, dtype=np.uint64),
+                ts_events=np.zeros(2, dtype=np.uint64),
+                ts_inits=np.zeros(1, dtype=np.uint64),
+            )
+
+    def test_unsorted_ts_inits_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BarColumns(
+                bar_type=TestDataStubs.bartype_audusd_1min_bid(),
+                price_precision=5,
+                size_precision=0,
+                opens=np.zeros(2, dtype=np.int64),
+                highs=np.zeros(2, dtype=np.int64),
+                lows=np.zeros(2, dtype=np.int64),
+                closes=np.zeros(2, dtype=np.int64),
+                volumes=np.zeros(2, dtype=np.uint64),
+                ts_events=np.array([1, 0], dtype=np.uint64),
+                ts_inits=np.array([1, 0], dtype=np.uint64),
+            )
+
+    def test_from_dataframe_matches_bar_data_wrangler(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_usdjpy_1min_bid()
+        df = TestDataProvider().read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:500]
+        wrangler = BarDataWrangler(bar_type=bar_type, instrument=USDJPY_SIM)
+
+        # Act
+        columns = BarColumns.from_dataframe(bar_type, USDJPY_SIM, df, ts_init_delta=1)
+
+        # Assert
+        assert columns.to_bars() == wrangler.process(df, ts_init_delta=1)
+
+    def test_iterator_stream_materializes_rows_in_order(self):
+        # Arrange
+        bars = _make_bars(3)
+        iterator = BacktestDataIterator()
+        iterator.add_stream("columns", BarColumns.from_bars(bars))
+
+        # Act
+        values = [iterator.next() for _ in range(3)]
+
+        # Assert
+        assert values == bars
+        assert iterator.is_done()
+        assert iterator.is_rewindable
+        assert iterator.last_ts_init() == 2
+        assert iterator.data() == bars
@@ -0,0 +1,66 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from pathlib import Path
+
+import pytest
+
+from nautilus_trader.backtest.data_cache import open_data_cache
+from nautilus_trader.backtest.data_cache import write_data_cache
+from nautilus_trader.model.data import InstrumentStatus
+from nautilus_trader.model.enums import MarketStatusAction
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestDataCache:
+    def test_write_and_open_round_trips_mixed_data(self, tmp_path: Path) -> None:
+        # Arrange
+        quotes = [
+            TestDataStubs.quote_tick(AUDUSD_SIM, ts_event=i, ts_init=i) for i in range(5)
+        ]
+        status = InstrumentStatus(
+            instrument_id=AUDUSD_SIM.id,
+            action=MarketStatusAction.TRADING,
+            ts_event=2,
+            ts_init=2,
+        )
+
+        # Act
+        entries = write_data_cache([*quotes[:2], status, *quotes[2:]], tmp_path, batch_size=2)
+        sources = open_data_cache(tmp_path)
+
+        # Assert
+        assert len(entries) == 2
+        assert [e.is_arrow for e in entries] == [True, False]
+        assert [len(s) for s in sources] == [5, 1]
+        assert sources[0].ts_init_first == 0
+        assert sources[0].ts_init_last == 4
+        assert [len(chunk) for chunk in sources[0]] == [2, 2, 1]  # Decoded per batch
+        assert [q for chunk in sources[0] for q in chunk] == quotes  # Re-iterable
+        assert list(sources[1]) == [[status]]
+
+    def test_write_when_empty_raises_value_error(self, tmp_path: Path) -> None:
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            write_data_cache([], tmp_path)
+
+    def test_open_when_no_manifest_raises_file_not_found_error(self, tmp_path: Path) -> None:
+        # Arrange, Act, Assert
+        with pytest.raises(FileNotFoundError):
+            open_data_cache(tmp_path)
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import multiprocessing
 import sys
 from decimal import Decimal
 from pathlib import Path
@@ -20,6 +21,8 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+from nautilus_trader.backtest.columns import BarColumns
+from nautilus_trader.backtest.engine import BacktestDataIterator
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
@@ -112,6 +115,21 @@ class TestBacktestEngine:
         self.engine.reset()
         self.engine.dispose()
 
+    def test_run_without_incremental_statistics_has_no_statistics(self):
+        # Arrange, Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.statistics is None
+        assert self.engine.get_result().stats_incremental is None
+
+    def test_set_stop_condition_enables_statistics(self):
+        # Arrange, Act
+        self.engine.set_stop_condition(lambda stats: False)
+
+        # Assert
+        assert self.engine.statistics is not None
+
     def test_initialization(self):
         engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
 
@@ -195,6 +213,36 @@ class TestBacktestEngine:
         # Assert
         assert len(self.engine.trader.strategy_states()) == 1
 
+    def test_run_with_profile_reports_component_times(self):
+        # Arrange
+        engine = self.create_engine(
+            BacktestEngineConfig(
+                logging=LoggingConfig(bypass_logging=True),
+                profile=True,
+            ),
+        )
+        engine.add_strategy(Strategy())
+
+        # Act
+        engine.run()
+        report = engine.get_profile_report()
+        result = engine.get_result()
+
+        # Assert
+        assert engine.profiler is not None
+        assert "BacktestEngine.run" in report.index
+        assert "DataEngine.process" in report.index
+        assert report.loc["DataEngine.process", "calls"] == 8000
+        assert result.profile is not None
+        assert set(result.profile) == set(report.index)
+
+        engine.dispose()
+
+    def test_get_profile_report_when_not_profiling_returns_none(self):
+        # Arrange, Act, Assert
+        assert self.engine.profiler is None
+        assert self.engine.get_profile_report() is None
+
     def test_change_fill_model(self):
         # Arrange, Act
         self.engine.change_fill_model(Venue("SIM"), FillModel())
@@ -410,6 +458,31 @@ class TestBacktestEngineData:
         # Assert
         assert len(self.engine.data) == 5
 
+    def test_add_data_stream_from_generator_adds_to_engine(self):
+        # Arrange
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+
+        def stream():
+            yield [CustomData(data_type, MyData("AAPL hacked", 0, 0))]
+            yield [CustomData(data_type, MyData("AMZN hacked", 1000, 1000))]
+
+        # Act
+        self.engine.add_data_stream(stream(), name="news", client_id=ClientId("NEWS_CLIENT"))
+
+        # Assert
+        assert self.engine.data_iterator.stream_names == ["news"]
+        assert self.engine.data == []  # Iterable streams are not listed
+
+    def test_add_data_stream_with_duplicate_name_raises_value_error(self):
+        # Arrange
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+        data = [CustomData(data_type, MyData("AAPL hacked"))]
+        self.engine.add_data_stream(data, name="news", client_id=ClientId("NEWS_CLIENT"))
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.add_data_stream(data, name="news", client_id=ClientId("NEWS_CLIENT"))
+
     def test_add_instrument_when_no_venue_raises_exception(self):
         # Arrange
         engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
@@ -646,6 +719,7 @@ class TestBacktestWithAddedBars:
         config = BacktestEngineConfig(
             logging=LoggingConfig(bypass_logging=True),
             run_analysis=False,
+            incremental_statistics=True,
         )
         self.engine = BacktestEngine(config=config)
         self.venue = Venue("SIM")
@@ -722,6 +796,279 @@ class TestBacktestWithAddedBars:
             USD,
         )
 
+    def test_run_ema_cross_with_added_bar_streams(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        bid_bars = [bar for bar in self.engine.data if bar.bar_type == bar_type]
+        ask_bars = [bar for bar in self.engine.data if bar.bar_type != bar_type]
+        self.engine.clear_data()
+
+        def chunked(bars: list, size: int = 1_000):
+            for i in range(0, len(bars), size):
+                yield bars[i : i + size]
+
+        # Act
+        self.engine.add_data_stream(chunked(bid_bars), name="bid")
+        self.engine.add_data_stream(chunked(ask_bars), name="ask")
+        self.engine.run()
+
+        # Assert
+        assert strategy.fast_ema.count == 30117
+        assert self.engine.iteration == 60234
+        assert self.engine.portfolio.account(self.venue).balance_total(USD) == Money(
+            1_011_166.89,
+            USD,
+        )
+
+    def test_run_ema_cross_with_added_bar_columns(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        bid_bars = [bar for bar in self.engine.data if bar.bar_type == bar_type]
+        ask_bars = [bar for bar in self.engine.data if bar.bar_type != bar_type]
+        self.engine.clear_data()
+
+        # Act
+        self.engine.add_data_stream(BarColumns.from_bars(bid_bars), name="bid")
+        self.engine.add_data_stream(BarColumns.from_bars(ask_bars), name="ask")
+        self.engine.run()
+
+        # Assert
+        assert strategy.fast_ema.count == 30117
+        assert self.engine.iteration == 60234
+        assert self.engine.portfolio.account(self.venue).balance_total(USD) == Money(
+            1_011_166.89,
+            USD,
+        )
+
+    def test_run_ema_cross_updates_incremental_statistics(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        stats = self.engine.statistics
+        assert stats.position_count > 0
+        assert stats.realized_pnl(USD) != 0.0
+        assert stats.max_drawdown(USD) >= 0.0
+        assert not self.engine.stop_requested
+        assert not self.engine.get_result().stopped_early
+
+    def test_run_with_stop_condition_halts_early(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+        self.engine.set_stop_condition(lambda stats: stats.position_count >= 5)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.stop_requested
+        assert self.engine.statistics.position_count == 5
+        assert self.engine.iteration < 60234
+        assert self.engine.get_result().stopped_early
+
+    def test_reset_after_stop_condition_clears_stop_request(self):
+        # Arrange
+        self.engine.set_stop_condition(lambda stats: True)
+        self.engine.run()
+
+        # Act
+        self.engine.reset()
+
+        # Assert
+        assert not self.engine.stop_requested
+        assert self.engine.statistics.position_count == 0
+
+    def test_run_with_start_seeks_to_start(self):
+        # Arrange, Act
+        self.engine.run(start="2012-06-01")
+
+        # Assert
+        result = self.engine.get_result()
+        assert result.backtest_start == pd.Timestamp("2012-06-01", tz="UTC").value
+        assert self.engine.iteration < 60234
+        assert result.iterations == self.engine.iteration  # Excludes the data skipped by seeking
+
+    def test_run_with_start_before_data_already_run_seeks_backwards(self):
+        # Arrange
+        self.engine.run(start="2012-06-01", streaming=True)
+        iteration = self.engine.iteration
+
+        # Act
+        self.engine.run(start="2012-06-01")
+
+        # Assert
+        assert self.engine.iteration == 2 * iteration
+
+    def test_run_again_without_start_when_all_data_run_raises_value_error(self):
+        # Arrange
+        self.engine.run(streaming=True)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.run()
+
+    def test_run_walk_forward_with_reset_runs_each_window_independently(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+        windows = [("2012-02-01", "2012-03-01"), ("2012-03-01", "2012-04-01")]
+
+        # Act
+        results = self.engine.run_walk_forward(windows)
+
+        # Assert
+        assert len(results) == 2
+        for result, (start, _) in zip(results, windows):
+            assert result.backtest_start == pd.Timestamp(start, tz="UTC").value
+            assert result.total_positions > 0
+            assert result.stats_incremental["Positions"] > 0
+
+    def test_run_walk_forward_carrying_state_accumulates_positions(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+        windows = [("2012-02-01", "2012-03-01"), ("2012-03-01", "2012-04-01")]
+
+        # Act
+        results = self.engine.run_walk_forward(windows, carry_state=True)
+
+        # Assert
+        assert len(results) == 2
+        assert results[1].total_positions > results[0].total_positions
+        assert results[1].stats_incremental["Positions"] < results[1].total_positions
+        assert not self.engine.kernel.trader.is_running
+
+    def test_run_walk_forward_carrying_state_with_overlapping_windows_raises_value_error(self):
+        # Arrange
+        windows = [("2012-02-01", "2012-03-15"), ("2012-03-01", "2012-04-01")]
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.run_walk_forward(windows, carry_state=True)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Forking not supported on Windows")
+    def test_fork_map_when_start_method_not_fork_raises_runtime_error(self, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(multiprocessing, "get_start_method", lambda: "spawn")
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            self.engine.fork_map(lambda engine, _: None, [1])
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="Forking requires the 'fork' start method",
+    )
+    def test_fork_map_from_warm_state_matches_full_run(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        def continue_run(engine: BacktestEngine, _) -> tuple[int, str]:
+            engine.run()
+            return engine.iteration, str(engine.portfolio.account(self.venue).balance_total(USD))
+
+        # Act
+        self.engine.run(end="2012-06-01", streaming=True)  # Warm-up checkpoint
+        results = self.engine.fork_map(continue_run, [1, 2], max_workers=2)
+
+        # Assert
+        assert results == [(60234, "1011166.89 USD")] * 2
+        assert self.engine.iteration < 60234  # Checkpoint unchanged by forks
+
     def test_dump_pickled_data(self):
         # Arrange, Act, Assert
         pickled = self.engine.dump_pickled_data()
@@ -757,3 +1104,188 @@ class TestBacktestWithAddedBars:
             1_011_166.89,
             USD,
         )
+
+    def test_dump_and_load_arrow_data(self, tmp_path: Path) -> None:
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        self.engine.dump_arrow_data(tmp_path / "cache")
+
+        # Act
+        self.engine.load_arrow_data(tmp_path / "cache")
+        self.engine.run()
+
+        # Assert
+        assert len(self.engine.data_iterator.stream_names) == 2
+        assert self.engine.data_iterator.is_rewindable
+        assert strategy.fast_ema.count == 30117
+        assert self.engine.iteration == 60234
+        assert self.engine.portfolio.account(self.venue).balance_total(USD) == Money(
+            1_011_166.89,
+            USD,
+        )
+
+    def test_dump_arrow_data_when_cache_exists_raises_file_exists_error(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        # Arrange
+        self.engine.dump_arrow_data(tmp_path)
+
+        # Act, Assert
+        with pytest.raises(FileExistsError):
+            self.engine.dump_arrow_data(tmp_path)
+
+
+class TestBacktestDataIterator:
+    def test_next_when_no_streams_returns_none(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+
+        # Act, Assert
+        assert iterator.is_done()
+        assert iterator.next() is None
+
+    def test_merges_streams_by_ts_init_with_ties_in_stream_order(self):
+        # Arrange
+        iterator = BacktestDataIterator(chunk_size=2)
+        data1 = [MyData("a", 0, 0), MyData("b", 2, 2), MyData("c", 4, 4)]
+        data2 = (x for x in [MyData("d", 1, 1), MyData("e", 2, 2), MyData("f", 3, 3)])
+        iterator.add_stream("list", data1)
+        iterator.add_stream("generator", data2)
+
+        # Act
+        values = []
+        while not iterator.is_done():
+            values.append(iterator.next().value)
+
+        # Assert
+        assert values == ["a", "d", "b", "e", "f", "c"]
+        assert iterator.next() is None
+
+    def test_stream_yielding_chunks_is_flattened(self):
+        # Arrange
+        iterator = BacktestDataIterator(chunk_size=1)
+        chunks = [[MyData("a", 0, 0), MyData("b", 1, 1)], [MyData("c", 2, 2)]]
+        iterator.add_stream("chunks", iter(chunks))
+
+        # Act
+        values = [iterator.next().value for _ in range(3)]
+
+        # Assert
+        assert values == ["a", "b", "c"]
+        assert iterator.is_done()
+
+    def test_reset_rewinds_list_streams(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        iterator.add_stream("list", [MyData("a", 0, 0), MyData("b", 1, 1)])
+        iterator.next()
+        iterator.next()
+
+        # Act
+        iterator.reset()
+
+        # Assert
+        assert iterator.is_rewindable
+        assert iterator.next().value == "a"
+
+    def test_one_shot_iterator_is_not_rewindable(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        iterator.add_stream("generator", (x for x in [MyData("a", 0, 0)]))
+
+        # Act, Assert
+        assert not iterator.is_rewindable
+        assert iterator.last_ts_init() is None
+
+    def test_data_merges_list_streams(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        iterator.add_stream("a", [MyData("a", 0, 0), MyData("c", 2, 2)])
+        iterator.add_stream("b", [MyData("b", 1, 1)])
+
+        # Act
+        data = iterator.data()
+
+        # Assert
+        assert [x.value for x in data] == ["a", "b", "c"]
+        assert iterator.last_ts_init() == 2
+
+    def test_remove_stream(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        iterator.add_stream("a", [MyData("a", 0, 0)])
+        iterator.add_stream("b", [MyData("b", 1, 1)])
+
+        # Act
+        iterator.remove_stream("a")
+
+        # Assert
+        assert iterator.stream_names == ["b"]
+        assert iterator.next().value == "b"
+
+    def test_seek_advances_list_streams_to_first_data_at_or_after_timestamp(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        iterator.add_stream("a", [MyData(str(i), i, i) for i in range(0, 100, 2)])
+        iterator.add_stream("b", [MyData(str(i), i, i) for i in range(1, 100, 2)])
+
+        # Act
+        skipped = iterator.seek(51)
+
+        # Assert
+        assert skipped == 51
+        assert [iterator.next().value for _ in range(3)] == ["51", "52", "53"]
+
+    def test_seek_skips_whole_chunks_of_iterable_streams(self):
+        # Arrange
+        iterator = BacktestDataIterator(chunk_size=3)
+        chunks = [[MyData(str(i), i, i) for i in range(j, j + 4)] for j in range(0, 20, 4)]
+        iterator.add_stream("chunks", iter(chunks))
+
+        # Act
+        skipped = iterator.seek(13)
+
+        # Assert
+        assert skipped == 13
+        assert [iterator.next().value for _ in range(7)] == [str(i) for i in range(13, 20)]
+        assert iterator.is_done()
+
+    def test_seek_past_end_of_data_exhausts_streams(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        iterator.add_stream("a", [MyData("a", 0, 0), MyData("b", 1, 1)])
+
+        # Act
+        skipped = iterator.seek(10)
+
+        # Assert
+        assert skipped == 2
+        assert iterator.is_done()
+
+    def test_seek_does_not_rewind(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        iterator.add_stream("a", [MyData(str(i), i, i) for i in range(5)])
+        iterator.seek(3)
+
+        # Act
+        skipped = iterator.seek(1)
+
+        # Assert
+        assert skipped == 0
+        assert iterator.next().value == "3"
@@ -22,6 +22,8 @@ from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.backtest.models import MakerTakerFeeModel
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import MarketStatusAction
@@ -29,6 +31,8 @@ from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orders import MarketOrder
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.component import TestComponentStubs
@@ -100,6 +104,27 @@ class TestOrderMatchingEngine:
         )
         self.matching_engine.process_order(order, self.account_id)
 
+    def test_process_bar_with_no_orders_leaves_market_at_close(self) -> None:
+        # Arrange
+        bar = Bar(
+            bar_type=BarType.from_str("ETHUSDT-PERP.BINANCE-1-MINUTE-LAST-EXTERNAL"),
+            open=Price.from_str("1000.00"),
+            high=Price.from_str("1010.00"),
+            low=Price.from_str("990.00"),
+            close=Price.from_str("1005.00"),
+            volume=Quantity.from_str("100.000"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.matching_engine.process_bar(bar)
+
+        # Assert
+        book = self.matching_engine.get_book()
+        assert book.best_bid_price() == Price.from_str("1005.00")
+        assert book.best_ask_price() == Price.from_str("1005.00")
+
     @pytest.mark.skip(reason="WIP to introduce flags")
     def test_process_auction_book(self) -> None:
         # Arrange
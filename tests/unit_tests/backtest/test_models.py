@@ -13,8 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
+from nautilus_trader.backtest.models import EmpiricalLatency
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import FixedLatency
 from nautilus_trader.backtest.models import LatencyModel
+from nautilus_trader.backtest.models import LogNormalLatency
+from nautilus_trader.backtest.models import SampledLatencyModel
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.commands import TestCommandStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
 
 
 class TestFillModel:
@@ -76,3 +85,137 @@ class TestExchangeLatency:
         assert latency.insert_latency_nanos == self.NANOSECONDS_IN_MILLISECOND
         assert latency.update_latency_nanos == self.NANOSECONDS_IN_MILLISECOND
         assert latency.cancel_latency_nanos == self.NANOSECONDS_IN_MILLISECOND
+
+    def test_get_latency_returns_latency_for_command_kind(self):
+        # Arrange
+        latency = LatencyModel(
+            base_latency_nanos=100,
+            insert_latency_nanos=1,
+            update_latency_nanos=2,
+            cancel_latency_nanos=3,
+        )
+        order = TestExecStubs.limit_order()
+
+        # Act, Assert
+        assert latency.get_latency(TestCommandStubs.submit_order_command(order)) == 101
+        modify = TestCommandStubs.modify_order_command(price=order.price, order=order)
+        assert latency.get_latency(modify) == 102
+        assert latency.get_latency(TestCommandStubs.cancel_order_command(order=order)) == 103
+
+
+class TestLatencyDistributions:
+    def test_fixed_latency_sample(self):
+        # Arrange
+        distribution = FixedLatency(500)
+
+        # Act
+        values = distribution.sample(np.random.default_rng(42), 3)
+
+        # Assert
+        assert values.dtype == np.uint64
+        assert values.tolist() == [500, 500, 500]
+
+    def test_lognormal_latency_sample_is_clipped(self):
+        # Arrange
+        distribution = LogNormalLatency(
+            median_nanos=1_000_000,
+            sigma=2.0,
+            min_nanos=500_000,
+            max_nanos=2_000_000,
+        )
+
+        # Act
+        values = distribution.sample(np.random.default_rng(42), 1_000)
+
+        # Assert
+        assert values.min() >= 500_000
+        assert values.max() <= 2_000_000
+
+    def test_lognormal_latency_sample_with_same_seed_is_reproducible(self):
+        # Arrange
+        distribution = LogNormalLatency(median_nanos=1_000_000, sigma=0.5)
+
+        # Act
+        values1 = distribution.sample(np.random.default_rng(42), 100)
+        values2 = distribution.sample(np.random.default_rng(42), 100)
+
+        # Assert
+        assert values1.tolist() == values2.tolist()
+
+    def test_empirical_latency_sample_is_within_bins_with_counts(self):
+        # Arrange
+        distribution = EmpiricalLatency([100, 200, 300, 400], [1, 0, 1])
+
+        # Act
+        values = distribution.sample(np.random.default_rng(42), 1_000)
+
+        # Assert
+        assert values.min() >= 100
+        assert values.max() < 400
+        assert not np.any((values >= 200) & (values < 300))
+
+    def test_empirical_latency_from_samples(self):
+        # Arrange
+        observed = [1_000, 1_200, 1_500, 3_000, 10_000]
+
+        # Act
+        distribution = EmpiricalLatency.from_samples(observed, bins=10)
+        values = distribution.sample(np.random.default_rng(42), 1_000)
+
+        # Assert
+        assert values.min() >= 1_000
+        assert values.max() <= 10_000
+
+    def test_empirical_latency_from_constant_samples(self):
+        # Arrange, Act
+        distribution = EmpiricalLatency.from_samples([1_000, 1_000])
+        values = distribution.sample(np.random.default_rng(42), 10)
+
+        # Assert
+        assert values.tolist() == [1_000] * 10
+
+
+class TestSampledLatencyModel:
+    def test_get_latency_with_same_seed_is_reproducible(self):
+        # Arrange
+        order = TestExecStubs.limit_order()
+        command = TestCommandStubs.submit_order_command(order)
+        model1 = SampledLatencyModel(LogNormalLatency(1_000_000, 0.5), random_seed=42, batch_size=8)
+        model2 = SampledLatencyModel(LogNormalLatency(1_000_000, 0.5), random_seed=42, batch_size=8)
+
+        # Act
+        latencies1 = [model1.get_latency(command) for _ in range(20)]
+        latencies2 = [model2.get_latency(command) for _ in range(20)]
+
+        # Assert
+        assert latencies1 == latencies2
+        assert len(set(latencies1)) > 1
+
+    def test_get_latency_uses_distribution_for_command_kind(self):
+        # Arrange
+        model = SampledLatencyModel(
+            insert_latency=FixedLatency(1),
+            update_latency=FixedLatency(2),
+            cancel_latency=FixedLatency(3),
+        )
+        order = TestExecStubs.limit_order()
+
+        # Act, Assert
+        assert model.get_latency(TestCommandStubs.submit_order_command(order)) == 1
+        modify = TestCommandStubs.modify_order_command(price=order.price, order=order)
+        assert model.get_latency(modify) == 2
+        assert model.get_latency(TestCommandStubs.cancel_order_command(order=order)) == 3
+
+    def test_get_latency_uses_instrument_model_when_set(self):
+        # Arrange
+        order = TestExecStubs.limit_order()
+        other = TestExecStubs.limit_order(instrument=TestInstrumentProvider.ethusdt_binance())
+        model = SampledLatencyModel(
+            insert_latency=FixedLatency(1),
+            instrument_models={order.instrument_id: LatencyModel(base_latency_nanos=1_000)},
+        )
+
+        # Act, Assert
+        assert model.get_latency(TestCommandStubs.submit_order_command(order)) == 1_000
+        assert model.get_latency(TestCommandStubs.cancel_order_command(order=order)) == 1_000
+        assert model.get_latency(TestCommandStubs.submit_order_command(other)) == 1
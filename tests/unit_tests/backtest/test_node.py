@@ -156,6 +156,36 @@ class TestBacktestNode:
         assert isinstance(results, list)
         assert len(results) == 1
 
+    def test_run_with_max_workers_returns_results_in_config_order(self):
+        # Arrange
+        configs = self.backtest_configs + [
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(
+                    strategies=self.strategies,
+                    logging=LoggingConfig(bypass_logging=True),
+                    run_analysis=False,
+                ),
+                venues=[self.venue_config],
+                data=[self.data_config],
+            ),
+        ]
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run(max_workers=2)
+
+        # Assert
+        assert [r.run_config_id for r in results] == [c.id for c in configs]
+        assert node.get_engines() == []
+
+    def test_run_parallel_with_invalid_max_workers_raises_value_error(self):
+        # Arrange
+        node = BacktestNode(configs=self.backtest_configs)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            list(node.run_parallel(max_workers=0))
+
     def test_node_config_from_raw(self):
         # Arrange
         raw = msgspec.json.encode(
@@ -0,0 +1,177 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.optimizer import ParameterSweep
+from nautilus_trader.backtest.optimizer import _run_variants_on_engine
+from nautilus_trader.backtest.optimizer import data_from_shared_memory
+from nautilus_trader.backtest.optimizer import data_to_shared_memory
+from nautilus_trader.config import BacktestDataConfig
+from nautilus_trader.config import BacktestRunConfig
+from nautilus_trader.config import BacktestVenueConfig
+from nautilus_trader.config import ImportableStrategyConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
+from nautilus_trader.test_kit.mocks.data import setup_catalog
+
+
+class TestParameterSweep:
+    def setup(self):
+        self.catalog = setup_catalog(protocol="file", path="./catalog")
+        self.data_config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol=self.catalog.fs_protocol,
+            data_cls=QuoteTick,
+            instrument_id=InstrumentId.from_str("AUD/USD.SIM"),
+            start_time=1580398089820000000,
+            end_time=1580504394501000000,
+        )
+        self.run_config = BacktestRunConfig(
+            engine=BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)),
+            venues=[
+                BacktestVenueConfig(
+                    name="SIM",
+                    oms_type="HEDGING",
+                    account_type="MARGIN",
+                    base_currency="USD",
+                    starting_balances=["1000000 USD"],
+                ),
+            ],
+            data=[self.data_config],
+        )
+        self.strategy = ImportableStrategyConfig(
+            strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+            config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+            config={
+                "instrument_id": "AUD/USD.SIM",
+                "bar_type": "AUD/USD.SIM-100-TICK-MID-INTERNAL",
+                "fast_ema_period": 10,
+                "slow_ema_period": 20,
+                "trade_size": "1_000_000",
+                "order_id_tag": "001",
+            },
+        )
+        load_catalog_with_stub_quote_ticks_audusd(self.catalog)  # Load sample data
+
+    def test_grid(self):
+        # Arrange, Act
+        variants = ParameterSweep.grid({"a": [1, 2], "b": ["x", "y"]})
+
+        # Assert
+        assert variants == [
+            {"a": 1, "b": "x"},
+            {"a": 1, "b": "y"},
+            {"a": 2, "b": "x"},
+            {"a": 2, "b": "y"},
+        ]
+
+    def test_sample_is_deterministic_for_seed(self):
+        # Arrange
+        params = {"a": [1, 2, 3], "b": lambda rng: rng.randint(10, 20)}
+
+        # Act
+        variants1 = ParameterSweep.sample(params, n_iter=5, seed=42)
+        variants2 = ParameterSweep.sample(params, n_iter=5, seed=42)
+
+        # Assert
+        assert len(variants1) == 5
+        assert variants1 == variants2
+        assert all(v["a"] in (1, 2, 3) and 10 <= v["b"] <= 20 for v in variants1)
+
+    def test_sample_with_invalid_n_iter_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            ParameterSweep.sample({"a": [1]}, n_iter=0)
+
+    def test_shared_memory_round_trip(self):
+        # Arrange
+        result = BacktestNode.load_data_config(self.data_config)
+
+        # Act
+        shm, handle = data_to_shared_memory(result)
+        try:
+            data = data_from_shared_memory(handle)
+        finally:
+            shm.close()
+            shm.unlink()
+
+        # Assert
+        assert handle.is_arrow
+        assert data == result.data
+
+    def test_run_grid_returns_ranked_results(self):
+        # Arrange
+        sweep = ParameterSweep(
+            run_config=self.run_config,
+            strategy=self.strategy,
+            objective="PnL (total)",
+        )
+
+        # Act
+        results = sweep.run_grid({"fast_ema_period": [5, 10], "slow_ema_period": [20]})
+
+        # Assert
+        assert len(results) == 2
+        assert results.index.name == "rank"
+        assert list(results.index) == [1, 2]
+        assert results["objective"].is_monotonic_decreasing
+        assert set(results["fast_ema_period"]) == {5, 10}
+
+    def test_run_with_workers_matches_in_process_results(self):
+        # Arrange
+        variants = ParameterSweep.grid({"fast_ema_period": [5, 10]})
+        sweep = ParameterSweep(self.run_config, self.strategy, objective="PnL (total)")
+        parallel = ParameterSweep(
+            self.run_config,
+            self.strategy,
+            objective="PnL (total)",
+            max_workers=2,
+        )
+
+        # Act
+        results1 = sweep.run(variants)
+        results2 = parallel.run(variants)
+
+        # Assert
+        assert results1["objective"].tolist() == results2["objective"].tolist()
+
+    def test_run_variants_on_engine_keeps_bus_subscriptions_stable(self, monkeypatch):
+        # Arrange
+        engines = []
+        create_engine = BacktestNode.create_engine
+
+        def capture_engine(node, config):
+            engine = create_engine(node, config)
+            engines.append(engine)
+            return engine
+
+        monkeypatch.setattr(BacktestNode, "create_engine", capture_engine)
+        data = [BacktestNode.load_data_config(self.data_config)]
+        variants = list(enumerate(ParameterSweep.grid({"fast_ema_period": [5, 10, 15]})))
+
+        # Act
+        subscription_counts = [
+            len(engines[0].kernel.msgbus.subscriptions())
+            for _ in _run_variants_on_engine(self.run_config, self.strategy, data, variants)
+        ]
+
+        # Assert
+        assert len(subscription_counts) == 3
+        assert len(set(subscription_counts)) == 1
@@ -0,0 +1,238 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.backtest.columns import BarColumns
+from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import FixedFeeModel
+from nautilus_trader.backtest.vectorized import VectorizedBacktester
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestVectorizedBacktester:
+    def setup(self):
+        # Fixture Setup
+        self.backtester = VectorizedBacktester(
+            instrument=AUDUSD_SIM,
+            starting_balance=Money(1_000_000, USD),
+        )
+        self.ts = np.arange(4, dtype=np.uint64)
+
+    def test_round_trip_matches_position_accounting(self):
+        # Arrange
+        order_factory = OrderFactory(
+            trader_id=TraderId("TESTER-000"),
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+        buy = order_factory.market(AUDUSD_SIM.id, OrderSide.BUY, Quantity.from_int(100_000))
+        sell = order_factory.market(AUDUSD_SIM.id, OrderSide.SELL, Quantity.from_int(100_000))
+        position = Position(
+            instrument=AUDUSD_SIM,
+            fill=TestEventStubs.order_filled(
+                buy,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-1"),
+                last_px=Price.from_str("0.80000"),
+            ),
+        )
+        position.apply(
+            TestEventStubs.order_filled(
+                sell,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-1"),
+                last_px=Price.from_str("0.80020"),
+            ),
+        )
+
+        # Act
+        result = self.backtester.run_prices(
+            ts_init=self.ts,
+            prices=[0.80000, 0.80000, 0.80010, 0.80020],
+            target_positions=[0, 100_000, 100_000, 0],
+        )
+
+        # Assert
+        assert result.total_orders == 2
+        assert result.total_positions == 1
+        assert result.positions[0].entry == OrderSide.BUY
+        assert result.positions[0].realized_pnl == position.realized_pnl
+        assert result.positions[0].realized_return == pytest.approx(position.realized_return)
+        assert result.balance_final == 1_000_000 + position.realized_pnl.as_double()
+        assert result.stats_pnls["USD"]["PnL (total)"] == position.realized_pnl.as_double()
+        assert result.fills["commission"].tolist() == [1.6, 1.6]
+
+    def test_order_quantities_match_target_positions(self):
+        # Arrange
+        prices = [0.80000, 0.80010, 0.79990, 0.80020]
+
+        # Act
+        result1 = self.backtester.run_prices(
+            self.ts,
+            prices,
+            target_positions=[100_000, np.nan, -100_000, 0],
+        )
+        result2 = self.backtester.run_prices(
+            self.ts,
+            prices,
+            order_quantities=[100_000, 0, -200_000, 100_000],
+        )
+
+        # Assert
+        assert result1.fills.equals(result2.fills)
+        assert result1.balance_final == result2.balance_final
+        assert [p.realized_pnl for p in result1.positions] == [
+            p.realized_pnl for p in result2.positions
+        ]
+
+    def test_flip_splits_position_and_commission(self):
+        # Arrange
+        backtester = VectorizedBacktester(
+            instrument=AUDUSD_SIM,
+            starting_balance=Money(1_000_000, USD),
+            fee_model=FixedFeeModel(Money(2, USD)),
+        )
+
+        # Act
+        result = backtester.run_prices(
+            ts_init=[1, 2, 3],
+            prices=[1.00000, 1.10000, 1.00000],
+            target_positions=[100_000, -100_000, 0],
+        )
+
+        # Assert
+        assert result.total_orders == 3
+        assert [p.entry for p in result.positions] == [OrderSide.BUY, OrderSide.SELL]
+        assert [p.realized_pnl for p in result.positions] == [
+            Money(9_997, USD),
+            Money(9_997, USD),
+        ]
+        assert [p.ts_closed for p in result.positions] == [2, 3]
+        assert result.balance_final == 1_019_994
+        assert result.stats_general["Long Ratio"] == "0.50"
+
+    def test_open_position_is_included_with_commission_only(self):
+        # Arrange, Act
+        result = self.backtester.run_prices(
+            ts_init=self.ts,
+            prices=[0.80000, 0.80000, 0.80010, 0.80020],
+            target_positions=[0, 100_000, 100_000, 100_000],
+        )
+
+        # Assert
+        assert result.total_positions == 1
+        assert not result.positions[0].is_closed
+        assert result.positions[0].realized_pnl == Money(-1.60, USD)
+
+    def test_run_quotes_fills_buys_at_ask_and_sells_at_bid(self):
+        # Arrange, Act
+        result = self.backtester.run_quotes(
+            ts_init=self.ts,
+            bid_prices=[0.80000, 0.80010, 0.80020, 0.80030],
+            ask_prices=[0.80002, 0.80012, 0.80022, 0.80032],
+            target_positions=[100_000, 100_000, 0, 0],
+        )
+
+        # Assert
+        assert result.fills["price"].tolist() == [0.80002, 0.80020]
+        assert result.fills["side"].tolist() == ["BUY", "SELL"]
+
+    def test_fill_model_slippage_moves_price_one_tick_against_order(self):
+        # Arrange
+        backtester = VectorizedBacktester(
+            instrument=AUDUSD_SIM,
+            starting_balance=Money(1_000_000, USD),
+            fill_model=FillModel(prob_slippage=1.0),
+        )
+
+        # Act
+        result = backtester.run_prices(
+            ts_init=self.ts,
+            prices=[0.80000, 0.80000, 0.80010, 0.80020],
+            target_positions=[0, 100_000, 100_000, 0],
+        )
+
+        # Assert
+        assert result.fills["price"].tolist() == [0.80001, 0.80019]
+
+    def test_run_bars_fills_at_close(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_audusd_1min_bid()
+        bars = [
+            Bar(
+                bar_type=bar_type,
+                open=Price.from_str("0.80000"),
+                high=Price.from_str("0.80050"),
+                low=Price.from_str("0.79950"),
+                close=Price(0.80000 + i * 0.00010, 5),
+                volume=Quantity.from_int(1_000_000),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        result = self.backtester.run_bars(
+            BarColumns.from_bars(bars),
+            target_positions=[100_000, 100_000, 0],
+        )
+
+        # Assert
+        assert result.iterations == 3
+        assert result.fills["price"].tolist() == [0.80000, 0.80020]
+        assert result.positions[0].realized_pnl == Money(16.80, USD)
+
+    def test_run_with_both_signals_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.backtester.run_prices(
+                self.ts,
+                [1.0] * 4,
+                target_positions=[0] * 4,
+                order_quantities=[0] * 4,
+            )
+
+    def test_run_with_signals_length_mismatch_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.backtester.run_prices(self.ts, [1.0] * 4, target_positions=[0] * 3)
+
+    def test_instantiate_with_inverse_instrument_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            VectorizedBacktester(
+                instrument=TestInstrumentProvider.xbtusd_bitmex(),
+                starting_balance=Money(1_000_000, USD),
+            )
@@ -20,8 +20,10 @@ import pytest
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.cache.cache import Cache
+from nautilus_trader.cache.config import CacheConfig
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.config import LoggingConfig
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.examples.strategies.ema_cross import EMACross
@@ -52,6 +54,7 @@ from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.risk.engine import RiskEngine
 from nautilus_trader.test_kit.mocks.actors import MockActor
+from nautilus_trader.test_kit.mocks.cache_database import MockCacheDatabase
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.events import TestEventStubs
@@ -945,6 +948,99 @@ class TestCache:
         assert order1 in self.cache.orders_for_position(position.id)
         assert order2 in self.cache.orders_for_position(position.id)
 
+    def test_orders_queries_with_status_and_side_filters_return_orders_sorted_by_id(self):
+        # Arrange
+        orders = [
+            self.strategy.order_factory.limit(
+                AUDUSD_SIM.id,
+                side,
+                Quantity.from_int(100_000),
+                Price.from_str("1.00000"),
+            )
+            for side in (OrderSide.BUY, OrderSide.SELL, OrderSide.BUY, OrderSide.BUY)
+        ]
+        for order in reversed(orders):
+            self.cache.add_order(order)
+
+        for order in orders[:3]:
+            order.apply(TestEventStubs.order_submitted(order))
+            self.cache.update_order(order)
+            order.apply(TestEventStubs.order_accepted(order))
+            self.cache.update_order(order)
+
+        # Act
+        orders[0].apply(TestEventStubs.order_canceled(orders[0]))
+        self.cache.update_order(orders[0])
+
+        # Assert
+        assert self.cache.orders(instrument_id=AUDUSD_SIM.id) == orders
+        assert self.cache.orders(strategy_id=self.strategy.id, side=OrderSide.BUY) == [
+            orders[0],
+            orders[2],
+            orders[3],
+        ]
+        assert self.cache.orders_open(venue=AUDUSD_SIM.id.venue) == orders[1:3]
+        assert self.cache.orders_open(instrument_id=AUDUSD_SIM.id, side=OrderSide.BUY) == [
+            orders[2],
+        ]
+        assert self.cache.orders_closed(strategy_id=self.strategy.id) == [orders[0]]
+        assert self.cache.orders_open(instrument_id=GBPUSD_SIM.id) == []
+        assert self.cache.client_order_ids_open(instrument_id=AUDUSD_SIM.id) == {
+            orders[1].client_order_id,
+            orders[2].client_order_id,
+        }
+        assert self.cache.orders_open_count(venue=AUDUSD_SIM.id.venue, side=OrderSide.SELL) == 1
+        assert self.cache.orders_closed_count(instrument_id=AUDUSD_SIM.id) == 1
+        assert self.cache.orders_total_count(strategy_id=self.strategy.id) == 4
+
+    def test_positions_queries_with_side_filter_after_position_closed(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        position_id = PositionId("P-1")
+        position = Position(
+            instrument=AUDUSD_SIM,
+            fill=TestEventStubs.order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                last_px=Price.from_str("1.00001"),
+            ),
+        )
+        self.cache.add_position(position, OmsType.HEDGING)
+        open_long = self.cache.positions_open(venue=AUDUSD_SIM.id.venue, side=PositionSide.LONG)
+
+        # Act
+        position.apply(
+            TestEventStubs.order_filled(
+                order2,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                last_px=Price.from_str("1.00001"),
+            ),
+        )
+        self.cache.update_position(position)
+
+        # Assert
+        assert open_long == [position]
+        assert self.cache.positions_open(side=PositionSide.LONG) == []
+        assert self.cache.positions(instrument_id=AUDUSD_SIM.id, side=PositionSide.LONG) == []
+        assert self.cache.positions(instrument_id=AUDUSD_SIM.id, side=PositionSide.FLAT) == [
+            position,
+        ]
+        assert self.cache.positions_closed(strategy_id=self.strategy.id) == [position]
+        assert self.cache.position_closed_ids(venue=AUDUSD_SIM.id.venue) == {position_id}
+        assert self.cache.positions_open_count(instrument_id=AUDUSD_SIM.id) == 0
+        assert self.cache.positions_closed_count(instrument_id=AUDUSD_SIM.id) == 1
+
     def test_positions_queries_with_multiple_open_returns_expected_positions(self):
         # Arrange
         # -- Position 1 --------------------------------------------------------
@@ -1359,3 +1455,164 @@ class TestExecutionCacheIntegrityCheck:
 
         # Act, Assert
         assert not self.engine.cache.check_integrity()
+
+
+class TestExecutionCacheLazyLoading:
+    def setup(self):
+        # Fixture Setup
+        self.database = MockCacheDatabase()
+        self.cache = Cache(
+            database=self.database,
+            config=CacheConfig(lazy_load_closed=True),
+        )
+
+    def _position(self, position_id: PositionId, *client_order_ids: str) -> Position:
+        position = None
+        side = OrderSide.BUY
+        for client_order_id in client_order_ids:
+            order = TestExecStubs.make_accepted_order(
+                instrument=AUDUSD_SIM,
+                order_side=side,
+                client_order_id=ClientOrderId(client_order_id),
+            )
+            fill = TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+            )
+            if position is None:
+                position = Position(instrument=AUDUSD_SIM, fill=fill)
+            else:
+                position.apply(fill)
+            side = OrderSide.SELL
+        return position
+
+    def test_cache_orders_defers_closed_orders_until_first_access(self):
+        # Arrange
+        open_order = TestExecStubs.make_accepted_order(
+            instrument=AUDUSD_SIM,
+            client_order_id=ClientOrderId("O-1"),
+        )
+        closed_order = TestExecStubs.make_filled_order(
+            instrument=AUDUSD_SIM,
+            client_order_id=ClientOrderId("O-2"),
+        )
+        self.database.add_order(open_order)
+        self.database.add_order(closed_order)
+
+        # Act
+        self.cache.cache_orders()
+        self.cache.build_index()
+        orders_open = self.cache.orders_open()
+        exists = self.cache.order_exists(closed_order.client_order_id)
+        order = self.cache.order(closed_order.client_order_id)
+
+        # Assert
+        assert orders_open == [open_order]
+        assert exists
+        assert order == closed_order
+        assert self.cache.orders() == [open_order, closed_order]
+        assert self.cache.orders_closed() == [closed_order]
+        assert self.cache.order(ClientOrderId("O-3")) is None
+        assert self.cache.check_integrity()
+
+    def test_cache_orders_loads_closed_contingent_orders_of_open_orders(self):
+        # Arrange
+        order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+        bracket = order_factory.bracket(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            sl_trigger_price=Price.from_str("0.99000"),
+            tp_price=Price.from_str("1.01000"),
+        )
+        entry = TestExecStubs.make_accepted_order(order=bracket.orders[0])
+        entry.apply(
+            TestEventStubs.order_filled(entry, instrument=AUDUSD_SIM, position_id=PositionId("P-1")),
+        )
+        stop_loss = TestExecStubs.make_accepted_order(order=bracket.orders[1])
+        take_profit = TestExecStubs.make_accepted_order(order=bracket.orders[2])
+        unrelated_order = TestExecStubs.make_filled_order(
+            instrument=AUDUSD_SIM,
+            client_order_id=ClientOrderId("O-1"),
+        )
+        for order in (entry, stop_loss, take_profit, unrelated_order):
+            self.database.add_order(order)
+
+        # Act
+        self.cache.cache_orders()
+        self.cache.cache_order_lists()
+        self.cache.build_index()
+
+        # Assert
+        assert entry.is_closed
+        assert self.cache.is_order_closed(entry.client_order_id)
+        assert stop_loss.position_id == PositionId("P-1")
+        assert take_profit.position_id == PositionId("P-1")
+        assert self.cache.position_id(stop_loss.client_order_id) == PositionId("P-1")
+        assert self.cache.position_id(take_profit.client_order_id) == PositionId("P-1")
+        assert len(self.cache.order_list(bracket.id).orders) == 3
+
+    def test_orders_query_including_closed_orders_loads_deferred_orders(self):
+        # Arrange
+        open_order = TestExecStubs.make_accepted_order(
+            instrument=AUDUSD_SIM,
+            client_order_id=ClientOrderId("O-1"),
+        )
+        closed_order = TestExecStubs.make_filled_order(
+            instrument=AUDUSD_SIM,
+            client_order_id=ClientOrderId("O-2"),
+        )
+        self.database.add_order(open_order)
+        self.database.add_order(closed_order)
+        self.cache.cache_orders()
+        self.cache.build_index()
+
+        # Act
+        orders = self.cache.orders()
+
+        # Assert
+        assert orders == [open_order, closed_order]
+        assert self.cache.orders_closed_count() == 1
+        assert self.cache.orders_total_count() == 2
+        assert self.cache.check_integrity()
+
+    def test_positions_query_including_closed_positions_loads_deferred_positions(self):
+        # Arrange
+        open_position = self._position(PositionId("P-1"), "O-1")
+        closed_position = self._position(PositionId("P-2"), "O-2", "O-3")
+        self.database.add_position(open_position)
+        self.database.add_position(closed_position)
+        self.cache.cache_positions()
+        self.cache.build_index()
+
+        # Act
+        positions_closed_count = self.cache.positions_closed_count()
+
+        # Assert
+        assert positions_closed_count == 1
+        assert self.cache.positions() == [open_position, closed_position]
+        assert self.cache.positions_total_count() == 2
+
+    def test_cache_positions_defers_closed_positions_until_first_access(self):
+        # Arrange
+        open_position = self._position(PositionId("P-1"), "O-1")
+        closed_position = self._position(PositionId("P-2"), "O-2", "O-3")
+        self.database.add_position(open_position)
+        self.database.add_position(closed_position)
+
+        # Act
+        self.cache.cache_positions()
+        self.cache.build_index()
+        positions_open = self.cache.positions_open()
+        position = self.cache.position(closed_position.id)
+
+        # Assert
+        assert positions_open == [open_position]
+        assert position == closed_position
+        assert self.cache.positions_closed() == [closed_position]
+        assert self.cache.positions_open() == [open_position]
@@ -0,0 +1,249 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.cache.config import CacheConfig
+from nautilus_trader.cache.history import BarHistory
+from nautilus_trader.cache.history import QuoteTickHistory
+from nautilus_trader.cache.history import TradeTickHistory
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestQuoteTickHistory:
+    def setup(self):
+        # Fixture Setup
+        self.history = QuoteTickHistory(AUDUSD_SIM.id, capacity=3)
+
+    def _append(self, count: int) -> list:
+        ticks = [
+            TestDataStubs.quote_tick(
+                AUDUSD_SIM,
+                bid_price=1.00000 + i * 0.00010,
+                ask_price=1.00002 + i * 0.00010,
+                ts_event=i,
+                ts_init=i,
+            )
+            for i in range(count)
+        ]
+        for tick in ticks:
+            self.history.append(tick)
+        return ticks
+
+    def test_instantiate_with_invalid_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickHistory(AUDUSD_SIM.id, capacity=0)
+
+    def test_empty_history_returns_empty_arrays(self):
+        # Arrange, Act, Assert
+        assert len(self.history) == 0
+        assert len(self.history.bid_prices()) == 0
+        assert self.history.quote_tick() is None
+
+    def test_append_returns_last_n_in_chronological_order(self):
+        # Arrange
+        self._append(2)
+
+        # Act
+        bid_prices = self.history.bid_prices()
+        ts_inits = self.history.ts_inits(1)
+
+        # Assert
+        assert len(self.history) == 2
+        assert bid_prices.tolist() == [1.00000, 1.00010]
+        assert ts_inits.tolist() == [1]
+
+    def test_append_when_full_overwrites_oldest_rows(self):
+        # Arrange
+        self._append(5)
+
+        # Act
+        ask_prices = self.history.ask_prices()
+
+        # Assert
+        assert len(self.history) == 3
+        assert ask_prices == pytest.approx([1.00022, 1.00032, 1.00042])
+        assert self.history.ts_events().tolist() == [2, 3, 4]
+        assert self.history.ts_inits(10).tolist() == [2, 3, 4]
+
+    def test_arrays_are_read_only_views(self):
+        # Arrange
+        self._append(5)
+
+        # Act
+        bid_prices = self.history.bid_prices(2)
+
+        # Assert
+        assert not bid_prices.flags.writeable
+        assert not bid_prices.flags.owndata
+        with pytest.raises(ValueError):
+            bid_prices[0] = 0.0
+
+    def test_arrays_with_copy_are_not_changed_by_later_appends(self):
+        # Arrange
+        self._append(3)
+
+        # Act
+        ts_inits = self.history.ts_inits(copy=True)
+        bid_prices = self.history.bid_prices(2, copy=True)
+        self.history.append(TestDataStubs.quote_tick(AUDUSD_SIM, ts_event=9, ts_init=9))
+
+        # Assert
+        assert ts_inits.flags.writeable
+        assert ts_inits.flags.owndata
+        assert ts_inits.tolist() == [0, 1, 2]
+        assert bid_prices == pytest.approx([1.00010, 1.00020])
+        assert self.history.ts_inits().tolist() == [1, 2, 9]
+
+    def test_mid_prices(self):
+        # Arrange
+        self._append(4)
+
+        # Act
+        mid_prices = self.history.mid_prices(2)
+
+        # Assert
+        assert mid_prices == pytest.approx([1.00021, 1.00031])
+
+    def test_quote_tick_materializes_row_at_index(self):
+        # Arrange
+        ticks = self._append(5)
+
+        # Act, Assert
+        assert self.history.quote_tick() == ticks[-1]
+        assert self.history.quote_tick(2) == ticks[2]
+        assert self.history.quote_tick(3) is None
+        assert self.history.to_quote_ticks(2) == ticks[3:]
+
+    def test_clear(self):
+        # Arrange
+        self._append(2)
+
+        # Act
+        self.history.clear()
+
+        # Assert
+        assert len(self.history) == 0
+        assert len(self.history.ask_sizes()) == 0
+
+
+class TestTradeTickHistory:
+    def test_append_and_materialize_trade_ticks(self):
+        # Arrange
+        history = TradeTickHistory(AUDUSD_SIM.id, capacity=2)
+        ticks = [
+            TestDataStubs.trade_tick(
+                AUDUSD_SIM,
+                price=1.00000 + i * 0.00010,
+                aggressor_side=AggressorSide.SELLER if i % 2 else AggressorSide.BUYER,
+                trade_id=str(i),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        for tick in ticks:
+            history.append(tick)
+
+        # Assert
+        assert history.prices() == pytest.approx([1.00010, 1.00020])
+        assert history.sizes().tolist() == [100_000.0, 100_000.0]
+        assert history.aggressor_sides().tolist() == [AggressorSide.SELLER, AggressorSide.BUYER]
+        assert history.to_trade_ticks() == ticks[1:]
+        assert history.trade_tick().trade_id == ticks[-1].trade_id
+
+
+class TestBarHistory:
+    def test_append_and_materialize_bars(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_audusd_1min_bid()
+        history = BarHistory(bar_type, capacity=10)
+        bars = [
+            Bar(
+                bar_type=bar_type,
+                open=Price.from_str("1.00000"),
+                high=Price.from_str("1.00050"),
+                low=Price.from_str("0.99950"),
+                close=Price(1.00000 + i * 0.00010, 5),
+                volume=Quantity.from_int(1_000_000),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        for bar in bars:
+            history.append(bar)
+
+        # Assert
+        assert history.closes() == pytest.approx([1.00000, 1.00010, 1.00020])
+        assert np.all(history.highs() == 1.00050)
+        assert history.volumes(1).tolist() == [1_000_000.0]
+        assert history.bar(1) == bars[1]
+        assert history.to_bars() == bars
+
+
+class TestCacheHistory:
+    def test_cache_without_history_capacity_keeps_no_history(self):
+        # Arrange
+        cache = Cache()
+
+        # Act
+        cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+
+        # Assert
+        assert cache.history_capacity == 0
+        assert cache.quote_tick_history(AUDUSD_SIM.id) is None
+
+    def test_cache_with_history_capacity_appends_market_data(self):
+        # Arrange
+        cache = Cache(config=CacheConfig(history_capacity=2))
+        bar = TestDataStubs.bar_5decimal()
+
+        # Act
+        for i in range(3):
+            cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=1.0 + i))
+        cache.add_trade_ticks([TestDataStubs.trade_tick(AUDUSD_SIM, price=2.0)])
+        cache.add_bar(bar)
+
+        # Assert
+        assert cache.quote_tick_history(AUDUSD_SIM.id).bid_prices().tolist() == [2.0, 3.0]
+        assert cache.trade_tick_history(AUDUSD_SIM.id).prices().tolist() == [2.0]
+        assert cache.bar_history(bar.bar_type).bar() == bar
+
+    def test_reset_clears_history(self):
+        # Arrange
+        cache = Cache(config=CacheConfig(history_capacity=2))
+        cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+
+        # Act
+        cache.reset()
+
+        # Assert
+        assert cache.quote_tick_history(AUDUSD_SIM.id) is None
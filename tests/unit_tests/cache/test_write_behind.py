@@ -0,0 +1,197 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import time
+
+import msgspec
+import pytest
+
+from nautilus_trader.cache.database import CacheWriteBehindQueue
+from nautilus_trader.serialization.serializer import MsgSpecSerializer
+
+
+class _RecordingBacking:
+    def __init__(self, fail_key: str | None = None) -> None:
+        self.ops: list[tuple[str, str, list[bytes] | None]] = []
+        self._fail_key = fail_key
+
+    def insert(self, key: str, payload: list[bytes]) -> None:
+        self._record("insert", key, payload)
+
+    def update(self, key: str, payload: list[bytes]) -> None:
+        self._record("update", key, payload)
+
+    def delete(self, key: str, payload: list[bytes] | None = None) -> None:
+        self._record("delete", key, payload)
+
+    def _record(self, op: str, key: str, payload: list[bytes] | None) -> None:
+        if key == self._fail_key:
+            raise RuntimeError("write failed")
+        self.ops.append((op, key, payload))
+
+
+class TestCacheWriteBehindQueue:
+    def setup(self):
+        # Fixture Setup
+        self.backing = _RecordingBacking()
+        self.serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+
+    def _queue(self, **kwargs) -> CacheWriteBehindQueue:
+        return CacheWriteBehindQueue(
+            backing=self.backing,
+            serializer=self.serializer,
+            **kwargs,
+        )
+
+    def test_instantiate_with_invalid_interval_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self._queue(interval_ms=0)
+
+    def test_put_single_value_key_coalesces_to_last_write(self):
+        # Arrange
+        queue = self._queue()
+
+        # Act
+        queue.put("insert", "general:A", [b"1"])
+        queue.put("insert", "general:A", [b"2"])
+        queue.put("insert", "health:heartbeat", [b"3"])
+        queue.put("insert", "general:A", [b"4"])
+        queue.flush()
+
+        # Assert
+        assert self.backing.ops == [
+            ("insert", "health:heartbeat", [b"3"]),
+            ("insert", "general:A", [b"4"]),
+        ]
+        assert queue.queued_count == 4
+        assert queue.coalesced_count == 2
+        assert queue.written_count == 2
+
+    def test_put_index_member_coalesces_to_last_operation(self):
+        # Arrange
+        queue = self._queue()
+
+        # Act
+        queue.put("insert", "index:orders_inflight", [b"O-1"])
+        queue.put("insert", "index:orders_inflight", [b"O-2"])
+        queue.put("delete", "index:orders_inflight", [b"O-1"])
+        queue.flush()
+
+        # Assert
+        assert self.backing.ops == [
+            ("insert", "index:orders_inflight", [b"O-2"]),
+            ("delete", "index:orders_inflight", [b"O-1"]),
+        ]
+
+    def test_put_list_appends_are_never_coalesced(self):
+        # Arrange
+        queue = self._queue()
+
+        # Act
+        queue.put("insert", "orders:O-1", [b"1"])
+        queue.put("update", "orders:O-1", [b"2"])
+        queue.put("update", "orders:O-1", [b"3"])
+        queue.put("insert", "snapshots:orders:O-1", [b"4"])
+        queue.put("insert", "snapshots:orders:O-1", [b"5"])
+        queue.flush()
+
+        # Assert
+        assert self.backing.ops == [
+            ("insert", "orders:O-1", [b"1"]),
+            ("update", "orders:O-1", [b"2"]),
+            ("update", "orders:O-1", [b"3"]),
+            ("insert", "snapshots:orders:O-1", [b"4"]),
+            ("insert", "snapshots:orders:O-1", [b"5"]),
+        ]
+        assert queue.coalesced_count == 0
+
+    def test_put_with_object_serializes_when_flushed(self):
+        # Arrange
+        queue = self._queue()
+        state = {"A": 1}
+
+        # Act
+        queue.put("insert", "actors:A:state", obj=state)
+        queue.flush()
+
+        # Assert
+        assert self.backing.ops == [
+            ("insert", "actors:A:state", [self.serializer.serialize(state)]),
+        ]
+
+    def test_put_when_full_flushes_on_calling_thread(self):
+        # Arrange
+        queue = self._queue(max_queue_size=2)
+
+        # Act
+        queue.put("update", "orders:O-1", [b"1"])
+        queued = queue.qsize()
+        queue.put("update", "orders:O-1", [b"2"])
+
+        # Assert
+        assert queued == 1
+        assert queue.qsize() == 0
+        assert len(self.backing.ops) == 2
+        assert queue.batch_count == 1
+
+    def test_flush_when_write_fails_counts_failure_and_continues(self):
+        # Arrange
+        self.backing = _RecordingBacking(fail_key="general:BAD")
+        queue = self._queue()
+        queue.put("insert", "general:BAD", [b"1"])
+        queue.put("insert", "general:GOOD", [b"2"])
+
+        # Act
+        queue.flush()
+
+        # Assert
+        assert self.backing.ops == [("insert", "general:GOOD", [b"2"])]
+        assert queue.failed_count == 1
+        assert queue.written_count == 1
+
+    def test_running_queue_writes_batches_in_background(self):
+        # Arrange
+        queue = self._queue(interval_ms=1)
+        queue.start()
+
+        # Act
+        for i in range(25):
+            queue.put("update", "orders:O-1", [f"{i}".encode()])
+
+        deadline = time.monotonic() + 2.0
+        while queue.written_count < 25 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        written_count = queue.written_count
+        queue.stop()
+
+        # Assert
+        assert written_count == 25
+        assert not queue.is_running()
+        assert [op[2] for op in self.backing.ops] == [[f"{i}".encode()] for i in range(25)]
+
+    def test_stop_flushes_pending_mutations(self):
+        # Arrange
+        queue = self._queue(interval_ms=60_000)
+        queue.start()
+        queue.put("delete", "strategies:S-001:state")
+
+        # Act
+        queue.stop()
+
+        # Assert
+        assert self.backing.ops == [("delete", "strategies:S-001:state", None)]
+        assert queue.qsize() == 0
@@ -0,0 +1,204 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.profiler import MessageBusMetrics
+from nautilus_trader.common.profiler import Profiler
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+class _Component:
+    id = "Component-001"
+
+    def handle(self) -> None:
+        pass
+
+
+class TestProfiler:
+    def test_stats_when_nothing_profiled_returns_empty_list(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act, Assert
+        assert profiler.stats() == []
+        assert profiler.report().empty
+
+    def test_stop_records_calls_for_key(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act
+        for _ in range(3):
+            ts_start = profiler.start()
+            profiler.stop("DataEngine.process", ts_start)
+
+        # Assert
+        stats = profiler.stats()
+        assert len(stats) == 1
+        assert stats[0].name == "DataEngine.process"
+        assert stats[0].count == 3
+        assert stats[0].total_ns >= stats[0].self_ns
+        assert stats[0].max_ns <= stats[0].total_ns
+
+    def test_nested_sections_exclude_child_time_from_self_time(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act
+        ts_outer = profiler.start()
+        ts_inner = profiler.start()
+        sum(range(100_000))
+        profiler.stop("inner", ts_inner)
+        profiler.stop("outer", ts_outer)
+
+        # Assert
+        stats = {s.name: s for s in profiler.stats()}
+        assert stats["outer"].total_ns >= stats["inner"].total_ns
+        assert stats["outer"].self_ns == stats["outer"].total_ns - stats["inner"].total_ns
+
+    def test_bound_method_keys_resolve_to_component_id(self):
+        # Arrange
+        profiler = Profiler()
+        component = _Component()
+
+        # Act
+        ts_start = profiler.start()
+        component.handle()
+        profiler.stop(component.handle, ts_start)
+
+        # Assert
+        assert profiler.stats()[0].name == "Component-001.handle"
+
+    def test_report_is_ordered_by_self_time(self):
+        # Arrange
+        profiler = Profiler()
+        ts_start = profiler.start()
+        profiler.stop("fast", ts_start)
+        ts_start = profiler.start()
+        sum(range(100_000))
+        profiler.stop("slow", ts_start)
+
+        # Act
+        report = profiler.report()
+
+        # Assert
+        assert list(report.index) == ["slow", "fast"]
+        assert list(report.columns) == [
+            "calls",
+            "total_ms",
+            "self_ms",
+            "self_pct",
+            "mean_us",
+            "max_us",
+            "calls_per_sec",
+        ]
+
+    def test_reset_clears_stats(self):
+        # Arrange
+        profiler = Profiler()
+        ts_start = profiler.start()
+        profiler.stop("key", ts_start)
+
+        # Act
+        profiler.reset()
+
+        # Assert
+        assert profiler.stats() == []
+
+
+class TestMessageBusMetrics:
+    def setup(self):
+        # Fixture Setup
+        self.msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=TestClock(),
+        )
+
+    def test_instantiate_with_invalid_sample_rate_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            MessageBusMetrics(sample_rate=0)
+
+    def test_metrics_when_nothing_published_returns_empty(self):
+        # Arrange
+        metrics = MessageBusMetrics()
+
+        # Act
+        snapshot = metrics.snapshot()
+
+        # Assert
+        assert metrics.topic_counts() == {}
+        assert metrics.handler_metrics() == []
+        assert snapshot == {
+            "sample_rate": 1,
+            "publish_count": 0,
+            "topics": {},
+            "handlers": [],
+        }
+
+    def test_publish_records_topic_counts_and_handler_times(self):
+        # Arrange
+        metrics = MessageBusMetrics()
+        self.msgbus.set_metrics(metrics)
+        self.msgbus.subscribe("events.*", [].append)
+
+        # Act
+        self.msgbus.publish("events.a", "message1")
+        self.msgbus.publish("events.a", "message2")
+        self.msgbus.publish("events.b", "message3")
+
+        # Assert
+        handlers = metrics.handler_metrics()
+        assert self.msgbus.metrics is metrics
+        assert metrics.topic_counts() == {"events.a": 2, "events.b": 1}
+        assert len(handlers) == 1
+        assert handlers[0].name == "list.append[events.*]"
+        assert handlers[0].count == 3
+        assert handlers[0].max_ns <= handlers[0].total_ns
+        assert handlers[0].percentile(50.0) <= handlers[0].max_ns
+
+    def test_publish_with_sample_rate_only_times_sampled_publishes(self):
+        # Arrange
+        metrics = MessageBusMetrics(sample_rate=4)
+        self.msgbus.set_metrics(metrics)
+        self.msgbus.subscribe("events.*", [].append)
+
+        # Act
+        for _ in range(10):
+            self.msgbus.publish("events.a", "message")
+
+        # Assert
+        snapshot = metrics.snapshot()
+        assert snapshot["publish_count"] == 10
+        assert snapshot["topics"] == {"events.a": 10}
+        assert snapshot["handlers"][0]["count"] == 2
+        assert snapshot["handlers"][0]["est_total_ns"] == 4 * snapshot["handlers"][0]["total_ns"]
+
+    def test_reset_clears_metrics(self):
+        # Arrange
+        metrics = MessageBusMetrics()
+        self.msgbus.set_metrics(metrics)
+        self.msgbus.subscribe("events.*", [].append)
+        self.msgbus.publish("events.a", "message")
+
+        # Act
+        metrics.reset()
+
+        # Assert
+        assert metrics.topic_counts() == {}
+        assert metrics.handler_metrics() == []
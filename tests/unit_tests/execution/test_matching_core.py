@@ -0,0 +1,160 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.execution.matching_core import MatchingCore
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestMatchingCore:
+    def setup(self):
+        # Fixture Setup
+        self.order_factory = OrderFactory(
+            trader_id=TraderId("TESTER-000"),
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+        self.core = MatchingCore(
+            instrument_id=AUDUSD_SIM.id,
+            price_increment=AUDUSD_SIM.price_increment,
+            trigger_stop_order=lambda order: None,
+            fill_market_order=lambda order: None,
+            fill_limit_order=lambda order: None,
+        )
+
+    def _limit(self, side: OrderSide, price: str):
+        return self.order_factory.limit(
+            AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(100_000),
+            Price.from_str(price),
+        )
+
+    def _stop_market(self, side: OrderSide, trigger_price: str):
+        return self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(100_000),
+            Price.from_str(trigger_price),
+        )
+
+    def test_get_orders_when_no_orders_returns_empty_lists(self):
+        # Arrange, Act, Assert
+        assert self.core.get_orders() == []
+        assert self.core.get_orders_bid() == []
+        assert self.core.get_orders_ask() == []
+
+    def test_add_orders_returns_bids_descending_and_asks_ascending_in_fifo_order(self):
+        # Arrange
+        bid1 = self._limit(OrderSide.BUY, "0.80000")
+        bid2 = self._limit(OrderSide.BUY, "0.80010")
+        bid3 = self._limit(OrderSide.BUY, "0.80000")
+        ask1 = self._limit(OrderSide.SELL, "0.80030")
+        ask2 = self._limit(OrderSide.SELL, "0.80020")
+
+        # Act
+        for order in (bid1, bid2, bid3, ask1, ask2):
+            self.core.add_order(order)
+
+        # Assert
+        assert self.core.get_orders_bid() == [bid2, bid1, bid3]
+        assert self.core.get_orders_ask() == [ask2, ask1]
+        assert self.core.get_orders() == [bid2, bid1, bid3, ask2, ask1]
+
+    def test_get_orders_merges_limit_and_stop_orders_by_price(self):
+        # Arrange
+        limit = self._limit(OrderSide.BUY, "0.80000")
+        stop_high = self._stop_market(OrderSide.BUY, "0.80050")
+        stop_low = self._stop_market(OrderSide.BUY, "0.79950")
+
+        # Act
+        for order in (stop_low, limit, stop_high):
+            self.core.add_order(order)
+
+        # Assert
+        assert self.core.get_orders_bid() == [stop_high, limit, stop_low]
+
+    def test_add_order_twice_does_not_duplicate_order(self):
+        # Arrange
+        order = self._limit(OrderSide.BUY, "0.80000")
+        self.core.add_order(order)
+
+        # Act
+        self.core.add_order(order)
+
+        # Assert
+        assert self.core.get_orders() == [order]
+
+    def test_delete_order_removes_order_and_empty_level(self):
+        # Arrange
+        bid1 = self._limit(OrderSide.BUY, "0.80000")
+        bid2 = self._limit(OrderSide.BUY, "0.80010")
+        self.core.add_order(bid1)
+        self.core.add_order(bid2)
+
+        # Act
+        self.core.delete_order(bid2)
+        self.core.delete_order(bid2)  # Idempotent
+
+        # Assert
+        assert not self.core.order_exists(bid2.client_order_id)
+        assert self.core.get_orders_bid() == [bid1]
+
+    def test_update_order_moves_order_to_new_level(self):
+        # Arrange
+        bid1 = self._limit(OrderSide.BUY, "0.80000")
+        bid2 = self._limit(OrderSide.BUY, "0.80010")
+        self.core.add_order(bid1)
+        self.core.add_order(bid2)
+        bid1.apply(TestEventStubs.order_submitted(bid1))
+        bid1.apply(TestEventStubs.order_accepted(bid1))
+        bid1.apply(TestEventStubs.order_updated(bid1, price=Price.from_str("0.80020")))
+
+        # Act
+        self.core.update_order(bid1)
+
+        # Assert
+        assert self.core.get_orders_bid() == [bid1, bid2]
+
+    def test_update_order_when_order_not_held_does_nothing(self):
+        # Arrange
+        order = self._limit(OrderSide.BUY, "0.80000")
+
+        # Act
+        self.core.update_order(order)
+
+        # Assert
+        assert self.core.get_orders() == []
+
+    def test_reset_clears_orders(self):
+        # Arrange
+        self.core.add_order(self._limit(OrderSide.BUY, "0.80000"))
+        self.core.add_order(self._stop_market(OrderSide.SELL, "0.79000"))
+
+        # Act
+        self.core.reset()
+
+        # Assert
+        assert self.core.get_orders() == []
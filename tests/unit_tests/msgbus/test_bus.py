@@ -18,9 +18,13 @@ import pytest
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.component import is_matching_py
+from nautilus_trader.common.config import MessageBusConfig
+from nautilus_trader.common.profiler import Profiler
 from nautilus_trader.core.message import Request
 from nautilus_trader.core.message import Response
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
@@ -440,6 +444,65 @@ class TestMessageBus:
         assert handler1 == ["message1"]
         assert handler2 == ["message1", "message2", "message3"]
 
+    def test_subscribe_with_wildcard_after_publish_receives_messages_on_topic(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        self.msgbus.subscribe(topic="data.signal.my_signal", handler=handler1.append)
+        self.msgbus.publish("data.signal.my_signal", "message1")
+
+        # Act
+        self.msgbus.subscribe(topic="data.signal.*", handler=handler2.append)
+        self.msgbus.publish("data.signal.my_signal", "message2")
+
+        # Assert
+        assert handler1 == ["message1", "message2"]
+        assert handler2 == ["message2"]
+
+    def test_subscribe_after_publish_to_wildcard_topic_matches_as_before_publish(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        self.msgbus.publish("data.signal.*", "message1")
+
+        # Act
+        self.msgbus.subscribe(topic="data.signal.my_signal", handler=handler1.append)
+        self.msgbus.subscribe(topic="data.signal.*", handler=handler2.append)
+        self.msgbus.publish("data.signal.*", "message2")
+
+        # Assert
+        assert handler1 == []
+        assert handler2 == ["message2"]
+
+    def test_publish_sends_to_handlers_by_priority_then_subscription_order(self):
+        # Arrange
+        received = []
+        self.msgbus.publish("data.signal.my_signal", "message1")  # Resolve topic first
+        self.msgbus.subscribe("data.*", lambda m: received.append("low1"))
+        self.msgbus.subscribe("data.signal.*", lambda m: received.append("high"), priority=5)
+        self.msgbus.subscribe("data.signal.my_signal", lambda m: received.append("low2"))
+
+        # Act
+        self.msgbus.publish("data.signal.my_signal", "message2")
+        self.msgbus.publish("data.signal.another_signal", "message3")
+
+        # Assert
+        assert received == ["high", "low1", "low2", "high", "low1"]
+
+    def test_unsubscribe_after_publish_stops_messages_on_topic(self):
+        # Arrange
+        handler = []
+        self.msgbus.subscribe(topic="data.signal.*", handler=handler.append)
+        self.msgbus.publish("data.signal.my_signal", "message1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="data.signal.*", handler=handler.append)
+        self.msgbus.publish("data.signal.my_signal", "message2")
+
+        # Assert
+        assert handler == ["message1"]
+        assert not self.msgbus.has_subscribers("data.signal.*")
+
     def test_msgbus_for_system_events_using_component_id(self):
         # Arrange
         subscriber = []
@@ -456,6 +519,108 @@ class TestMessageBus:
         assert len(subscriber) == 2
         assert subscriber == ["DUMMY EVENT", "TRADER EVENT"]
 
+    def test_publish_with_profiler_attributes_time_to_handlers(self):
+        # Arrange
+        profiler = Profiler()
+        self.msgbus.set_profiler(profiler)
+        subscriber = []
+        self.msgbus.subscribe(topic="events.system.*", handler=subscriber.append)
+
+        # Act
+        self.msgbus.publish("events.system.DUMMY", "DUMMY EVENT")
+        self.msgbus.publish("events.system.DUMMY", "DUMMY EVENT")
+
+        # Assert
+        stats = profiler.stats()
+        assert subscriber == ["DUMMY EVENT", "DUMMY EVENT"]
+        assert len(stats) == 1
+        assert stats[0].name == "list.append[events.system.*]"
+        assert stats[0].count == 2
+
+    def test_instantiate_with_metrics_sample_rate_enables_metrics(self):
+        # Arrange
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            config=MessageBusConfig(metrics_sample_rate=10),
+        )
+
+        # Act
+        msgbus.publish("events.a", "message")
+
+        # Assert
+        assert self.msgbus.metrics is None
+        assert msgbus.metrics.sample_rate == 10
+        assert msgbus.metrics.topic_counts() == {"events.a": 1}
+
+    def test_channel_returns_same_channel_for_data_cls_and_key(self):
+        # Arrange
+        instrument_id = TestIdStubs.audusd_id()
+
+        # Act
+        channel1 = self.msgbus.channel(QuoteTick, instrument_id, "data.quotes.SIM.AUD/USD")
+        channel2 = self.msgbus.channel(QuoteTick, instrument_id, "data.quotes.SIM.AUD/USD")
+        channel3 = self.msgbus.channel(TradeTick, instrument_id, "data.trades.SIM.AUD/USD")
+
+        # Assert
+        assert channel1 is channel2
+        assert channel1 is not channel3
+        assert channel1.data_cls == QuoteTick
+        assert channel1.key == instrument_id
+        assert channel1.topic == "data.quotes.SIM.AUD/USD"
+
+    def test_publish_channel_sends_to_topic_and_wildcard_subscribers(self):
+        # Arrange
+        received = []
+        self.msgbus.subscribe("data.quotes.*", lambda m: received.append(("all", m)))
+        channel = self.msgbus.channel(
+            QuoteTick,
+            TestIdStubs.audusd_id(),
+            "data.quotes.SIM.AUD/USD",
+        )
+        self.msgbus.subscribe(
+            "data.quotes.SIM.AUD/USD",
+            lambda m: received.append(("one", m)),
+            priority=5,
+        )
+        self.msgbus.subscribe("data.quotes.SIM.GBP/USD", lambda m: received.append(("other", m)))
+
+        # Act
+        self.msgbus.publish_channel(channel, "message1")
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "message2")
+
+        # Assert
+        assert received == [
+            ("one", "message1"),
+            ("all", "message1"),
+            ("one", "message2"),
+            ("all", "message2"),
+        ]
+        assert [s.topic for s in channel.subscriptions()] == [
+            "data.quotes.SIM.AUD/USD",
+            "data.quotes.*",
+        ]
+        assert self.msgbus.pub_count == 2
+
+    def test_unsubscribe_removes_handler_from_channel(self):
+        # Arrange
+        handler = []
+        self.msgbus.subscribe(topic="data.trades.*", handler=handler.append)
+        channel = self.msgbus.channel(
+            TradeTick,
+            TestIdStubs.audusd_id(),
+            "data.trades.SIM.AUD/USD",
+        )
+        self.msgbus.publish_channel(channel, "message1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="data.trades.*", handler=handler.append)
+        self.msgbus.publish_channel(channel, "message2")
+
+        # Assert
+        assert handler == ["message1"]
+        assert channel.subscriptions() == []
+
 
 @pytest.mark.parametrize(
     ("topic", "pattern", "expected"),
@@ -469,6 +634,12 @@ class TestMessageBus:
         ["data.quotes.BINANCE", "data.*.BINANCE", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.*", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.ETH*", True],
+        ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.BTC*", False],
+        ["data.trades.BINANCE.ETHUSDT", "data.??????.BINANCE.*", True],
+        ["data.trades.BINANCE.ETHUSDT", "*USDT", True],
+        ["data.trades.BINANCE.ETHUSDT", "*USD", False],
+        ["", "*", True],
+        ["a", "", False],
     ],
 )
 def test_is_matching_given_various_topic_pattern_combos(topic, pattern, expected):
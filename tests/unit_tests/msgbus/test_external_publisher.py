@@ -0,0 +1,196 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import time
+
+import msgspec
+import pytest
+
+from nautilus_trader.common.component import ExternalPublisher
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.config import MessageBusConfig
+from nautilus_trader.serialization.serializer import MsgSpecSerializer
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+class _RecordingDatabase:
+    def __init__(self, fail_topic: str | None = None) -> None:
+        self.published: list[tuple[str, bytes]] = []
+        self.closed = False
+        self._fail_topic = fail_topic
+
+    def publish(self, topic: str, payload: bytes) -> None:
+        if topic == self._fail_topic:
+            raise RuntimeError("write failed")
+        self.published.append((topic, payload))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestExternalPublisher:
+    def setup(self):
+        # Fixture Setup
+        self.database = _RecordingDatabase()
+        self.serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+
+    def _publisher(self, **kwargs) -> ExternalPublisher:
+        return ExternalPublisher(
+            database=self.database,
+            serializer=self.serializer,
+            **kwargs,
+        )
+
+    def test_instantiate_with_invalid_backpressure_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self._publisher(backpressure="ignore")
+
+    def test_publish_queues_until_flushed_in_order(self):
+        # Arrange
+        publisher = self._publisher(max_batch_size=2)
+
+        # Act
+        for i in range(5):
+            publisher.publish("events.test", f"{i}".encode())
+
+        queued = publisher.qsize()
+        publisher.flush()
+
+        # Assert
+        assert queued == 5
+        assert publisher.qsize() == 0
+        assert self.database.published == [("events.test", f"{i}".encode()) for i in range(5)]
+        assert publisher.queued_count == 5
+        assert publisher.flushed_count == 5
+        assert publisher.batch_count == 3
+
+    def test_publish_when_full_with_drop_oldest_drops_oldest_message(self):
+        # Arrange
+        publisher = self._publisher(max_queue_size=2, backpressure="drop_oldest")
+
+        # Act
+        results = [publisher.publish("events.test", msg) for msg in (b"1", b"2", b"3")]
+        publisher.flush()
+
+        # Assert
+        assert results == [True, True, True]
+        assert self.database.published == [("events.test", b"2"), ("events.test", b"3")]
+        assert publisher.dropped_count == 1
+
+    def test_publish_when_full_with_drop_newest_drops_published_message(self):
+        # Arrange
+        publisher = self._publisher(max_queue_size=2, backpressure="drop_newest")
+
+        # Act
+        results = [publisher.publish("events.test", msg) for msg in (b"1", b"2", b"3")]
+        publisher.flush()
+
+        # Assert
+        assert results == [True, True, False]
+        assert self.database.published == [("events.test", b"1"), ("events.test", b"2")]
+        assert publisher.queued_count == 2
+        assert publisher.dropped_count == 1
+
+    def test_flush_when_write_fails_counts_failure_and_continues(self):
+        # Arrange
+        self.database = _RecordingDatabase(fail_topic="events.bad")
+        publisher = self._publisher()
+        publisher.publish("events.bad", b"1")
+        publisher.publish("events.good", b"2")
+
+        # Act
+        publisher.flush()
+
+        # Assert
+        assert self.database.published == [("events.good", b"2")]
+        assert publisher.failed_count == 1
+        assert publisher.flushed_count == 1
+
+    def test_running_publisher_writes_batches_in_background(self):
+        # Arrange
+        publisher = self._publisher(max_batch_size=10, max_latency_ms=1)
+        publisher.start()
+
+        # Act
+        for i in range(25):
+            publisher.publish("events.test", f"{i}".encode())
+
+        deadline = time.monotonic() + 2.0
+        while publisher.flushed_count < 25 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        flushed_count = publisher.flushed_count
+        publisher.stop()
+
+        # Assert
+        assert flushed_count == 25
+        assert not publisher.is_running()
+        assert [p[1] for p in self.database.published] == [f"{i}".encode() for i in range(25)]
+
+    def test_stop_flushes_remaining_messages(self):
+        # Arrange
+        publisher = self._publisher(max_latency_ms=60_000)
+        publisher.start()
+        publisher.publish("events.test", b"1")
+
+        # Act
+        publisher.stop()
+
+        # Assert
+        assert self.database.published == [("events.test", b"1")]
+        assert publisher.qsize() == 0
+
+
+class TestMessageBusExternalPublishing:
+    def test_publish_with_external_async_hands_messages_to_publisher(self):
+        # Arrange
+        database = _RecordingDatabase()
+        msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=TestClock(),
+            serializer=MsgSpecSerializer(encoding=msgspec.msgpack),
+            database=database,
+            config=MessageBusConfig(external_async=True, external_batch_interval_ms=60_000),
+        )
+
+        # Act
+        msgbus.publish("events.test", b"1")
+        msgbus.publish("events.test", b"2")
+        msgbus.dispose()
+
+        # Assert
+        assert msgbus.external_publisher.queued_count == 2
+        assert msgbus.external_publisher.flushed_count == 2
+        assert database.published == [("events.test", b"1"), ("events.test", b"2")]
+        assert database.closed
+
+    def test_publish_without_external_async_writes_synchronously(self):
+        # Arrange
+        database = _RecordingDatabase()
+        msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=TestClock(),
+            serializer=MsgSpecSerializer(encoding=msgspec.msgpack),
+            database=database,
+        )
+
+        # Act
+        msgbus.publish("events.test", b"1")
+
+        # Assert
+        assert msgbus.external_publisher is None
+        assert database.published == [("events.test", b"1")]
@@ -0,0 +1,137 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.component import TopicTrie
+from nautilus_trader.common.component import is_matching_py
+
+
+class TestTopicTrie:
+    def setup(self):
+        # Fixture Setup
+        self.trie = TopicTrie()
+
+    def test_add_and_get(self):
+        # Arrange, Act
+        self.trie.add("data.quotes.SIM.AUDUSD", 1)
+        self.trie.add("data.quotes.SIM.AUDUSD", 2)
+        self.trie.add("data.quotes.SIM", 3)
+
+        # Assert
+        assert self.trie.count == 3
+        assert self.trie.get("data.quotes.SIM.AUDUSD") == [1, 2]
+        assert self.trie.get("data.quotes.SIM") == [3]
+        assert self.trie.get("data.quotes") == []
+
+    def test_remove_prunes_value(self):
+        # Arrange
+        self.trie.add("data.quotes.SIM.AUDUSD", 1)
+        self.trie.add("data.quotes.SIM.GBPUSD", 2)
+
+        # Act
+        removed1 = self.trie.remove("data.quotes.SIM.AUDUSD", 1)
+        removed2 = self.trie.remove("data.quotes.SIM.AUDUSD", 1)
+
+        # Assert
+        assert removed1
+        assert not removed2
+        assert self.trie.count == 1
+        assert self.trie.match_pattern("*") == [2]
+
+    def test_match_pattern_returns_literal_keys_matching_pattern(self):
+        # Arrange
+        for topic in (
+            "data.quotes.SIM.AUDUSD",
+            "data.quotes.SIM.GBPUSD",
+            "data.trades.SIM.AUDUSD",
+            "events.order.S-001",
+        ):
+            self.trie.add(topic, topic)
+
+        # Act, Assert
+        assert sorted(self.trie.match_pattern("data.quotes.*")) == [
+            "data.quotes.SIM.AUDUSD",
+            "data.quotes.SIM.GBPUSD",
+        ]
+        assert sorted(self.trie.match_pattern("data.*.SIM.AUDUSD")) == [
+            "data.quotes.SIM.AUDUSD",
+            "data.trades.SIM.AUDUSD",
+        ]
+        assert self.trie.match_pattern("events.order.S-00?") == ["events.order.S-001"]
+        assert self.trie.match_pattern("events.order") == []
+        assert len(self.trie.match_pattern("*")) == 4
+
+    def test_match_topic_returns_pattern_keys_matching_topic(self):
+        # Arrange
+        for pattern in (
+            "data.quotes.SIM.AUDUSD",
+            "data.quotes.*",
+            "data.*.SIM.*",
+            "data.??????.SIM.AUDUSD",
+            "events.*",
+            "*",
+        ):
+            self.trie.add(pattern, pattern)
+
+        # Act
+        result = self.trie.match_topic("data.quotes.SIM.AUDUSD")
+
+        # Assert
+        assert sorted(result) == [
+            "*",
+            "data.*.SIM.*",
+            "data.??????.SIM.AUDUSD",
+            "data.quotes.*",
+            "data.quotes.SIM.AUDUSD",
+        ]
+
+    def test_match_topic_with_repeated_wildcards_returns_each_value_once(self):
+        # Arrange
+        self.trie.add("**a*", 1)
+
+        # Act, Assert
+        assert self.trie.match_topic("aaaa") == [1]
+
+
+@pytest.mark.parametrize(
+    ("topic", "pattern"),
+    [
+        ["data.quotes.SIM.AUDUSD", "data.*"],
+        ["data.quotes.SIM.AUDUSD", "data.*.SIM.*"],
+        ["data.quotes.SIM.AUDUSD", "*.AUDUSD"],
+        ["data.quotes.SIM.AUDUSD", "data.quotes.SIM.AUDUSD"],
+        ["data.quotes.SIM.AUDUSD", "data.quotes.SIM.GBPUSD"],
+        ["data.quotes.SIM.AUDUSD", "data.??????.SIM.*"],
+        ["data.quotes.SIM.AUDUSD", "data.?????.SIM.*"],
+        ["data.signal.*", "data.signal.*"],
+        ["data.signal.*", "data.signal.my_signal"],
+        ["abc", "a*b*c*"],
+        ["abc", "a*d"],
+        ["", "*"],
+        ["", "?"],
+    ],
+)
+def test_trie_matching_is_consistent_with_is_matching(topic, pattern):
+    # Arrange
+    literal = TopicTrie()
+    literal.add(topic, topic)
+    patterns = TopicTrie()
+    patterns.add(pattern, pattern)
+
+    # Act, Assert
+    expected = is_matching_py(topic=topic, pattern=pattern)
+    assert (patterns.match_topic(topic) == [pattern]) == expected
+    assert (literal.match_pattern(pattern) == [topic]) == expected
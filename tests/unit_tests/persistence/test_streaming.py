@@ -16,6 +16,9 @@
 import copy
 from collections import Counter
 
+import msgspec
+import pyarrow as pa
+
 from nautilus_trader.backtest.node import BacktestNode
 from nautilus_trader.backtest.results import BacktestResult
 from nautilus_trader.config import BacktestDataConfig
@@ -28,11 +31,17 @@ from nautilus_trader.core.rust.model import BookType
 from nautilus_trader.model.book import OrderBook
 from nautilus_trader.model.data import InstrumentStatus
 from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.funcs import urisafe_instrument_id
+from nautilus_trader.persistence.writer import StreamingFeatherWriter
 from nautilus_trader.persistence.writer import generate_signal_class
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.test_kit.mocks.data import NewsEventData
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.persistence import TestPersistenceStubs
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 
@@ -312,3 +321,187 @@ class TestPersistenceStreaming:
             "TradeTick": 179,
         }
         assert counts == expected
+
+
+class TestStreamingFeatherWriter:
+    def _write_quote_ticks(self, path: str, count: int, **kwargs) -> list[int]:
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        writer = StreamingFeatherWriter(
+            path=path,
+            flush_interval_ms=60_000,
+            batch_interval_ms=60_000,
+            **kwargs,
+        )
+        writer.write(instrument)
+        for i in range(count):
+            writer.write(TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i))
+        writer.close()
+
+        file = f"{path}/quote_tick/{urisafe_instrument_id(instrument.id.value)}.feather"
+        with open(file, "rb") as f:
+            return [batch.num_rows for batch in pa.ipc.open_stream(f)]
+
+    def test_write_buffers_rows_into_record_batches_flushed_on_close(self, tmp_path) -> None:
+        # Arrange, Act
+        batch_rows = self._write_quote_ticks(str(tmp_path / "stream"), 25, batch_size=10)
+
+        # Assert
+        assert batch_rows == [10, 10, 5]
+
+    def test_write_with_background_thread_writes_all_rows_in_order(self, tmp_path) -> None:
+        # Arrange, Act
+        batch_rows = self._write_quote_ticks(
+            str(tmp_path / "stream"),
+            25,
+            batch_size=10,
+            use_thread=True,
+        )
+
+        # Assert
+        assert batch_rows == [10, 10, 5]
+
+    def test_write_with_background_thread_survives_write_errors(
+        self,
+        tmp_path,
+        monkeypatch,
+    ) -> None:
+        # Arrange
+        write_batch = StreamingFeatherWriter._write_batch
+        calls: list[int] = []
+
+        def failing_write_batch(writer, key, cls, objs) -> None:
+            calls.append(len(objs))
+            if len(calls) == 1:
+                raise OSError("Storage unavailable")
+            write_batch(writer, key, cls, objs)
+
+        monkeypatch.setattr(StreamingFeatherWriter, "_write_batch", failing_write_batch)
+
+        # Act
+        batch_rows = self._write_quote_ticks(
+            str(tmp_path / "stream"),
+            25,
+            batch_size=10,
+            use_thread=True,
+        )
+
+        # Assert
+        assert batch_rows == [10, 5]
+
+    def test_write_when_batch_fails_to_serialize_writes_other_rows(
+        self,
+        tmp_path,
+        monkeypatch,
+    ) -> None:
+        # Arrange
+        serialize_batch = ArrowSerializer.serialize_batch
+
+        def failing_serialize_batch(data, data_cls):
+            if any(obj.ts_init == 3 for obj in data):
+                raise ValueError("Invalid row")
+            return serialize_batch(data, data_cls=data_cls)
+
+        monkeypatch.setattr(
+            ArrowSerializer,
+            "serialize_batch",
+            staticmethod(failing_serialize_batch),
+        )
+
+        # Act
+        batch_rows = self._write_quote_ticks(str(tmp_path / "stream"), 10, batch_size=5)
+
+        # Assert
+        assert batch_rows == [1, 1, 1, 1, 5]
+
+    def test_flush_writes_partial_buffers(self, tmp_path) -> None:
+        # Arrange
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        path = str(tmp_path / "stream")
+        writer = StreamingFeatherWriter(path=path, batch_size=100, batch_interval_ms=60_000)
+        writer.write(instrument)
+        writer.write(TestDataStubs.quote_tick(instrument))
+
+        # Act
+        writer.flush()
+
+        # Assert
+        file = f"{path}/quote_tick/{urisafe_instrument_id(instrument.id.value)}.feather"
+        with open(file, "rb") as f:
+            assert pa.ipc.open_stream(f).read_next_batch().num_rows == 1
+        writer.close()
+
+    def _write_rotated_quote_ticks(self, path: str, count: int, **kwargs) -> None:
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        writer = StreamingFeatherWriter(path=path, batch_size=1, **kwargs)
+        writer.write(instrument)
+        for i in range(count):
+            ts = i * 500_000  # Two ticks per millisecond
+            writer.write(TestDataStubs.quote_tick(instrument, ts_event=ts, ts_init=ts))
+        writer.close()
+
+    def test_write_with_rotation_interval_writes_segments_and_manifest(self, tmp_path) -> None:
+        # Arrange
+        path = str(tmp_path / "live" / "run-001")
+
+        # Act
+        self._write_rotated_quote_ticks(path, 6, rotation_interval_ms=1)
+
+        # Assert
+        with open(f"{path}/manifest.json", "rb") as f:
+            manifest = msgspec.json.decode(f.read())
+        segments = [s for s in manifest["segments"] if s["cls"] == "quote_tick"]
+        assert [s["path"] for s in segments] == [
+            f"quote_tick/AUDUSD.SIM-{i:06d}.feather" for i in range(1, 4)
+        ]
+        assert [(s["ts_min"], s["ts_max"]) for s in segments] == [
+            (0, 500_000),
+            (1_000_000, 1_500_000),
+            (2_000_000, 2_500_000),
+        ]
+        assert all(s["rows"] == 2 and s["closed"] for s in segments)
+
+    def test_write_with_rotation_size_rotates_segments(self, tmp_path) -> None:
+        # Arrange
+        path = str(tmp_path / "live" / "run-001")
+
+        # Act
+        self._write_rotated_quote_ticks(path, 4, rotation_size_bytes=1)
+
+        # Assert
+        with open(f"{path}/manifest.json", "rb") as f:
+            manifest = msgspec.json.decode(f.read())
+        segments = [s for s in manifest["segments"] if s["cls"] == "quote_tick"]
+        assert [s["rows"] for s in segments] == [1, 1, 1, 1, 0]
+
+    def test_read_live_run_with_range_reads_overlapping_segments(self, tmp_path) -> None:
+        # Arrange
+        catalog = ParquetDataCatalog(path=str(tmp_path))
+        self._write_rotated_quote_ticks(
+            f"{catalog.path}/live/run-001",
+            6,
+            rotation_interval_ms=1,
+        )
+
+        # Act
+        result = catalog.read_live_run(instance_id="run-001", start=1_000_000, end=1_500_000)
+
+        # Assert
+        assert [r.ts_init for r in result] == [1_000_000, 1_500_000]
+
+    def test_compact_live_run_writes_segments_to_catalog(self, tmp_path) -> None:
+        # Arrange
+        catalog = ParquetDataCatalog(path=str(tmp_path))
+        path = f"{catalog.path}/live/run-001"
+        self._write_rotated_quote_ticks(path, 6, rotation_interval_ms=1)
+
+        # Act
+        count = catalog.compact_live_run(instance_id="run-001")
+
+        # Assert
+        result = catalog.read_live_run(instance_id="run-001")
+        assert count == 4  # Includes the instrument segment
+        assert not catalog.fs.glob(f"{path}/quote_tick/*.feather")
+        assert len(catalog.quote_ticks()) == 6
+        assert [r.ts_init for r in result if isinstance(r, QuoteTick)] == [
+            i * 500_000 for i in range(6)
+        ]
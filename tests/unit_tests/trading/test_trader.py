@@ -298,6 +298,21 @@ class TestTrader:
         assert not strategy.is_running
         assert self.trader.strategies() == []
 
+    def test_remove_strategy_unsubscribes_its_handlers(self) -> None:
+        # Arrange
+        subscription_count = len(self.msgbus.subscriptions())
+        strategy = Strategy()
+        self.trader.add_strategy(strategy)
+        self.trader.start_strategy(strategy.id)
+        strategy.subscribe_quote_ticks(USDJPY_SIM.id)
+
+        # Act
+        self.trader.remove_strategy(strategy.id)
+
+        # Assert
+        assert not self.msgbus.has_subscribers(f"events.order.{strategy.id}")
+        assert len(self.msgbus.subscriptions()) == subscription_count
+
     def test_add_strategies_with_no_order_id_tags(self) -> None:
         # Arrange
         strategies = [Strategy(), Strategy()]